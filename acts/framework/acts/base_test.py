@@ -14,7 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import os
+import threading
+import time
 
 from acts import asserts
 from acts import keys
@@ -22,6 +25,7 @@ from acts import logger
 from acts import records
 from acts import signals
 from acts import test_runner
+from acts import tracing
 from acts import utils
 
 # Macro strings for test result reporting
@@ -50,6 +54,15 @@ class BaseTestClass(object):
         current_test_name: A string that's the name of the test case currently
                            being executed. If no test is executing, this should
                            be None.
+        timeline: A tracing.Timeline object the phases of the test cases are
+                  recorded on. Shared with the test runner if there is one.
+        results_stream: A records.TestResultStream object each test record is
+                        appended to as soon as the test case completes, or
+                        None.
+        completed_tests: A dictionary mapping test class names to dictionaries
+                         of test names to results, for tests completed by a
+                         previous test run that is being resumed. These tests
+                         are not executed again.
     """
 
     TAG = None
@@ -58,6 +71,9 @@ class BaseTestClass(object):
         self.tests = []
         if not self.TAG:
             self.TAG = self.__class__.__name__
+        self.timeline = tracing.Timeline()
+        self.results_stream = None
+        self.completed_tests = {}
         # Set all the controller objects and params.
         for name, value in configs.items():
             setattr(self, name, value)
@@ -291,7 +307,8 @@ class BaseTestClass(object):
                        case executed.
         """
         try:
-            func(tr_record)
+            self._exec_phase(func.__name__.lstrip("_"), tr_record, func,
+                             tr_record)
         except signals.TestAbortAll:
             raise
         except Exception as e:
@@ -299,6 +316,33 @@ class BaseTestClass(object):
                                func.__name__, self.current_test_name)
             tr_record.add_error(func.__name__, e)
 
+    def _exec_phase(self, phase, tr_record, func, *args, **kwargs):
+        """Executes one phase of a test case, like setup_test or the test
+        function itself, and records how long it took.
+
+        The duration is added to the test's record and the phase is added to
+        the timeline.
+
+        Args:
+            phase: A string that is the name of the phase.
+            tr_record: The TestResultRecord object associated with the test
+                       case executed.
+            func: The function to be executed.
+            args: Positional args to be passed to func.
+            kwargs: Keyword args to be passed to func.
+
+        Returns:
+            Whatever func returns.
+        """
+        begin_time = time.time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end_time = time.time()
+            tr_record.add_phase_duration(phase, end_time - begin_time)
+            self.timeline.add_span(phase, "test_phase", begin_time, end_time,
+                                   test_name=tr_record.test_name)
+
     def exec_one_testcase(self, test_name, test_func, args, **kwargs):
         """Executes one test case and update test results.
 
@@ -311,23 +355,32 @@ class BaseTestClass(object):
             test_func: The test function.
             args: A tuple of params.
             kwargs: Extra kwargs.
+
+        Returns:
+            The records.TestResultRecord object of the test case, or None if
+            the test case is a trigger for generated tests.
         """
         is_generate_trigger = False
         tr_record = records.TestResultRecord(test_name, self.TAG)
         tr_record.test_begin()
+        records.set_current_record(tr_record)
+        begin_time = time.time()
         self.log.info("%s %s", TEST_CASE_TOKEN, test_name)
         verdict = None
         try:
-            ret = self._setup_test(test_name)
+            ret = self._exec_phase("setup_test", tr_record, self._setup_test,
+                                   test_name)
             asserts.assert_true(ret is not False,
                                 "Setup for %s failed." % test_name)
             try:
                 if args or kwargs:
-                    verdict = test_func(*args, **kwargs)
+                    verdict = self._exec_phase("test", tr_record, test_func,
+                                               *args, **kwargs)
                 else:
-                    verdict = test_func()
+                    verdict = self._exec_phase("test", tr_record, test_func)
             finally:
-                self._teardown_test(test_name)
+                self._exec_phase("teardown_test", tr_record,
+                                 self._teardown_test, test_name)
         except (signals.TestFailure, AssertionError) as e:
             tr_record.test_fail(e)
             self._exec_procedure_func(self._on_fail, tr_record)
@@ -359,30 +412,50 @@ class BaseTestClass(object):
                 # Test passed.
                 tr_record.test_pass()
                 self._exec_procedure_func(self._on_pass, tr_record)
-                return
-            # Test failed because it didn't return True.
-            # This should be removed eventually.
-            tr_record.test_fail()
-            self._exec_procedure_func(self._on_fail, tr_record)
+            else:
+                # Test failed because it didn't return True.
+                # This should be removed eventually.
+                tr_record.test_fail()
+                self._exec_procedure_func(self._on_fail, tr_record)
         finally:
+            records.set_current_record(None)
             if not is_generate_trigger:
                 self.results.add_record(tr_record)
+                if self.results_stream:
+                    self.results_stream.add_record(tr_record)
+                self.timeline.add_span(test_name, "test_case", begin_time,
+                                       time.time(), test_class=self.TAG,
+                                       result=tr_record.result)
+        if not is_generate_trigger:
+            return tr_record
 
     def run_generated_testcases(self, test_func, settings,
                                 args=None, kwargs=None,
-                                tag="", name_func=None):
+                                tag="", name_func=None,
+                                device_pool=None, device_count_func=None):
         """Runs generated test cases.
 
         Generated test cases are not written down as functions, but as a list
         of parameter sets. This way we reduce code repetition and improve
         test case scalability.
 
+        Settings are consumed one at a time, so they can be produced lazily
+        by a generator instead of being enumerated up front.
+
+        If device_pool is given, test cases run concurrently, each on its own
+        devices taken from the pool, and test_func is called with the keyword
+        argument "devices", the list of devices the test case may use. A test
+        case starts as soon as enough devices are free. Since test cases run
+        on separate threads, setup_test and teardown_test must be safe to run
+        concurrently, and utils.timeout cannot be used in test_func.
+
         Args:
             test_func: The common logic shared by all these generated test
                        cases. This function should take at least one argument,
                        which is a parameter set.
-            settings: A list of strings representing parameter sets. These are
-                      usually json strings that get loaded in the test_func.
+            settings: An iterable of parameter sets, e.g. a list of strings or
+                      a generator. These are usually json strings that get
+                      loaded in the test_func.
             args: Iterable of additional position args to be passed to
                   test_func.
             kwargs: Dict of additional keyword args to be passed to test_func
@@ -392,31 +465,131 @@ class BaseTestClass(object):
                        proper test name. The test name should be shorter than
                        utils.MAX_FILENAME_LEN. Names over the limit will be
                        truncated.
+            device_pool: A list of interchangeable devices, e.g.
+                         self.android_devices, to run test cases on
+                         concurrently.
+            device_count_func: A function that takes a test setting and returns
+                               how many devices from device_pool the test case
+                               needs. Test cases need one device by default.
 
         Returns:
-            A list of settings that did not pass.
+            A list of settings that did not pass. With device_pool, the order
+            is the order in which the test cases completed.
         """
         args = args or ()
         kwargs = kwargs or {}
+        if device_pool:
+            return self._run_generated_testcases_concurrently(
+                test_func, settings, args, kwargs, tag, name_func,
+                device_pool, device_count_func)
         failed_settings = []
         for s in settings:
-            test_name = "{} {}".format(tag, s)
-            if name_func:
-                try:
-                    test_name = name_func(s, *args, **kwargs)
-                except:
-                    self.log.exception(("Failed to get test name from "
-                                        "test_func. Fall back to default %s"),
-                                       test_name)
-            self.results.requested.append(test_name)
-            if len(test_name) > utils.MAX_FILENAME_LEN:
-                test_name = test_name[:utils.MAX_FILENAME_LEN]
-            previous_success_cnt = len(self.results.passed)
-            self.exec_one_testcase(test_name, test_func, (s,) + args, **kwargs)
-            if len(self.results.passed) - previous_success_cnt != 1:
+            test_name = self._get_generated_test_name(s, args, kwargs, tag,
+                                                      name_func)
+            if self._skip_completed_test(test_name, s, failed_settings):
+                continue
+            record = self.exec_one_testcase(test_name, test_func,
+                                            (s,) + args, **kwargs)
+            if not record or (record.result !=
+                              records.TestResultEnums.TEST_RESULT_PASS):
                 failed_settings.append(s)
         return failed_settings
 
+    def _get_generated_test_name(self, setting, args, kwargs, tag, name_func):
+        """Gets the name of a generated test case and adds it to the requested
+        tests.
+
+        Returns:
+            The test name, truncated to utils.MAX_FILENAME_LEN.
+        """
+        test_name = "{} {}".format(tag, setting)
+        if name_func:
+            try:
+                test_name = name_func(setting, *args, **kwargs)
+            except:
+                self.log.exception(("Failed to get test name from "
+                                    "test_func. Fall back to default %s"),
+                                   test_name)
+        self.results.requested.append(test_name)
+        if len(test_name) > utils.MAX_FILENAME_LEN:
+            test_name = test_name[:utils.MAX_FILENAME_LEN]
+        return test_name
+
+    def _skip_completed_test(self, test_name, setting, failed_settings):
+        """Checks whether a generated test case was completed by a previous
+        test run that is being resumed.
+
+        Returns:
+            True if the test case should be skipped.
+        """
+        previous_result = self._get_completed_tests().get(test_name)
+        if not previous_result:
+            return False
+        self.log.info("Skipping %s, completed with %s in a previous run.",
+                      test_name, previous_result)
+        if previous_result != records.TestResultEnums.TEST_RESULT_PASS:
+            failed_settings.append(setting)
+        return True
+
+    def _run_generated_testcases_concurrently(self, test_func, settings, args,
+                                              kwargs, tag, name_func,
+                                              device_pool, device_count_func):
+        """Runs generated test cases on a pool of devices, see
+        run_generated_testcases.
+        """
+        free_devices = list(device_pool)
+        lock = threading.Condition()
+        failed_settings = []
+        aborts = []
+
+        def run_case(setting, test_name, devices):
+            try:
+                record = self.exec_one_testcase(test_name, test_func,
+                                                (setting,) + args,
+                                                devices=devices, **kwargs)
+                if not record or (record.result !=
+                                  records.TestResultEnums.TEST_RESULT_PASS):
+                    with lock:
+                        failed_settings.append(setting)
+            except (signals.TestAbortClass, signals.TestAbortAll) as e:
+                with lock:
+                    failed_settings.append(setting)
+                    aborts.append(e)
+            finally:
+                with lock:
+                    free_devices.extend(devices)
+                    lock.notify_all()
+
+        def fail_case(count):
+            asserts.fail("Test case needs %d devices, only %d in the pool." %
+                         (count, len(device_pool)))
+
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(device_pool)) as executor:
+            for s in settings:
+                if aborts:
+                    break
+                test_name = self._get_generated_test_name(s, args, kwargs, tag,
+                                                          name_func)
+                if self._skip_completed_test(test_name, s, failed_settings):
+                    continue
+                count = device_count_func(s) if device_count_func else 1
+                if count > len(device_pool):
+                    self.exec_one_testcase(test_name, fail_case, (count,))
+                    failed_settings.append(s)
+                    continue
+                with lock:
+                    while len(free_devices) < count and not aborts:
+                        lock.wait()
+                    if aborts:
+                        break
+                    devices = free_devices[:count]
+                    del free_devices[:count]
+                executor.submit(run_case, s, test_name, devices)
+        if aborts:
+            raise aborts[0]
+        return failed_settings
+
     def _exec_func(self, func, *args):
         """Executes a function with exception safeguard.
 
@@ -453,6 +626,9 @@ class BaseTestClass(object):
                 test_names.append(name)
         return test_names
 
+    def _get_completed_tests(self):
+        return self.completed_tests.get(self.TAG, {})
+
     def _get_test_funcs(self, test_names):
         """Obtain the actual functions of test cases based on test names.
 
@@ -514,14 +690,29 @@ class BaseTestClass(object):
                 test_names = self._get_all_test_names()
         self.results.requested = test_names
         tests = self._get_test_funcs(test_names)
+        completed = self._get_completed_tests()
+        if completed:
+            remaining = [t for t in tests if t[0] not in completed]
+            self.log.info("Skipping %d tests completed in a previous run.",
+                          len(tests) - len(remaining))
+            # The test classes that already ran to completion do not need to
+            # be set up again.
+            if not remaining:
+                return self.results
+            tests = remaining
         # Setup for the class.
         try:
-            if self._setup_class() is False:
-                raise signals.TestFailure("Failed to setup %s." % self.TAG)
+            with self.timeline.span("setup_class", "test_class",
+                                    test_class=self.TAG):
+                if self._setup_class() is False:
+                    raise signals.TestFailure("Failed to setup %s." %
+                                              self.TAG)
         except Exception as e:
             self.log.exception("Failed to setup %s.", self.TAG)
-            self.results.fail_class(self.TAG, e)
-            self._exec_func(self.teardown_class)
+            record = self.results.fail_class(self.TAG, e)
+            if self.results_stream:
+                self.results_stream.add_record(record)
+            self._exec_teardown_class()
             return self.results
         # Run tests in order.
         try:
@@ -536,10 +727,15 @@ class BaseTestClass(object):
             setattr(e, "results", self.results)
             raise e
         finally:
-            self._exec_func(self.teardown_class)
+            self._exec_teardown_class()
             self.log.info("Summary for test class %s: %s", self.TAG,
                           self.results.summary_str())
 
+    def _exec_teardown_class(self):
+        with self.timeline.span("teardown_class", "test_class",
+                                test_class=self.TAG):
+            self._exec_func(self.teardown_class)
+
     def clean_up(self):
         """A function that is executed upon completion of all tests cases
         selected in the test class.
@@ -17,17 +17,23 @@
 from builtins import str
 
 import argparse
+import json
 import multiprocessing
+import multiprocessing.connection
+import os
 import signal
 import sys
+import time
 import traceback
 
+from acts import history
+from acts import utils
 from acts.keys import Config
+from acts.records import TestResult
 from acts.signals import TestAbortAll
 from acts.test_runner import TestRunner
 from acts.test_runner import USERError
 from acts.utils import abs_path
-from acts.utils import concurrent_exec
 from acts.utils import load_config
 from acts.utils import valid_filename_chars
 
@@ -192,7 +198,7 @@ def load_test_config_file(test_config_path, tb_filters=None):
         config_jsons.append(new_test_config)
     return config_jsons
 
-def _run_test(test_runner, repeat=1):
+def _run_test(test_runner, repeat=1, on_iteration=None):
     """Instantiate and runs TestRunner.
 
     This is the function to start separate processes with.
@@ -200,10 +206,14 @@ def _run_test(test_runner, repeat=1):
     Args:
         test_runner: The test_runner instance to be executed.
         repeat: Number of times to iterate the specified tests.
+        on_iteration: An optional function called with the test_runner after
+            each completed iteration.
     """
     try:
         for i in range(repeat):
             test_runner.run()
+            if on_iteration:
+                on_iteration(test_runner)
     except TestAbortAll:
         return
     except:
@@ -221,12 +231,429 @@ def _gen_term_signal_handler(test_runners):
         sys.exit(1)
     return termination_sig_handler
 
-def _run_tests_parallel(process_args):
-    print("Executing {} concurrent test runs.".format(len(process_args)))
-    results = concurrent_exec(_run_test, process_args)
-    for r in results:
-        if r is False or isinstance(r, Exception):
-            return False
+class _ResultStreamer(object):
+    """Sends the records a TestRunner has accumulated back to the parent
+    process, one batch per call, without resending what was already sent.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.num_requested = 0
+        self.num_executed = 0
+
+    def __call__(self, test_runner):
+        results = test_runner.results
+        requested = results.requested[self.num_requested:]
+        executed = results.executed[self.num_executed:]
+        if not requested and not executed:
+            return
+        self.conn.send(("results", test_runner.testbed_name, requested,
+                        executed))
+        self.num_requested += len(requested)
+        self.num_executed += len(executed)
+
+def _gen_child_term_signal_handler(test_runner):
+    def termination_sig_handler(signal_num, frame):
+        # A terminal ^C reaches this process directly and again through the
+        # parent's SIGTERM; only the first one should interrupt the run.
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        test_runner.stop()
+        sys.exit(1)
+    return termination_sig_handler
+
+def _run_test_process(test_config, test_identifiers, repeat,
+                      reuse_controllers, conn):
+    """Entry point of a child process running all iterations on one testbed.
+
+    Records are streamed back over conn after each iteration, followed by a
+    ("done", testbed_name, ok) message.
+
+    Args:
+        test_config: The configuration of the testbed to run on.
+        test_identifiers: The parsed list of tests to run.
+        repeat: Number of times to iterate the specified tests.
+        reuse_controllers: Whether controllers are kept across iterations.
+        conn: The sending end of a multiprocessing.Pipe.
+    """
+    testbed_name = test_config[Config.key_testbed.value][
+        Config.key_testbed_name.value]
+    try:
+        try:
+            test_runner = TestRunner(test_config, test_identifiers,
+                                     reuse_controllers)
+        except:
+            print("Failed to instantiate test runner for {}.".format(
+                testbed_name))
+            print(traceback.format_exc())
+            conn.send(("done", testbed_name, False))
+            return
+        handler = _gen_child_term_signal_handler(test_runner)
+        signal.signal(signal.SIGTERM, handler)
+        signal.signal(signal.SIGINT, handler)
+        stream = _ResultStreamer(conn)
+        ok = _run_test(test_runner, repeat, on_iteration=stream)
+        # Flush what a failed or interrupted iteration left behind.
+        stream(test_runner)
+        conn.send(("done", testbed_name, ok is not False))
+    finally:
+        conn.close()
+
+def _gen_parent_term_signal_handler(processes, stopping):
+    def termination_sig_handler(signal_num, frame):
+        stopping.append(signal_num)
+        for p in processes:
+            if p.is_alive():
+                p.terminate()
+    return termination_sig_handler
+
+def _run_processes(target, process_args, debug=False):
+    """Runs target in one child process per element of process_args and
+    collects the messages they send back.
+
+    Each element of process_args is a tuple of arguments for target, to
+    which the sending end of a pipe is appended. SIGTERM and SIGINT received
+    by this process are forwarded to the children, whose partial results are
+    still collected.
+
+    Args:
+        target: The entry point of the child processes.
+        process_args: A list of argument tuples, one per process.
+        debug: If True, termination signals are not intercepted.
+
+    Returns:
+        A tuple of (summary, finished, durations, interrupted). summary is a
+        TestResult merged from all children, finished maps testbed names to
+        whether their run ended without unexpected errors, durations maps
+        work item keys to the seconds they took and interrupted is True if a
+        termination signal was received.
+    """
+    processes = []
+    conns = []
+    for args in process_args:
+        recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+        p = multiprocessing.Process(target=target,
+                                    args=tuple(args) + (send_conn,))
+        p.start()
+        # Only the child should hold the sending end, so that the receiving
+        # end sees EOF when the child exits.
+        send_conn.close()
+        processes.append(p)
+        conns.append(recv_conn)
+    stopping = []
+    if not debug:
+        handler = _gen_parent_term_signal_handler(processes, stopping)
+        signal.signal(signal.SIGTERM, handler)
+        signal.signal(signal.SIGINT, handler)
+    summary = TestResult()
+    finished = {}
+    durations = {}
+    while conns:
+        for conn in multiprocessing.connection.wait(conns):
+            try:
+                msg = conn.recv()
+            except EOFError:
+                conns.remove(conn)
+                conn.close()
+                continue
+            if msg[0] == "results":
+                _, testbed_name, requested, executed = msg
+                summary.requested.extend(requested)
+                for record in executed:
+                    summary.add_record(record)
+            elif msg[0] == "duration":
+                _, key, seconds = msg
+                durations[key] = seconds
+            elif msg[0] == "done":
+                _, testbed_name, ok = msg
+                finished[testbed_name] = ok
+    for p in processes:
+        p.join()
+    print("Summary for all test runs: %s" % summary.summary_str())
+    return summary, finished, durations, bool(stopping)
+
+def _run_tests_parallel(test_configs, test_identifiers, repeat=1,
+                        debug=False, reuse_controllers=False):
+    """Runs each testbed in its own process and merges their results.
+
+    Each child gets its own interpreter, so test runners no longer share a
+    GIL, and SIGALRM based timeouts work since every runner is on the main
+    thread of its process.
+
+    Args:
+        test_configs: A list of testbed configurations, one per process.
+        test_identifiers: The parsed list of tests to run.
+        repeat: Number of times to iterate the specified tests.
+        debug: If True, termination signals are not intercepted.
+        reuse_controllers: Whether controllers are kept across iterations.
+
+    Returns:
+        False if any test run raised an unexpected error or was interrupted,
+        True otherwise.
+    """
+    print("Executing {} concurrent test runs.".format(len(test_configs)))
+    process_args = [(c, test_identifiers, repeat, reuse_controllers)
+                    for c in test_configs]
+    _, finished, _, interrupted = _run_processes(_run_test_process,
+                                                 process_args, debug)
+    if interrupted or len(finished) != len(test_configs):
+        return False
+    return all(finished.values())
+
+def _get_work_item_key(item):
+    test_cls_name, test_case_names = item
+    if test_case_names:
+        return "%s:%s" % (test_cls_name, ",".join(test_case_names))
+    return test_cls_name
+
+def _gen_work_items(test_identifiers, repeat=1, durations=None):
+    """Splits a run list into independently schedulable work items.
+
+    A test class requested as a whole is one item. Test cases requested
+    explicitly become one item each, so they can land on different
+    testbeds.
+
+    Items are ordered longest first according to durations; items without
+    history are assumed to be the longest, so they are started early.
+
+    Args:
+        test_identifiers: The parsed list of tests to run.
+        repeat: Number of times each item should be executed.
+        durations: A dict mapping work item keys to the seconds they took
+            in previous runs.
+
+    Returns:
+        A list of (test class name, test case names) tuples.
+    """
+    durations = durations or {}
+    items = []
+    for test_cls_name, test_case_names in test_identifiers:
+        if test_case_names:
+            for test_case_name in test_case_names:
+                items.append((test_cls_name, [test_case_name]))
+        else:
+            items.append((test_cls_name, None))
+    items = items * repeat
+    unknown = float("inf")
+    # sorted is stable, so items with equal durations keep the user's order.
+    return sorted(items, key=lambda item: -durations.get(
+        _get_work_item_key(item), unknown))
+
+def _get_durations_path(test_config):
+    return os.path.join(test_config[Config.key_log_path.value],
+                        "test_durations.json")
+
+def _load_durations(path):
+    """Loads the work item durations recorded by previous sharded runs.
+
+    Returns:
+        A dict mapping work item keys to seconds, empty if there is no
+        usable history.
+    """
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+
+def _save_durations(path, durations):
+    utils.create_dir(os.path.dirname(path))
+    with open(path, 'w') as f:
+        json.dump(durations, f, indent=4, sort_keys=True)
+
+def _open_history(test_config):
+    path = os.path.join(test_config[Config.key_log_path.value],
+                        history.HISTORY_FILE_NAME)
+    try:
+        utils.create_dir(os.path.dirname(path))
+        return history.TestHistory(path)
+    except Exception:
+        print("Failed to open test history {}.".format(path))
+        return None
+
+def _add_history_durations(test_config, items, durations):
+    """Fills in the durations of work items never sharded before with the
+    durations of their test cases in the test history.
+
+    Args:
+        test_config: A test bed configuration, for the log path.
+        items: A list of work items.
+        durations: A dict mapping work item keys to seconds, updated in
+            place.
+    """
+    test_history = _open_history(test_config)
+    if not test_history:
+        return
+    with test_history:
+        for item in items:
+            key = _get_work_item_key(item)
+            if key in durations:
+                continue
+            estimate = test_history.estimate_duration(*item)
+            if estimate is not None:
+                durations[key] = estimate
+
+def _print_history_forecast(test_config, test_identifiers, repeat=1):
+    """Prints the run time predicted from the test history, and the known
+    flaky tests among the requested ones.
+
+    Args:
+        test_config: A test bed configuration, for the log path.
+        test_identifiers: The parsed list of tests to run.
+        repeat: Number of times to iterate the specified tests.
+    """
+    test_history = _open_history(test_config)
+    if not test_history:
+        return
+    with test_history:
+        total = 0
+        unknown = []
+        for test_cls_name, test_case_names in test_identifiers:
+            estimate = test_history.estimate_duration(test_cls_name,
+                                                      test_case_names)
+            if estimate is None:
+                unknown.append(test_cls_name)
+            else:
+                total += estimate
+        requested = set(c for c, _ in test_identifiers)
+        flaky = sorted(t for t in test_history.get_flaky_tests()
+                       if t[0] in requested)
+    if total:
+        msg = "Predicted run time per test bed: {:.0f}s".format(total * repeat)
+        if unknown:
+            msg += ", not counting {} without history".format(
+                ", ".join(sorted(set(unknown))))
+        print(msg + ".")
+    if flaky:
+        print("Known flaky tests, retried once if they fail: {}.".format(
+            ", ".join("%s:%s" % t for t in flaky)))
+
+def _validate_testbed_pool(test_configs):
+    """Verifies that the testbeds in a pool are interchangeable.
+
+    Testbeds are considered interchangeable if they declare the same set of
+    controllers and params, regardless of the values.
+
+    Raises:
+        USERError is raised if two testbeds declare different keys.
+    """
+    tb_key = Config.key_testbed.value
+    name_key = Config.key_testbed_name.value
+    first = test_configs[0][tb_key]
+    expected = set(first.keys())
+    for c in test_configs[1:]:
+        keys = set(c[tb_key].keys())
+        if keys != expected:
+            raise USERError(("Test bed %s is not interchangeable with %s, "
+                             "differing keys: %s.") % (
+                             c[tb_key][name_key], first[name_key],
+                             sorted(keys ^ expected)))
+
+def _run_test_pool_process(test_config, work_queue, reuse_controllers,
+                           conn):
+    """Entry point of a child process serving work items on one testbed.
+
+    The child takes (test class name, test case names) items from
+    work_queue until it gets None. The records of each item are streamed
+    back over conn, together with a ("duration", key, seconds) message,
+    followed by a ("done", testbed_name, ok) message.
+
+    Args:
+        test_config: The configuration of the testbed to run on.
+        work_queue: A multiprocessing.Queue of work items shared by all the
+            testbeds in the pool.
+        reuse_controllers: Whether controllers are kept across work items.
+        conn: The sending end of a multiprocessing.Pipe.
+    """
+    testbed_name = test_config[Config.key_testbed.value][
+        Config.key_testbed_name.value]
+    try:
+        try:
+            test_runner = TestRunner(test_config, [], reuse_controllers)
+        except:
+            print("Failed to instantiate test runner for {}.".format(
+                testbed_name))
+            print(traceback.format_exc())
+            conn.send(("done", testbed_name, False))
+            return
+        handler = _gen_child_term_signal_handler(test_runner)
+        signal.signal(signal.SIGTERM, handler)
+        signal.signal(signal.SIGINT, handler)
+        stream = _ResultStreamer(conn)
+        ok = True
+        try:
+            for item in iter(work_queue.get, None):
+                test_runner.run_list = [item]
+                begin_time = time.time()
+                try:
+                    test_runner.run()
+                except TestAbortAll:
+                    # The testbed is unusable, leave the rest of the queue
+                    # to the other testbeds in the pool.
+                    break
+                except:
+                    print("Exception when executing {} on {}.".format(
+                        _get_work_item_key(item), testbed_name))
+                    print(traceback.format_exc())
+                    ok = False
+                    continue
+                finally:
+                    stream(test_runner)
+                conn.send(("duration", _get_work_item_key(item),
+                           time.time() - begin_time))
+        finally:
+            test_runner.stop()
+        conn.send(("done", testbed_name, ok))
+    finally:
+        conn.close()
+
+def _run_tests_sharded(test_configs, test_identifiers, repeat=1,
+                       debug=False, reuse_controllers=False):
+    """Treats the testbeds as a pool and shards the run list across them.
+
+    Instead of every testbed running the full run list, work items are put
+    on a queue shared by one process per testbed, longest first according
+    to the durations recorded by previous sharded runs, and the results are
+    merged into one summary.
+
+    Args:
+        test_configs: A list of interchangeable testbed configurations.
+        test_identifiers: The parsed list of tests to run.
+        repeat: Number of times to execute each work item.
+        debug: If True, termination signals are not intercepted.
+        reuse_controllers: Whether controllers are kept across work items.
+
+    Returns:
+        False if any work item raised an unexpected error or the run was
+        interrupted, True otherwise.
+    """
+    _validate_testbed_pool(test_configs)
+    durations_path = _get_durations_path(test_configs[0])
+    durations = _load_durations(durations_path)
+    measured = dict(durations)
+    _add_history_durations(test_configs[0],
+                           _gen_work_items(test_identifiers), durations)
+    items = _gen_work_items(test_identifiers, repeat, durations)
+    print("Sharding {} work items across {} test beds.".format(
+        len(items), len(test_configs)))
+    work_queue = multiprocessing.Queue()
+    for item in items:
+        work_queue.put(item)
+    for _ in test_configs:
+        work_queue.put(None)
+    # Items nobody took, e.g. if all test beds failed, must not block exit.
+    work_queue.cancel_join_thread()
+    process_args = [(c, work_queue, reuse_controllers) for c in test_configs]
+    _, finished, new_durations, interrupted = _run_processes(
+        _run_test_pool_process, process_args, debug)
+    if new_durations:
+        # Only store measured durations, history estimates exclude
+        # setup_class and teardown_class.
+        measured.update(new_durations)
+        _save_durations(durations_path, measured)
+    if interrupted or len(finished) != len(test_configs):
+        return False
+    return all(finished.values())
 
 def _run_tests_sequential(process_args):
     ok = True
@@ -235,6 +662,38 @@ def _run_tests_sequential(process_args):
             ok = False
     return ok
 
+def _set_resume_log_paths(test_configs, log_paths):
+    """Assigns the log paths of the test runs to resume to the test bed
+    configs they were executed with.
+
+    Log paths are matched by the test bed name they are found under, i.e.
+    <logpath>/<test bed name>/<timestamp>. A single log path given for a
+    single test bed is used regardless of its location.
+
+    Args:
+        test_configs: A list of test bed configurations.
+        log_paths: A list of log directories of previous test runs.
+
+    Raises:
+        USERError is raised if a log path does not match any test bed.
+    """
+    tb_key = Config.key_testbed.value
+    name_key = Config.key_testbed_name.value
+    resume_key = Config.ikey_resume_log_path.value
+    # Resolve "latest" links now, the new test runs will move them.
+    log_paths = [os.path.realpath(abs_path(p)) for p in log_paths]
+    if len(test_configs) == 1 and len(log_paths) == 1:
+        test_configs[0][resume_key] = log_paths[0]
+        return
+    configs_by_name = {c[tb_key][name_key]: c for c in test_configs}
+    for log_path in log_paths:
+        name = os.path.basename(os.path.dirname(log_path))
+        if name not in configs_by_name:
+            raise USERError(("Log path %s does not belong to any of the test "
+                             "beds %s.") % (log_path,
+                                            sorted(configs_by_name)))
+        configs_by_name[name][resume_key] = log_path
+
 def _parse_test_file(fpath):
     try:
         with open(fpath, 'r') as f:
@@ -264,8 +723,24 @@ def main(argv):
     parser.add_argument('-d', '--debug', action="store_true",
         help=("Set this flag if manual debugging is required."))
     parser.add_argument('-p', '--parallel', action="store_true",
-        help=("If set, tests will be executed on all testbeds in parallel. "
+        help=("If set, tests will be executed on all testbeds in parallel, "
+              "one process per testbed. "
               "Otherwise, tests are executed iteratively testbed by testbed."))
+    parser.add_argument('-s', '--shard', action="store_true",
+        help=("If set, the test beds are treated as a pool of interchangeable "
+              "test beds and the test classes are distributed across them, "
+              "longest first, instead of each test bed running all of them."))
+    parser.add_argument('--reuse_controllers', action="store_true",
+        help=("If set, controller objects are created once per test bed and "
+              "kept across repeats, test classes and work items. They are "
+              "health checked before each run and only re-created if they "
+              "failed the check."))
+    parser.add_argument('--resume', nargs='+', type=str,
+        metavar="<LOG DIR>",
+        help=("Resume interrupted test runs from their log directories, e.g. "
+              "<logpath>/<test bed name>/latest. Tests completed in those "
+              "runs are not executed again and their results are merged into "
+              "the new ones."))
     parser.add_argument('-r', '--repeat', type=int,
         metavar="<NUMBER>",
         help="Number of times to run the specified test cases.")
@@ -296,12 +771,37 @@ def main(argv):
         sys.exit(1)
     # Prepare args for test runs
     test_identifiers = parse_test_list(test_list)
+    for c in parsed_configs:
+        c[Config.ikey_cli_args.value] = args.test_args
+    _print_history_forecast(parsed_configs[0], test_identifiers, repeat)
+    if args.resume:
+        try:
+            _set_resume_log_paths(parsed_configs, args.resume)
+        except USERError as e:
+            print("Cannot resume test runs.")
+            print(str(e))
+            sys.exit(1)
+    if args.shard and len(parsed_configs) > 1:
+        try:
+            exec_result = _run_tests_sharded(parsed_configs, test_identifiers,
+                                             repeat, args.debug,
+                                             args.reuse_controllers)
+        except USERError as e:
+            print("Cannot shard tests across the test beds.")
+            print(str(e))
+            sys.exit(1)
+        sys.exit(0 if exec_result else 1)
+    if args.parallel and len(parsed_configs) > 1:
+        # Test runners are created in their own processes.
+        exec_result = _run_tests_parallel(parsed_configs, test_identifiers,
+                                          repeat, args.debug,
+                                          args.reuse_controllers)
+        sys.exit(0 if exec_result else 1)
     test_runners = []
     process_args = []
     try:
         for c in parsed_configs:
-            c[Config.ikey_cli_args.value] = args.test_args
-            t = TestRunner(c, test_identifiers)
+            t = TestRunner(c, test_identifiers, args.reuse_controllers)
             test_runners.append(t)
             process_args.append((t, repeat))
     except:
@@ -314,10 +814,7 @@ def main(argv):
         signal.signal(signal.SIGTERM, handler)
         signal.signal(signal.SIGINT, handler)
     # Execute test runners.
-    if args.parallel and len(process_args) > 1:
-        exec_result = _run_tests_parallel(process_args)
-    else:
-        exec_result = _run_tests_sequential(process_args)
+    exec_result = _run_tests_sequential(process_args)
     if exec_result is False:
         sys.exit(1)
     sys.exit(0)
@@ -56,8 +56,12 @@ def main(FLAGS):
         # Have to sleep a bit here for monsoon to be ready to lower the rate of
         # socket read timeout.
         time.sleep(1)
-        result = mon.take_samples(FLAGS.hz, FLAGS.samples,
-            sample_offset=FLAGS.offset, live=True)
+        if FLAGS.output:
+            result = mon.take_samples_to_file(FLAGS.hz, FLAGS.samples,
+                FLAGS.output, sample_offset=FLAGS.offset, live=True)
+        else:
+            result = mon.take_samples(FLAGS.hz, FLAGS.samples,
+                sample_offset=FLAGS.offset, live=True)
         print(repr(result))
 
 if __name__ == '__main__':
@@ -84,6 +88,8 @@ if __name__ == '__main__':
         help="The serial number of the Monsoon to use.")
     parser.add_argument("--offset", type=int, nargs='?', default=0,
         help="The number of samples to discard when calculating average.")
+    parser.add_argument("-o", "--output", help=("Stream the samples to this "
+        "binary trace file instead of keeping them in memory."))
     parser.add_argument("-r", "--ramp", action="store_true", help=("Gradually "
         "increase voltage to prevent tripping Monsoon overvoltage"))
     args = parser.parse_args()
@@ -41,6 +41,36 @@ class SL4AProtocolError(SL4AException):
     NO_RESPONSE_FROM_SERVER = "No response from server."
     MISMATCHED_API_ID = "Mismatched API id."
 
+# RPCs known to only read the state of the device. Any other RPC is counted
+# as one that may change it.
+_READ_ONLY_RPCS = frozenset([
+    "connectivityCheckAirplaneMode",
+    "imsGetWfcMode",
+    "imsIsEnhanced4gLteModeSettingEnabledByPlatform",
+    "imsIsEnhanced4gLteModeSettingEnabledByUser",
+    "subscriptionGetAllSubInfoList",
+    "subscriptionGetDefaultDataSubId",
+    "subscriptionGetDefaultSmsSubId",
+    "subscriptionGetDefaultSubId",
+    "subscriptionGetDefaultVoiceSubId",
+    "telecomCallGetCallIds",
+    "telecomGetCallState",
+    "telecomIsInCall",
+    "telecomIsRinging",
+    "telephonyGetCallState",
+    "telephonyGetCallStateForSubscription",
+    "telephonyGetCurrentDataNetworkTypeForSubscription",
+    "telephonyGetCurrentVoiceNetworkTypeForSubscription",
+    "telephonyGetDataConnectionState",
+    "telephonyGetNetworkTypeForSubscription",
+    "telephonyGetSimOperatorForSubscription",
+    "telephonyGetSimSerialNumberForSubscription",
+    "telephonyIsImsRegistered",
+    "telephonyIsVideoCallingAvailable",
+    "telephonyIsVolteAvailable",
+    "telephonyIsWifiCallingAvailable",
+])
+
 def IDCounter():
     i = 0
     while True:
@@ -56,6 +86,10 @@ class Android(object):
         self.lock = threading.RLock()
         self.client = None  # prevent close errors on connect failure
         self.uid = None
+        # Number of RPCs sent that may have changed the state of the device,
+        # so callers caching the state can tell when it may be stale. It
+        # does not see changes made by anything but this session.
+        self.state_changing_rpc_count = 0
         timeout_time = time.time() + self._SOCKET_CONNECT_TIMEOUT
         while True:
             try:
@@ -91,6 +125,15 @@ class Android(object):
             self.conn.close()
             self.conn = None
 
+    def _abort(self):
+        """Closes the connection even while the client still uses it."""
+        if self.conn is not None:
+            try:
+                self.conn.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+        self.close()
+
     def _cmd(self, command, uid=None):
         if not uid:
             uid = self.uid
@@ -100,26 +143,62 @@ class Android(object):
         self.client.flush()
         return self.client.readline()
 
-    def _rpc(self, method, *args):
-        self.lock.acquire()
+    def _send_request(self, method, args):
         apiid = next(Android.COUNTER)
-        self.lock.release()
+        if method not in _READ_ONLY_RPCS:
+            self.state_changing_rpc_count += 1
         data = {'id': apiid,
                 'method': method,
                 'params': args}
         request = json.dumps(data)
         self.client.write(request.encode("utf8")+b'\n')
-        self.client.flush()
+        return apiid
+
+    def _read_response(self, apiid):
         response = self.client.readline()
         if not response:
             raise SL4AProtocolError(SL4AProtocolError.NO_RESPONSE_FROM_SERVER)
         result = json.loads(str(response, encoding="utf8"))
-        if result['error']:
-            raise SL4AAPIError(result['error'])
         if result['id'] != apiid:
             raise SL4AProtocolError(SL4AProtocolError.MISMATCHED_API_ID)
+        return result
+
+    def _rpc(self, method, *args):
+        with self.lock:
+            apiid = self._send_request(method, args)
+            self.client.flush()
+            result = self._read_response(apiid)
+        if result['error']:
+            raise SL4AAPIError(result['error'])
         return result['result']
 
+    def rpc_batch(self, calls):
+        """Makes several RPCs in a single round trip.
+
+        All the requests are sent before reading any response, which sl4a
+        answers in order.
+
+        Args:
+            calls: A list of (method name, argument tuple) tuples.
+
+        Returns:
+            A list with the result of each call, or the SL4AAPIError it
+            failed with.
+        """
+        with self.lock:
+            try:
+                apiids = [self._send_request(method, args)
+                          for method, args in calls]
+                self.client.flush()
+                results = [self._read_response(apiid) for apiid in apiids]
+            except Exception:
+                # The responses left unread would be taken for the responses
+                # of the next RPCs, so the session can no longer be used.
+                self._abort()
+                raise
+        return [SL4AAPIError(result['error']) if result['error']
+                else result['result'] for result in results]
+
     def __getattr__(self, name):
         def rpc_call(*args):
             return self._rpc(name, *args)
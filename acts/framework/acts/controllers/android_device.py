@@ -23,6 +23,7 @@ import traceback
 
 from acts import logger as acts_logger
 from acts import signals
+from acts import tracing
 from acts import utils
 from acts.controllers import adb
 from acts.controllers import android
@@ -63,17 +64,18 @@ def create(configs, logger):
         if ad.serial not in connected_ads:
             raise DoesNotExistError(("Android device %s is specified in config"
                                      " but is not attached.") % ad.serial)
-        ad.start_adb_logcat()
-        try:
-            ad.get_droid()
-            ad.ed.start()
-        except:
-            # This exception is logged here to help with debugging under py2,
-            # because "exception raised while processing another exception" is
-            # only printed under py3.
-            msg = "Failed to start sl4a on %s" % ad.serial
-            logger.exception(msg)
-            raise AndroidDeviceError(msg)
+        with tracing.span("setup %s" % ad.serial, "device"):
+            ad.start_adb_logcat()
+            try:
+                ad.get_droid()
+                ad.ed.start()
+            except:
+                # This exception is logged here to help with debugging under
+                # py2, because "exception raised while processing another
+                # exception" is only printed under py3.
+                msg = "Failed to start sl4a on %s" % ad.serial
+                logger.exception(msg)
+                raise AndroidDeviceError(msg)
     return ads
 
 def destroy(ads):
@@ -85,6 +87,28 @@ def destroy(ads):
         if ad.adb_logcat_process:
             ad.stop_adb_logcat()
 
+def health_check(ads):
+    """Checks whether AndroidDevice objects kept from a previous test run can
+    be used again.
+
+    Args:
+        ads: A list of AndroidDevice objects.
+
+    Returns:
+        False if any device is no longer attached, or lost its sl4a session or
+        adb logcat collection, True otherwise.
+    """
+    connected_ads = list_adb_devices()
+    for ad in ads:
+        if ad.serial not in connected_ads:
+            ad.log.warning("Device %s is no longer attached.", ad.serial)
+            return False
+        if not ad.droid or not ad.is_adb_logcat_on:
+            ad.log.warning("Device %s lost its sl4a session or adb logcat.",
+                           ad.serial)
+            return False
+    return True
+
 def _parse_device_list(device_list_str, key):
     """Parses a byte string representing a list of devices. The string is
     generated by calling either adb or fastboot.
@@ -337,6 +361,13 @@ class AndroidDevice:
             model = out.decode("utf-8").strip().split('[')[-1][:-1].lower()
             return model
 
+    @property
+    def build_id(self):
+        """The build id of the software running on the device.
+        """
+        out = self.adb.shell("getprop ro.build.id")
+        return out.decode("utf-8").strip()
+
     @property
     def droid(self):
         """The first sl4a session initiated on this device. None if there isn't
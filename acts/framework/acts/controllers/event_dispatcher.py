@@ -46,7 +46,14 @@ class EventDispatcher:
         self.poller = None
         self.event_dict = {}
         self.handlers = {}
+        # Functions called with every event received, replaced rather than
+        # modified so the poller can iterate without the lock.
+        self.listeners = ()
         self.lock = threading.RLock()
+        # Number of events received per event name, for waiting on new
+        # events without popping them.
+        self.event_counts = {}
+        self.event_received = threading.Condition(self.lock)
 
     def poll_events(self):
         """Continuously polls all types of events from sl4a.
@@ -73,6 +80,12 @@ class EventDispatcher:
                 continue
             else:
                 event_name = event_obj['name']
+            for listener in self.listeners:
+                try:
+                    listener(event_obj)
+                except Exception:
+                    print("Exception happened in event listener.")
+                    print(traceback.format_exc())
             # if handler registered, process event
             if event_name in self.handlers:
                 self.handle_subscribed_event(event_obj, event_name)
@@ -87,6 +100,9 @@ class EventDispatcher:
                     q = queue.Queue()
                     q.put(event_obj)
                     self.event_dict[event_name] = q
+                self.event_counts[event_name] = self.event_counts.get(
+                    event_name, 0) + 1
+                self.event_received.notify_all()
                 self.lock.release()
 
     def register_handler(self, handler, event_name, args):
@@ -117,6 +133,29 @@ class EventDispatcher:
         finally:
             self.lock.release()
 
+    def add_listener(self, listener):
+        """Adds a function to call with every event received.
+
+        Unlike handlers, listeners can be added while the dispatcher runs,
+        and the events are still stored for pop_event. Listeners are called
+        from the polling thread, so they must return quickly.
+
+        Args:
+            listener: A function that takes an event.
+        """
+        with self.lock:
+            self.listeners = self.listeners + (listener,)
+
+    def remove_listener(self, listener):
+        """Removes a function added with add_listener, if it was added.
+
+        Args:
+            listener: The function to remove.
+        """
+        with self.lock:
+            self.listeners = tuple(l for l in self.listeners
+                                   if l != listener)
+
     def start(self):
         """Starts the event dispatcher.
 
@@ -238,6 +277,79 @@ class EventDispatcher:
                     'Timeout after {}s waiting for event: {}'.format(
                         timeout, event_name))
 
+    def get_event_count(self, event_names):
+        """Gets how many events of the specified names have been received.
+
+        Args:
+            event_names: A list of event names.
+
+        Returns:
+            The total number of events of these names received so far.
+        """
+        with self.lock:
+            return sum(self.event_counts.get(name, 0) for name in event_names)
+
+    def wait_for_new_events(self, event_names, count, timeout):
+        """Waits until more events of the specified names than count have
+        been received.
+
+        Unlike pop_event, this does not remove any event, so it can be used
+        to get notified of changes while other code consumes the events.
+
+        Args:
+            event_names: A list of event names.
+            count: An event count previously returned by get_event_count.
+            timeout: Number of seconds to wait.
+
+        Returns:
+            The new total number of events of these names, equal to count if
+            the wait timed out.
+        """
+        deadline = time.time() + timeout
+        with self.event_received:
+            while True:
+                new_count = self.get_event_count(event_names)
+                remaining = deadline - time.time()
+                if new_count != count or remaining <= 0:
+                    return new_count
+                self.event_received.wait(remaining)
+
+    def pop_matching_events(self, event_name, predicate, *args, **kwargs):
+        """Pops the stored events of a name that satisfy a predicate.
+
+        Unlike wait_for_event, the events that do not satisfy the predicate
+        are kept in their queue, in order, so other code waiting for them
+        still gets them. The predicate is called on the events in the order
+        they were received, so it may keep state across events, like the
+        parts of a multipart message received so far.
+
+        Args:
+            event_name: Name of the events to be popped.
+            predicate: A function that takes an event and returns True if the
+                event should be popped, False otherwise.
+            *args: Optional positional args passed to predicate().
+            **kwargs: Optional keyword args passed to predicate().
+
+        Returns:
+            A list of the popped events, oldest first.
+        """
+        matched = []
+        with self.lock:
+            e_queue = self.get_event_q(event_name)
+            kept = []
+            while True:
+                try:
+                    event = e_queue.get(False)
+                except queue.Empty:
+                    break
+                if predicate(event, *args, **kwargs):
+                    matched.append(event)
+                else:
+                    kept.append(event)
+            for event in kept:
+                e_queue.put(event)
+        return matched
+
     def pop_events(self, regex_pattern, timeout):
         """Pop events whose names match a regex pattern.
 
@@ -26,7 +26,7 @@ ACTS_CONTROLLER_CONFIG_NAME = "IPerfServer"
 ACTS_CONTROLLER_REFERENCE_NAME = "iperf_servers"
 
 def create(configs, logger):
-    log_path = os.path.dirname(logger.handlers[1].baseFilename)
+    log_path = logger.log_path
     results = []
     for c in configs:
         try:
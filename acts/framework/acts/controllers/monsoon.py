@@ -21,11 +21,16 @@
 _new_author_ = 'angli@google.com (Ang Li)'
 _author_ = 'kens@google.com (Ken Shirriff)'
 
+import array
+import bisect
 import fcntl
+import json
+import math
 import os
 import select
 import struct
 import sys
+import threading
 import time
 import traceback
 import collections
@@ -52,6 +57,18 @@ def create(configs, logger):
 def destroy(objs):
     return
 
+def health_check(objs):
+    """Checks whether Monsoon objects kept from a previous test run can be
+    used again.
+
+    Returns:
+        False if any Monsoon does not respond to a status request.
+    """
+    for m in objs:
+        if not m.status:
+            return False
+    return True
+
 class MonsoonError(acts.signals.ControllerError):
     """Raised for exceptions encountered in monsoon lib."""
 
@@ -69,6 +86,24 @@ class MonsoonProxy:
 
     See http://wiki/Main/MonsoonProtocol for information on the protocol.
     """
+    # status packet format
+    STATUS_FORMAT = ">BBBhhhHhhhHBBBxBbHBHHHHBbbHHBBBbbbbbbbbbBH"
+    STATUS_FIELDS = [
+            "packetType", "firmwareVersion", "protocolVersion",
+            "mainFineCurrent", "usbFineCurrent", "auxFineCurrent",
+            "voltage1", "mainCoarseCurrent", "usbCoarseCurrent",
+            "auxCoarseCurrent", "voltage2", "outputVoltageSetting",
+            "temperature", "status", "leds", "mainFineResistor",
+            "serialNumber", "sampleRate", "dacCalLow", "dacCalHigh",
+            "powerUpCurrentLimit", "runTimeCurrentLimit", "powerUpTime",
+            "usbFineResistor", "auxFineResistor",
+            "initialUsbVoltage", "initialAuxVoltage",
+            "hardwareRevision", "temperatureLimit", "usbPassthroughMode",
+            "mainCoarseResistor", "usbCoarseResistor", "auxCoarseResistor",
+            "defMainFineResistor", "defUsbFineResistor",
+            "defAuxFineResistor", "defMainCoarseResistor",
+            "defUsbCoarseResistor", "defAuxCoarseResistor", "eventCode",
+            "eventData", ]
 
     def __init__(self, device=None, serialno=None, wait=1):
         """Establish a connection to a Monsoon.
@@ -143,24 +178,8 @@ class MonsoonProxy:
         Returns:
             status dictionary.
         """
-        # status packet format
-        STATUS_FORMAT = ">BBBhhhHhhhHBBBxBbHBHHHHBbbHHBBBbbbbbbbbbBH"
-        STATUS_FIELDS = [
-                "packetType", "firmwareVersion", "protocolVersion",
-                "mainFineCurrent", "usbFineCurrent", "auxFineCurrent",
-                "voltage1", "mainCoarseCurrent", "usbCoarseCurrent",
-                "auxCoarseCurrent", "voltage2", "outputVoltageSetting",
-                "temperature", "status", "leds", "mainFineResistor",
-                "serialNumber", "sampleRate", "dacCalLow", "dacCalHigh",
-                "powerUpCurrentLimit", "runTimeCurrentLimit", "powerUpTime",
-                "usbFineResistor", "auxFineResistor",
-                "initialUsbVoltage", "initialAuxVoltage",
-                "hardwareRevision", "temperatureLimit", "usbPassthroughMode",
-                "mainCoarseResistor", "usbCoarseResistor", "auxCoarseResistor",
-                "defMainFineResistor", "defUsbFineResistor",
-                "defAuxFineResistor", "defMainCoarseResistor",
-                "defUsbCoarseResistor", "defAuxCoarseResistor", "eventCode",
-                "eventData", ]
+        STATUS_FORMAT = self.STATUS_FORMAT
+        STATUS_FIELDS = self.STATUS_FIELDS
 
         self._SendStruct("BBB", 0x01, 0x00, 0x00)
         while 1:  # Keep reading, discarding non-status packets
@@ -376,20 +395,26 @@ class MonsoonData:
     sr = 6
     # Delimiter for writing multiple MonsoonData objects to text file.
     delimiter = "\n\n==========\n\n"
+    # Prefix of the marker lines in the text representation.
+    marker_prefix = "Marker"
 
-    def __init__(self, data_points, timestamps, hz, voltage, offset=0):
+    def __init__(self, data_points, timestamps, hz, voltage, offset=0,
+                 markers=None):
         """Instantiates a MonsoonData object.
 
         Args:
             data_points: A list of current values in Amp (float).
-            timestamps: A list of epoch timestamps (int).
+            timestamps: A list of epoch timestamps in seconds (float).
             hz: The hertz at which the data points are measured.
             voltage: The voltage at which the data points are measured.
             offset: The number of initial data points to discard
                 in calculations.
+            markers: A list of (timestamp, name) tuples marking test events
+                that happened during the measurement.
         """
         self._data_points = data_points
         self._timestamps = timestamps
+        self.markers = sorted(markers or [], key=lambda m: m[0])
         self.offset = offset
         num_of_data_pt = len(self._data_points)
         if self.offset >= num_of_data_pt:
@@ -400,6 +425,7 @@ class MonsoonData:
         self.hz = hz
         self.voltage = voltage
         self.tag = None
+        self._pyramid = None
         self._validate_data()
 
     @property
@@ -448,21 +474,26 @@ class MonsoonData:
                       lines[5] != "Time" + ' ' * 7 + "Amp"]
         if any(conditions):
             raise MonsoonError(err_msg)
-        hz_str = lines[4].split()[2]
-        hz = int(hz_str[:-2])
+        hz_str = lines[4].split()[4]
+        hz = int(hz_str[:-3])
         voltage_str = lines[2].split()[1]
-        voltage = int(voltage[:-1])
+        voltage = float(voltage_str[:-2])
         lines = lines[6:]
         t = []
         v = []
+        markers = []
         for l in lines:
             try:
+                if l.startswith(MonsoonData.marker_prefix):
+                    _, timestamp, name = l.split(' ', 2)
+                    markers.append((float(timestamp), name))
+                    continue
                 timestamp, value = l.split(' ')
-                t.append(int(timestamp))
+                t.append(float(timestamp))
                 v.append(float(value))
             except ValueError:
                 raise MonsoonError(err_msg)
-        return MonsoonData(v, t, hz, voltage)
+        return MonsoonData(v, t, hz, voltage, markers=markers)
 
     @staticmethod
     def save_to_text_file(monsoon_data, file_path):
@@ -522,6 +553,23 @@ class MonsoonData:
         self.offset = new_offset
         self.data_points = self._data_points[self.offset:]
         self.timestamps = self._timestamps[self.offset:]
+        self._pyramid = None
+
+    def get_pyramid(self):
+        """Gets the multi-resolution summary of the data points, to answer
+        range queries and downsample for plotting without going through every
+        data point.
+
+        The summary is built the first time this is called.
+
+        Returns:
+            A MonsoonTracePyramid object.
+        """
+        if not self._pyramid:
+            self._pyramid = MonsoonTracePyramid.build(
+                self.timestamps[0] if self.timestamps else 0, self.hz,
+                [self.data_points], lambda i, j: self.data_points[i:j])
+        return self._pyramid
 
     def get_data_with_timestamps(self):
         """Returns the data points with timestamps.
@@ -534,6 +582,31 @@ class MonsoonData:
             result.append(t, round(d, self.lr))
         return result
 
+    def get_segments(self):
+        """Splits the data points into segments delimited by the markers.
+
+        Each segment starts at a marker and ends at the next marker, or at the
+        end of the data for the last marker. Data points within the offset
+        are not part of any segment.
+
+        Returns:
+            A list of MonsoonSegment objects, one per marker.
+        """
+        segments = []
+        for i, (begin, name) in enumerate(self.markers):
+            end = None
+            if i + 1 < len(self.markers):
+                end = self.markers[i + 1][0]
+            segment = MonsoonSegment(name, begin, end, self.hz, self.voltage)
+            start_idx = bisect.bisect_left(self.timestamps, begin)
+            end_idx = len(self.timestamps)
+            if end is not None:
+                end_idx = bisect.bisect_left(self.timestamps, end)
+            for d in self.data_points[start_idx:end_idx]:
+                segment.stats.add(d)
+            segments.append(segment)
+        return segments
+
     def get_average_record(self, n):
         """Returns a list of average current numbers, each representing the
         average over the last n data points.
@@ -576,6 +649,8 @@ class MonsoonData:
         strs = []
         strs.append(self._header())
         strs.append("Time" + ' ' * 7 + "Amp")
+        for t, name in self.markers:
+            strs.append("{} {} {}".format(self.marker_prefix, t, name))
         for t, d in zip(self.timestamps, self.data_points):
             strs.append("{} {}".format(t, round(d, self.sr)))
         return "\n".join(strs)
@@ -583,9 +658,696 @@ class MonsoonData:
     def __repr__(self):
         return self._header()
 
+class MonsoonStats:
+    """Running aggregates of a stream of current values.
+
+    Values are folded in one at a time, so the memory used does not depend on
+    the number of values seen.
+
+    Attributes:
+        count: Number of values seen.
+        total: Sum of the values seen, in Amp.
+        min_value: Smallest value seen, in Amp. None if no value was seen.
+        max_value: Largest value seen, in Amp. None if no value was seen.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min_value = None
+        self.max_value = None
+
+    def add(self, value):
+        """Folds one current value into the aggregates.
+
+        Args:
+            value: A current value in Amp.
+        """
+        self.count += 1
+        self.total += value
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if self.max_value is None or value > self.max_value:
+            self.max_value = value
+
+    @property
+    def mean(self):
+        """Mean of the values seen in Amp, 0 if no value was seen.
+        """
+        if not self.count:
+            return 0
+        return self.total / self.count
+
+
+class MonsoonSegment:
+    """The part of a measurement between a marker and the next one.
+
+    Attributes:
+        name: The name of the marker this segment starts at.
+        begin_time: The timestamp of the marker this segment starts at.
+        end_time: The timestamp of the next marker, None if this segment lasts
+            until the end of the measurement.
+        hz: The hertz at which the data points are measured.
+        voltage: The voltage at which the data points are measured.
+        stats: A MonsoonStats of the data points in this segment.
+    """
+
+    def __init__(self, name, begin_time, end_time, hz, voltage):
+        self.name = name
+        self.begin_time = begin_time
+        self.end_time = end_time
+        self.hz = hz
+        self.voltage = voltage
+        self.stats = MonsoonStats()
+
+    @property
+    def average_current(self):
+        """Average current in the unit of mA.
+        """
+        return round(self.stats.mean * 1000, MonsoonData.sr)
+
+    @property
+    def total_charge(self):
+        """Total charged used in the unit of mAh.
+        """
+        charge = (self.stats.total / self.hz) * 1000 / 3600
+        return round(charge, MonsoonData.sr)
+
+    @property
+    def total_power(self):
+        """Total power used.
+        """
+        return round(self.average_current * self.voltage, MonsoonData.sr)
+
+    def __len__(self):
+        return self.stats.count
+
+    def __repr__(self):
+        return "%s: %d samples, average current %smA." % (
+            self.name, len(self), self.average_current)
+
+
+class MonsoonTraceWriter:
+    """Streams monsoon samples to an append-only binary trace file.
+
+    Samples are buffered and written in fixed-size chunks, so the memory used
+    is bounded by the chunk size regardless of the capture length. Running
+    aggregates are kept so the summary of a capture is available without
+    reading the file back.
+
+    The file starts with a header packed as HEADER_FORMAT, followed by one
+    RECORD_FORMAT record, (timestamp, current in Amp), per sample. Markers are
+    appended to a json lines file next to it, named file_path + MARKER_SUFFIX.
+
+    Attributes:
+        file_path: The full path of the trace file.
+        hz: The hertz at which the samples are measured.
+        voltage: The voltage at which the samples are measured.
+        offset: The number of initial samples excluded from the aggregates.
+        chunk_size: The number of samples buffered before each write.
+        num_samples: The number of samples appended so far.
+        stats: A MonsoonStats of the samples after offset.
+        markers: A list of (timestamp, name) tuples of the markers added.
+        segments: A list of MonsoonSegment objects, one per marker, with the
+            stats of the samples after offset.
+        tag: A string that's the name of the collected data group.
+    """
+    MAGIC = b"MSNT"
+    VERSION = 1
+    # magic, version, hz, offset, voltage
+    HEADER_FORMAT = "<4sHIId"
+    # timestamp, current in Amp
+    RECORD_FORMAT = "<dd"
+    MARKER_SUFFIX = ".markers"
+    default_chunk_size = 4096
+
+    def __init__(self, file_path, hz, voltage, offset=0,
+                 chunk_size=default_chunk_size):
+        if chunk_size <= 0:
+            raise MonsoonError("Chunk size (%d) must be positive." % chunk_size)
+        self.file_path = file_path
+        self.hz = hz
+        self.voltage = voltage
+        self.offset = offset
+        self.chunk_size = chunk_size
+        self.num_samples = 0
+        self.stats = MonsoonStats()
+        self.markers = []
+        self.segments = []
+        self.tag = None
+        self._chunk = []
+        self._marker_f = None
+        utils.create_dir(os.path.dirname(file_path))
+        self._f = open(file_path, "wb")
+        self._f.write(struct.pack(self.HEADER_FORMAT, self.MAGIC, self.VERSION,
+                                  hz, offset, voltage))
+        self._f.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def append(self, timestamp, current):
+        """Appends one sample to the trace.
+
+        Args:
+            timestamp: The time the sample was taken at.
+            current: The measured current in Amp.
+        """
+        self._chunk.append(timestamp)
+        self._chunk.append(current)
+        if self.num_samples >= self.offset:
+            self.stats.add(current)
+            if self.segments:
+                self.segments[-1].stats.add(current)
+        self.num_samples += 1
+        if len(self._chunk) >= 2 * self.chunk_size:
+            self.flush()
+
+    def mark(self, timestamp, name):
+        """Adds a marker to the trace.
+
+        Markers have to be added in time order, before the samples that come
+        after them are appended.
+
+        Args:
+            timestamp: The time the marked event happened at.
+            name: A string that's the name of the marked event.
+        """
+        if self.segments:
+            self.segments[-1].end_time = timestamp
+        self.markers.append((timestamp, name))
+        self.segments.append(MonsoonSegment(name, timestamp, None, self.hz,
+                                            self.voltage))
+        if not self._marker_f:
+            self._marker_f = open(self.file_path + self.MARKER_SUFFIX, "w")
+        self._marker_f.write(json.dumps([timestamp, name]) + "\n")
+        self._marker_f.flush()
+
+    def get_segments(self):
+        """Gets the segments of the trace, delimited by the markers.
+
+        Returns:
+            A list of MonsoonSegment objects, one per marker.
+        """
+        return list(self.segments)
+
+    def flush(self):
+        """Writes the buffered samples to the trace file.
+
+        After this returns, the samples are visible to MonsoonTraceReader.
+        """
+        if not self._chunk:
+            return
+        self._f.write(struct.pack("<%dd" % len(self._chunk), *self._chunk))
+        self._f.flush()
+        self._chunk = []
+
+    def close(self):
+        """Flushes the remaining samples and closes the trace file.
+        """
+        if self._f.closed:
+            return
+        self.flush()
+        self._f.close()
+        if self._marker_f:
+            self._marker_f.close()
+
+    @property
+    def average_current(self):
+        """Average current in the unit of mA.
+        """
+        return round(self.stats.mean * 1000, MonsoonData.sr)
+
+    @property
+    def total_charge(self):
+        """Total charged used in the unit of mAh.
+        """
+        charge = (self.stats.total / self.hz) * 1000 / 3600
+        return round(charge, MonsoonData.sr)
+
+    @property
+    def total_power(self):
+        """Total power used.
+        """
+        return round(self.average_current * self.voltage, MonsoonData.sr)
+
+    def __len__(self):
+        return self.stats.count
+
+    def __repr__(self):
+        strs = [""]
+        strs.append(self.tag or "Monsoon Measurement Data")
+        strs.append("Average Current: {}mA.".format(self.average_current))
+        strs.append("Voltage: {}V.".format(self.voltage))
+        strs.append("Total Power: {}mW.".format(self.total_power))
+        strs.append(("{} samples taken at {}Hz, with an offset of {} samples."
+                    ).format(self.num_samples, self.hz, self.offset))
+        strs.append("Trace file: {}".format(self.file_path))
+        return "\n".join(strs)
+
+
+class MonsoonTraceReader:
+    """Reads a binary trace file written by MonsoonTraceWriter.
+
+    Only complete records are read, so a trace can be read while the capture
+    writing it is still going on. Each read picks up where the previous one
+    left off.
+
+    Attributes:
+        file_path: The full path of the trace file.
+        hz: The hertz at which the samples are measured.
+        voltage: The voltage at which the samples are measured.
+        offset: The number of initial samples to discard in calculations.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        header_size = struct.calcsize(MonsoonTraceWriter.HEADER_FORMAT)
+        self._record_size = struct.calcsize(MonsoonTraceWriter.RECORD_FORMAT)
+        self._f = open(file_path, "rb")
+        header = self._f.read(header_size)
+        if len(header) != header_size:
+            self._f.close()
+            raise MonsoonError("Trace file %s has no valid header." %
+                               file_path)
+        magic, version, self.hz, self.offset, self.voltage = struct.unpack(
+            MonsoonTraceWriter.HEADER_FORMAT, header)
+        if magic != MonsoonTraceWriter.MAGIC:
+            self._f.close()
+            raise MonsoonError("%s is not a monsoon trace file." % file_path)
+        if version != MonsoonTraceWriter.VERSION:
+            self._f.close()
+            raise MonsoonError("Unsupported monsoon trace version %d in %s." %
+                               (version, file_path))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._f.close()
+
+    def num_available(self):
+        """Returns the number of complete samples in the file that have not
+        been read yet.
+        """
+        pos = self._f.tell()
+        size = os.fstat(self._f.fileno()).st_size
+        return (size - pos) // self._record_size
+
+    def read_markers(self):
+        """Reads the markers added to the trace so far.
+
+        Returns:
+            A list of (timestamp, name) tuples.
+        """
+        markers = []
+        marker_path = self.file_path + MonsoonTraceWriter.MARKER_SUFFIX
+        if not os.path.exists(marker_path):
+            return markers
+        with open(marker_path, "r") as f:
+            for line in f:
+                # Skip a line that is still being written.
+                if not line.endswith("\n"):
+                    break
+                timestamp, name = json.loads(line)
+                markers.append((timestamp, name))
+        return markers
+
+    def iter_chunks(self, chunk_size=MonsoonTraceWriter.default_chunk_size):
+        """Reads the samples that are in the file at the time of the call.
+
+        Samples appended to the file later can be read by calling this again.
+
+        Args:
+            chunk_size: The max number of samples in each chunk.
+
+        Yields:
+            Lists of (timestamp, current in Amp) tuples.
+        """
+        remaining = self.num_available()
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+            raw = self._f.read(n * self._record_size)
+            values = struct.unpack("<%dd" % (2 * n), raw)
+            yield list(zip(values[0::2], values[1::2]))
+            remaining -= n
+
+    def read_samples(self, begin, end):
+        """Reads the samples with indexes in [begin, end), without moving the
+        position iter_chunks reads from.
+
+        Args:
+            begin: The index of the first sample to read.
+            end: The index to stop reading at.
+
+        Returns:
+            A list of (timestamp, current in Amp) tuples.
+        """
+        header_size = struct.calcsize(MonsoonTraceWriter.HEADER_FORMAT)
+        raw = os.pread(self._f.fileno(), (end - begin) * self._record_size,
+                       header_size + begin * self._record_size)
+        n = len(raw) // self._record_size
+        values = struct.unpack("<%dd" % (2 * n), raw[:n * self._record_size])
+        return list(zip(values[0::2], values[1::2]))
+
+    def get_pyramid(self):
+        """Gets the multi-resolution summary of the samples after offset in
+        the trace.
+
+        The summary is persisted next to the trace file. It is loaded from
+        there if it is up to date, or built and saved otherwise.
+
+        Returns:
+            A MonsoonTracePyramid object.
+        """
+        offset = self.offset
+        num_samples = self.num_samples()
+
+        def read_values(i, j):
+            return [v for _, v in self.read_samples(offset + i, offset + j)]
+
+        pyramid_path = self.file_path + MonsoonTracePyramid.FILE_SUFFIX
+        if os.path.exists(pyramid_path):
+            try:
+                pyramid = MonsoonTracePyramid.load(pyramid_path, read_values)
+                if pyramid.num_samples == num_samples - offset:
+                    return pyramid
+            except (MonsoonError, struct.error):
+                pass
+        chunk_size = MonsoonTraceWriter.default_chunk_size
+        begin_time = 0
+        if num_samples > offset:
+            begin_time = self.read_samples(offset, offset + 1)[0][0]
+        chunks = (read_values(i, min(i + chunk_size, num_samples - offset))
+                  for i in range(0, num_samples - offset, chunk_size))
+        pyramid = MonsoonTracePyramid.build(begin_time, self.hz, chunks,
+                                            read_values)
+        pyramid.save(pyramid_path)
+        return pyramid
+
+    def num_samples(self):
+        """Returns the number of complete samples in the file.
+        """
+        header_size = struct.calcsize(MonsoonTraceWriter.HEADER_FORMAT)
+        size = os.fstat(self._f.fileno()).st_size
+        return (size - header_size) // self._record_size
+
+    def to_monsoon_data(self):
+        """Loads all the samples in the trace file into memory.
+
+        Returns:
+            A MonsoonData object with the samples of this trace.
+        """
+        timestamps = []
+        currents = []
+        self._f.seek(struct.calcsize(MonsoonTraceWriter.HEADER_FORMAT))
+        for chunk in self.iter_chunks():
+            for t, v in chunk:
+                timestamps.append(t)
+                currents.append(v)
+        return MonsoonData(currents, timestamps, self.hz, self.voltage,
+                           offset=self.offset, markers=self.read_markers())
+
+
+class MonsoonTracePyramid:
+    """A multi-resolution summary of a power trace.
+
+    Each level splits the trace into bins of a fixed number of samples and
+    keeps the min, max and sum of the current values in each bin. Range
+    queries combine the coarsest bins that fit with finer ones at the edges,
+    and only read the raw samples for the few at the very edges, so they take
+    a bounded amount of work regardless of the length of the trace.
+
+    Samples are assumed to be evenly spaced at hz, which holds for the traces
+    taken by Monsoon, so a timestamp maps directly to a sample index.
+
+    Attributes:
+        begin_time: The timestamp of the first sample.
+        hz: The hertz at which the samples are measured.
+        num_samples: The number of samples in the trace.
+        levels: A list of (factor, mins, maxs, sums) tuples, finest first.
+            factor is the number of samples per bin, the others are arrays
+            with one value per bin.
+    """
+    MAGIC = b"MSNP"
+    VERSION = 1
+    # magic, version, begin time, hz, number of samples, number of levels
+    HEADER_FORMAT = "<4sHddQB"
+    # factor, number of bins
+    LEVEL_FORMAT = "<IQ"
+    FILE_SUFFIX = ".pyramid"
+    default_factors = (10, 100, 1000)
+
+    def __init__(self, begin_time, hz, num_samples, levels, read_values):
+        """
+        Args:
+            begin_time: The timestamp of the first sample.
+            hz: The hertz at which the samples are measured.
+            num_samples: The number of samples in the trace.
+            levels: A list of (factor, mins, maxs, sums) tuples, finest first.
+            read_values: A function that takes a begin and an end sample
+                index, and returns the list of raw current values in between.
+        """
+        self.begin_time = begin_time
+        self.hz = hz
+        self.num_samples = num_samples
+        self.levels = levels
+        self._read_values = read_values
+
+    @classmethod
+    def build(cls, begin_time, hz, chunks, read_values,
+              factors=default_factors):
+        """Builds a pyramid in one pass over the samples of a trace.
+
+        Args:
+            begin_time: The timestamp of the first sample.
+            hz: The hertz at which the samples are measured.
+            chunks: An iterable of lists of current values, in order.
+            read_values: See __init__.
+            factors: The number of samples per bin of each level, finest
+                first. Each factor has to divide the next one.
+
+        Returns:
+            A MonsoonTracePyramid object.
+        """
+        for finer, coarser in zip(factors, factors[1:]):
+            if coarser % finer:
+                raise MonsoonError(("Pyramid factor %d does not divide %d."
+                    ) % (finer, coarser))
+        num_samples = 0
+        mins, maxs, sums = array.array("d"), array.array("d"), array.array("d")
+        f = factors[0]
+        pending = []
+        for chunk in chunks:
+            num_samples += len(chunk)
+            pending.extend(chunk)
+            full = len(pending) - len(pending) % f
+            for i in range(0, full, f):
+                values = pending[i:i + f]
+                mins.append(min(values))
+                maxs.append(max(values))
+                sums.append(sum(values))
+            pending = pending[full:]
+        if pending:
+            mins.append(min(pending))
+            maxs.append(max(pending))
+            sums.append(sum(pending))
+        levels = [(f, mins, maxs, sums)]
+        for finer, coarser in zip(factors, factors[1:]):
+            ratio = coarser // finer
+            _, f_mins, f_maxs, f_sums = levels[-1]
+            mins, maxs, sums = (array.array("d"), array.array("d"),
+                                array.array("d"))
+            for i in range(0, len(f_sums), ratio):
+                mins.append(min(f_mins[i:i + ratio]))
+                maxs.append(max(f_maxs[i:i + ratio]))
+                sums.append(sum(f_sums[i:i + ratio]))
+            levels.append((coarser, mins, maxs, sums))
+        return cls(begin_time, hz, num_samples, levels, read_values)
+
+    def save(self, file_path):
+        """Writes the pyramid to a file.
+
+        Args:
+            file_path: The full path of the file to write to.
+        """
+        with open(file_path, "wb") as f:
+            f.write(struct.pack(self.HEADER_FORMAT, self.MAGIC, self.VERSION,
+                                self.begin_time, self.hz, self.num_samples,
+                                len(self.levels)))
+            for factor, mins, maxs, sums in self.levels:
+                f.write(struct.pack(self.LEVEL_FORMAT, factor, len(sums)))
+                for values in (mins, maxs, sums):
+                    f.write(struct.pack("<%dd" % len(values), *values))
+
+    @classmethod
+    def load(cls, file_path, read_values):
+        """Reads a pyramid written by save.
+
+        Args:
+            file_path: The full path of the file to read from.
+            read_values: See __init__.
+
+        Returns:
+            A MonsoonTracePyramid object.
+        """
+        header_size = struct.calcsize(cls.HEADER_FORMAT)
+        level_size = struct.calcsize(cls.LEVEL_FORMAT)
+        with open(file_path, "rb") as f:
+            header = f.read(header_size)
+            if len(header) != header_size:
+                raise MonsoonError("%s is not a pyramid file." % file_path)
+            (magic, version, begin_time, hz, num_samples,
+             num_levels) = struct.unpack(cls.HEADER_FORMAT, header)
+            if magic != cls.MAGIC or version != cls.VERSION:
+                raise MonsoonError("%s is not a pyramid file." % file_path)
+            levels = []
+            for _ in range(num_levels):
+                factor, num_bins = struct.unpack(cls.LEVEL_FORMAT,
+                                                 f.read(level_size))
+                fields = []
+                for _ in range(3):
+                    raw = f.read(8 * num_bins)
+                    fields.append(array.array(
+                        "d", struct.unpack("<%dd" % num_bins, raw)))
+                levels.append((factor,) + tuple(fields))
+        return cls(begin_time, hz, num_samples, levels, read_values)
+
+    def _index(self, timestamp):
+        """Maps a timestamp to the index of the first sample at or after it.
+        """
+        if timestamp is None:
+            return self.num_samples
+        # Tolerate float rounding in timestamps derived from sample counts.
+        i = int(math.ceil((timestamp - self.begin_time) * self.hz - 1e-6))
+        return min(max(i, 0), self.num_samples)
+
+    def _aggregate(self, begin, end, level=None):
+        """Aggregates the samples with indexes in [begin, end).
+
+        Returns:
+            A list of [sum, min, max] of the samples.
+        """
+        if level is None:
+            level = len(self.levels) - 1
+        result = [0.0, float("inf"), float("-inf")]
+        if begin >= end:
+            return result
+        if level < 0:
+            values = self._read_values(begin, end)
+            return [sum(values), min(values), max(values)]
+        factor, mins, maxs, sums = self.levels[level]
+        first_bin = -(-begin // factor)
+        # The last bin may be partial, it is whole if it ends the trace.
+        end_bin = len(sums) if end == self.num_samples else end // factor
+        if first_bin >= end_bin:
+            return self._aggregate(begin, end, level - 1)
+        result = [sum(sums[first_bin:end_bin]), min(mins[first_bin:end_bin]),
+                  max(maxs[first_bin:end_bin])]
+        edges = ((begin, first_bin * factor),
+                 (min(end_bin * factor, self.num_samples), end))
+        for edge_begin, edge_end in edges:
+            edge = self._aggregate(edge_begin, edge_end, level - 1)
+            result[0] += edge[0]
+            result[1] = min(result[1], edge[1])
+            result[2] = max(result[2], edge[2])
+        return result
+
+    def get_stats(self, begin_time=None, end_time=None):
+        """Gets the stats of the samples taken in [begin_time, end_time).
+
+        Args:
+            begin_time: The timestamp to start from. Default is the beginning
+                of the trace.
+            end_time: The timestamp to stop at. Default is the end of the
+                trace.
+
+        Returns:
+            A MonsoonStats object.
+        """
+        begin = self._index(begin_time) if begin_time is not None else 0
+        end = self._index(end_time)
+        stats = MonsoonStats()
+        if begin < end:
+            stats.total, stats.min_value, stats.max_value = self._aggregate(
+                begin, end)
+            stats.count = end - begin
+        return stats
+
+    def get_average_current(self, begin_time=None, end_time=None):
+        """Average current in the unit of mA of the samples taken in
+        [begin_time, end_time).
+        """
+        stats = self.get_stats(begin_time, end_time)
+        return round(stats.mean * 1000, MonsoonData.sr)
+
+    def render(self, num_points, begin_time=None, end_time=None):
+        """Downsamples the samples taken in [begin_time, end_time) to about
+        num_points points, e.g. to plot them.
+
+        Each point is computed from the coarsest level whose bins are no
+        larger than the points, so the amount of work depends on num_points
+        rather than the length of the range.
+
+        Args:
+            num_points: The max number of points to return.
+            begin_time: The timestamp to start from. Default is the beginning
+                of the trace.
+            end_time: The timestamp to stop at. Default is the end of the
+                trace.
+
+        Returns:
+            A list of (timestamp, min, mean, max) tuples, with currents in
+            Amp.
+        """
+        begin = self._index(begin_time) if begin_time is not None else 0
+        end = self._index(end_time)
+        if begin >= end or num_points <= 0:
+            return []
+        step = max(1, (end - begin) / num_points)
+        level = -1
+        for i, (factor, _, _, _) in enumerate(self.levels):
+            if factor <= step:
+                level = i
+        points = []
+        point_begin = begin
+        num_points = min(num_points, end - begin)
+        for n in range(1, num_points + 1):
+            point_end = begin + int(round(n * step)) if n < num_points else end
+            if point_end <= point_begin:
+                continue
+            if level < 0:
+                values = self._read_values(point_begin, point_end)
+                low, high = min(values), max(values)
+                mean = sum(values) / len(values)
+            else:
+                factor, mins, maxs, sums = self.levels[level]
+                # Snap to bins, which is accurate enough for plotting.
+                first_bin = point_begin // factor
+                end_bin = max(first_bin + 1, point_end // factor)
+                low = min(mins[first_bin:end_bin])
+                high = max(maxs[first_bin:end_bin])
+                count = min(end_bin * factor, self.num_samples) - (
+                    first_bin * factor)
+                mean = sum(sums[first_bin:end_bin]) / count
+            timestamp = self.begin_time + point_begin / self.hz
+            points.append((timestamp, low, mean, high))
+            point_begin = point_end
+        return points
+
+
 class Monsoon:
     """The wrapper class for test scripts to interact with monsoon.
     """
+    # Number of seconds to wait for a background capture to start.
+    capture_start_timeout = 10
+
     def __init__(self, *args, **kwargs):
         serial = kwargs["serial"]
         device = None
@@ -597,6 +1359,14 @@ class Monsoon:
             device = kwargs["device"]
         self.mon = MonsoonProxy(serialno=serial, device=device)
         self.dut = None
+        # (epoch time, monotonic time) at the start of the ongoing capture.
+        self._clock = None
+        # Markers that have not been added to the ongoing capture yet.
+        self._markers = collections.deque()
+        self._capture_thread = None
+        self._capture_result = None
+        self._capture_started = threading.Event()
+        self._capture_stop = threading.Event()
 
     def attach_device(self, dut):
         """Attach the controller object for the Device Under Test (DUT)
@@ -647,28 +1417,24 @@ class Monsoon:
         """
         return self.mon.GetStatus()
 
-    def take_samples(self, sample_hz, sample_num, sample_offset=0, live=False):
-        """Take samples of the current value supplied by monsoon.
+    def _collect_samples(self, sample_hz, sample_num, live=False):
+        """Generator that collects current samples from monsoon, resampled to
+        sample_hz.
 
-        This is the actual measurement for power consumption. This function
-        blocks until the number of samples requested has been fulfilled.
+        Data collection is started before the first sample is produced and
+        stopped when the generator is exhausted or closed. Only the raw
+        samples needed for the next output sample are held in memory.
 
         Args:
-            hz: Number of points to take for every second.
-            sample_num: Number of samples to take.
-            offset: The number of initial data points to discard in MonsoonData
-                calculations. sample_num is extended by offset to compensate.
+            sample_hz: Number of points to produce for every second.
+            sample_num: Number of samples to produce, -1 for no limit.
             live: Print each sample in console as measurement goes on.
 
-        Returns:
-            A MonsoonData object representing the data obtained in this
-            sampling. None if sampling is unsuccessful.
+        Yields:
+            Tuples of (timestamp, current in Amp). Timestamps are in epoch
+            seconds, derived from the sample count and the host's monotonic
+            clock at the start of data collection.
         """
-        sys.stdout.flush()
-        voltage = self.mon.GetVoltage()
-        self.log.info("Taking samples at %dhz for %ds, voltage %.2fv." % (
-            sample_hz, sample_num/sample_hz, voltage))
-        sample_num += sample_offset
         # Make sure state is normal
         self.mon.StopDataCollection()
         status = self.mon.GetStatus()
@@ -676,6 +1442,10 @@ class Monsoon:
 
         # Collect and average samples as specified
         self.mon.StartDataCollection()
+        if not self._clock:
+            self._clock = (time.time(), time.monotonic())
+        start_time = self.get_trace_time()
+        self._capture_started.set()
 
         # In case sample_hz doesn't divide native_hz exactly, use this
         # invariant: 'offset' = (consumed samples) * sample_hz -
@@ -684,10 +1454,6 @@ class Monsoon:
         # algorithm.
         emitted = offset = 0
         collected = []
-        # past n samples for rolling average
-        history_deque = collections.deque()
-        current_values = []
-        timestamps = []
 
         try:
             last_flush = time.time()
@@ -708,12 +1474,10 @@ class Monsoon:
                     while offset >= native_hz:
                         # TODO(angli): Optimize "collected" operations.
                         this_sample = sum(collected[:need]) / need
-                        this_time = int(time.time())
-                        timestamps.append(this_time)
+                        this_time = start_time + emitted / sample_hz
                         if live:
                             self.log.info("%s %s" % (this_time, this_sample))
-                        current_values.append(this_sample)
-                        sys.stdout.flush()
+                        yield this_time, this_sample
                         offset -= native_hz
                         emitted += 1 # adjust for emitting 1 output sample
                     collected = collected[need:]
@@ -723,12 +1487,269 @@ class Monsoon:
                         last_flush = now
         except Exception as e:
             pass
-        self.mon.StopDataCollection()
+        finally:
+            self.mon.StopDataCollection()
+
+    def _capture(self, sample_hz, sample_num, sample_offset=0, file_path=None,
+                 live=False, chunk_size=MonsoonTraceWriter.default_chunk_size,
+                 clock=None):
+        """Takes samples and puts them, along with the markers added during
+        the capture, into a MonsoonData object or a trace file.
+
+        The capture ends when sample_num samples are taken, the monsoon stops
+        sending data, or stop_capture is called.
+
+        Args:
+            sample_hz: Number of points to take for every second.
+            sample_num: Number of samples to take, -1 for no limit.
+            sample_offset: The number of initial data points to discard in
+                calculations. sample_num is extended by offset to compensate.
+            file_path: If set, samples are streamed to this trace file instead
+                of being kept in memory.
+            live: Print each sample in console as measurement goes on.
+            chunk_size: Number of samples to buffer before writing to file.
+            clock: An (epoch time, monotonic time) tuple to use as the clock of
+                this capture, so it can be aligned with other captures. By
+                default the clock starts with data collection.
+
+        Returns:
+            A MonsoonData object, or the closed MonsoonTraceWriter if file_path
+            is set. None if sampling is unsuccessful.
+        """
+        self._clock = clock
+        sys.stdout.flush()
+        voltage = self.mon.GetVoltage()
+        if sample_num != -1:
+            sample_num += sample_offset
+        samples = self._collect_samples(sample_hz, sample_num, live)
         try:
-            return MonsoonData(current_values, timestamps, sample_hz,
-                voltage, offset=sample_offset)
-        except:
+            if file_path:
+                return self._capture_to_file(samples, file_path, sample_hz,
+                                             voltage, sample_offset,
+                                             chunk_size)
+            current_values = []
+            timestamps = []
+            for this_time, this_sample in samples:
+                timestamps.append(this_time)
+                current_values.append(this_sample)
+                if self._capture_stop.is_set():
+                    break
+            try:
+                return MonsoonData(current_values, timestamps, sample_hz,
+                    voltage, offset=sample_offset, markers=list(self._markers))
+            except:
+                return None
+        finally:
+            samples.close()
+            self._clock = None
+            self._markers.clear()
+
+    def _capture_to_file(self, samples, file_path, sample_hz, voltage,
+                         sample_offset, chunk_size):
+        """Streams samples, along with the markers added during the capture,
+        to a trace file.
+
+        Returns:
+            The closed MonsoonTraceWriter. None if no sample was taken.
+        """
+        with MonsoonTraceWriter(file_path, sample_hz, voltage,
+                                offset=sample_offset,
+                                chunk_size=chunk_size) as writer:
+            for this_time, this_sample in samples:
+                while self._markers and self._markers[0][0] <= this_time:
+                    writer.mark(*self._markers.popleft())
+                writer.append(this_time, this_sample)
+                if self._capture_stop.is_set():
+                    break
+            while self._markers:
+                writer.mark(*self._markers.popleft())
+        if not writer.num_samples:
             return None
+        return writer
+
+    def get_trace_time(self):
+        """Gets the current time on the clock of the ongoing capture.
+
+        This is the clock used for the sample timestamps: epoch seconds at the
+        start of the capture, advanced by the host's monotonic clock.
+
+        Returns:
+            The current trace time in epoch seconds (float).
+
+        Raises:
+            MonsoonError is raised if no capture is ongoing.
+        """
+        if not self._clock:
+            raise MonsoonError("No capture is ongoing on monsoon %s." %
+                               self.mon.serial)
+        epoch, mono = self._clock
+        return epoch + time.monotonic() - mono
+
+    def mark(self, name, timestamp=None):
+        """Adds a marker to the ongoing capture.
+
+        Markers are stored in the resulting trace, so the statistics of each
+        part of the capture can be computed with MonsoonData.get_segments.
+
+        Args:
+            name: A string that's the name of the event being marked, e.g.
+                "call_connected".
+            timestamp: The trace time of the event. Default is now.
+
+        Returns:
+            The timestamp of the marker.
+
+        Raises:
+            MonsoonError is raised if no capture is ongoing.
+        """
+        now = self.get_trace_time()
+        if timestamp is None:
+            timestamp = now
+        self._markers.append((timestamp, name))
+        self.log.debug("Monsoon marker %s at %s." % (name, timestamp))
+        return timestamp
+
+    def start_capture(self, sample_hz, sample_offset=0, file_path=None,
+                      live=False, sample_num=-1, clock=None):
+        """Starts taking samples in the background.
+
+        Use mark to annotate the capture with test events and stop_capture to
+        end it and get the result.
+
+        Args:
+            sample_hz: Number of points to take for every second.
+            sample_offset: The number of initial data points to discard in
+                calculations.
+            file_path: If set, samples are streamed to this trace file instead
+                of being kept in memory.
+            live: Print each sample in console as measurement goes on.
+            sample_num: Number of samples to take, -1 to sample until
+                stop_capture is called.
+            clock: An (epoch time, monotonic time) tuple to use as the clock of
+                this capture, so it can be aligned with other captures. By
+                default the clock starts with data collection.
+
+        Raises:
+            MonsoonError is raised if a capture is already ongoing or fails to
+            start.
+        """
+        if self._capture_thread:
+            raise MonsoonError("A capture is already ongoing on monsoon %s." %
+                               self.mon.serial)
+        self._capture_result = None
+        self._capture_started.clear()
+        self._capture_stop.clear()
+
+        def capture():
+            try:
+                self._capture_result = self._capture(
+                    sample_hz, sample_num, sample_offset=sample_offset,
+                    file_path=file_path, live=live, clock=clock)
+            finally:
+                # Unblock start_capture if the capture failed to start.
+                self._capture_started.set()
+
+        self._capture_thread = threading.Thread(target=capture)
+        self._capture_thread.daemon = True
+        self._capture_thread.start()
+        started = self._capture_started.wait(self.capture_start_timeout)
+        if not started or not (self._capture_thread.is_alive() or
+                               self._capture_result):
+            self.stop_capture()
+            raise MonsoonError("Failed to start capture on monsoon %s." %
+                               self.mon.serial)
+
+    def wait_for_capture(self, timeout=None):
+        """Waits for the capture started by start_capture to take all the
+        requested samples.
+
+        Args:
+            timeout: Number of seconds to wait for, None to wait forever.
+
+        Returns:
+            True if the capture has finished, False otherwise.
+        """
+        if not self._capture_thread:
+            raise MonsoonError("No capture was started on monsoon %s." %
+                               self.mon.serial)
+        self._capture_thread.join(timeout)
+        return not self._capture_thread.is_alive()
+
+    def request_stop_capture(self):
+        """Asks the capture started by start_capture to stop, without waiting
+        for it to finish.
+        """
+        self._capture_stop.set()
+
+    def stop_capture(self):
+        """Stops the capture started by start_capture.
+
+        Returns:
+            A MonsoonData object, or a MonsoonTraceWriter if the capture was
+            streamed to a file. None if sampling is unsuccessful.
+        """
+        if not self._capture_thread:
+            raise MonsoonError("No capture was started on monsoon %s." %
+                               self.mon.serial)
+        self.request_stop_capture()
+        self._capture_thread.join()
+        self._capture_thread = None
+        # Let the synchronous captures that follow run to completion.
+        self._capture_stop.clear()
+        return self._capture_result
+
+    def take_samples(self, sample_hz, sample_num, sample_offset=0, live=False):
+        """Take samples of the current value supplied by monsoon.
+
+        This is the actual measurement for power consumption. This function
+        blocks until the number of samples requested has been fulfilled.
+
+        Args:
+            hz: Number of points to take for every second.
+            sample_num: Number of samples to take.
+            offset: The number of initial data points to discard in MonsoonData
+                calculations. sample_num is extended by offset to compensate.
+            live: Print each sample in console as measurement goes on.
+
+        Returns:
+            A MonsoonData object representing the data obtained in this
+            sampling. None if sampling is unsuccessful.
+        """
+        self.log.info("Taking samples at %dhz for %ds." % (
+            sample_hz, sample_num/sample_hz))
+        return self._capture(sample_hz, sample_num,
+                             sample_offset=sample_offset, live=live)
+
+    def take_samples_to_file(self, sample_hz, sample_num, file_path,
+                             sample_offset=0, live=False,
+                             chunk_size=MonsoonTraceWriter.default_chunk_size):
+        """Take samples of the current value supplied by monsoon and stream
+        them to a binary trace file.
+
+        Unlike take_samples, the samples are not kept in memory. They are
+        written to file_path in chunks of chunk_size samples as the
+        measurement goes on, so the file can be read with MonsoonTraceReader
+        while the capture is still running. Use this for long captures.
+
+        Args:
+            sample_hz: Number of points to take for every second.
+            sample_num: Number of samples to take, -1 to sample until the
+                monsoon stops sending data.
+            file_path: The full path of the trace file to write to.
+            sample_offset: The number of initial data points to discard in
+                calculations. sample_num is extended by offset to compensate.
+            live: Print each sample in console as measurement goes on.
+            chunk_size: Number of samples to buffer before writing to file.
+
+        Returns:
+            The closed MonsoonTraceWriter, which holds the aggregated stats of
+            this sampling. None if no sample was taken.
+        """
+        self.log.info("Streaming samples at %dhz to %s." % (sample_hz,
+                                                           file_path))
+        return self._capture(sample_hz, sample_num,
+                             sample_offset=sample_offset, file_path=file_path,
+                             live=live, chunk_size=chunk_size)
 
     @utils.timeout(60)
     def usb(self, state):
@@ -860,7 +1881,7 @@ class Monsoon:
                 droid.goToSleepNow()
         return results
 
-    def measure_power(self, hz, duration, tag, offset=30):
+    def measure_power(self, hz, duration, tag, offset=30, file_path=None):
         """Measure power consumption of the attached device.
 
         Because it takes some time for the device to calm down after the usb
@@ -872,9 +1893,13 @@ class Monsoon:
             duration: Number of seconds to take samples for in each step.
             offset: The number of seconds of initial data to discard.
             tag: A string that's the name of the collected data group.
+            file_path: If set, samples are streamed to this binary trace file
+                instead of being kept in memory. Use this for long
+                measurements.
 
         Returns:
-            A MonsoonData object with the measured power data.
+            A MonsoonData object with the measured power data, or a
+            MonsoonTraceWriter with the aggregated stats if file_path is set.
         """
         if offset >= duration:
             raise MonsoonError(("Measurement duration (%ds) should be larger "
@@ -888,7 +1913,11 @@ class Monsoon:
             time.sleep(1)
             self.dut.terminate_all_sessions()
             time.sleep(1)
-            data = self.take_samples(hz, num, sample_offset=oset)
+            if file_path:
+                data = self.take_samples_to_file(hz, num, file_path,
+                                                 sample_offset=oset)
+            else:
+                data = self.take_samples(hz, num, sample_offset=oset)
             if not data:
                 raise MonsoonError(("No data was collected in measurement %s."
                     ) % tag)
@@ -896,14 +1925,268 @@ class Monsoon:
             self.log.info("Measurement summary: %s" % repr(data))
         finally:
             self.mon.StopDataCollection()
-            self.log.info("Finished taking samples, reconnecting to dut.")
-            self.usb("on")
-            self._wait_for_device(self.dut)
-            # Wait for device to come back online.
-            time.sleep(10)
-            droid, ed = self.dut.get_droid(True)
-            ed.start()
-            # Release wake lock to put device into sleep.
-            droid.goToSleepNow()
-            self.log.info("Dut reconncted.")
-            return data
\ No newline at end of file
+            self._reconnect_dut()
+            return data
+
+    def measure_power_sequence(self, hz, steps, tag, offset=30,
+                               file_path=None):
+        """Measure power consumption of the attached device through a sequence
+        of steps, in one capture.
+
+        The usb connection to the dut is cut once for the whole sequence,
+        instead of once per measurement. A marker named after each step is
+        added right before the step is executed, so the stats of each step
+        are available from MonsoonData.get_segments, or the segments of the
+        MonsoonTraceWriter if file_path is set.
+
+        Args:
+            hz: Number of samples to take per second.
+            steps: A list of (name, func, duration) tuples. func is called
+                with no argument once the step's marker is added, and must not
+                rely on the usb connection to the dut. duration is the number
+                of seconds the step lasts, including the execution of func.
+            tag: A string that's the name of the collected data group.
+            offset: The number of seconds of initial data to discard, before
+                the first step starts.
+            file_path: If set, samples are streamed to this binary trace file
+                instead of being kept in memory.
+
+        Returns:
+            A MonsoonData object with the measured power data, or a
+            MonsoonTraceWriter with the aggregated stats if file_path is set.
+        """
+        data = None
+        try:
+            self.usb("auto")
+            time.sleep(1)
+            self.dut.terminate_all_sessions()
+            time.sleep(1)
+            self.start_capture(hz, sample_offset=offset * hz,
+                               file_path=file_path)
+            try:
+                time.sleep(offset)
+                for name, func, duration in steps:
+                    step_begin = time.monotonic()
+                    self.mark(name)
+                    self.log.info("Executing step %s." % name)
+                    func()
+                    remaining = duration - (time.monotonic() - step_begin)
+                    if remaining > 0:
+                        time.sleep(remaining)
+            finally:
+                data = self.stop_capture()
+            if not data:
+                raise MonsoonError(("No data was collected in measurement %s."
+                    ) % tag)
+            data.tag = tag
+            self.log.info("Measurement summary: %s" % repr(data))
+            for segment in data.get_segments():
+                self.log.info("Step summary: %s" % repr(segment))
+        finally:
+            self._reconnect_dut()
+        return data
+
+    def _reconnect_dut(self):
+        """Turns the usb passthrough back on and reconnects to the dut after
+        a measurement.
+        """
+        self.log.info("Finished taking samples, reconnecting to dut.")
+        self.usb("on")
+        self._wait_for_device(self.dut)
+        # Wait for device to come back online.
+        time.sleep(10)
+        droid, ed = self.dut.get_droid(True)
+        ed.start()
+        # Release wake lock to put device into sleep.
+        droid.goToSleepNow()
+        self.log.info("Dut reconncted.")
+
+
+class MonsoonGroupData:
+    """The combined result of a capture taken with a MonsoonGroup.
+
+    All the traces are timestamped on the same host clock, so samples and
+    markers from different monsoons can be compared directly.
+
+    Attributes:
+        traces: An OrderedDict mapping each monsoon's serial number to its
+            MonsoonData object, or MonsoonTraceWriter if the capture was
+            streamed to files. None if sampling on that monsoon failed.
+        markers: A list of (timestamp, name) tuples of the group markers.
+        tag: A string that's the name of the collected data group.
+    """
+
+    def __init__(self, traces, markers=None):
+        self.traces = traces
+        self.markers = markers or []
+        self.tag = None
+
+    def __getitem__(self, serial):
+        return self.traces[serial]
+
+    def __len__(self):
+        return len(self.traces)
+
+    def get_segments(self):
+        """Gets the segments of each trace, delimited by the markers.
+
+        Returns:
+            A dictionary mapping each monsoon's serial number to a list of
+            MonsoonSegment objects.
+        """
+        return {serial: trace.get_segments()
+                for serial, trace in self.traces.items() if trace}
+
+    def __repr__(self):
+        strs = [""]
+        strs.append(self.tag or "Monsoon Group Measurement Data")
+        for serial, trace in self.traces.items():
+            strs.append("Monsoon {}: {}".format(serial, repr(trace).strip()))
+        return "\n".join(strs)
+
+
+class MonsoonGroup:
+    """Captures with several monsoons at the same time.
+
+    Each monsoon is read on its own thread, and all of them share the same
+    capture clock, so the resulting traces are aligned.
+
+    Example:
+        group = MonsoonGroup(self.monsoons)
+        group.start_capture(500)
+        ...
+        group.mark("screen_on")
+        ...
+        result = group.stop_capture()
+    """
+
+    def __init__(self, monsoons, logger=None):
+        """
+        Args:
+            monsoons: A list of Monsoon objects.
+            logger: The main logger used in the current test run.
+        """
+        if not monsoons:
+            raise MonsoonError("A monsoon group needs at least one monsoon.")
+        self.monsoons = monsoons
+        self.log = acts.logger.LoggerProxy(logger)
+        self._clock = None
+        self._markers = []
+
+    def start_capture(self, sample_hz, sample_offset=0, file_dir=None,
+                      sample_num=-1):
+        """Starts taking samples on all the monsoons in the background.
+
+        Args:
+            sample_hz: Number of points to take for every second.
+            sample_offset: The number of initial data points to discard in
+                calculations.
+            file_dir: If set, the samples of each monsoon are streamed to
+                a trace file named monsoon_<serial>.bin under this directory.
+            sample_num: Number of samples to take on each monsoon, -1 to
+                sample until stop_capture is called.
+
+        Raises:
+            MonsoonError is raised if the capture failed to start on any of
+            the monsoons. The captures already started are stopped.
+        """
+        self._clock = (time.time(), time.monotonic())
+        self._markers = []
+        started = []
+        try:
+            for mon in self.monsoons:
+                file_path = None
+                if file_dir:
+                    file_path = os.path.join(file_dir,
+                                             "monsoon_%s.bin" % mon.mon.serial)
+                mon.start_capture(sample_hz, sample_offset=sample_offset,
+                                  file_path=file_path, sample_num=sample_num,
+                                  clock=self._clock)
+                started.append(mon)
+        except:
+            for mon in started:
+                mon.stop_capture()
+            self._clock = None
+            raise
+
+    def mark(self, name):
+        """Adds a marker to the ongoing capture of every monsoon.
+
+        Args:
+            name: A string that's the name of the event being marked.
+
+        Returns:
+            The timestamp of the marker.
+        """
+        if not self._clock:
+            raise MonsoonError("No capture is ongoing on this monsoon group.")
+        epoch, mono = self._clock
+        timestamp = epoch + time.monotonic() - mono
+        for mon in self.monsoons:
+            mon.mark(name, timestamp=timestamp)
+        self._markers.append((timestamp, name))
+        return timestamp
+
+    def stop_capture(self):
+        """Stops the capture on all the monsoons.
+
+        Returns:
+            A MonsoonGroupData object with the traces of all the monsoons.
+        """
+        # Ask all the captures to stop first so they end at the same time.
+        for mon in self.monsoons:
+            mon.request_stop_capture()
+        traces = collections.OrderedDict()
+        for mon in self.monsoons:
+            traces[mon.mon.serial] = mon.stop_capture()
+        self._clock = None
+        return MonsoonGroupData(traces, self._markers)
+
+    def measure_power(self, hz, duration, tag, offset=30, file_dir=None):
+        """Measure power consumption of the devices attached to all the
+        monsoons at the same time.
+
+        Args:
+            hz: Number of samples to take per second.
+            duration: Number of seconds to take samples for.
+            tag: A string that's the name of the collected data group.
+            offset: The number of seconds of initial data to discard.
+            file_dir: If set, the samples of each monsoon are streamed to a
+                trace file under this directory.
+
+        Returns:
+            A MonsoonGroupData object with the measured power data.
+        """
+        if offset >= duration:
+            raise MonsoonError(("Measurement duration (%ds) should be larger "
+                "than offset (%ds) for measurement %s."
+                ) % (duration, offset, tag))
+        data = None
+        try:
+            for mon in self.monsoons:
+                mon._check_dut()
+                mon.usb("auto")
+            time.sleep(1)
+            for mon in self.monsoons:
+                mon.dut.terminate_all_sessions()
+            time.sleep(1)
+            self.start_capture(hz, sample_offset=offset * hz,
+                               file_dir=file_dir, sample_num=duration * hz)
+            try:
+                for mon in self.monsoons:
+                    mon.wait_for_capture()
+            finally:
+                data = self.stop_capture()
+            data.tag = tag
+            failed = [s for s, trace in data.traces.items() if not trace]
+            if failed:
+                raise MonsoonError(("No data was collected on monsoon(s) %s "
+                    "in measurement %s.") % (failed, tag))
+            self.log.info("Measurement summary: %s" % repr(data))
+        finally:
+            # usb and _wait_for_device rely on SIGALRM, which only works on
+            # the main thread, so reconnect the duts one at a time.
+            for mon in self.monsoons:
+                mon.mon.StopDataCollection()
+                mon._reconnect_dut()
+        return data
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""A software Monsoon power meter that speaks the Monsoon serial protocol over
+a pseudo terminal.
+
+This lets acts.controllers.monsoon be exercised without hardware, e.g. to test
+it or to benchmark the decoding and resampling of samples at full rate:
+
+    sim = MonsoonSimulator(current=lambda t: 0.1 if int(t) % 2 else 0.3)
+    sim.start()
+    mon = monsoon.Monsoon(serial=sim.serial_number, device=sim.device)
+    data = mon.take_samples(5000, 5000)
+    sim.stop()
+"""
+
+import argparse
+import os
+import pty
+import random
+import select
+import struct
+import threading
+import time
+import tty
+
+from acts.controllers.monsoon import Monsoon
+from acts.controllers.monsoon import MonsoonError
+from acts.controllers.monsoon import MonsoonProxy
+
+# Calibration values reported by the simulator. The zero/ref pairs determine
+# the scales the host uses to decode raw values, see MonsoonProxy.CollectData.
+FINE_ZERO = 0
+FINE_REF = 30000
+COARSE_ZERO = 0
+COARSE_REF = 30000
+FINE_SCALE = 0.0332 / (FINE_REF - FINE_ZERO)
+COARSE_SCALE = 2.88 / (COARSE_REF - COARSE_ZERO)
+# Largest current that can be reported with the fine scale, in Amp.
+MAX_FINE_CURRENT = (0x7ffe - FINE_ZERO) * FINE_SCALE
+# Largest current that can be reported at all, in Amp.
+MAX_CURRENT = ((0x7fff & ~1) - COARSE_ZERO) * COARSE_SCALE
+
+# Packet types.
+STATUS_PACKET_TYPE = 0x10
+DATA_PACKET_TYPE = 0x20
+# Data packet subtypes.
+MEASUREMENT = 0
+ZERO_CALIBRATION = 1
+REF_CALIBRATION = 2
+
+
+def encode_current(current):
+    """Encodes a current value into a raw main channel sample.
+
+    The lowest bit of a sample tells the host which scale to decode it with:
+    0 for fine, 1 for coarse.
+
+    Args:
+        current: A current value in Amp.
+
+    Returns:
+        An int that is the raw sample.
+    """
+    current = max(0, min(current, MAX_CURRENT))
+    if current <= MAX_FINE_CURRENT:
+        return (int(round(current / FINE_SCALE)) + FINE_ZERO) & ~1
+    return (int(round(current / COARSE_SCALE)) + COARSE_ZERO) | 1
+
+
+def frame(payload):
+    """Adds the length and checksum bytes around a packet payload, the way
+    both ends of the Monsoon protocol do.
+
+    Args:
+        payload: The bytes of the packet.
+
+    Returns:
+        The bytes to write to the serial port.
+    """
+    data_len = len(payload) + 1
+    checksum = (data_len + sum(payload)) % 256
+    return bytes([data_len]) + payload + bytes([checksum])
+
+
+class MonsoonSimulator(object):
+    """A software Monsoon that serves the Monsoon protocol on a pty.
+
+    Point acts.controllers.monsoon.Monsoon at the device attribute to talk to
+    it. The simulator runs on its own thread between start and stop.
+
+    Attributes:
+        device: The path of the serial device the host should open.
+        serial_number: The serial number reported in status packets.
+        sample_rate: The native sample rate in kHz.
+        current: A float, or a function of the number of seconds since data
+            collection started, that gives the simulated current in Amp.
+        packet_size: The number of samples in each data packet.
+        loss_rate: The probability of each data packet being dropped.
+        jitter: The max delay, in seconds, randomly added to each data packet.
+        calibration_interval: The number of data packets between two
+            calibration packets.
+        voltage: The output voltage set by the host.
+        usb_passthrough: The usb passthrough mode set by the host.
+        collecting: True if the host has started data collection.
+        packets_sent: The number of data packets sent.
+        packets_dropped: The number of data packets dropped.
+    """
+
+    def __init__(self, serial_number=1, sample_rate=5, current=0.1,
+                 packet_size=10, loss_rate=0, jitter=0,
+                 calibration_interval=50, seed=None):
+        if not 0 <= loss_rate < 1:
+            raise MonsoonError("Packet loss rate %s is not in [0, 1)." %
+                               loss_rate)
+        self.serial_number = serial_number
+        self.sample_rate = sample_rate
+        self.current = current
+        self.packet_size = packet_size
+        self.loss_rate = loss_rate
+        self.jitter = jitter
+        self.calibration_interval = calibration_interval
+        self.voltage = 0
+        self.max_current = 8
+        self.max_power_up_current = 8
+        # Low bytes of the current limits, set before their high bytes.
+        self._max_current_low = 0
+        self._max_power_up_current_low = 0
+        self.usb_passthrough = 1
+        self.collecting = False
+        self.packets_sent = 0
+        self.packets_dropped = 0
+        self.device = None
+        self._random = random.Random(seed)
+        self._master = self._slave = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._rx = b""
+        self._seq = 0
+        self._samples_sent = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        """Creates the pty and starts serving on it.
+        """
+        self._master, self._slave = pty.openpty()
+        # No line discipline processing, the protocol is binary.
+        tty.setraw(self._slave)
+        self.device = os.ttyname(self._slave)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._serve)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stops serving and closes the pty.
+        """
+        if not self._thread:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        os.close(self._master)
+        os.close(self._slave)
+
+    def _serve(self):
+        period = self.packet_size / (self.sample_rate * 1000.0)
+        # When the next packet is due without jitter, and with it.
+        scheduled_time = send_time = None
+        while not self._stop.is_set():
+            timeout = 0.1
+            if self.collecting:
+                timeout = max(0, send_time - time.monotonic())
+            readable, _, _ = select.select([self._master], [], [], timeout)
+            if readable:
+                try:
+                    self._rx += os.read(self._master, 4096)
+                except OSError:
+                    # The host side was closed, wait for it to reopen.
+                    time.sleep(0.1)
+                    continue
+                was_collecting = self.collecting
+                self._handle_commands()
+                if self.collecting and not was_collecting:
+                    self._send_calibration()
+                    scheduled_time = send_time = time.monotonic()
+            if self.collecting and time.monotonic() >= send_time:
+                self._send_data_packet()
+                # Jitter delays packets without slowing down the sample rate.
+                scheduled_time += period
+                send_time = scheduled_time
+                if self.jitter:
+                    send_time += self._random.uniform(0, self.jitter)
+
+    def _handle_commands(self):
+        """Parses and executes the complete commands received so far.
+        """
+        while self._rx:
+            data_len = self._rx[0]
+            if len(self._rx) < data_len + 1:
+                return
+            packet = self._rx[1:data_len + 1]
+            self._rx = self._rx[data_len + 1:]
+            payload, checksum = packet[:-1], packet[-1]
+            if (data_len + sum(payload)) % 256 != checksum:
+                continue
+            self._handle_command(payload)
+
+    def _handle_command(self, payload):
+        if payload[0] == 0x01 and len(payload) == 3:
+            register, value = payload[1], payload[2]
+            if register == 0x00:
+                self._send(self._status_packet())
+            elif register == 0x01:
+                self.voltage = 0 if value == 0 else 2.0 + value * 0.01
+            elif register == 0x0a:
+                self._max_current_low = value
+            elif register == 0x0b:
+                raw = (value << 8) | self._max_current_low
+                self.max_current = 8 * (1023 - raw) / 1023.0
+            elif register == 0x08:
+                self._max_power_up_current_low = value
+            elif register == 0x09:
+                raw = (value << 8) | self._max_power_up_current_low
+                self.max_power_up_current = 8 * (1023 - raw) / 1023.0
+            elif register == 0x10:
+                self.usb_passthrough = value
+        elif payload[0] == 0x02:
+            self.collecting = True
+            self._seq = 0
+            self._samples_sent = 0
+        elif payload[0] == 0x03:
+            self.collecting = False
+
+    def _send(self, payload):
+        try:
+            os.write(self._master, frame(payload))
+        except OSError:
+            # The host side is not open.
+            pass
+
+    def _status_packet(self):
+        status = dict.fromkeys(MonsoonProxy.STATUS_FIELDS, 0)
+        status["packetType"] = STATUS_PACKET_TYPE
+        status["firmwareVersion"] = 16
+        status["protocolVersion"] = 16
+        status["serialNumber"] = self.serial_number
+        status["sampleRate"] = self.sample_rate
+        status["usbPassthroughMode"] = self.usb_passthrough
+        if self.voltage:
+            status["outputVoltageSetting"] = int(round(
+                (self.voltage - 2.0) * 100))
+            status["voltage1"] = int(round(self.voltage / 0.000125))
+        status["runTimeCurrentLimit"] = 1023 - int(self.max_current / 8 * 1023)
+        status["powerUpCurrentLimit"] = 1023 - int(
+            self.max_power_up_current / 8 * 1023)
+        values = [status[k] for k in MonsoonProxy.STATUS_FIELDS]
+        return struct.pack(MonsoonProxy.STATUS_FORMAT, *values)
+
+    def _data_packet(self, subtype, samples):
+        """Builds a data packet.
+
+        Args:
+            subtype: One of MEASUREMENT, ZERO_CALIBRATION, REF_CALIBRATION.
+            samples: A list of raw main channel samples.
+        """
+        header = struct.pack("BBBB", DATA_PACKET_TYPE | self._seq, subtype,
+                             0, 0)
+        self._seq = (self._seq + 1) & 0xF
+        body = b"".join(struct.pack(">hhhh", s, 0, 0, 0) for s in samples)
+        # The host ignores the last byte of each packet.
+        return header + body + b"\x00"
+
+    def _send_calibration(self):
+        self._send(self._data_packet(ZERO_CALIBRATION,
+                                     [FINE_ZERO, COARSE_ZERO]))
+        self._send(self._data_packet(REF_CALIBRATION,
+                                     [FINE_REF, COARSE_REF]))
+
+    def _current_at(self, t):
+        if callable(self.current):
+            return self.current(t)
+        return self.current
+
+    def _send_data_packet(self):
+        if (self.calibration_interval and self.packets_sent and
+                self.packets_sent % self.calibration_interval == 0):
+            self._send_calibration()
+        native_hz = self.sample_rate * 1000.0
+        samples = []
+        for i in range(self.packet_size):
+            t = (self._samples_sent + i) / native_hz
+            samples.append(encode_current(self._current_at(t)))
+        self._samples_sent += self.packet_size
+        packet = self._data_packet(MEASUREMENT, samples)
+        if self.loss_rate and self._random.random() < self.loss_rate:
+            self.packets_dropped += 1
+            return
+        self.packets_sent += 1
+        self._send(packet)
+
+
+def measure_throughput(sample_hz, duration, **simulator_kwargs):
+    """Runs a capture against a simulator and measures how fast the host
+    consumes samples.
+
+    Args:
+        sample_hz: Number of samples per second to take.
+        duration: Number of seconds to take samples for.
+        simulator_kwargs: Extra args passed to MonsoonSimulator.
+
+    Returns:
+        A tuple of (number of samples taken, wall clock seconds spent, the
+        MonsoonData taken).
+    """
+    with MonsoonSimulator(**simulator_kwargs) as sim:
+        mon = Monsoon(serial=sim.serial_number, device=sim.device)
+        try:
+            begin = time.monotonic()
+            data = mon.take_samples(sample_hz, int(sample_hz * duration))
+            elapsed = time.monotonic() - begin
+        finally:
+            mon.mon.ser.close()
+    return len(data) if data else 0, elapsed, data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=("Benchmarks the monsoon "
+                 "sample pipeline against a simulated monsoon."))
+    parser.add_argument("-hz", "--hz", type=int, default=5000,
+        help="Sample this many times per second.")
+    parser.add_argument("-t", "--duration", type=float, default=10,
+        help="Number of seconds to take samples for.")
+    parser.add_argument("--rate", type=int, default=5,
+        help="Native sample rate of the simulated monsoon, in kHz.")
+    parser.add_argument("--loss", type=float, default=0,
+        help="Probability of each data packet being dropped.")
+    parser.add_argument("--jitter", type=float, default=0,
+        help="Max delay in seconds randomly added to each data packet.")
+    args = parser.parse_args()
+    num, elapsed, _ = measure_throughput(args.hz, args.duration,
+                                         sample_rate=args.rate,
+                                         loss_rate=args.loss,
+                                         jitter=args.jitter)
+    print("Took %d samples in %.3fs, %.1f samples/s (%.1f%% of real time)." % (
+        num, elapsed, num / elapsed, 100.0 * num / args.hz / elapsed))
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""This module keeps the results of all test runs in a local SQLite database,
+so test runs can be ordered and timed from history and flaky tests can be
+told apart from real failures.
+"""
+
+import json
+import math
+import re
+import sqlite3
+import time
+
+from acts.records import TestResultEnums
+
+HISTORY_FILE_NAME = "test_history.db"
+
+# Window of history considered by default, in days.
+DEFAULT_WINDOW_DAYS = 30
+# Number of most recent results of a test looked at for flakiness.
+DEFAULT_FLAKY_WINDOW = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    testbed TEXT,
+    test_class TEXT,
+    test_name TEXT,
+    build TEXT,
+    model TEXT,
+    result TEXT,
+    begin_time INTEGER,
+    duration REAL,
+    phases TEXT,
+    signature TEXT
+);
+CREATE INDEX IF NOT EXISTS results_by_test
+    ON results (test_name, begin_time);
+CREATE INDEX IF NOT EXISTS results_by_class
+    ON results (test_class, test_name, begin_time);
+"""
+
+_FAILED_RESULTS = (TestResultEnums.TEST_RESULT_FAIL,
+                   TestResultEnums.TEST_RESULT_UNKNOWN)
+
+_SIGNATURE_PATTERNS = (
+    (re.compile(r"0x[0-9a-fA-F]+"), "0x?"),
+    (re.compile(r"\d+(\.\d+)?"), "#"),
+    (re.compile(r"\s+"), " "),
+)
+_SIGNATURE_MAX_LEN = 200
+
+
+def get_failure_signature(details):
+    """Reduces the details of a failure to a signature shared by failures
+    with the same cause.
+
+    Numbers, like timestamps, serials and ids, and addresses are masked.
+
+    Args:
+        details: A string describing the failure, or None.
+
+    Returns:
+        A string, or None if there are no details.
+    """
+    if not details:
+        return None
+    signature = str(details)
+    for pattern, repl in _SIGNATURE_PATTERNS:
+        signature = pattern.sub(repl, signature)
+    return signature.strip()[:_SIGNATURE_MAX_LEN]
+
+
+def percentile(values, p):
+    """Computes a percentile with linear interpolation.
+
+    Args:
+        values: A sorted list of numbers.
+        p: The percentile, between 0 and 100.
+
+    Returns:
+        The percentile, or None if values is empty.
+    """
+    if not values:
+        return None
+    k = (len(values) - 1) * p / 100.0
+    f = math.floor(k)
+    c = math.ceil(k)
+    if f == c:
+        return values[int(k)]
+    return values[int(f)] * (c - k) + values[int(c)] * (k - f)
+
+
+class TestHistory(object):
+    """The results of past test runs, stored in a SQLite database.
+
+    Attributes:
+        path: A string that is the path of the database file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def add_records(self, testbed, records, build=None, model=None):
+        """Stores test records.
+
+        Args:
+            testbed: A string that is the name of the test bed the tests were
+                executed on.
+            records: A list of records.TestResultRecord objects.
+            build: A string identifying the build under test, if known.
+            model: A string that is the model of the device under test, if
+                known.
+        """
+        rows = []
+        for record in records:
+            if not record.test_name or record.begin_time is None:
+                continue
+            duration = None
+            if record.end_time is not None:
+                duration = (record.end_time - record.begin_time) / 1000.0
+            signature = None
+            if record.result in _FAILED_RESULTS:
+                signature = get_failure_signature(record.details)
+            rows.append((testbed, record.test_class, record.test_name, build,
+                         model, record.result, record.begin_time, duration,
+                         json.dumps(record.phases), signature))
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO results (testbed, test_class, test_name, build, "
+                "model, result, begin_time, duration, phases, signature) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def _get_since(self, days):
+        return int((time.time() - days * 24 * 60 * 60) * 1000)
+
+    def get_durations(self, test_name, test_class=None,
+                      days=DEFAULT_WINDOW_DAYS):
+        """Gets the durations of the recent executions of a test.
+
+        Args:
+            test_name: A string that is the name of the test case.
+            test_class: A string that is the name of the test class, or None
+                to match the test case in any class.
+            days: How many days of history to consider.
+
+        Returns:
+            A sorted list of durations in seconds.
+        """
+        query = ("SELECT duration FROM results WHERE test_name = ? AND "
+                 "begin_time >= ? AND duration IS NOT NULL")
+        args = [test_name, self._get_since(days)]
+        if test_class:
+            query += " AND test_class = ?"
+            args.append(test_class)
+        query += " ORDER BY duration"
+        return [row[0] for row in self._conn.execute(query, args)]
+
+    def get_duration_percentile(self, test_name, p, test_class=None,
+                                days=DEFAULT_WINDOW_DAYS):
+        """Gets a percentile of the duration of a test, e.g. its p95 over the
+        last 30 days.
+
+        Returns:
+            The duration in seconds, or None if the test has no history.
+        """
+        return percentile(self.get_durations(test_name, test_class, days), p)
+
+    def get_expected_durations(self, test_class, days=DEFAULT_WINDOW_DAYS):
+        """Gets the median duration of each test case of a test class.
+
+        Returns:
+            A dictionary mapping test names to durations in seconds.
+        """
+        rows = self._conn.execute(
+            "SELECT test_name, duration FROM results WHERE test_class = ? "
+            "AND begin_time >= ? AND duration IS NOT NULL "
+            "ORDER BY test_name, duration",
+            (test_class, self._get_since(days)))
+        durations = {}
+        for test_name, duration in rows:
+            durations.setdefault(test_name, []).append(duration)
+        return {name: percentile(values, 50)
+                for name, values in durations.items()}
+
+    def estimate_duration(self, test_class, test_names=None,
+                          days=DEFAULT_WINDOW_DAYS):
+        """Predicts how long running tests of a test class takes.
+
+        Args:
+            test_class: A string that is the name of the test class.
+            test_names: A list of test case names, or None for all the test
+                cases of the class found in history.
+            days: How many days of history to consider.
+
+        Returns:
+            The predicted duration in seconds, or None if none of the tests
+            has history.
+        """
+        expected = self.get_expected_durations(test_class, days)
+        if test_names is not None:
+            expected = {name: expected[name] for name in test_names
+                        if name in expected}
+        if not expected:
+            return None
+        return sum(expected.values())
+
+    def get_flaky_tests(self, test_class=None, days=DEFAULT_WINDOW_DAYS,
+                        window=DEFAULT_FLAKY_WINDOW):
+        """Finds the tests that both passed and failed on the same build in
+        their recent executions.
+
+        Failing on one build and passing on the next is a fix or a
+        regression, not flakiness, so results are compared per build.
+
+        Args:
+            test_class: A string that is the name of the test class to look
+                at, or None for all test classes.
+            days: How many days of history to consider.
+            window: How many of the most recent executions of each test to
+                consider.
+
+        Returns:
+            A set of (test class name, test case name) tuples.
+        """
+        query = ("SELECT test_class, test_name, build, result FROM results "
+                 "WHERE begin_time >= ?")
+        args = [self._get_since(days)]
+        if test_class:
+            query += " AND test_class = ?"
+            args.append(test_class)
+        query += " ORDER BY test_class, test_name, begin_time DESC"
+        seen = {}
+        outcomes = {}
+        for cls, name, build, result in self._conn.execute(query, args):
+            key = (cls, name)
+            seen[key] = seen.get(key, 0) + 1
+            if seen[key] > window:
+                continue
+            if result == TestResultEnums.TEST_RESULT_PASS:
+                outcomes.setdefault((key, build), set()).add(True)
+            elif result in _FAILED_RESULTS:
+                outcomes.setdefault((key, build), set()).add(False)
+        return set(key for (key, _), o in outcomes.items() if len(o) == 2)
+
+    def get_failure_signatures(self, test_name, test_class=None,
+                               days=DEFAULT_WINDOW_DAYS):
+        """Counts the distinct failure signatures of a test.
+
+        Returns:
+            A list of (signature, count) tuples, most frequent first.
+        """
+        query = ("SELECT signature, COUNT(*) FROM results WHERE "
+                 "test_name = ? AND begin_time >= ? AND signature IS NOT NULL")
+        args = [test_name, self._get_since(days)]
+        if test_class:
+            query += " AND test_class = ?"
+            args.append(test_class)
+        query += " GROUP BY signature ORDER BY COUNT(*) DESC"
+        return [tuple(row) for row in self._conn.execute(query, args)]
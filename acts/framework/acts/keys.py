@@ -29,6 +29,10 @@ class Config(enum.Enum):
     key_testbed = "testbed"
     key_testbed_name = "name"
     key_test_paths = "testpaths"
+    key_log_queue_size = "log_queue_size"
+    key_log_max_bytes = "log_max_bytes"
+    key_log_backup_count = "log_backup_count"
+    key_log_debug_rate_limit = "log_debug_rate_limit"
     key_port = "Port"
     key_address = "Address"
     # Config names for controllers packaged in ACTS.
@@ -45,6 +49,10 @@ class Config(enum.Enum):
     ikey_logger = "log"
     ikey_logpath = "log_path"
     ikey_cli_args = "cli_args"
+    ikey_timeline = "timeline"
+    ikey_results_stream = "results_stream"
+    ikey_completed_tests = "completed_tests"
+    ikey_resume_log_path = "resume_log_path"
     # module name of controllers packaged in ACTS.
     m_key_monsoon = "monsoon"
     m_key_android_device = "android_device"
@@ -16,11 +16,18 @@
 
 from __future__ import print_function
 
+import atexit
 import datetime
+import gzip
 import logging
+import logging.handlers
 import os
+import queue
 import re
+import shutil
 import sys
+import threading
+import time
 
 from acts.utils import create_dir
 
@@ -32,6 +39,19 @@ log_line_timestamp_len = 18
 
 logline_timestamp_re = re.compile("\d\d-\d\d \d\d:\d\d:\d\d.\d\d\d")
 
+# Number of records that can wait to be written before logging calls block.
+DEFAULT_QUEUE_SIZE = 10000
+# How long a logging call waits for space in a full queue before the record
+# is dropped, in seconds.
+QUEUE_PUT_TIMEOUT = 1
+# Log files are not rotated by default.
+DEFAULT_MAX_BYTES = 0
+DEFAULT_BACKUP_COUNT = 5
+
+# Listeners of the loggers that have not been killed, stopped at exit so
+# queued records are not lost.
+_listeners = set()
+
 
 def _parse_logline_timestamp(t):
     """Parses a logline timestamp into a tuple.
@@ -112,19 +132,166 @@ def get_log_file_timestamp(delta=None):
     """
     return _get_timestamp("%m-%d-%Y_%H-%M-%S-%f", delta)
 
-def _get_test_logger(log_path, TAG, prefix=None, filename=None):
+class QueueHandler(logging.handlers.QueueHandler):
+    """A handler that puts records on a bounded queue.
+
+    When the queue is full, the logging call blocks for up to
+    QUEUE_PUT_TIMEOUT seconds, then the record is dropped and counted instead
+    of stalling the test.
+
+    Attributes:
+        listener: The QueueListener writing out the records of this handler.
+        dropped: Number of records dropped because the queue was full.
+    """
+    def __init__(self, q):
+        super(QueueHandler, self).__init__(q)
+        self.listener = None
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put(record, timeout=QUEUE_PUT_TIMEOUT)
+        except queue.Full:
+            self.dropped += 1
+
+
+class QueueListener(logging.handlers.QueueListener):
+    """A listener that writes records out to its handlers in a background
+    thread, honoring the level of each handler.
+    """
+    def handle(self, record):
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def stop(self):
+        """Writes out the records left in the queue and stops the thread."""
+        if self._thread:
+            super(QueueListener, self).stop()
+        _listeners.discard(self)
+
+
+class CompressingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """A size based rotating file handler that gzips rotated files in a
+    background thread, so the logging thread does not wait for compression.
+    """
+    def __init__(self, filename, max_bytes=0, backup_count=0):
+        super(CompressingRotatingFileHandler, self).__init__(
+            filename, maxBytes=max_bytes, backupCount=backup_count)
+        self._compress_thread = None
+
+    def rotation_filename(self, default_name):
+        return default_name + ".gz"
+
+    def rotate(self, source, dest):
+        # Backups are renamed on the next rotation, do not let that happen
+        # while one is still being written.
+        self.wait_for_compression()
+        tmp_path = dest + ".tmp"
+        os.rename(source, tmp_path)
+        self._compress_thread = threading.Thread(target=self._compress,
+                                                 args=(tmp_path, dest))
+        self._compress_thread.start()
+
+    @staticmethod
+    def _compress(source, dest):
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+    def wait_for_compression(self):
+        if self._compress_thread:
+            self._compress_thread.join()
+            self._compress_thread = None
+
+    def close(self):
+        super(CompressingRotatingFileHandler, self).close()
+        self.wait_for_compression()
+
+
+class RateLimitFilter(logging.Filter):
+    """Limits how many records each logging call site lets through per
+    period, for logging in hot loops.
+
+    Records above max_level are never limited.
+    """
+    def __init__(self, rate, period=1, max_level=logging.DEBUG):
+        super(RateLimitFilter, self).__init__()
+        self.rate = rate
+        self.period = period
+        self.max_level = max_level
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno > self.max_level:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.time()
+        with self._lock:
+            start, count = self._windows.get(key, (now, 0))
+            if now - start >= self.period:
+                start, count = now, 0
+            self._windows[key] = (start, count + 1)
+        return count < self.rate
+
+
+class SamplingFilter(logging.Filter):
+    """Lets through one record out of every n from each logging call site.
+
+    Records above max_level are never sampled.
+    """
+    def __init__(self, n, max_level=logging.DEBUG):
+        super(SamplingFilter, self).__init__()
+        self.n = n
+        self.max_level = max_level
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno > self.max_level:
+            return True
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        return count % self.n == 0
+
+
+def _stop_listeners():
+    for listener in list(_listeners):
+        listener.stop()
+
+atexit.register(_stop_listeners)
+
+
+def _get_test_logger(log_path, TAG, prefix=None, filename=None,
+                     queue_size=DEFAULT_QUEUE_SIZE,
+                     max_bytes=DEFAULT_MAX_BYTES,
+                     backup_count=DEFAULT_BACKUP_COUNT,
+                     debug_rate_limit=None):
     """Returns a logger object used for tests.
 
     The logger object has a stream handler and a file handler. The stream
     handler logs INFO level to the terminal, the file handler logs DEBUG
     level to files.
 
+    The handlers are driven by a QueueListener thread, the logger itself only
+    puts records on a bounded queue, so logging calls do not block on I/O.
+
     Args:
         log_path: Location of the log file.
         TAG: Name of the logger's owner.
         prefix: A prefix for each log line in terminal.
         filename: Name of the log file. The default is the time the logger
             is requested.
+        queue_size: Maximum number of records waiting to be written.
+        max_bytes: Size in bytes at which the log file is rotated, 0 to never
+            rotate it.
+        backup_count: Number of compressed rotated log files kept.
+        debug_rate_limit: Maximum number of DEBUG records per second let
+            through from each logging call site, None for no limit.
 
     Returns:
         A logger configured with one stream handler and one file handler
@@ -149,11 +316,18 @@ def _get_test_logger(log_path, TAG, prefix=None, filename=None):
     if filename is None:
         filename = get_log_file_timestamp()
         create_dir(log_path)
-    fh = logging.FileHandler(os.path.join(log_path, 'test_run_details.txt'))
+    fh = CompressingRotatingFileHandler(
+        os.path.join(log_path, 'test_run_details.txt'), max_bytes,
+        backup_count)
     fh.setFormatter(f_formatter)
     fh.setLevel(logging.DEBUG)
-    log.addHandler(ch)
-    log.addHandler(fh)
+    qh = QueueHandler(queue.Queue(queue_size))
+    if debug_rate_limit:
+        qh.addFilter(RateLimitFilter(debug_rate_limit))
+    qh.listener = QueueListener(qh.queue, ch, fh)
+    qh.listener.start()
+    _listeners.add(qh.listener)
+    log.addHandler(qh)
     log.log_path = log_path
     return log
 
@@ -165,6 +339,13 @@ def kill_test_logger(logger):
     """
     for h in list(logger.handlers):
         logger.removeHandler(h)
+        if isinstance(h, QueueHandler):
+            h.listener.stop()
+            for handler in h.listener.handlers:
+                handler.close()
+            if h.dropped:
+                print("%d log records of %s were dropped, the log queue was "
+                      "full." % (h.dropped, logger.name))
         if isinstance(h, logging.FileHandler):
             h.close()
 
@@ -179,7 +360,7 @@ def create_latest_log_alias(actual_path):
         os.remove(link_path)
     os.symlink(actual_path, link_path)
 
-def get_test_logger(log_path, TAG, prefix=None, filename=None):
+def get_test_logger(log_path, TAG, prefix=None, filename=None, **kwargs):
     """Returns a logger customized for a test run.
 
     Args:
@@ -188,6 +369,7 @@ def get_test_logger(log_path, TAG, prefix=None, filename=None):
         prefix: A prefix for each log line in terminal.
         filename: Name of the files. The default is the time the objects
             are requested.
+        kwargs: Queue, rotation and rate limit options, see _get_test_logger.
 
     Returns:
         A logger object.
@@ -195,7 +377,7 @@ def get_test_logger(log_path, TAG, prefix=None, filename=None):
     if filename is None:
         filename = get_log_file_timestamp()
     create_dir(log_path)
-    logger = _get_test_logger(log_path, TAG, prefix, filename)
+    logger = _get_test_logger(log_path, TAG, prefix, filename, **kwargs)
     create_latest_log_alias(log_path)
     return logger
 
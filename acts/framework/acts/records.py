@@ -19,12 +19,16 @@
 """
 
 import json
+import os
 import pprint
+import threading
 
 from acts.signals import TestSignal
 from acts.utils import epoch_to_human_time
 from acts.utils import get_current_epoch_time
 
+_current = threading.local()
+
 class TestResultEnums(object):
     """Enums used for TestResultRecord class.
 
@@ -40,6 +44,8 @@ class TestResultEnums(object):
     RECORD_UID = "UID"
     RECORD_EXTRAS = "Extras"
     RECORD_EXTRA_ERRORS = "Extra Errors"
+    RECORD_PHASES = "Phase Durations"
+    RECORD_METRICS = "Metrics"
     RECORD_DETAILS = "Details"
     TEST_RESULT_PASS = "PASS"
     TEST_RESULT_FAIL = "FAIL"
@@ -57,6 +63,11 @@ class TestResultRecord(object):
         self.result: Test result, PASS/FAIL/SKIP.
         self.extras: User defined extra information of the test result.
         self.details: A string explaining the details of the test case.
+        self.phases: A dict mapping the names of the phases of the test case
+            execution, e.g. "setup_test" or "on_fail", to their durations in
+            seconds.
+        self.metrics: A dict mapping the names of measurements taken during
+            the test case, e.g. "call_kpi", to lists of their values.
     """
 
     def __init__(self, t_name, t_class=None):
@@ -69,6 +80,8 @@ class TestResultRecord(object):
         self.extras = None
         self.details = None
         self.extra_errors = {}
+        self.phases = {}
+        self.metrics = {}
 
     def test_begin(self):
         """Call this when the test case it records begins execution.
@@ -130,6 +143,24 @@ class TestResultRecord(object):
         """
         self._test_end(TestResultEnums.TEST_RESULT_UNKNOWN, e)
 
+    def add_phase_duration(self, phase, duration):
+        """Adds time spent in a phase of the test case execution.
+
+        Args:
+            phase: A string that is the name of the phase.
+            duration: The time spent in the phase, in seconds.
+        """
+        self.phases[phase] = self.phases.get(phase, 0) + duration
+
+    def add_metric(self, name, value):
+        """Adds a measurement taken during the test case execution.
+
+        Args:
+            name: A string that is the name of the measurement.
+            value: A json serializable measured value.
+        """
+        self.metrics.setdefault(name, []).append(value)
+
     def add_error(self, tag, e):
         """Add extra error happened during a test mark the test result as
         UNKNOWN.
@@ -171,8 +202,33 @@ class TestResultRecord(object):
         d[TestResultEnums.RECORD_EXTRAS] = self.extras
         d[TestResultEnums.RECORD_DETAILS] = self.details
         d[TestResultEnums.RECORD_EXTRA_ERRORS] = self.extra_errors
+        d[TestResultEnums.RECORD_PHASES] = self.phases
+        d[TestResultEnums.RECORD_METRICS] = self.metrics
         return d
 
+    @classmethod
+    def from_dict(cls, d):
+        """Creates a record from the output of to_dict.
+
+        Args:
+            d: A dictionary as returned by to_dict.
+
+        Returns:
+            A TestResultRecord object.
+        """
+        record = cls(d[TestResultEnums.RECORD_NAME],
+                     d.get(TestResultEnums.RECORD_CLASS))
+        record.begin_time = d.get(TestResultEnums.RECORD_BEGIN_TIME)
+        record.end_time = d.get(TestResultEnums.RECORD_END_TIME)
+        record.result = d.get(TestResultEnums.RECORD_RESULT)
+        record.uid = d.get(TestResultEnums.RECORD_UID)
+        record.extras = d.get(TestResultEnums.RECORD_EXTRAS)
+        record.details = d.get(TestResultEnums.RECORD_DETAILS)
+        record.extra_errors = d.get(TestResultEnums.RECORD_EXTRA_ERRORS) or {}
+        record.phases = d.get(TestResultEnums.RECORD_PHASES) or {}
+        record.metrics = d.get(TestResultEnums.RECORD_METRICS) or {}
+        return record
+
     def json_str(self):
         """Converts this test record to a string in json format.
 
@@ -232,6 +288,24 @@ class TestResult(object):
             setattr(sum_result, name, l_value + r_value)
         return sum_result
 
+    def __iadd__(self, r):
+        """Overrides '+=' operator for TestResult class.
+
+        Unlike '+', this extends the lists of this TestResult in place, so
+        merging costs O(1) per record of r instead of copying every record
+        merged so far.
+
+        Args:
+            r: another instance of TestResult to be added
+
+        Returns:
+            This TestResult instance.
+        """
+        assert isinstance(r, TestResult)
+        for name in self.__dict__:
+            getattr(self, name).extend(getattr(r, name))
+        return self
+
     def add_record(self, record):
         """Adds a test record to test result.
 
@@ -250,6 +324,18 @@ class TestResult(object):
         else:
             self.unknown.append(record)
 
+    def remove_record(self, record):
+        """Removes a test record from test result, e.g. because the test was
+        executed again.
+
+        Args:
+            record: A test record object previously added.
+        """
+        self.executed.remove(record)
+        for records in (self.failed, self.skipped, self.passed, self.unknown):
+            if record in records:
+                records.remove(record)
+
     def fail_class(self, class_name, e):
         """Add a record to indicate a test class setup has failed and no test
         in the class was executed.
@@ -257,6 +343,9 @@ class TestResult(object):
         Args:
             class_name: A string that is the name of the failed test class.
             e: An exception object.
+
+        Returns:
+            The record added.
         """
         record = TestResultRecord("", class_name)
         record.test_begin()
@@ -269,6 +358,7 @@ class TestResult(object):
         record.test_fail(new_e)
         self.executed.append(record)
         self.failed.append(record)
+        return record
 
     def json_str(self):
         """Converts this test result to a string in json format.
@@ -327,3 +417,112 @@ class TestResult(object):
         d["Skipped"] = len(self.skipped)
         d["Unknown"] = len(self.unknown)
         return d
+
+
+class TestResultStream(object):
+    """An append-only file of test results in JSON Lines format.
+
+    Each line is a json object, either {"Record": <test record dict>} for a
+    test case that completed, {"Requested": [<test name>, ...]} for the
+    tests requested by a test class, or {"Superseded": <test record dict>}
+    for a record replaced by a later execution of the same test. Every line
+    is flushed and fsynced as soon as it is written, so the results survive
+    the test run being killed.
+
+    Attributes:
+        path: A string that is the path of the file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a')
+
+    def _write(self, d):
+        line = json.dumps(d) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def add_record(self, record):
+        """Appends a completed test record.
+
+        Args:
+            record: A TestResultRecord object.
+        """
+        self._write({"Record": record.to_dict()})
+
+    def add_superseded(self, record):
+        """Appends a line removing a record previously appended.
+
+        Args:
+            record: A TestResultRecord object previously appended.
+        """
+        self._write({"Superseded": record.to_dict()})
+
+    def add_requested(self, test_names):
+        """Appends the names of requested tests.
+
+        Args:
+            test_names: A list of strings, each is the name of a test
+                requested by user.
+        """
+        self._write({"Requested": list(test_names)})
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    @staticmethod
+    def load(path):
+        """Rebuilds a TestResult from a results stream.
+
+        A partially written last line, left by a killed test run, is
+        ignored.
+
+        Args:
+            path: The path of the results stream file.
+
+        Returns:
+            A TestResult object.
+        """
+        result = TestResult()
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    d = json.loads(line)
+                except ValueError:
+                    continue
+                if "Record" in d:
+                    result.add_record(TestResultRecord.from_dict(d["Record"]))
+                elif "Requested" in d:
+                    result.requested.extend(d["Requested"])
+                elif "Superseded" in d:
+                    superseded = d["Superseded"]
+                    for record in result.executed:
+                        if record.to_dict() == superseded:
+                            result.remove_record(record)
+                            break
+        return result
+
+
+def set_current_record(record):
+    """Sets the record of the test case executing in the calling thread.
+
+    Args:
+        record: A TestResultRecord object, or None when the test case is done.
+    """
+    _current.record = record
+
+
+def get_current_record():
+    """Gets the record of the test case executing in the calling thread.
+
+    This lets test utilities attach measurements, like call setup timings,
+    to the test case they are used in.
+
+    Returns:
+        A TestResultRecord object, or None.
+    """
+    return getattr(_current, "record", None)
@@ -19,20 +19,64 @@ __author__ = "angli@google.com"
 from future import standard_library
 standard_library.install_aliases()
 
+import ast
 import copy
 import importlib
 import inspect
+import json
 import os
 import pkgutil
 import sys
+import time
 
+from acts import history
 from acts import keys
 from acts import logger
 from acts import records
 from acts import signals
+from acts import tracing
 from acts import utils
 
 
+TEST_INDEX_FILE_NAME = "test_index.json"
+RESULTS_STREAM_FILE_NAME = "test_run_results.jsonl"
+
+
+def _is_testfile_name(name, ext):
+    if ext == ".py":
+        if name.endswith("Test") or name.endswith("_test"):
+            return True
+    return False
+
+def _scan_test_classes(file_path):
+    """Finds the names of the test classes defined at the top level of a
+    test script without importing it.
+
+    Args:
+        file_path: The path to the test script.
+
+    Returns:
+        A list of class names ending with "Test". The list is empty if the
+        file cannot be parsed.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            tree = ast.parse(f.read(), file_path)
+    except (IOError, OSError, SyntaxError, ValueError):
+        return []
+    return [node.name for node in tree.body
+            if isinstance(node, ast.ClassDef) and node.name.endswith("Test")]
+
+def _get_test_classes(module):
+    test_classes = {}
+    for member_name in dir(module):
+        if not member_name.startswith("__"):
+            if member_name.endswith("Test"):
+                test_class = getattr(module, member_name)
+                if inspect.isclass(test_class):
+                    test_classes[member_name] = test_class
+    return test_classes
+
 class USERError(Exception):
     """Raised when a problem is caused by user mistake, e.g. wrong command,
     misformatted config, test info, wrong test paths etc.
@@ -57,15 +101,39 @@ class TestRunner(object):
                                   objects used in a test run.
         self.controller_destructors: A dictionary that holds the controller
                                      distructors. Keys are controllers' names.
+        self.controller_health_checks: A dictionary that holds the optional
+                                       health check functions of controller
+                                       modules. Keys are controllers' names.
+        self.reuse_controllers: A boolean. If True, controller objects are
+                                kept across calls to run and only destroyed
+                                by stop.
         self.test_classes: A dictionary where we can look up the test classes
                            by name to instantiate.
         self.run_list: A list of tuples specifying what tests to run.
         self.results: The test result object used to record the results of
                       this test run.
+        self.results_stream: The records.TestResultStream each test record is
+                             appended to as soon as it completes. Created by
+                             the first call to run.
+        self.history: The history.TestHistory the results of this run are
+                      stored in by stop, and which known flaky tests are
+                      looked up in. None if it could not be opened.
+        self.dut_build: The build id of the first Android device, if any.
+        self.dut_model: The model of the first Android device, if any.
+        self.completed_tests: A dictionary mapping test class names to
+                              dictionaries of test names to results, for the
+                              tests completed by a previous run this run
+                              resumes. These tests are not executed again.
         self.running: A boolean signifies whether this test run is ongoing or
                       not.
+        self.timeline: A tracing.Timeline object recording controller creation,
+                       device setup and test phases of this test run. It is
+                       written to timeline.json in the log path by stop.
+        self.create_time: Epoch timestamp of when this test run was created.
+        self.first_test_time: Epoch timestamp of when the first test class
+                              started, None until then.
     """
-    def __init__(self, test_configs, run_list):
+    def __init__(self, test_configs, run_list, reuse_controllers=False):
         self.test_run_info = {}
         self.test_configs = test_configs
         self.testbed_configs = self.test_configs[keys.Config.key_testbed.value]
@@ -79,21 +147,71 @@ class TestRunner(object):
         self.log_path = os.path.abspath(l_path)
         self.log = logger.get_test_logger(self.log_path,
                                           self.id,
-                                          self.testbed_name)
+                                          self.testbed_name,
+                                          **self._get_logger_options())
         self.controller_registry = {}
         self.controller_destructors = {}
+        self.controller_health_checks = {}
+        self.reuse_controllers = reuse_controllers
         self.run_list = run_list
         self.results = records.TestResult()
+        self.results_stream = None
+        self.completed_tests = {}
         self.running = False
+        self.dut_build = None
+        self.dut_model = None
+        # Records that must not be stored in history again, and records
+        # replaced by a retry, which must still be stored.
+        self._resumed_record_ids = set()
+        self._superseded_records = []
+        history_path = os.path.join(
+            self.test_configs[keys.Config.key_log_path.value],
+            history.HISTORY_FILE_NAME)
+        try:
+            self.history = history.TestHistory(history_path)
+        except Exception:
+            self.log.exception("Failed to open test history %s.",
+                               history_path)
+            self.history = None
+        self.timeline = tracing.Timeline(self.id)
+        resume_log_path = self.test_configs.get(
+            keys.Config.ikey_resume_log_path.value)
+        if resume_log_path:
+            self.resume(resume_log_path)
+        self.create_time = time.time()
+        self.first_test_time = None
+
+    def _get_logger_options(self):
+        """Gets the options of the test logger set in the test config.
+
+        Returns:
+            A dict of keyword arguments for logger.get_test_logger.
+        """
+        options = {}
+        option_keys = {
+            "queue_size": keys.Config.key_log_queue_size,
+            "max_bytes": keys.Config.key_log_max_bytes,
+            "backup_count": keys.Config.key_log_backup_count,
+            "debug_rate_limit": keys.Config.key_log_debug_rate_limit
+        }
+        for option, key in option_keys.items():
+            if key.value in self.test_configs:
+                options[option] = int(self.test_configs[key.value])
+        return options
 
     def import_test_modules(self, test_paths):
-        """Imports test classes from test scripts.
+        """Imports the test classes on the run list from test scripts.
 
         1. Locate all .py files under test paths.
-        2. Import the .py files as modules.
-        3. Find the module members that are test classes.
+        2. Look up the test classes defined in each file in the test index,
+           scanning the files that changed since the index was cached.
+        3. Import only the files defining test classes on the run list.
         4. Categorize the test classes by name.
 
+        If a test class on the run list is not in the index, e.g. because it
+        is imported into a test script rather than defined there, all test
+        scripts are imported instead.
+
         Args:
             test_paths: A list of directory paths where the test files reside.
 
@@ -101,39 +219,108 @@ class TestRunner(object):
             A dictionary where keys are test class name strings, values are
             actual test classes that can be instantiated.
         """
-        def is_testfile_name(name, ext):
-            if ext == ".py":
-                if name.endswith("Test") or name.endswith("_test"):
-                    return True
-            return False
-        file_list = utils.find_files(test_paths, is_testfile_name)
+        begin_time = time.time()
+        file_list = utils.find_files(test_paths, _is_testfile_name)
+        for path, _, _ in file_list:
+            if path not in sys.path:
+                sys.path.append(path)
+        index = self.load_test_index(file_list)
         test_classes = {}
-        for path, name, _ in file_list:
-            sys.path.append(path)
-            try:
-                module = importlib.import_module(name)
-            except:
-                for test_cls_name, _ in self.run_list:
-                    alt_name = name.replace('_', '').lower()
-                    alt_cls_name = test_cls_name.lower()
-                    # Only block if a test class on the run list causes an
-                    # import error. We need to check against both naming
-                    # conventions: AaaBbb and aaa_bbb.
-                    if name == test_cls_name or alt_name == alt_cls_name:
-                        msg = ("Encountered error importing test class %s, "
-                               "abort.") % test_cls_name
-                        # This exception is logged here to help with debugging
-                        # under py2, because "raise X from Y" syntax is only
-                        # supported under py3.
-                        self.log.exception(msg)
-                        raise USERError(msg)
+        for test_cls_name, _ in self.run_list:
+            if test_cls_name in test_classes:
                 continue
-            for member_name in dir(module):
-                if not member_name.startswith("__"):
-                    if member_name.endswith("Test"):
-                        test_class = getattr(module, member_name)
-                        if inspect.isclass(test_class):
-                            test_classes[member_name] = test_class
+            if test_cls_name not in index:
+                self.log.debug("Test class %s is not in the test index, "
+                               "importing all test scripts.", test_cls_name)
+                return self._import_all_test_modules(file_list)
+            name = index[test_cls_name]
+            module = self._import_test_module(name)
+            if module:
+                test_classes.update(_get_test_classes(module))
+        self.log.debug("Imported %d test classes in %.3fs.",
+                       len(test_classes), time.time() - begin_time)
+        return test_classes
+
+    def load_test_index(self, file_list):
+        """Gets the test class names defined in each test script.
+
+        Test scripts are scanned with the ast module instead of being
+        imported. The result is cached in the log path, keyed by the path and
+        modification time of each script, so unchanged scripts are not
+        scanned again.
+
+        Args:
+            file_list: A list of (directory, module name, extension) tuples as
+                returned by utils.find_files.
+
+        Returns:
+            A dictionary mapping test class names to module names.
+        """
+        index_path = os.path.join(
+            self.test_configs[keys.Config.key_log_path.value],
+            TEST_INDEX_FILE_NAME)
+        try:
+            with open(index_path, 'r') as f:
+                cache = json.load(f)
+        except (IOError, OSError, ValueError):
+            cache = {}
+        new_cache = {}
+        index = {}
+        for path, name, ext in file_list:
+            file_path = os.path.join(path, name + ext)
+            mtime = os.path.getmtime(file_path)
+            entry = cache.get(file_path)
+            if not entry or entry["mtime"] != mtime:
+                entry = {"mtime": mtime,
+                         "classes": _scan_test_classes(file_path)}
+            new_cache[file_path] = entry
+            for test_cls_name in entry["classes"]:
+                index.setdefault(test_cls_name, name)
+        if new_cache != cache:
+            try:
+                utils.create_dir(os.path.dirname(index_path))
+                with open(index_path, 'w') as f:
+                    json.dump(new_cache, f, indent=4, sort_keys=True)
+            except (IOError, OSError):
+                self.log.warning("Failed to write test index to %s.",
+                                 index_path)
+        return index
+
+    def _import_test_module(self, name):
+        """Imports a test script.
+
+        Args:
+            name: The module name of the test script.
+
+        Returns:
+            The module object, or None if importing it failed and none of the
+            test classes on the run list are named after it.
+        """
+        try:
+            return importlib.import_module(name)
+        except:
+            for test_cls_name, _ in self.run_list:
+                alt_name = name.replace('_', '').lower()
+                alt_cls_name = test_cls_name.lower()
+                # Only block if a test class on the run list causes an
+                # import error. We need to check against both naming
+                # conventions: AaaBbb and aaa_bbb.
+                if name == test_cls_name or alt_name == alt_cls_name:
+                    msg = ("Encountered error importing test class %s, "
+                           "abort.") % test_cls_name
+                    # This exception is logged here to help with debugging
+                    # under py2, because "raise X from Y" syntax is only
+                    # supported under py3.
+                    self.log.exception(msg)
+                    raise USERError(msg)
+            return None
+
+    def _import_all_test_modules(self, file_list):
+        test_classes = {}
+        for _, name, _ in file_list:
+            module = self._import_test_module(name)
+            if module:
+                test_classes.update(_get_test_classes(module))
         return test_classes
 
     @staticmethod
@@ -175,6 +362,9 @@ class TestRunner(object):
                       controller module raises exceptions. If False, returns
                       None upon failures.
 
+        If self.reuse_controllers is True, registering a module that has
+        already been registered returns the existing controller objects.
+
         Returns:
             A list of controller objects instantiated from controller_module, or
             None.
@@ -196,6 +386,10 @@ class TestRunner(object):
             builtin = False
             module_ref_name = module.__name__.split('.')[-1]
         if module_ref_name in self.controller_registry:
+            if self.reuse_controllers:
+                self.log.debug("Reusing objects for controller %s",
+                               module_ref_name)
+                return self.controller_registry[module_ref_name]
             raise signals.ControllerError(("Controller module %s has already "
                                            "been registered. It can not be "
                                            "registered again."
@@ -217,7 +411,9 @@ class TestRunner(object):
             # in case the controller module modifies the config internally.
             original_config = self.testbed_configs[module_config_name]
             controller_config = copy.deepcopy(original_config)
-            objects = create(controller_config, self.log)
+            with self.timeline.span("create %s" % module_ref_name,
+                                    "controller"):
+                objects = create(controller_config, self.log)
         except:
             self.log.exception(("Failed to initialize objects for controller "
                                 "%s, abort!"), module_config_name)
@@ -234,21 +430,57 @@ class TestRunner(object):
                        module_config_name)
         destroy_func = module.destroy
         self.controller_destructors[module_ref_name] = destroy_func
+        health_check = getattr(module, "health_check", None)
+        if health_check:
+            self.controller_health_checks[module_ref_name] = health_check
         return objects
 
+    def unregister_controller(self, name):
+        """Destroys the objects of one controller and removes it from the
+        internal registry.
+
+        Args:
+            name: The name the controller module is registered under.
+        """
+        try:
+            self.log.debug("Destroying %s.", name)
+            with self.timeline.span("destroy %s" % name, "controller"):
+                destroy = self.controller_destructors[name]
+                destroy(self.controller_registry[name])
+        except:
+            self.log.exception("Exception occurred destroying %s.", name)
+        del self.controller_registry[name]
+        del self.controller_destructors[name]
+        self.controller_health_checks.pop(name, None)
+        self.test_run_info.pop(name, None)
+
     def unregister_controllers(self):
         """Destroy controller objects and clear internal registry.
 
-        This will be called at the end of each TestRunner.run call.
+        This will be called at the end of each TestRunner.run call, or by
+        TestRunner.stop if self.reuse_controllers is True.
+        """
+        for name in list(self.controller_registry):
+            self.unregister_controller(name)
+
+    def check_controllers(self):
+        """Runs the health checks of the registered controllers and destroys
+        the ones that failed, so they are re-created when registered again.
+
+        Controller modules may provide a health_check function that takes the
+        list of controller objects and returns False if they are no longer
+        usable. Modules without one are assumed to be healthy.
         """
-        for name, destroy in self.controller_destructors.items():
+        for name, health_check in list(self.controller_health_checks.items()):
             try:
-                self.log.debug("Destroying %s.", name)
-                destroy(self.controller_registry[name])
+                healthy = health_check(self.controller_registry[name])
             except:
-                self.log.exception("Exception occurred destroying %s.", name)
-        self.controller_registry = {}
-        self.controller_destructors = {}
+                self.log.exception("Exception occurred checking %s.", name)
+                healthy = False
+            if not healthy:
+                self.log.warning("Controller %s failed its health check, "
+                                 "re-creating it.", name)
+                self.unregister_controller(name)
 
     def parse_config(self, test_configs):
         """Parses the test configuration and unpacks objects and parameters
@@ -271,6 +503,11 @@ class TestRunner(object):
         self.test_run_info[keys.Config.ikey_logger.value] = self.log
         cli_args = test_configs[keys.Config.ikey_cli_args.value]
         self.test_run_info[keys.Config.ikey_cli_args.value] = cli_args
+        self.test_run_info[keys.Config.ikey_timeline.value] = self.timeline
+        self.test_run_info[keys.Config.ikey_results_stream.value] = (
+            self.results_stream)
+        self.test_run_info[keys.Config.ikey_completed_tests.value] = (
+            self.completed_tests)
         user_param_pairs = []
         for item in test_configs.items():
             if item[0] not in keys.Config.reserved_keys.value:
@@ -325,29 +562,51 @@ class TestRunner(object):
 
         with test_cls(self.test_run_info) as test_cls_instance:
             try:
-                cls_result = test_cls_instance.run(test_cases)
-                self.results += cls_result
+                with self.timeline.span(test_cls_name, "test_class"):
+                    cls_result = test_cls_instance.run(test_cases)
+                self._add_class_result(cls_result)
             except signals.TestAbortAll as e:
-                self.results += e.results
+                self._add_class_result(e.results)
                 raise e
 
+    def _add_class_result(self, cls_result):
+        """Merges the results of a test class into the results of this run.
+
+        The records were already streamed by the test class as they
+        completed; only the requested test names are left to stream.
+        """
+        self.results += cls_result
+        self.results_stream.add_requested(cls_result.requested)
+
     def run(self):
         """Executes test cases.
 
         This will instantiate controller and test classes, and execute test
         classes. This can be called multiple times to repeatly execute the
-        requested test cases.
+        requested test cases. If self.reuse_controllers is True, controller
+        objects are created by the first call, health checked by the following
+        ones, and destroyed by TestRunner.stop.
 
         A call to TestRunner.stop should eventually happen to conclude the life
         cycle of a TestRunner.
         """
         if not self.running:
             self.running = True
+        self._open_results_stream()
+        first_record = len(self.results.executed)
+        # Let controller modules record device setup on this run's timeline.
+        tracing.set_current_timeline(self.timeline)
+        # Controllers kept from a previous run are only re-created if they
+        # are no longer healthy.
+        with self.timeline.span("check_controllers", "controller"):
+            self.check_controllers()
         # Initialize controller objects and pack appropriate objects/params
         # to be passed to test class.
         self.parse_config(self.test_configs)
+        self._update_dut_info()
         t_configs = self.test_configs[keys.Config.key_test_paths.value]
-        self.test_classes = self.import_test_modules(t_configs)
+        with self.timeline.span("import_test_modules", "test_runner"):
+            self.test_classes = self.import_test_modules(t_configs)
         self.log.debug("Executing run list %s.", self.run_list)
         try:
             for test_cls_name, test_case_names in self.run_list:
@@ -359,14 +618,136 @@ class TestRunner(object):
                                    test_cls_name)
                 else:
                     self.log.debug("Executing test class %s", test_cls_name)
+                if self.first_test_time is None:
+                    self.first_test_time = time.time()
+                    self.log.debug("First test class started %.3fs after the "
+                                   "test run was created.",
+                                   self.first_test_time - self.create_time)
                 try:
                     self.run_test_class(test_cls_name, test_case_names)
                 except signals.TestAbortAll as e:
                     self.log.warning(("Abort all subsequent test classes. Reason: "
                                       "%s"), e)
                     raise
+            if self.running:
+                self._retry_flaky_tests(first_record)
         finally:
-            self.unregister_controllers()
+            if not self.reuse_controllers:
+                self.unregister_controllers()
+
+    def _update_dut_info(self):
+        """Gets the build and model of the first Android device, which the
+        results are filed under in the test history.
+        """
+        if self.dut_model is not None:
+            return
+        ads = self.controller_registry.get("android_devices")
+        if not ads:
+            return
+        try:
+            self.dut_model = ads[0].model
+            self.dut_build = ads[0].build_id
+        except:
+            self.log.exception("Failed to get the build of %s.", ads[0].serial)
+
+    def _retry_flaky_tests(self, first_record):
+        """Executes the tests that failed in this run once more, if the test
+        history knows them to be flaky.
+
+        The retry's record replaces the failed one in the results of this run,
+        whatever its result. The failed record is still stored in history.
+
+        Args:
+            first_record: The index in self.results.executed of the first
+                record of this run.
+        """
+        if not self.history:
+            return
+        failed_results = (records.TestResultEnums.TEST_RESULT_FAIL,
+                          records.TestResultEnums.TEST_RESULT_UNKNOWN)
+        failed = [r for r in self.results.executed[first_record:]
+                  if r.result in failed_results]
+        if not failed:
+            return
+        flaky = self.history.get_flaky_tests()
+        for record in failed:
+            test_cls = self.test_classes.get(record.test_class)
+            if ((record.test_class, record.test_name) not in flaky or
+                    not test_cls or
+                    not record.test_name.startswith("test_") or
+                    not hasattr(test_cls, record.test_name)):
+                continue
+            self.log.info("Retrying %s in %s, it is known to be flaky.",
+                          record.test_name, record.test_class)
+            with test_cls(self.test_run_info) as test_cls_instance:
+                with self.timeline.span(record.test_class, "test_class",
+                                        retry=record.test_name):
+                    retry_result = test_cls_instance.run([record.test_name])
+            if not retry_result.executed:
+                continue
+            self.results.remove_record(record)
+            self.results_stream.add_superseded(record)
+            self._superseded_records.append(record)
+            for retry_record in retry_result.executed:
+                self.results.add_record(retry_record)
+
+    def _store_history(self):
+        """Stores the records of this run in the test history."""
+        if not self.history:
+            return
+        new_records = [r for r in self.results.executed
+                       if id(r) not in self._resumed_record_ids]
+        try:
+            self.history.add_records(self.testbed_name,
+                                     new_records + self._superseded_records,
+                                     self.dut_build, self.dut_model)
+        except Exception:
+            self.log.exception("Failed to store results in test history.")
+        self.history.close()
+        self.history = None
+
+    def _open_results_stream(self):
+        if not self.results_stream:
+            self.results_stream = records.TestResultStream(
+                os.path.join(self.log_path, RESULTS_STREAM_FILE_NAME))
+
+    def resume(self, log_path):
+        """Resumes an interrupted test run.
+
+        The records with a terminal result, i.e. pass, fail or skip, are
+        loaded from the results stream of the previous run and added to the
+        results of this run. The corresponding test cases are skipped when
+        the test classes are executed, so only the tests that did not
+        complete, or ended with an unknown result, are executed again.
+
+        Args:
+            log_path: The log path of the test run to resume.
+
+        Raises:
+            USERError is raised if there is no results stream in log_path.
+        """
+        path = os.path.join(log_path, RESULTS_STREAM_FILE_NAME)
+        if not os.path.isfile(path):
+            raise USERError("No test results to resume from in %s." % log_path)
+        previous = records.TestResultStream.load(path)
+        self._open_results_stream()
+        terminal = (records.TestResultEnums.TEST_RESULT_PASS,
+                    records.TestResultEnums.TEST_RESULT_FAIL,
+                    records.TestResultEnums.TEST_RESULT_SKIP)
+        num_resumed = 0
+        for record in previous.executed:
+            # A record without test name is a setup_class failure, which is
+            # worth retrying.
+            if record.result not in terminal or not record.test_name:
+                continue
+            tests = self.completed_tests.setdefault(record.test_class, {})
+            tests[record.test_name] = record.result
+            self.results.add_record(record)
+            self.results_stream.add_record(record)
+            self._resumed_record_ids.add(id(record))
+            num_resumed += 1
+        self.log.info("Resumed %d completed tests from %s.", num_resumed,
+                      log_path)
 
     def stop(self):
         """Releases resources from test run. Should always be called after
@@ -374,10 +755,16 @@ class TestRunner(object):
 
         This function concludes a test run and writes out a test report.
         """
+        self.unregister_controllers()
+        if tracing.get_current_timeline() is self.timeline:
+            tracing.set_current_timeline(None)
         if self.running:
             msg = "\nSummary for test run %s: %s\n" % (self.id,
                 self.results.summary_str())
             self._write_results_json_str()
+            self._store_history()
+            self.timeline.write(os.path.join(self.log_path,
+                                             tracing.TIMELINE_FILE_NAME))
             self.log.info(msg.strip())
             logger.kill_test_logger(self.log)
             self.running = False
@@ -385,11 +772,19 @@ class TestRunner(object):
     def _write_results_json_str(self):
         """Writes out a json file with the test result info for easy parsing.
 
+        The content is derived from the results stream, which is what is left
+        if a test run gets killed before reaching this point.
+
         TODO(angli): This should be replaced by standard log record mechanism.
         """
+        results = self.results
+        if self.results_stream:
+            self.results_stream.close()
+            results = records.TestResultStream.load(self.results_stream.path)
+            self.results_stream = None
         path = os.path.join(self.log_path, "test_run_summary.json")
         with open(path, 'w') as f:
-            f.write(self.results.json_str())
+            f.write(results.json_str())
 
 if __name__ == "__main__":
     pass
@@ -101,14 +101,14 @@ def run_continuous_write_descriptor(cen_droid, cen_ed, per_droid, per_ed,
                 characteristic_uuids = (
                     cen_droid.gattClientGetDiscoveredCharacteristicUuids(
                         discovered_services_index, i))
-                log.info(characteristic_uuids)
+                log.debug(characteristic_uuids)
                 for characteristic in characteristic_uuids:
                     descriptor_uuids = (
                         cen_droid.gattClientGetDiscoveredDescriptorUuids(
                             discovered_services_index, i, characteristic))
-                    log.info(descriptor_uuids)
+                    log.debug(descriptor_uuids)
                     for descriptor in descriptor_uuids:
-                        log.info("descriptor to be written {}".format(
+                        log.debug("descriptor to be written {}".format(
                             descriptor))
                         cen_droid.gattClientDescriptorSetValue(
                             bluetooth_gatt, discovered_services_index, i,
@@ -27,22 +27,39 @@ from acts.base_test import BaseTestClass
 from acts.signals import TestSignal
 from acts import utils
 
+from acts.test_utils.tel.tel_call_kpi import get_call_kpi_collector
+from acts.test_utils.tel.tel_call_kpi import write_call_kpi_report
 from acts.test_utils.tel.tel_subscription_utils import \
     get_subid_from_slot_index
 from acts.test_utils.tel.tel_subscription_utils import \
     initial_set_up_for_subid_infomation
+from acts.test_utils.tel.tel_subscription_utils import \
+    invalidate_subscription_cache
 from acts.test_utils.tel.tel_subscription_utils import set_subid_for_data
 from acts.test_utils.tel.tel_subscription_utils import \
     set_subid_for_message
 from acts.test_utils.tel.tel_subscription_utils import \
     set_subid_for_outgoing_call
+from acts.test_utils.tel.tel_state_utils import invalidate_telephony_state
+from acts.test_utils.tel.tel_test_utils import clear_call_kpi
 from acts.test_utils.tel.tel_test_utils import ensure_phones_default_state
+from acts.test_utils.tel.tel_test_utils import multithread_func
 from acts.test_utils.tel.tel_test_utils import \
     reset_preferred_network_type_to_allowable_range
 from acts.test_utils.tel.tel_test_utils import set_phone_screen_on
 from acts.test_utils.tel.tel_test_utils import set_phone_silent_mode
 from acts.test_utils.tel.tel_test_utils import setup_droid_properties
 from acts.test_utils.tel.tel_test_utils import refresh_droid_config
+from acts.test_utils.tel.tel_task_executor import shutdown_task_executor
+from acts.test_utils.tel.tel_task_executor import start_task_executor
+from acts.test_utils.tel.tel_transition_recorder import \
+    TRANSITION_FILE_NAME_TEMPLATE
+from acts.test_utils.tel.tel_transition_recorder import \
+    get_transition_recorder
+from acts.test_utils.tel.tel_transition_recorder import \
+    start_transition_tracking
+from acts.test_utils.tel.tel_transition_recorder import \
+    stop_transition_tracking
 from acts.test_utils.tel.tel_defines import PRECISE_CALL_STATE_LISTEN_LEVEL_FOREGROUND
 from acts.test_utils.tel.tel_defines import PRECISE_CALL_STATE_LISTEN_LEVEL_RINGING
 from acts.test_utils.tel.tel_defines import PRECISE_CALL_STATE_LISTEN_LEVEL_BACKGROUND
@@ -55,6 +72,7 @@ class TelephonyBaseTest(BaseTestClass):
     def __init__(self, controllers):
         BaseTestClass.__init__(self, controllers)
         self.logger_sessions = []
+        self.test_begin_time = None
 
     # Use for logging in the test cases to facilitate
     # faster log lookup and reduce ambiguity in logging.
@@ -112,32 +130,38 @@ class TelephonyBaseTest(BaseTestClass):
         setattr(self, "diag_logger",
                 self.register_controller(acts.controllers.diag_logger,
                                          required=False))
-        for ad in self.android_devices:
-            setup_droid_properties(self.log, ad,
-                                   self.user_params["sim_conf_file"])
-            if not set_phone_screen_on(self.log, ad):
-                self.log.error("Failed to set phone screen-on time.")
-                return False
-            if not set_phone_silent_mode(self.log, ad):
-                self.log.error("Failed to set phone silent mode.")
-                return False
+        # Size the shared executor so operations run on all devices at once.
+        start_task_executor(len(self.android_devices))
+        get_call_kpi_collector().clear()
+        tasks = [(self._setup_device, (ad, )) for ad in self.android_devices]
+        return multithread_func(self.log, tasks)
+
+    def _setup_device(self, ad):
+        get_transition_recorder(ad)
+        setup_droid_properties(self.log, ad,
+                               self.user_params["sim_conf_file"])
+        if not set_phone_screen_on(self.log, ad):
+            self.log.error("Failed to set phone screen-on time.")
+            return False
+        if not set_phone_silent_mode(self.log, ad):
+            self.log.error("Failed to set phone silent mode.")
+            return False
 
-            ad.droid.telephonyAdjustPreciseCallStateListenLevel(
-                PRECISE_CALL_STATE_LISTEN_LEVEL_FOREGROUND, True)
-            ad.droid.telephonyAdjustPreciseCallStateListenLevel(
-                PRECISE_CALL_STATE_LISTEN_LEVEL_RINGING, True)
-            ad.droid.telephonyAdjustPreciseCallStateListenLevel(
-                PRECISE_CALL_STATE_LISTEN_LEVEL_BACKGROUND, True)
+        ad.droid.telephonyAdjustPreciseCallStateListenLevel(
+            PRECISE_CALL_STATE_LISTEN_LEVEL_FOREGROUND, True)
+        ad.droid.telephonyAdjustPreciseCallStateListenLevel(
+            PRECISE_CALL_STATE_LISTEN_LEVEL_RINGING, True)
+        ad.droid.telephonyAdjustPreciseCallStateListenLevel(
+            PRECISE_CALL_STATE_LISTEN_LEVEL_BACKGROUND, True)
 
-            if "enable_wifi_verbose_logging" in self.user_params:
-                ad.droid.wifiEnableVerboseLogging(WIFI_VERBOSE_LOGGING_ENABLED)
+        if "enable_wifi_verbose_logging" in self.user_params:
+            ad.droid.wifiEnableVerboseLogging(WIFI_VERBOSE_LOGGING_ENABLED)
 
-            # Reset preferred network type.
-            reset_preferred_network_type_to_allowable_range(self.log, ad)
+        # Reset preferred network type.
+        reset_preferred_network_type_to_allowable_range(self.log, ad)
 
         # Sub ID setup
-        for ad in self.android_devices:
-            initial_set_up_for_subid_infomation(self.log, ad)
+        initial_set_up_for_subid_infomation(self.log, ad)
         return True
 
     def teardown_class(self):
@@ -165,11 +189,24 @@ class TelephonyBaseTest(BaseTestClass):
                         self.log.error(
                             "Can not turn on airplane mode on:{}".format(
                                 ad.serial))
+                invalidate_subscription_cache(ad)
+                invalidate_telephony_state(ad)
+            shutdown_task_executor()
+            write_call_kpi_report(self.log, self.log_path, self.TAG)
+            for ad in self.android_devices:
+                recorder = getattr(ad, "transition_recorder", None)
+                if recorder:
+                    recorder.stop()
         return True
 
     def setup_test(self):
+        self.test_begin_time = time.time()
         for ad in self.android_devices:
+            # The event dispatcher is replaced when sl4a is restarted.
+            get_transition_recorder(ad)
             refresh_droid_config(self.log, ad)
+            start_transition_tracking(self.log, ad)
+            clear_call_kpi(ad)
 
         if getattr(self, "diag_logger", None):
             for logger in self.diag_logger:
@@ -185,8 +222,27 @@ class TelephonyBaseTest(BaseTestClass):
                 logger, session))
             logger.reset()
         self.logger_sessions = []
+        for ad in self.android_devices:
+            stop_transition_tracking(self.log, ad)
+            clear_call_kpi(ad)
+        self._write_transitions()
         return True
 
+    def _write_transitions(self):
+        """Writes the network state transitions of each device during the
+        test case to a file.
+        """
+        path = os.path.join(self.log_path, "NetworkTransitions")
+        for ad in self.android_devices:
+            timeline = get_transition_recorder(ad).get_timeline(
+                self.test_begin_time)
+            if not timeline.transitions:
+                continue
+            utils.create_dir(path)
+            timeline.write(os.path.join(
+                path, TRANSITION_FILE_NAME_TEMPLATE.format(
+                    self.current_test_name, ad.serial)))
+
     def on_exception(self, test_name, begin_time):
         self._pull_diag_logs(test_name, begin_time)
         return self._take_bug_report(test_name, begin_time)
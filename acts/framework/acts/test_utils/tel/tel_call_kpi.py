@@ -0,0 +1,277 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - Google
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Call setup KPIs: how long each phase of a voice call takes, and which RAT
+each phase happened on.
+
+The call utils mark the phases of a call on a CallKpi object as they observe
+them on the host. When the call ends, its KPI is added to the record of the
+test case being executed and to a process wide CallKpiCollector, which
+summarizes the latencies of all calls per RAT combination.
+
+Marking a phase only reads the clock, so this is cheap enough for stress
+loops. RATs are read from the cached telephony state snapshot.
+"""
+
+import json
+import os
+import threading
+import time
+
+from acts import records
+from acts import tracing
+from acts.history import percentile
+
+# Phases of a call, in the order they happen.
+CALL_KPI_DIAL = "dial"
+CALL_KPI_CALLER_OFFHOOK = "caller_offhook"
+CALL_KPI_RINGING = "ringing"
+CALL_KPI_ANSWER = "answer"
+CALL_KPI_CALLEE_OFFHOOK = "callee_offhook"
+CALL_KPI_HANGUP = "hangup"
+CALL_KPI_IDLE = "idle"
+
+# The measured intervals, as (name, begin phase, end phase) tuples. The
+# caller goes off hook when it dials, so it is timed from the dial; the
+# callee is timed from the answer.
+CALL_KPI_INTERVALS = (
+    ("dial_to_offhook", CALL_KPI_DIAL, CALL_KPI_CALLER_OFFHOOK),
+    ("dial_to_ringing", CALL_KPI_DIAL, CALL_KPI_RINGING),
+    ("ringing_to_answer", CALL_KPI_RINGING, CALL_KPI_ANSWER),
+    ("answer_to_offhook", CALL_KPI_ANSWER, CALL_KPI_CALLEE_OFFHOOK),
+    ("hangup_to_idle", CALL_KPI_HANGUP, CALL_KPI_IDLE),
+)
+
+# Sides of a call a RAT is read on.
+CALL_KPI_CALLER = "caller"
+CALL_KPI_CALLEE = "callee"
+
+CALL_KPI_METRIC = "call_kpi"
+CALL_KPI_FILE_NAME_TEMPLATE = "{}_call_kpi.json"
+CALL_KPI_PERCENTILES = (50, 90, 95, 99)
+
+_RAT_NONE = "none"
+# The phases of the call setup, in order. The RAT a side read last during the
+# setup is the RAT the call was set up on.
+_SETUP_PHASES = (CALL_KPI_DIAL, CALL_KPI_CALLER_OFFHOOK, CALL_KPI_RINGING,
+                 CALL_KPI_ANSWER, CALL_KPI_CALLEE_OFFHOOK)
+
+
+class CallKpi(object):
+    """The timings of the phases of one voice call.
+
+    Attributes:
+        caller: The serial of the caller device, None if not a test device.
+        callee: The serial of the callee device, None if not a test device.
+        times: A dict mapping phases to the epoch times in seconds they were
+            observed at.
+        rats: A dict mapping (side, phase) tuples to the voice RAT of that
+            side at that phase.
+        failure: A string describing why the call failed, None if it did not.
+        reported: True once the KPI was added to the records and collector.
+    """
+
+    def __init__(self, caller=None, callee=None):
+        self.caller = caller
+        self.callee = callee
+        self.times = {}
+        self.rats = {}
+        self.failure = None
+        self.reported = False
+
+    def mark(self, phase):
+        """Records that a phase of the call was observed now."""
+        self.times[phase] = time.time()
+
+    def set_rat(self, side, phase, rat):
+        """Records the voice RAT of one side of the call at a phase."""
+        self.rats[(side, phase)] = rat
+
+    def fail(self, failure):
+        """Records why the call failed, unless a reason was recorded already.
+        """
+        if self.failure is None:
+            self.failure = str(failure)
+
+    def get_intervals(self):
+        """Gets the durations of the intervals of the call that completed.
+
+        Returns:
+            A dict mapping interval names to durations in seconds.
+        """
+        intervals = {}
+        for name, begin, end in CALL_KPI_INTERVALS:
+            if begin in self.times and end in self.times:
+                intervals[name] = self.times[end] - self.times[begin]
+        return intervals
+
+    def _get_setup_rat(self, side):
+        rat = None
+        for phase in _SETUP_PHASES:
+            rat = self.rats.get((side, phase), rat)
+        return rat or _RAT_NONE
+
+    @property
+    def rat_combination(self):
+        """A string naming the caller and callee RATs, e.g. "lte->umts"."""
+        return "{}->{}".format(self._get_setup_rat(CALL_KPI_CALLER),
+                               self._get_setup_rat(CALL_KPI_CALLEE))
+
+    def to_dict(self):
+        return {
+            "caller": self.caller,
+            "callee": self.callee,
+            "rat_combination": self.rat_combination,
+            "rats": {"{}_{}".format(side, phase): rat
+                     for (side, phase), rat in self.rats.items()},
+            "times": dict(self.times),
+            "intervals": self.get_intervals(),
+            "failure": self.failure
+        }
+
+
+class CallKpiCollector(object):
+    """A thread safe collection of the KPIs of the calls made in a test run.
+
+    Attributes:
+        kpis: A list of CallKpi objects.
+    """
+
+    def __init__(self):
+        self.kpis = []
+        self._lock = threading.Lock()
+
+    def add(self, kpi):
+        with self._lock:
+            self.kpis.append(kpi)
+
+    def clear(self):
+        with self._lock:
+            self.kpis = []
+
+    def get_summary(self):
+        """Summarizes the call KPIs per RAT combination.
+
+        Intervals of failed calls are counted as failures only, so they do
+        not skew the latencies.
+
+        Returns:
+            A dict mapping RAT combinations to dicts with the number of
+            "calls" and "failures", and for each interval name, a dict with
+            its "count", "min", "max" and percentiles, e.g. "p95".
+        """
+        with self._lock:
+            kpis = list(self.kpis)
+        durations = {}
+        summary = {}
+        for kpi in kpis:
+            combination = kpi.rat_combination
+            stats = summary.setdefault(combination,
+                                       {"calls": 0, "failures": 0})
+            stats["calls"] += 1
+            if kpi.failure is not None:
+                stats["failures"] += 1
+                continue
+            for name, duration in kpi.get_intervals().items():
+                durations.setdefault((combination, name), []).append(duration)
+        for (combination, name), values in durations.items():
+            values.sort()
+            interval = {"count": len(values),
+                        "min": values[0],
+                        "max": values[-1]}
+            for p in CALL_KPI_PERCENTILES:
+                interval["p{}".format(p)] = percentile(values, p)
+            summary[combination][name] = interval
+        return summary
+
+    def write(self, path):
+        """Writes the summary and the KPIs of all calls to a json file.
+
+        Args:
+            path: The path of the file to write.
+        """
+        with self._lock:
+            kpis = [kpi.to_dict() for kpi in self.kpis]
+        with open(path, 'w') as f:
+            json.dump({"summary": self.get_summary(), "calls": kpis}, f,
+                      indent=4, sort_keys=True)
+
+
+_collector = CallKpiCollector()
+
+
+def get_call_kpi_collector():
+    """Gets the collector the KPIs of all calls are added to.
+
+    Returns:
+        A CallKpiCollector object.
+    """
+    return _collector
+
+
+def report_call_kpi(kpi):
+    """Adds the KPI of a call that ended to the record of the current test
+    case, the current timeline and the collector.
+
+    A KPI is only reported once, so every util a call goes through can report
+    it.
+
+    Args:
+        kpi: A CallKpi object.
+    """
+    if kpi.reported:
+        return
+    kpi.reported = True
+    record = records.get_current_record()
+    if record:
+        record.add_metric(CALL_KPI_METRIC, kpi.to_dict())
+    timeline = tracing.get_current_timeline()
+    if timeline:
+        for name, begin, end in CALL_KPI_INTERVALS:
+            if begin in kpi.times and end in kpi.times:
+                timeline.add_span(name, CALL_KPI_METRIC, kpi.times[begin],
+                                  kpi.times[end],
+                                  rat_combination=kpi.rat_combination)
+    _collector.add(kpi)
+
+
+def write_call_kpi_report(log, log_path, name):
+    """Writes the KPIs of the calls collected so far to a report, logs their
+    summary and starts a new collection.
+
+    Args:
+        log: The logger object.
+        log_path: A string that is the path of the directory to write the
+            report to.
+        name: A string naming the report, e.g. the test class name.
+
+    Returns:
+        The path of the report, or None if no call was made.
+    """
+    if not _collector.kpis:
+        return None
+    path = os.path.join(log_path, CALL_KPI_FILE_NAME_TEMPLATE.format(name))
+    _collector.write(path)
+    for combination, stats in sorted(_collector.get_summary().items()):
+        log.info("Call KPI {}: {} calls, {} failed.".format(
+            combination, stats["calls"], stats["failures"]))
+        for interval, _, _ in CALL_KPI_INTERVALS:
+            if interval in stats:
+                log.info("Call KPI {} {}: p50 {:.3f}s, p95 {:.3f}s".format(
+                    combination, interval, stats[interval]["p50"],
+                    stats[interval]["p95"]))
+    _collector.clear()
+    return path
@@ -0,0 +1,554 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - Google
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Three phone multi call and conference call scenarios.
+
+A ConferenceScenario describes a test case in a few fields: the RAT of the
+host (PhoneA) and of the participants (PhoneB and PhoneC), the direction of
+the two calls, how many times the host swaps them, how it merges them and
+which calls are dropped from where afterwards. run_conference_scenario sets
+up all phones in parallel and then plays the calls, swaps, merge and drops
+on them, verifying the call states after each step.
+"""
+
+import time
+
+from acts.test_utils.tel.tel_defines import CALL_CAPABILITY_MANAGE_CONFERENCE
+from acts.test_utils.tel.tel_defines import CALL_PROPERTY_CONFERENCE
+from acts.test_utils.tel.tel_defines import CALL_STATE_ACTIVE
+from acts.test_utils.tel.tel_defines import CALL_STATE_HOLDING
+from acts.test_utils.tel.tel_defines import PHONE_TYPE_CDMA
+from acts.test_utils.tel.tel_defines import PHONE_TYPE_GSM
+from acts.test_utils.tel.tel_defines import WAIT_TIME_IN_CALL
+from acts.test_utils.tel.tel_setup_planner import setup_phones
+from acts.test_utils.tel.tel_test_utils import call_setup_teardown
+from acts.test_utils.tel.tel_test_utils import get_call_uri
+from acts.test_utils.tel.tel_test_utils import is_uri_equivalent
+from acts.test_utils.tel.tel_test_utils import num_active_calls
+from acts.test_utils.tel.tel_test_utils import verify_incall_state
+from acts.test_utils.tel.tel_voice_utils import get_cep_conference_call_id
+from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_1x
+from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_2g
+from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_3g
+from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_csfb
+from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_iwlan
+from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_volte
+from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_wcdma
+from acts.test_utils.tel.tel_voice_utils import phone_setup_csfb
+from acts.test_utils.tel.tel_voice_utils import phone_setup_iwlan
+from acts.test_utils.tel.tel_voice_utils import phone_setup_voice_2g
+from acts.test_utils.tel.tel_voice_utils import phone_setup_voice_3g
+from acts.test_utils.tel.tel_voice_utils import phone_setup_voice_general
+from acts.test_utils.tel.tel_voice_utils import phone_setup_volte
+from acts.test_utils.tel.tel_voice_utils import swap_calls
+
+# Directions of the first and the second call, from the host's point of view.
+CONFERENCE_MO_MO = "mo_mo"
+CONFERENCE_MO_MT = "mo_mt"
+CONFERENCE_MT_MT = "mt_mt"
+
+# How the host merges the calls, which decides how many call ids it has
+# after the merge: CS conferences keep the two calls as children of the
+# conference, IMS ones without CEP only have the conference, and with CEP the
+# conference has a child per participant.
+CONFERENCE_MERGE_CS = "cs"
+CONFERENCE_MERGE_IMS = "ims"
+CONFERENCE_MERGE_CEP = "cep"
+
+# Where a call is dropped from.
+CONFERENCE_DROP_FROM_PARTICIPANT = "participant"
+CONFERENCE_DROP_FROM_HOST = "host"
+
+# The calls a drop can target. The first call is the one between PhoneA and
+# PhoneB, the second the one between PhoneA and PhoneC. The held and active
+# calls are the ones in that state after the swaps, so they can only be
+# dropped before a merge.
+CONFERENCE_FIRST_CALL = "first"
+CONFERENCE_SECOND_CALL = "second"
+CONFERENCE_HELD_CALL = "held"
+CONFERENCE_ACTIVE_CALL = "active"
+
+# The drop sequences of the conference tests.
+CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT = (
+    (CONFERENCE_DROP_FROM_PARTICIPANT, CONFERENCE_SECOND_CALL),
+    (CONFERENCE_DROP_FROM_PARTICIPANT, CONFERENCE_FIRST_CALL))
+CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT = (
+    (CONFERENCE_DROP_FROM_PARTICIPANT, CONFERENCE_FIRST_CALL),
+    (CONFERENCE_DROP_FROM_PARTICIPANT, CONFERENCE_SECOND_CALL))
+CONFERENCE_DROP_SECOND_CALL_FROM_HOST = (
+    (CONFERENCE_DROP_FROM_HOST, CONFERENCE_SECOND_CALL),
+    (CONFERENCE_DROP_FROM_HOST, CONFERENCE_FIRST_CALL))
+CONFERENCE_DROP_FIRST_CALL_FROM_HOST = (
+    (CONFERENCE_DROP_FROM_HOST, CONFERENCE_FIRST_CALL),
+    (CONFERENCE_DROP_FROM_HOST, CONFERENCE_SECOND_CALL))
+CONFERENCE_DROP_HELD_FROM_PARTICIPANT = (
+    (CONFERENCE_DROP_FROM_PARTICIPANT, CONFERENCE_HELD_CALL), )
+CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT = (
+    (CONFERENCE_DROP_FROM_PARTICIPANT, CONFERENCE_ACTIVE_CALL), )
+
+_DIRECTIONS = (CONFERENCE_MO_MO, CONFERENCE_MO_MT, CONFERENCE_MT_MT)
+_MERGES = (None, CONFERENCE_MERGE_CS, CONFERENCE_MERGE_IMS,
+           CONFERENCE_MERGE_CEP)
+_DROP_SIDES = (CONFERENCE_DROP_FROM_PARTICIPANT, CONFERENCE_DROP_FROM_HOST)
+_DROP_CALLS = (CONFERENCE_FIRST_CALL, CONFERENCE_SECOND_CALL,
+               CONFERENCE_HELD_CALL, CONFERENCE_ACTIVE_CALL)
+# Number of call ids the host has right after each kind of merge.
+_MERGED_CALL_COUNTS = {CONFERENCE_MERGE_CS: 3, CONFERENCE_MERGE_IMS: 1}
+
+
+class ConferenceRat(object):
+    """How to put a phone on a RAT and check it is in call on it.
+
+    Attributes:
+        name: A string naming the RAT, used in logs.
+        setup_func: The phone setup function, called with the log, the ad
+            and setup_args. None to leave the phone as it is.
+        verify_func: The in call verify function, called with the log and
+            the ad. None to only check the phone is in call.
+        phone_type: The phone type the phone must have for the RAT, e.g.
+            PHONE_TYPE_GSM. None for any.
+        setup_args: A tuple of extra arguments for setup_func.
+    """
+
+    def __init__(self,
+                 name,
+                 setup_func,
+                 verify_func,
+                 phone_type=None,
+                 setup_args=()):
+        self.name = name
+        self.setup_func = setup_func
+        self.verify_func = verify_func
+        self.phone_type = phone_type
+        self.setup_args = tuple(setup_args)
+
+    def __repr__(self):
+        return self.name
+
+
+# The RATs scenarios can name instead of passing a ConferenceRat.
+CONFERENCE_RATS = {
+    "volte": ConferenceRat("volte", phone_setup_volte, is_phone_in_call_volte),
+    "wcdma": ConferenceRat("wcdma", phone_setup_voice_3g,
+                           is_phone_in_call_wcdma, PHONE_TYPE_GSM),
+    "3g": ConferenceRat("3g", phone_setup_voice_3g, is_phone_in_call_3g,
+                        PHONE_TYPE_GSM),
+    "csfb": ConferenceRat("csfb", phone_setup_csfb, is_phone_in_call_csfb,
+                          PHONE_TYPE_GSM),
+    "gsm": ConferenceRat("gsm", phone_setup_voice_2g, is_phone_in_call_2g,
+                         PHONE_TYPE_GSM),
+    "1x": ConferenceRat("1x", phone_setup_voice_3g, is_phone_in_call_1x,
+                        PHONE_TYPE_CDMA),
+    "general": ConferenceRat("general", phone_setup_voice_general, None),
+}
+
+
+def get_wfc_conference_rat(is_airplane_mode,
+                           wfc_mode,
+                           wifi_ssid=None,
+                           wifi_pwd=None):
+    """Gets the RAT of a phone in a WiFi calling (epdg) call.
+
+    Args:
+        is_airplane_mode: True to turn on airplane mode.
+        wfc_mode: WFC mode to set to.
+        wifi_ssid: WiFi network SSID to connect to, optional.
+        wifi_pwd: WiFi network password, optional.
+
+    Returns:
+        A ConferenceRat object.
+    """
+    return ConferenceRat("iwlan", phone_setup_iwlan, is_phone_in_call_iwlan,
+                         setup_args=(is_airplane_mode, wfc_mode, wifi_ssid,
+                                     wifi_pwd))
+
+
+def _get_rat(rat):
+    if isinstance(rat, ConferenceRat):
+        return rat
+    if rat not in CONFERENCE_RATS:
+        raise ValueError("Unknown conference RAT {}.".format(rat))
+    return CONFERENCE_RATS[rat]
+
+
+class ConferenceScenario(object):
+    """A three phone multi call or conference call test case.
+
+    PhoneA is the host. It has a call with PhoneB (the first call) and then
+    a call with PhoneC (the second call), swaps them num_swaps times, merges
+    them if merge is set, and then drops calls in the order of drops.
+
+    Attributes:
+        host: The ConferenceRat of PhoneA.
+        participants: A list of the ConferenceRats of PhoneB and PhoneC.
+        direction: The directions of the two calls, e.g. CONFERENCE_MO_MT
+            for PhoneA calling PhoneB and PhoneC calling PhoneA.
+        num_swaps: How many times PhoneA swaps the calls. Can be 0.
+        merge: One of the CONFERENCE_MERGE_* kinds, None to not merge.
+        drops: A list of (side, call) tuples, where side is one of the
+            CONFERENCE_DROP_FROM_* constants and call one of the
+            CONFERENCE_*_CALL constants. Calls not dropped stay up.
+    """
+
+    def __init__(self,
+                 host,
+                 participants,
+                 direction=CONFERENCE_MO_MO,
+                 num_swaps=0,
+                 merge=None,
+                 drops=()):
+        """
+        Args:
+            host: A ConferenceRat, or the name of one of CONFERENCE_RATS.
+            participants: A ConferenceRat or RAT name for both participants,
+                or a list of two of them.
+            direction, num_swaps, merge, drops: See the class attributes.
+
+        Raises:
+            ValueError if the description is inconsistent.
+        """
+        self.host = _get_rat(host)
+        if isinstance(participants, (list, tuple)):
+            if len(participants) != 2:
+                raise ValueError("A conference needs two participants.")
+            self.participants = [_get_rat(rat) for rat in participants]
+        else:
+            self.participants = [_get_rat(participants)] * 2
+        if direction not in _DIRECTIONS:
+            raise ValueError("Unknown call direction {}.".format(direction))
+        if merge not in _MERGES:
+            raise ValueError("Unknown merge {}.".format(merge))
+        self.direction = direction
+        self.num_swaps = num_swaps
+        self.merge = merge
+        self.drops = list(drops)
+        dropped = set()
+        for side, call in self.drops:
+            if side not in _DROP_SIDES or call not in _DROP_CALLS:
+                raise ValueError("Unknown drop {}.".format((side, call)))
+            if merge and call in (CONFERENCE_HELD_CALL,
+                                  CONFERENCE_ACTIVE_CALL):
+                raise ValueError("Calls are neither held nor active after "
+                                 "a merge.")
+            index = self.get_call_index(call)
+            if index in dropped:
+                raise ValueError("Call {} is dropped twice.".format(call))
+            dropped.add(index)
+
+    def get_call_index(self, call):
+        """Gets the index of the participant of a call.
+
+        Args:
+            call: One of the CONFERENCE_*_CALL constants.
+
+        Returns:
+            1 for the first call (PhoneB), 2 for the second call (PhoneC).
+        """
+        if call == CONFERENCE_FIRST_CALL:
+            return 1
+        if call == CONFERENCE_SECOND_CALL:
+            return 2
+        # The second call is active once placed, and each swap flips it.
+        second_active = self.num_swaps % 2 == 0
+        if call == CONFERENCE_ACTIVE_CALL:
+            return 2 if second_active else 1
+        return 1 if second_active else 2
+
+    def __repr__(self):
+        text = "{} {} add {}".format(self.host, self.direction, "/".join(
+            rat.name for rat in self.participants))
+        if self.num_swaps:
+            text += " swap x{}".format(self.num_swaps)
+        if self.merge:
+            text += " merge {}".format(self.merge)
+        for side, call in self.drops:
+            text += " drop {} call from {}".format(call, side)
+        return text
+
+
+def setup_conference_calls(log, ads, scenario):
+    """Sets up the phones of a scenario and places its two calls.
+
+    The phones are checked for the phone types of their RATs, set up in
+    parallel unless they are set up already, and their call lists cleared.
+    Then the first call and the second call are placed in the scenario's
+    directions, and left up.
+
+    Args:
+        log: Log object.
+        ads: A list of the ad objects of PhoneA, PhoneB and PhoneC.
+        scenario: A ConferenceScenario object.
+
+    Returns:
+        The id of the first call on PhoneA, or None if something failed.
+    """
+    rats = [scenario.host] + scenario.participants
+    for ad, rat in zip(ads, rats):
+        if (rat.phone_type is not None and
+                ad.droid.telephonyGetPhoneType() != rat.phone_type):
+            log.error("{} is not phone type {}, abort {} test.".format(
+                ad.serial, rat.phone_type, rat))
+            return None
+
+    tasks = [(rat.setup_func, (log, ad) + rat.setup_args)
+             for ad, rat in zip(ads, rats) if rat.setup_func is not None]
+    if not setup_phones(log, tasks):
+        log.error("Phone Failed to Set Up Properly.")
+        return None
+    for ad in ads:
+        ad.droid.telecomCallClearCallList()
+        if num_active_calls(log, ad) != 0:
+            log.error("Phone {} Call List is not empty.".format(ad.serial))
+            return None
+
+    directions = scenario.direction.split("_")
+    call_ab_id = None
+    for index, direction in enumerate(directions, 1):
+        verify_funcs = (rats[0].verify_func, rats[index].verify_func)
+        if direction == "mo":
+            ad_caller, ad_callee = ads[0], ads[index]
+        else:
+            ad_caller, ad_callee = ads[index], ads[0]
+            verify_funcs = tuple(reversed(verify_funcs))
+        log.info("Step{}: Call From {} to {}.".format(index, ad_caller.serial,
+                                                      ad_callee.serial))
+        if not call_setup_teardown(log,
+                                   ad_caller,
+                                   ad_callee,
+                                   ad_hangup=None,
+                                   verify_caller_func=verify_funcs[0],
+                                   verify_callee_func=verify_funcs[1]):
+            log.error("{} call {} failed.".format(ad_caller.serial,
+                                                  ad_callee.serial))
+            return None
+        if call_ab_id is None:
+            calls = ads[0].droid.telecomCallGetCallIds()
+            log.info("Calls in PhoneA{}".format(calls))
+            if num_active_calls(log, ads[0]) != 1:
+                log.error("Call list verify failed.")
+                return None
+            call_ab_id = calls[0]
+    if not verify_incall_state(log, ads[:3], True):
+        log.error("Not All phones are in-call.")
+        return None
+    return call_ab_id
+
+
+def _verify_call_state(log, ad, call_id, call_state):
+    actual_state = ad.droid.telecomCallGetCallState(call_id)
+    if actual_state != call_state:
+        log.error("Call_id:{}, state:{}, expected: {}".format(
+            call_id, actual_state, call_state))
+        return False
+    return True
+
+
+def _merge_calls(log, ads, scenario, call_ab_id, call_ac_id):
+    """Merges the two calls of the host and verifies the conference.
+
+    Returns:
+        The id of the conference call on PhoneA, None if the merge failed.
+    """
+    log.info("Merge to Conf Call and verify Conf Call.")
+    ads[0].droid.telecomCallJoinCallsInConf(call_ab_id, call_ac_id)
+    time.sleep(WAIT_TIME_IN_CALL)
+    calls = ads[0].droid.telecomCallGetCallIds()
+    log.info("Calls in PhoneA{}".format(calls))
+
+    if scenario.merge == CONFERENCE_MERGE_CEP:
+        call_conf_id = get_cep_conference_call_id(ads[0])
+        if call_conf_id is None:
+            log.error("No call with children. Probably CEP not enabled or "
+                      "merge failed.")
+            return None
+        calls.remove(call_conf_id)
+        children = ads[0].droid.telecomCallGetCallChildren(call_conf_id)
+        if set(children) != set(calls):
+            log.error("Children list<{}> for conference call is not "
+                      "correct.".format(children))
+            return None
+        properties = ads[0].droid.telecomCallGetProperties(call_conf_id)
+        if CALL_PROPERTY_CONFERENCE not in properties:
+            log.error("Conf call id properties wrong: {}".format(properties))
+            return None
+        capabilities = ads[0].droid.telecomCallGetCapabilities(call_conf_id)
+        if CALL_CAPABILITY_MANAGE_CONFERENCE not in capabilities:
+            log.error("Conf call id capabilities wrong: {}".format(
+                capabilities))
+            return None
+        if call_ab_id in calls or call_ac_id in calls:
+            log.error("Previous call ids should not in new call list after "
+                      "merge.")
+            return None
+    else:
+        expected_count = _MERGED_CALL_COUNTS[scenario.merge]
+        if num_active_calls(log, ads[0]) != expected_count:
+            log.error("Total number of call ids in {} is not {}.".format(
+                ads[0].serial, expected_count))
+            if (scenario.merge == CONFERENCE_MERGE_IMS and
+                    get_cep_conference_call_id(ads[0]) is not None):
+                log.error("CEP enabled.")
+            return None
+        call_conf_id = None
+        for call_id in calls:
+            if call_id != call_ab_id and call_id != call_ac_id:
+                call_conf_id = call_id
+        if not call_conf_id:
+            log.error("Merge call fail, no new conference call id.")
+            return None
+
+    if not verify_incall_state(log, ads[:3], True):
+        return None
+    if not _verify_call_state(log, ads[0], call_conf_id, CALL_STATE_ACTIVE):
+        return None
+    return call_conf_id
+
+
+def _find_host_call(log, ads, call_conf_id, call_uri):
+    for call_id in ads[0].droid.telecomCallGetCallIds():
+        if (call_id != call_conf_id and
+                is_uri_equivalent(call_uri, get_call_uri(ads[0], call_id))):
+            return call_id
+    log.error("Can NOT find call on host to {}.".format(call_uri))
+    return None
+
+
+def _drop_call(log, ads, scenario, call_ids, call_uris, call_conf_id,
+               dropped, drop):
+    """Drops one call of a scenario and verifies the calls left.
+
+    Args:
+        call_ids: A dict mapping participant indexes to the ids of their
+            calls on PhoneA before the merge.
+        call_uris: A dict mapping participant indexes to the uris of their
+            calls on PhoneA.
+        call_conf_id: The id of the conference on PhoneA, None if the calls
+            were not merged.
+        dropped: A set of the indexes of the participants already dropped,
+            this drop is added to it.
+        drop: The (side, call) tuple to drop.
+
+    Returns:
+        True if no error happened. Otherwise False.
+    """
+    side, call = drop
+    index = scenario.get_call_index(call)
+    log.info("Drop {} call from {}, verify call continues.".format(call,
+                                                                   side))
+    if side == CONFERENCE_DROP_FROM_PARTICIPANT:
+        ads[index].droid.telecomEndCall()
+    elif call_conf_id is None:
+        ads[0].droid.telecomCallDisconnect(call_ids[index])
+    else:
+        call_id = _find_host_call(log, ads, call_conf_id, call_uris[index])
+        if call_id is None:
+            return False
+        ads[0].droid.telecomCallDisconnect(call_id)
+    time.sleep(WAIT_TIME_IN_CALL)
+    dropped.add(index)
+
+    remaining = [i for i in (1, 2) if i not in dropped]
+    if not remaining:
+        return verify_incall_state(log, ads[:3], False)
+    if call_conf_id is None:
+        # The other call is active again if the held call was dropped, and
+        # stays on hold if the active call was dropped.
+        if index == scenario.get_call_index(CONFERENCE_HELD_CALL):
+            call_state = CALL_STATE_ACTIVE
+        else:
+            call_state = CALL_STATE_HOLDING
+        if not _verify_call_state(log, ads[0], call_ids[remaining[0]],
+                                  call_state):
+            return False
+    elif scenario.merge == CONFERENCE_MERGE_CS:
+        calls = ads[0].droid.telecomCallGetCallIds()
+        log.info("Calls in PhoneA{}".format(calls))
+        if num_active_calls(log, ads[0]) != 1:
+            return False
+    if not verify_incall_state(log, [ads[0]] + [ads[i] for i in remaining],
+                               True):
+        return False
+    return verify_incall_state(log, [ads[index]], False)
+
+
+def setup_and_swap_conference_calls(log, ads, scenario):
+    """Places the two calls of a scenario and swaps them.
+
+    Args:
+        log: Log object.
+        ads: A list of the ad objects of PhoneA, PhoneB and PhoneC.
+        scenario: A ConferenceScenario object.
+
+    Returns:
+        The ids of the first and the second call on PhoneA, or None, None if
+        something failed.
+    """
+    call_ab_id = setup_conference_calls(log, ads, scenario)
+    if call_ab_id is None:
+        log.error("Failed to get call_ab_id")
+        return None, None
+
+    calls = ads[0].droid.telecomCallGetCallIds()
+    log.info("Calls in PhoneA{}".format(calls))
+    if num_active_calls(log, ads[0]) != 2:
+        return None, None
+    call_ac_id = calls[1] if calls[0] == call_ab_id else calls[0]
+
+    if scenario.num_swaps > 0:
+        log.info("Begin Swap x{} test.".format(scenario.num_swaps))
+        if not swap_calls(log, ads, call_ab_id, call_ac_id,
+                          scenario.num_swaps):
+            log.error("Swap test failed.")
+            return None, None
+    return call_ab_id, call_ac_id
+
+
+def run_conference_scenario(log, ads, scenario):
+    """Runs a three phone multi call or conference call scenario.
+
+    Args:
+        log: Log object.
+        ads: A list of the ad objects of PhoneA, PhoneB and PhoneC.
+        scenario: A ConferenceScenario object.
+
+    Returns:
+        True if no error happened. Otherwise False.
+    """
+    log.info("Conference scenario: {}".format(scenario))
+    call_ab_id, call_ac_id = setup_and_swap_conference_calls(log, ads,
+                                                             scenario)
+    if call_ab_id is None:
+        return False
+
+    call_ids = {1: call_ab_id, 2: call_ac_id}
+    call_uris = {}
+    if any(side == CONFERENCE_DROP_FROM_HOST for side, _ in scenario.drops):
+        # Merging replaces the call ids, so the calls are found by uri.
+        call_uris = {index: get_call_uri(ads[0], call_id)
+                     for index, call_id in call_ids.items()}
+    call_conf_id = None
+    if scenario.merge:
+        call_conf_id = _merge_calls(log, ads, scenario, call_ab_id,
+                                    call_ac_id)
+        if call_conf_id is None:
+            return False
+
+    dropped = set()
+    for drop in scenario.drops:
+        if not _drop_call(log, ads, scenario, call_ids, call_uris,
+                          call_conf_id, dropped, drop):
+            return False
+    return True
@@ -68,6 +68,11 @@ MAX_WAIT_TIME_WFC_ENABLED = MAX_WAIT_TIME_IMS_REGISTRATION + 50
 # Max time to wait for WFC enabled flag to be False
 MAX_WAIT_TIME_WFC_DISABLED = 60
 
+# Max time a phone setup function may take on one device, when phones are
+# set up in parallel by setup_phones.
+MAX_WAIT_TIME_PHONE_SETUP = (MAX_WAIT_TIME_NW_SELECTION +
+                             MAX_WAIT_TIME_WFC_ENABLED)
+
 # Max time to wait for WiFi Manager to Connect to an AP
 MAX_WAIT_TIME_WIFI_CONNECTION = 30
 
@@ -145,12 +150,31 @@ WAIT_TIME_TETHERING_AFTER_REBOOT = 10
 # Time to wait after changing data sub id
 WAIT_TIME_CHANGE_DATA_SUB_ID = 30
 
+# Time to wait between checks of a device state that did not change with an
+# event. The time doubles after each check, up to the max.
+WAIT_TIME_STATE_POLL_INITIAL = 0.25
+WAIT_TIME_STATE_POLL_MAX = 2
+
+# Max age of a cached telephony state snapshot, in seconds.
+MAX_TELEPHONY_STATE_AGE = 0.5
+
+# Max number of SMS a sender has sent but not yet seen received.
+MAX_OUTSTANDING_SMS = 5
+
+# Time to wait for received SMS events before checking the sent and
+# delivered reports of the sender again.
+WAIT_TIME_SMS_EVENT_POLL = 0.2
+
 # These are used in phone_number_formatter
 PHONE_NUMBER_STRING_FORMAT_7_DIGIT = 7
 PHONE_NUMBER_STRING_FORMAT_10_DIGIT = 10
 PHONE_NUMBER_STRING_FORMAT_11_DIGIT = 11
 PHONE_NUMBER_STRING_FORMAT_12_DIGIT = 12
 
+# Max number of results phone_number_formatter and check_phone_number_match
+# keep, as they are called with the same few numbers for every event.
+PHONE_NUMBER_CACHE_SIZE = 1024
+
 # MAX screen-on time during test (in unit of second)
 MAX_SCREEN_ON_TIME = 1800
 
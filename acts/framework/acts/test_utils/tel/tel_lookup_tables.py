@@ -13,16 +13,23 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
+import types
+
 from acts.utils import NexusModelNames
 from acts.test_utils.tel import tel_defines
 
+# Length of the mobile country code at the start of a PLMN id or an IMSI.
+_MCC_LENGTH = 3
+# Length of a PLMN id with a 3 digit MNC.
+_MAX_PLMN_ID_LENGTH = 6
+
 
 def rat_family_from_rat(rat_type):
-    return _TelTables.technology_tbl[rat_type]['rat_family']
+    return _RAT_FAMILIES[rat_type]
 
 
 def rat_generation_from_rat(rat_type):
-    return _TelTables.technology_tbl[rat_type]['generation']
+    return _RAT_GENERATIONS[rat_type]
 
 
 def network_preference_for_generaton(generation, operator):
@@ -40,11 +47,33 @@ def rat_family_for_generation(generation, operator):
 
 
 def operator_name_from_plmn_id(plmn_id):
-    return _TelTables.operator_id_to_name[plmn_id]
+    """Gets the name of the operator of a PLMN id, or of an IMSI.
+
+    A PLMN id is an MCC followed by a 2 or 3 digit MNC. For a longer string,
+    like an IMSI, the MNC lengths the table uses for its MCC are tried.
+
+    Args:
+        plmn_id: A string starting with an MCC and MNC.
+
+    Returns:
+        The operator name.
+
+    Raises:
+        KeyError if the operator is not in the table.
+    """
+    operator_id_to_name = _TelTables.operator_id_to_name
+    if plmn_id in operator_id_to_name:
+        return operator_id_to_name[plmn_id]
+    if plmn_id and len(plmn_id) > _MAX_PLMN_ID_LENGTH:
+        for mnc_length in _MNC_LENGTHS.get(plmn_id[:_MCC_LENGTH], ()):
+            prefix = plmn_id[:_MCC_LENGTH + mnc_length]
+            if prefix in operator_id_to_name:
+                return operator_id_to_name[prefix]
+    raise KeyError(plmn_id)
 
 
 def is_valid_rat(rat_type):
-    return True if rat_type in _TelTables.technology_tbl else False
+    return rat_type in _RAT_GENERATIONS
 
 
 def is_valid_generation(gen):
@@ -553,6 +582,30 @@ class _TelTables():
     }
 
 
+# Read only flat views of the tables above, built once at import, for the
+# lookups made in state polling loops.
+_RAT_FAMILIES = types.MappingProxyType(
+    {rat: info['rat_family']
+     for rat, info in _TelTables.technology_tbl.items()})
+_RAT_GENERATIONS = types.MappingProxyType(
+    {rat: info['generation']
+     for rat, info in _TelTables.technology_tbl.items()})
+
+
+def _get_mnc_lengths(operator_ids):
+    lengths = {}
+    for operator_id in operator_ids:
+        lengths.setdefault(operator_id[:_MCC_LENGTH], set()).add(
+            len(operator_id) - _MCC_LENGTH)
+    # Longest first, as a 3 digit MNC can start with a 2 digit one.
+    return types.MappingProxyType(
+        {mcc: tuple(sorted(mnc_lengths, reverse=True))
+         for mcc, mnc_lengths in lengths.items()})
+
+
+# Maps MCCs to the MNC lengths of their operator ids.
+_MNC_LENGTHS = _get_mnc_lengths(_TelTables.operator_id_to_name)
+
 device_capabilities = {
     NexusModelNames.ONE:
     [tel_defines.CAPABILITY_PHONE, tel_defines.CAPABILITY_MSIM],
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - Google
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""An engine that sends many SMS between devices at once and verifies they
+are received.
+
+Each sender keeps several messages in flight instead of waiting for each
+message to be received before sending the next one. The sent, delivered and
+received events of the messages are correlated by a hash of their content,
+and long messages received in several parts are put back together. Events
+that belong to no message sent by the engine are left in their queue.
+"""
+
+import collections
+import hashlib
+import threading
+import time
+
+from acts import records
+from acts.history import percentile
+from acts.test_utils.tel.tel_defines import MAX_OUTSTANDING_SMS
+from acts.test_utils.tel.tel_defines import MAX_WAIT_TIME_SMS_RECEIVE
+from acts.test_utils.tel.tel_defines import MAX_WAIT_TIME_SMS_SENT_SUCCESS
+from acts.test_utils.tel.tel_defines import WAIT_TIME_SMS_EVENT_POLL
+from acts.test_utils.tel.tel_defines import EventSmsDeliverFailure
+from acts.test_utils.tel.tel_defines import EventSmsDeliverSuccess
+from acts.test_utils.tel.tel_defines import EventSmsReceived
+from acts.test_utils.tel.tel_defines import EventSmsSentFailure
+from acts.test_utils.tel.tel_defines import EventSmsSentSuccess
+from acts.test_utils.tel.tel_task_executor import run_tasks
+
+MESSAGE_METRIC = "sms_throughput"
+MESSAGE_PERCENTILES = (50, 90, 95, 99)
+
+# The measured latencies, as (name, attribute of the end time) tuples. All
+# are timed from the moment the message is handed to the sender.
+MESSAGE_LATENCIES = (
+    ("send_to_sent", "sent_time"),
+    ("send_to_delivered", "delivered_time"),
+    ("send_to_received", "received_time"),
+)
+
+_SENDER_EVENTS = (EventSmsSentSuccess, EventSmsSentFailure,
+                  EventSmsDeliverSuccess, EventSmsDeliverFailure)
+
+
+def get_content_hash(text):
+    """Gets the hash messages are correlated by.
+
+    Args:
+        text: The text of a message.
+
+    Returns:
+        A string.
+    """
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class Message(object):
+    """One SMS sent by a MessageEngine.
+
+    Attributes:
+        text: The text of the message.
+        content_hash: The hash of the text.
+        send_time: Epoch time in seconds the message was handed to the
+            sender at, None if it was not sent yet.
+        sent_time: Epoch time the sender reported the message sent at.
+        delivered_time: Epoch time the sender reported the message delivered
+            at. Delivery reports are optional, so this may stay None.
+        received_time: Epoch time the receiver got the last part of the
+            message at.
+        received_text: The parts of the message received so far.
+        failure: A string describing why the message failed, None if it did
+            not.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.content_hash = get_content_hash(text)
+        self.send_time = None
+        self.sent_time = None
+        self.delivered_time = None
+        self.received_time = None
+        self.received_text = ""
+        self.failure = None
+
+    @property
+    def done(self):
+        """True once the message failed, or was both reported sent and
+        received. Delivery reports are not waited for."""
+        return self.failure is not None or (self.sent_time is not None and
+                                            self.received_time is not None)
+
+    def to_dict(self):
+        d = {"length": len(self.text),
+             "content_hash": self.content_hash,
+             "failure": self.failure}
+        for name, attr in MESSAGE_LATENCIES:
+            end_time = getattr(self, attr)
+            if end_time is not None and self.send_time is not None:
+                d[name] = end_time - self.send_time
+        return d
+
+
+class MessageFlow(object):
+    """The messages sent from one device to another.
+
+    Attributes:
+        ad_tx: Sender's Android Device Object.
+        ad_rx: Receiver's Android Device Object.
+        phonenumber_tx: Sender's phone number.
+        phonenumber_rx: Receiver's phone number.
+        messages: A list of all the Message objects of the flow.
+        pending: A deque of the messages not sent yet.
+        outstanding: A list of the messages sent and not received yet,
+            oldest first.
+    """
+
+    def __init__(self, ad_tx, ad_rx, subid_tx, subid_rx, texts):
+        self.ad_tx = ad_tx
+        self.ad_rx = ad_rx
+        self.phonenumber_tx = ad_tx.cfg['subscription'][subid_tx]['phone_num']
+        self.phonenumber_rx = ad_rx.cfg['subscription'][subid_rx]['phone_num']
+        self.messages = [Message(text) for text in texts]
+        self.pending = collections.deque(self.messages)
+        self.outstanding = []
+
+    def match_report(self, event):
+        """Correlates a sent or delivered report of the sender with the
+        message it is about.
+
+        The reports carry the text of the message in newer sl4a versions. If
+        they do not, they are matched to the oldest sent message waiting for
+        one, as the sender reports messages in the order they were sent.
+
+        Returns:
+            True if the event is about a message of this flow.
+        """
+        if event['name'] in (EventSmsSentSuccess, EventSmsSentFailure):
+            attr = "sent_time"
+        else:
+            attr = "delivered_time"
+        text = (event.get('data') or {}).get('Text')
+        content_hash = get_content_hash(text) if text is not None else None
+        for message in self.messages:
+            if message.send_time is None:
+                break
+            if getattr(message, attr) is not None:
+                continue
+            if content_hash and message.content_hash != content_hash:
+                continue
+            setattr(message, attr, time.time())
+            if event['name'] == EventSmsSentFailure:
+                message.failure = "Sending failed."
+            elif event['name'] == EventSmsDeliverFailure:
+                message.failure = "Delivery failed."
+            return True
+        return False
+
+    def match_received(self, event, match_number):
+        """Correlates a message received by the receiver with the message
+        of this flow it is, or is a part of.
+
+        A long message may be received in several parts. Each part is added
+        to the oldest message of the sender whose text continues with it.
+
+        Args:
+            event: A received SMS event.
+            match_number: A function telling whether two phone numbers
+                match.
+
+        Returns:
+            True if the event is about a message of this flow.
+        """
+        data = event['data']
+        if not match_number(data['Sender'], self.phonenumber_tx):
+            return False
+        part = data['Text']
+        content_hash = get_content_hash(part)
+        # Most messages fit in one part and are found by their hash.
+        message = None
+        for candidate in self.outstanding:
+            if candidate.received_time is not None:
+                continue
+            if (not candidate.received_text and
+                    candidate.content_hash == content_hash):
+                message = candidate
+                break
+        if not message and part:
+            for candidate in self.outstanding:
+                remaining = candidate.text[len(candidate.received_text):]
+                if candidate.received_time is None and remaining.startswith(
+                        part):
+                    message = candidate
+                    break
+        if not message:
+            return False
+        message.received_text += part
+        if message.received_text == message.text:
+            message.received_time = time.time()
+        return True
+
+
+class MessageEngine(object):
+    """Sends the messages of several flows at once and verifies they are
+    received.
+
+    Attributes:
+        log: The logger object.
+        flows: A list of MessageFlow objects.
+        max_outstanding: Max number of messages of a flow in flight at once.
+        timeout: Max time in seconds for a message to be received.
+        begin_time: Epoch time in seconds the last run started at.
+        end_time: Epoch time in seconds the last run ended at.
+    """
+
+    def __init__(self,
+                 log,
+                 match_number,
+                 max_outstanding=MAX_OUTSTANDING_SMS,
+                 timeout=MAX_WAIT_TIME_SMS_RECEIVE):
+        """
+        Args:
+            log: The logger object.
+            match_number: A function telling whether two phone numbers
+                match, e.g. tel_test_utils.check_phone_number_match.
+            max_outstanding: Max number of messages of a flow in flight at
+                once.
+            timeout: Max time in seconds for a message to be received.
+        """
+        self.log = log
+        self.match_number = match_number
+        self.max_outstanding = max_outstanding
+        self.timeout = timeout
+        self.flows = []
+        self.begin_time = None
+        self.end_time = None
+        # Flows sharing a device process its events one at a time.
+        self._lock = threading.Lock()
+
+    def add_flow(self, ad_tx, ad_rx, subid_tx, subid_rx, texts):
+        """Adds messages to send from one device to another.
+
+        Args:
+            ad_tx: Sender's Android Device Object.
+            ad_rx: Receiver's Android Device Object.
+            subid_tx: Sender's subsciption ID to be used for SMS.
+            subid_rx: Receiver's subsciption ID to be used for SMS.
+            texts: A list of the texts of the messages to send, in order.
+
+        Returns:
+            The MessageFlow object.
+        """
+        flow = MessageFlow(ad_tx, ad_rx, subid_tx, subid_rx, texts)
+        self.flows.append(flow)
+        return flow
+
+    def run(self):
+        """Sends the messages of all flows and waits for them to be received.
+
+        The summary of the run is added to the record of the current test
+        case.
+
+        Returns:
+            True if all the messages were received.
+        """
+        receivers = {id(flow.ad_rx): flow.ad_rx for flow in self.flows}
+        senders = {id(flow.ad_tx): flow.ad_tx for flow in self.flows}
+        for ad in senders.values():
+            for event_name in _SENDER_EVENTS:
+                ad.ed.clear_events(event_name)
+        for ad in receivers.values():
+            ad.ed.clear_events(EventSmsReceived)
+            ad.droid.smsStartTrackingIncomingSmsMessage()
+        self.begin_time = time.time()
+        try:
+            results = run_tasks([(self._run_flow, (flow, ))
+                                 for flow in self.flows])
+        finally:
+            self.end_time = time.time()
+            for ad in receivers.values():
+                ad.droid.smsStopTrackingIncomingSmsMessage()
+        for result in results:
+            if result.exception:
+                raise result.exception
+        summary = self.get_summary()
+        record = records.get_current_record()
+        if record:
+            record.add_metric(MESSAGE_METRIC, summary)
+        self.log.info("SMS: {} of {} received, {:.1f} per hour.".format(
+            summary["received"], summary["messages"],
+            summary["received_per_hour"]))
+        return summary["failed"] == 0
+
+    def _run_flow(self, flow):
+        while flow.pending or flow.outstanding:
+            while (flow.pending and
+                   len(flow.outstanding) < self.max_outstanding):
+                self._send(flow)
+            count = flow.ad_rx.ed.get_event_count([EventSmsReceived])
+            self._process_events(flow)
+            self._expire(flow)
+            if not any(m.done for m in flow.outstanding):
+                flow.ad_rx.ed.wait_for_new_events(
+                    [EventSmsReceived], count, WAIT_TIME_SMS_EVENT_POLL)
+            flow.outstanding = [m for m in flow.outstanding if not m.done]
+        return all(m.received_time is not None for m in flow.messages)
+
+    def _send(self, flow):
+        message = flow.pending.popleft()
+        self.log.info("Sending SMS {} to {}, len: {}, content: {}.".format(
+            flow.phonenumber_tx, flow.phonenumber_rx, len(message.text),
+            message.text))
+        flow.outstanding.append(message)
+        message.send_time = time.time()
+        flow.ad_tx.droid.smsSendTextMessage(flow.phonenumber_rx, message.text,
+                                            True)
+
+    def _process_events(self, flow):
+        with self._lock:
+            for event_name in _SENDER_EVENTS:
+                flow.ad_tx.ed.pop_matching_events(event_name,
+                                                  flow.match_report)
+            flow.ad_rx.ed.pop_matching_events(EventSmsReceived,
+                                              flow.match_received,
+                                              self.match_number)
+
+    def _expire(self, flow):
+        now = time.time()
+        for message in flow.outstanding:
+            if message.done:
+                continue
+            if (message.sent_time is None and
+                    now > message.send_time + MAX_WAIT_TIME_SMS_SENT_SUCCESS):
+                message.failure = "No sent_success event."
+            elif now > message.send_time + self.timeout:
+                message.failure = "No matched SMS received event."
+                if message.received_text:
+                    self.log.error(
+                        "Only received partial matched SMS: {}".format(
+                            message.received_text))
+            else:
+                continue
+            self.log.error("SMS from {} to {} failed: {}".format(
+                flow.phonenumber_tx, flow.phonenumber_rx, message.failure))
+
+    def get_summary(self):
+        """Summarizes the throughput and latencies of the messages sent.
+
+        Returns:
+            A dict with the number of "messages", "received" and "failed"
+            messages, the run "duration" in seconds, the
+            "received_per_hour" throughput, and for each latency name, a
+            dict with its "count", "min", "max" and percentiles, e.g. "p95".
+        """
+        messages = [m for flow in self.flows for m in flow.messages]
+        received = [m for m in messages if m.received_time is not None]
+        duration = 0
+        if self.begin_time is not None and self.end_time is not None:
+            duration = self.end_time - self.begin_time
+        summary = {
+            "messages": len(messages),
+            "received": len(received),
+            "failed": len([m for m in messages if m.failure is not None]),
+            "duration": duration,
+            "received_per_hour": (len(received) * 3600.0 / duration
+                                  if duration else 0)
+        }
+        for name, attr in MESSAGE_LATENCIES:
+            values = sorted(getattr(m, attr) - m.send_time for m in messages
+                            if getattr(m, attr) is not None)
+            if not values:
+                continue
+            latency = {"count": len(values),
+                       "min": values[0],
+                       "max": values[-1]}
+            for p in MESSAGE_PERCENTILES:
+                latency["p{}".format(p)] = percentile(values, p)
+            summary[name] = latency
+        return summary
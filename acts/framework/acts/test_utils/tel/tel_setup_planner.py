@@ -0,0 +1,243 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - Google
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Sets up the phones of a test in parallel, skipping the phones that are in
+the required state already.
+
+A phone setup function can take minutes, mostly waiting for the network.
+Consecutive test cases usually need the same state, so before running a
+setup, the planner reads a telephony state snapshot of the device and skips
+the setup if the snapshot shows the state the setup puts the device in. The
+remaining setups run at once, each with a deadline, and the devices that
+failed are reported together.
+"""
+
+import time
+
+from acts import tracing
+from acts.test_utils.tel.tel_defines import GEN_2G
+from acts.test_utils.tel.tel_defines import GEN_3G
+from acts.test_utils.tel.tel_defines import GEN_4G
+from acts.test_utils.tel.tel_defines import MAX_WAIT_TIME_PHONE_SETUP
+from acts.test_utils.tel.tel_defines import RAT_FAMILY_LTE
+from acts.test_utils.tel.tel_defines import RAT_FAMILY_WLAN
+from acts.test_utils.tel.tel_defines import RAT_UNKNOWN
+from acts.test_utils.tel.tel_defines import WFC_MODE_DISABLED
+from acts.test_utils.tel.tel_lookup_tables import is_valid_rat
+from acts.test_utils.tel.tel_lookup_tables import rat_family_from_rat
+from acts.test_utils.tel.tel_lookup_tables import rat_generation_from_rat
+from acts.test_utils.tel.tel_state_utils import get_telephony_state
+from acts.test_utils.tel.tel_subscription_utils import get_default_data_sub_id
+from acts.test_utils.tel.tel_subscription_utils import \
+    get_outgoing_voice_sub_id
+from acts.test_utils.tel.tel_task_executor import run_tasks
+from acts.test_utils.tel.tel_task_executor import set_task_deadline
+from acts.test_utils.tel.tel_voice_utils import phone_setup_3g
+from acts.test_utils.tel.tel_voice_utils import phone_setup_csfb
+from acts.test_utils.tel.tel_voice_utils import phone_setup_iwlan
+from acts.test_utils.tel.tel_voice_utils import phone_setup_voice_2g
+from acts.test_utils.tel.tel_voice_utils import phone_setup_voice_3g
+from acts.test_utils.tel.tel_voice_utils import phone_setup_voice_general
+from acts.test_utils.tel.tel_voice_utils import phone_setup_volte
+
+PHONE_SETUP_SPAN_CATEGORY = "phone_setup"
+
+
+def _get_rat_family(rat):
+    if rat == RAT_UNKNOWN or not is_valid_rat(rat):
+        return None
+    return rat_family_from_rat(rat)
+
+
+def _get_generation(rat):
+    if rat == RAT_UNKNOWN or not is_valid_rat(rat):
+        return None
+    return rat_generation_from_rat(rat)
+
+
+def _is_cellular(state):
+    return not state.airplane_mode and state.wfc_mode == WFC_MODE_DISABLED
+
+
+def _is_volte_ready(state, sub_state):
+    return (_is_cellular(state) and state.volte_setting and
+            _get_generation(sub_state.data_rat) == GEN_4G and
+            _get_rat_family(sub_state.voice_rat) == RAT_FAMILY_LTE and
+            state.ims_registered and state.volte_available)
+
+
+def _is_csfb_ready(state, sub_state):
+    # The setup turns the VoLTE setting off where the platform supports it.
+    volte_on = state.volte_platform_enabled and state.volte_setting
+    return (_is_cellular(state) and not volte_on and
+            not state.volte_available and
+            _get_rat_family(sub_state.data_rat) == RAT_FAMILY_LTE and
+            _get_generation(sub_state.voice_rat) is not None)
+
+
+def _is_generation_ready(generation):
+    def is_ready(state, sub_state):
+        return (_is_cellular(state) and
+                _get_generation(sub_state.data_rat) == generation)
+
+    return is_ready
+
+
+def _is_voice_generation_ready(generation):
+    def is_ready(state, sub_state):
+        return (_is_cellular(state) and
+                _get_generation(sub_state.data_rat) == generation and
+                _get_generation(sub_state.voice_rat) == generation)
+
+    return is_ready
+
+
+def _is_voice_ready(state, sub_state):
+    return (not state.airplane_mode and
+            _get_generation(sub_state.voice_rat) is not None)
+
+
+def _is_iwlan_ready(state, sub_state, is_airplane_mode, wfc_mode,
+                    wifi_ssid=None, wifi_pwd=None):
+    return (state.airplane_mode == is_airplane_mode and
+            state.wfc_mode == wfc_mode and
+            _get_rat_family(sub_state.data_rat) == RAT_FAMILY_WLAN and
+            state.ims_registered and state.wfc_available)
+
+
+# Maps phone setup functions to (check function, subscription getter)
+# tuples. The check function takes a TelephonyState, the SubscriptionState
+# of the subscription the setup works on and the extra arguments of the
+# setup, and returns True if the device is in the state the setup puts it
+# in. Setups with side effects a snapshot does not show, like
+# phone_setup_video, are not listed and always run.
+_SETUP_CHECKS = {
+    phone_setup_volte: (_is_volte_ready, get_outgoing_voice_sub_id),
+    phone_setup_csfb: (_is_csfb_ready, get_outgoing_voice_sub_id),
+    phone_setup_iwlan: (_is_iwlan_ready, get_outgoing_voice_sub_id),
+    phone_setup_voice_3g: (_is_voice_generation_ready(GEN_3G),
+                           get_outgoing_voice_sub_id),
+    phone_setup_voice_2g: (_is_voice_generation_ready(GEN_2G),
+                           get_outgoing_voice_sub_id),
+    phone_setup_voice_general: (_is_voice_ready, get_outgoing_voice_sub_id),
+    phone_setup_3g: (_is_generation_ready(GEN_3G), get_default_data_sub_id),
+}
+
+
+def _get_setup_name(setup_func):
+    return getattr(setup_func, "__name__", str(setup_func))
+
+
+def is_phone_setup_done(log, setup_func, args):
+    """Checks whether a phone setup would leave a device as it is.
+
+    Args:
+        log: Log object.
+        setup_func: A phone setup function.
+        args: The arguments of setup_func, starting with the log and the ad.
+
+    Returns:
+        True if a snapshot of the device shows the state setup_func puts it
+        in. False if not, or if that cannot be told from a snapshot.
+    """
+    if setup_func not in _SETUP_CHECKS:
+        return False
+    check_func, get_sub_id = _SETUP_CHECKS[setup_func]
+    ad = args[1]
+    try:
+        sub_id = get_sub_id(ad)
+        state = get_telephony_state(ad, sub_id)
+        return bool(check_func(state, state.get_subscription_state(sub_id),
+                               *args[2:]))
+    except Exception as e:
+        log.debug("{} could not check {}: {}".format(
+            ad.serial, _get_setup_name(setup_func), e))
+        return False
+
+
+def plan_phone_setups(log, tasks):
+    """Drops the phone setups that would leave their device as it is.
+
+    Args:
+        log: Log object.
+        tasks: A list of (phone setup function, arguments) tuples, the
+            arguments starting with the log and the ad.
+
+    Returns:
+        The list of the tasks that still have to run.
+    """
+    planned = []
+    for setup_func, args in tasks:
+        if is_phone_setup_done(log, setup_func, args):
+            log.info("{} is set up for {} already, skip it.".format(
+                args[1].serial, _get_setup_name(setup_func)))
+        else:
+            planned.append((setup_func, args))
+    return planned
+
+
+def _run_phone_setup(deadline, setup_func, args):
+    set_task_deadline(deadline)
+    return setup_func(*args)
+
+
+def setup_phones(log, tasks, timeout=MAX_WAIT_TIME_PHONE_SETUP):
+    """Sets up phones in parallel, skipping the phones set up already.
+
+    Can replace multithread_func for a list of phone setup tasks. Each setup
+    has timeout seconds: the state waits of the telephony utils give up once
+    its deadline passed. All the devices that failed are logged together.
+
+    Args:
+        log: Log object.
+        tasks: A list of (phone setup function, arguments) tuples, the
+            arguments starting with the log and the ad.
+        timeout: Max time in seconds each setup can take.
+
+    Returns:
+        True if all the phones are set up. False otherwise.
+    """
+    planned = plan_phone_setups(log, tasks)
+    if not planned:
+        return True
+    deadline = time.monotonic() + timeout
+    deadline_time = time.time() + timeout
+    results = run_tasks([(_run_phone_setup, (deadline, setup_func, args))
+                         for setup_func, args in planned])
+    timeline = tracing.get_current_timeline()
+    failures = []
+    for result in results:
+        _, setup_func, args = result.args
+        serial = args[1].serial
+        name = _get_setup_name(setup_func)
+        if timeline and result.begin_time is not None:
+            timeline.add_span(name, PHONE_SETUP_SPAN_CATEGORY,
+                              result.begin_time, result.end_time,
+                              devices=[serial], succeeded=result.succeeded)
+        if result.succeeded:
+            continue
+        if result.exception is not None:
+            reason = "raised {!r}".format(result.exception)
+        elif result.end_time is not None and result.end_time >= deadline_time:
+            reason = "timed out after {:.1f}s".format(result.duration)
+        else:
+            reason = "failed after {:.1f}s".format(result.duration or 0)
+        failures.append("{} {} {}".format(serial, name, reason))
+    if failures:
+        log.error("Phone setup failed on {} of {} devices: {}".format(
+            len(failures), len(tasks), "; ".join(failures)))
+        return False
+    return True
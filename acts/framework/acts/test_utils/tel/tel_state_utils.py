@@ -0,0 +1,238 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - Google
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Snapshots of the telephony state of android devices.
+
+The state checks of the telephony utils read a snapshot fetched with a
+single batch of RPCs instead of making one RPC per value, and reuse it while
+it is fresh: younger than MAX_TELEPHONY_STATE_AGE, with no state changing RPC
+sent and no state change event received since it was taken. The values a
+snapshot reads are also recorded on the transition timeline of the device.
+"""
+
+import time
+
+from acts.test_utils.tel.tel_defines import EventCallStateChanged
+from acts.test_utils.tel.tel_defines import EventConnectivityChanged
+from acts.test_utils.tel.tel_defines import EventDataConnectionStateChanged
+from acts.test_utils.tel.tel_defines import EventServiceStateChanged
+from acts.test_utils.tel.tel_defines import EventVolteServiceStateChanged
+from acts.test_utils.tel.tel_defines import MAX_TELEPHONY_STATE_AGE
+from acts.test_utils.tel.tel_transition_recorder import record_transition
+
+# Events that may signal a change of the telephony state of a device.
+STATE_CHANGE_EVENTS = (EventServiceStateChanged,
+                       EventDataConnectionStateChanged,
+                       EventCallStateChanged,
+                       EventVolteServiceStateChanged,
+                       EventConnectivityChanged)
+
+# Fields of a device snapshot, and the RPCs they are read with.
+DEVICE_FIELDS = (
+    ("default_sub_id", "subscriptionGetDefaultSubId"),
+    ("in_call", "telecomIsInCall"),
+    ("ringing", "telecomIsRinging"),
+    ("telecom_call_state", "telecomGetCallState"),
+    ("data_connection_state", "telephonyGetDataConnectionState"),
+    ("ims_registered", "telephonyIsImsRegistered"),
+    ("volte_available", "telephonyIsVolteAvailable"),
+    ("video_calling_available", "telephonyIsVideoCallingAvailable"),
+    ("wfc_available", "telephonyIsWifiCallingAvailable"),
+    ("airplane_mode", "connectivityCheckAirplaneMode"),
+    ("volte_setting", "imsIsEnhanced4gLteModeSettingEnabledByUser"),
+    ("volte_platform_enabled",
+     "imsIsEnhanced4gLteModeSettingEnabledByPlatform"),
+    ("wfc_mode", "imsGetWfcMode"),
+)
+
+# Fields of a subscription snapshot, and the RPCs they are read with, which
+# take the subscription id.
+SUBSCRIPTION_FIELDS = (
+    ("voice_rat", "telephonyGetCurrentVoiceNetworkTypeForSubscription"),
+    ("data_rat", "telephonyGetCurrentDataNetworkTypeForSubscription"),
+    ("rat", "telephonyGetNetworkTypeForSubscription"),
+    ("call_state", "telephonyGetCallStateForSubscription"),
+)
+
+# Fields of the snapshots whose changes are recorded as transitions.
+RECORDED_DEVICE_FIELDS = ("airplane_mode", "wfc_mode")
+RECORDED_SUBSCRIPTION_FIELDS = ("voice_rat", "data_rat", "call_state")
+
+
+def _get_event_count(ad):
+    ed = getattr(ad, "ed", None)
+    if ed is None or not ed.started:
+        return None
+    return ed.get_event_count(STATE_CHANGE_EVENTS)
+
+
+class _Snapshot(object):
+    """Values read with RPCs, exposed as attributes.
+
+    Reading the attribute of a value whose RPC failed raises the error of
+    the RPC.
+    """
+
+    def __init__(self, fields, results):
+        self._values = dict(zip([name for name, _ in fields], results))
+
+    def _record_transitions(self, ad, names, sub_id, timestamp):
+        for name in names:
+            value = self._values.get(name)
+            if not isinstance(value, Exception):
+                record_transition(ad, name, value, sub_id, timestamp)
+
+    def __getattr__(self, name):
+        values = self.__dict__.get("_values", {})
+        if name not in values:
+            raise AttributeError(name)
+        value = values[name]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+class SubscriptionState(_Snapshot):
+    """A snapshot of the state of one subscription of an android device.
+
+    Attributes:
+        sub_id: The subscription id.
+        voice_rat: The current voice network type.
+        data_rat: The current data network type.
+        rat: The current network type.
+        call_state: The call state of the subscription.
+    """
+
+    def __init__(self, sub_id, results):
+        super(SubscriptionState, self).__init__(SUBSCRIPTION_FIELDS, results)
+        self.sub_id = sub_id
+
+
+class TelephonyState(_Snapshot):
+    """A snapshot of the telephony state of an android device.
+
+    Attributes:
+        ad: The android device.
+        fetch_time: Epoch time in seconds the snapshot was taken at.
+        default_sub_id: The default subscription id.
+        in_call: Whether telecom reports a call.
+        ringing: Whether telecom reports a ringing call.
+        telecom_call_state: The call state reported by telecom.
+        data_connection_state: The data connection state.
+        ims_registered: Whether the device is registered on IMS.
+        volte_available: Whether VoLTE is available.
+        video_calling_available: Whether video calling is available.
+        wfc_available: Whether WiFi calling is available.
+        airplane_mode: Whether airplane mode is on.
+        volte_setting: Whether the user setting enabling VoLTE is on.
+        volte_platform_enabled: Whether the platform supports the VoLTE
+            setting.
+        wfc_mode: The WFC mode, e.g. WFC_MODE_WIFI_PREFERRED.
+    """
+
+    def __init__(self, ad, sub_ids=()):
+        calls = [(rpc, ()) for _, rpc in DEVICE_FIELDS]
+        for sub_id in sub_ids:
+            calls.extend((rpc, (sub_id,)) for _, rpc in SUBSCRIPTION_FIELDS)
+        self.ad = ad
+        self.fetch_time = time.time()
+        # Taken before the RPCs, so that changes during them make the
+        # snapshot stale.
+        self._droid = ad.droid
+        self._rpc_count = self._droid.state_changing_rpc_count
+        self._event_count = _get_event_count(ad)
+        results = self._droid.rpc_batch(calls)
+        num_fields = len(DEVICE_FIELDS)
+        super(TelephonyState, self).__init__(DEVICE_FIELDS,
+                                             results[:num_fields])
+        self._subscriptions = {}
+        for i, sub_id in enumerate(sub_ids):
+            begin = num_fields + i * len(SUBSCRIPTION_FIELDS)
+            self._subscriptions[sub_id] = SubscriptionState(
+                sub_id, results[begin:begin + len(SUBSCRIPTION_FIELDS)])
+        self._record_transitions(ad, RECORDED_DEVICE_FIELDS, None,
+                                 self.fetch_time)
+        for sub_id, sub_state in self._subscriptions.items():
+            sub_state._record_transitions(ad, RECORDED_SUBSCRIPTION_FIELDS,
+                                          sub_id, self.fetch_time)
+
+    def is_fresh(self, max_age=MAX_TELEPHONY_STATE_AGE):
+        """Checks whether the snapshot still reflects the device state.
+
+        The RPC and event counts only catch the changes made through the
+        session of the snapshot and the changes sl4a posts events for. Any
+        other change, e.g. one made with adb, is only caught by max_age.
+
+        Args:
+            max_age: Maximum age of the snapshot in seconds.
+
+        Returns:
+            True if the snapshot is younger than max_age and no state
+            changing RPC or state change event happened since it was taken.
+        """
+        return (time.time() - self.fetch_time < max_age and
+                self.ad.droid is self._droid and
+                self._droid.state_changing_rpc_count == self._rpc_count and
+                _get_event_count(self.ad) == self._event_count)
+
+    def get_subscription_state(self, sub_id=None):
+        """Gets the snapshot of a subscription, fetching it on first use.
+
+        Args:
+            sub_id: The subscription id, None for the default subscription.
+
+        Returns:
+            A SubscriptionState object.
+        """
+        if sub_id is None:
+            sub_id = self.default_sub_id
+        if sub_id not in self._subscriptions:
+            fetch_time = time.time()
+            results = self._droid.rpc_batch(
+                [(rpc, (sub_id,)) for _, rpc in SUBSCRIPTION_FIELDS])
+            sub_state = SubscriptionState(sub_id, results)
+            sub_state._record_transitions(
+                self.ad, RECORDED_SUBSCRIPTION_FIELDS, sub_id, fetch_time)
+            self._subscriptions[sub_id] = sub_state
+        return self._subscriptions[sub_id]
+
+
+def get_telephony_state(ad, sub_id=None, max_age=MAX_TELEPHONY_STATE_AGE):
+    """Gets a snapshot of the telephony state of an android device.
+
+    The snapshot cached on the device is returned if it is still fresh,
+    otherwise a new one is taken.
+
+    Args:
+        ad: The android device.
+        sub_id: A subscription id whose state is going to be read, fetched
+            along with the device state if a new snapshot is taken.
+        max_age: Maximum age in seconds of a cached snapshot to return.
+
+    Returns:
+        A TelephonyState object.
+    """
+    state = getattr(ad, "telephony_state", None)
+    if state is None or not state.is_fresh(max_age):
+        sub_ids = [sub_id] if sub_id is not None else []
+        state = TelephonyState(ad, sub_ids)
+        ad.telephony_state = state
+    return state
+
+
+def invalidate_telephony_state(ad):
+    """Drops the cached telephony state snapshot of an android device."""
+    ad.telephony_state = None
@@ -20,9 +20,70 @@ from future import standard_library
 standard_library.install_aliases()
 from acts.test_utils.tel.tel_defines import INVALID_SUB_ID
 from acts.test_utils.tel.tel_defines import WAIT_TIME_CHANGE_DATA_SUB_ID
+from acts.test_utils.tel.tel_state_utils import invalidate_telephony_state
 import time
 
 
+class SubscriptionCache(object):
+    """Subscription metadata of an android device, read in one round trip.
+
+    Use get_subscription_cache to get the cache of a device, it is kept until
+    invalidate_subscription_cache is called.
+
+    Attributes:
+        sub_info_list: The subscription info list of the device.
+        default_sub_id: The default subscription id.
+        default_voice_sub_id: The default voice subscription id.
+        default_message_sub_id: The default SMS subscription id.
+        default_data_sub_id: The default data subscription id.
+    """
+
+    def __init__(self, ad):
+        self.droid = ad.droid
+        results = self.droid.rpc_batch([
+            ("subscriptionGetAllSubInfoList", ()),
+            ("subscriptionGetDefaultSubId", ()),
+            ("subscriptionGetDefaultVoiceSubId", ()),
+            ("subscriptionGetDefaultSmsSubId", ()),
+            ("subscriptionGetDefaultDataSubId", ())])
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        (self.sub_info_list, self.default_sub_id, self.default_voice_sub_id,
+         self.default_message_sub_id, self.default_data_sub_id) = results
+
+
+def get_subscription_cache(ad):
+    """Get the subscription metadata of an android device, read from the
+    device on first use.
+
+    Args:
+        ad: android device object.
+
+    Returns:
+        A SubscriptionCache object.
+    """
+    cache = getattr(ad, "subscription_cache", None)
+    # A new sl4a session, e.g. after a reboot, may see other subscriptions.
+    if cache is None or cache.droid is not ad.droid:
+        cache = SubscriptionCache(ad)
+        ad.subscription_cache = cache
+    return cache
+
+
+def invalidate_subscription_cache(ad):
+    """Drop the cached subscription metadata of an android device.
+
+    This must be called when the subscriptions of the device may have
+    changed, e.g. after toggling airplane mode or changing a default
+    subscription.
+
+    Args:
+        ad: android device object.
+    """
+    ad.subscription_cache = None
+
+
 def initial_set_up_for_subid_infomation(log, ad):
     """Initial subid setup for voice, message and data according to ad's
     attribute.
@@ -51,7 +112,8 @@ def initial_set_up_for_subid_infomation(log, ad):
             log, ad, ad.default_voice_sim_slot_index)
         set_subid_for_outgoing_call(ad, outgoing_voice_sub_id)
     else:
-        outgoing_voice_sub_id = ad.droid.subscriptionGetDefaultVoiceSubId()
+        outgoing_voice_sub_id = get_subscription_cache(
+            ad).default_voice_sub_id
     setattr(ad, "outgoing_voice_sub_id", outgoing_voice_sub_id)
 
     # outgoing_message_sub_id
@@ -64,7 +126,8 @@ def initial_set_up_for_subid_infomation(log, ad):
             log, ad, ad.default_message_sim_slot_index)
         set_subid_for_message(ad, outgoing_message_sub_id)
     else:
-        outgoing_message_sub_id = ad.droid.subscriptionGetDefaultSmsSubId()
+        outgoing_message_sub_id = get_subscription_cache(
+            ad).default_message_sub_id
     setattr(ad, "outgoing_message_sub_id", outgoing_message_sub_id)
 
     # default_data_sub_id
@@ -77,7 +140,7 @@ def initial_set_up_for_subid_infomation(log, ad):
             log, ad, ad.default_data_sim_slot_index)
         set_subid_for_data(ad, default_data_sub_id, 0)
     else:
-        default_data_sub_id = ad.droid.subscriptionGetDefaultDataSubId()
+        default_data_sub_id = get_subscription_cache(ad).default_data_sub_id
     setattr(ad, "default_data_sub_id", default_data_sub_id)
 
     # This is for Incoming Voice Sub ID
@@ -91,7 +154,8 @@ def initial_set_up_for_subid_infomation(log, ad):
         incoming_voice_sub_id = get_subid_from_slot_index(
             log, ad, ad.incoming_voice_sim_slot_index)
     else:
-        incoming_voice_sub_id = ad.droid.subscriptionGetDefaultVoiceSubId()
+        incoming_voice_sub_id = get_subscription_cache(
+            ad).default_voice_sub_id
     setattr(ad, "incoming_voice_sub_id", incoming_voice_sub_id)
 
     # This is for Incoming SMS Sub ID
@@ -105,7 +169,8 @@ def initial_set_up_for_subid_infomation(log, ad):
         incoming_message_sub_id = get_subid_from_slot_index(
             log, ad, ad.incoming_message_sim_slot_index)
     else:
-        incoming_message_sub_id = ad.droid.subscriptionGetDefaultSmsSubId()
+        incoming_message_sub_id = get_subscription_cache(
+            ad).default_message_sub_id
     setattr(ad, "incoming_message_sub_id", incoming_message_sub_id)
 
 
@@ -115,7 +180,7 @@ def get_default_data_sub_id(ad):
     if hasattr(ad, "default_data_sub_id"):
         return ad.default_data_sub_id
     else:
-        return ad.droid.subscriptionGetDefaultDataSubId()
+        return get_subscription_cache(ad).default_data_sub_id
 
 
 def get_outgoing_message_sub_id(ad):
@@ -124,7 +189,7 @@ def get_outgoing_message_sub_id(ad):
     if hasattr(ad, "outgoing_message_sub_id"):
         return ad.outgoing_message_sub_id
     else:
-        return ad.droid.subscriptionGetDefaultSmsSubId()
+        return get_subscription_cache(ad).default_message_sub_id
 
 
 def get_outgoing_voice_sub_id(ad):
@@ -133,7 +198,7 @@ def get_outgoing_voice_sub_id(ad):
     if hasattr(ad, "outgoing_voice_sub_id"):
         return ad.outgoing_voice_sub_id
     else:
-        return ad.droid.subscriptionGetDefaultVoiceSubId()
+        return get_subscription_cache(ad).default_voice_sub_id
 
 
 def get_incoming_voice_sub_id(ad):
@@ -142,7 +207,7 @@ def get_incoming_voice_sub_id(ad):
     if hasattr(ad, "incoming_voice_sub_id"):
         return ad.incoming_voice_sub_id
     else:
-        return ad.droid.subscriptionGetDefaultVoiceSubId()
+        return get_subscription_cache(ad).default_voice_sub_id
 
 
 def get_incoming_message_sub_id(ad):
@@ -151,7 +216,7 @@ def get_incoming_message_sub_id(ad):
     if hasattr(ad, "incoming_message_sub_id"):
         return ad.incoming_message_sub_id
     else:
-        return ad.droid.subscriptionGetDefaultSmsSubId()
+        return get_subscription_cache(ad).default_message_sub_id
 
 
 def get_subid_from_slot_index(log, ad, sim_slot_index):
@@ -163,7 +228,7 @@ def get_subid_from_slot_index(log, ad, sim_slot_index):
     Returns:
         result: Subscription ID
     """
-    subInfo = ad.droid.subscriptionGetAllSubInfoList()
+    subInfo = get_subscription_cache(ad).sub_info_list
     for info in subInfo:
         if info['simSlotIndex'] == sim_slot_index:
             return info['subscriptionId']
@@ -183,6 +248,8 @@ def set_subid_for_data(ad, sub_id, time_to_sleep=WAIT_TIME_CHANGE_DATA_SUB_ID):
     # TODO: Need to check onSubscriptionChanged event. b/27843365
     if ad.droid.subscriptionGetDefaultDataSubId() != sub_id:
         ad.droid.subscriptionSetDefaultDataSubId(sub_id)
+        invalidate_subscription_cache(ad)
+        invalidate_telephony_state(ad)
         time.sleep(time_to_sleep)
 
 
@@ -197,6 +264,8 @@ def set_subid_for_message(ad, sub_id):
         None
     """
     ad.droid.subscriptionSetDefaultSmsSubId(sub_id)
+    invalidate_subscription_cache(ad)
+    invalidate_telephony_state(ad)
 
 
 def set_subid_for_outgoing_call(ad, sub_id):
@@ -210,3 +279,5 @@ def set_subid_for_outgoing_call(ad, sub_id):
         None
     """
     ad.droid.telecomSetUserSelectedOutgoingPhoneAccountBySubId(sub_id)
+    invalidate_subscription_cache(ad)
+    invalidate_telephony_state(ad)
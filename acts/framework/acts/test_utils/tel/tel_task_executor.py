@@ -0,0 +1,267 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - Google
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""A thread pool shared by the telephony utils, to run the same operation on
+many devices at once.
+
+The pool is created once per test bed and sized to its number of devices,
+so operations on all devices run in a single wave and no threads are
+created and torn down per call. It is never resized while in use: other
+threads may hold it, and a batch larger than the pool is queued.
+"""
+
+import concurrent.futures
+import threading
+import time
+
+_executor = None
+_executor_lock = threading.Lock()
+_local = threading.local()
+
+
+class TaskResult(object):
+    """The outcome of one task run by a TaskExecutor.
+
+    Attributes:
+        func: The function of the task.
+        args: The arguments the function was called with.
+        result: What the function returned, None if it raised an exception or
+            did not run.
+        exception: The exception raised by the function, if any.
+        begin_time: Epoch time in seconds the task started at, None if it did
+            not run.
+        end_time: Epoch time in seconds the task ended at, None if it did not
+            run.
+        cancelled: True if the task did not run because another task failed.
+    """
+
+    def __init__(self, func, args):
+        self.func = func
+        self.args = args
+        self.result = None
+        self.exception = None
+        self.begin_time = None
+        self.end_time = None
+        self.cancelled = False
+
+    @property
+    def duration(self):
+        """Seconds the task ran for, None if it did not run."""
+        if self.begin_time is None or self.end_time is None:
+            return None
+        return self.end_time - self.begin_time
+
+    @property
+    def succeeded(self):
+        """True if the task ran, raised nothing and returned a true value."""
+        return (not self.cancelled and self.exception is None and
+                bool(self.result))
+
+    def __repr__(self):
+        if self.cancelled:
+            outcome = "cancelled"
+        elif self.exception is not None:
+            outcome = "raised {!r}".format(self.exception)
+        else:
+            outcome = "returned {!r}".format(self.result)
+        duration = self.duration
+        if duration is not None:
+            outcome += " in {:.3f}s".format(duration)
+        return "{}{} {}".format(getattr(self.func, "__name__", self.func),
+                                tuple(self.args), outcome)
+
+
+class TaskExecutor(object):
+    """Runs batches of tasks on a thread pool.
+
+    Attributes:
+        max_workers: Number of threads of the pool.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers)
+
+    def run(self, tasks, fail_fast=False):
+        """Runs tasks in parallel and waits for all of them to end.
+
+        Args:
+            tasks: A list of (function, arguments) tuples.
+            fail_fast: If True, once a task fails, the tasks that have not
+                started are cancelled, and running tasks see
+                is_task_cancelled() return True.
+
+        Returns:
+            A list of TaskResult objects, in the order of tasks.
+        """
+        cancel_event = threading.Event()
+        results = [TaskResult(func, args) for func, args in tasks]
+        futures = {}
+        for task_result in results:
+            future = self._executor.submit(_run_task, task_result,
+                                           cancel_event)
+            futures[future] = task_result
+        for future in concurrent.futures.as_completed(futures):
+            if future.cancelled():
+                futures[future].cancelled = True
+            elif fail_fast and not futures[future].succeeded:
+                cancel_event.set()
+                for pending in futures:
+                    pending.cancel()
+        for task_result in results:
+            if cancel_event.is_set() and task_result.begin_time is None:
+                task_result.cancelled = True
+        return results
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+
+def _run_task(task_result, cancel_event):
+    if cancel_event.is_set():
+        task_result.cancelled = True
+        return
+    _local.cancel_event = cancel_event
+    _local.in_task = True
+    task_result.begin_time = time.time()
+    try:
+        task_result.result = task_result.func(*task_result.args)
+    except Exception as e:
+        task_result.exception = e
+    finally:
+        task_result.end_time = time.time()
+        _local.cancel_event = None
+        _local.deadline = None
+        _local.in_task = False
+
+
+def is_task_cancelled():
+    """Checks whether the task running in the calling thread should stop
+    because another task of the same batch failed.
+
+    Long running tasks can check this between steps to stop early.
+
+    Returns:
+        True if the task should stop.
+    """
+    cancel_event = getattr(_local, "cancel_event", None)
+    return cancel_event is not None and cancel_event.is_set()
+
+
+def set_task_deadline(deadline):
+    """Sets the time by which the task running in the calling thread should
+    end. It is cleared when the task ends.
+
+    The state waits of the telephony utils give up once it has passed, so a
+    task made of several waits ends close to its deadline.
+
+    Args:
+        deadline: A time.monotonic() value, None for no deadline.
+    """
+    _local.deadline = deadline
+
+
+def get_task_deadline():
+    """Gets the deadline of the task running in the calling thread.
+
+    Returns:
+        A time.monotonic() value, or None if the task has no deadline.
+    """
+    return getattr(_local, "deadline", None)
+
+
+def start_task_executor(num_workers):
+    """Creates the shared task executor with num_workers threads, replacing
+    the current one once its tasks are done.
+
+    Call this while no util is using the executor, e.g. from setup_class.
+
+    Args:
+        num_workers: Number of threads of the executor.
+
+    Returns:
+        A TaskExecutor object.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor:
+            _executor.shutdown()
+        _executor = TaskExecutor(num_workers)
+        return _executor
+
+
+def get_task_executor(num_workers=1):
+    """Gets the shared task executor, creating it with num_workers threads if
+    start_task_executor was not called. Later, larger batches are then queued
+    on those threads.
+
+    Called from a task of the shared executor, this returns a new executor
+    instead, as tasks waiting on tasks queued behind them in the same pool
+    could deadlock. The caller must shut it down.
+
+    Args:
+        num_workers: Number of threads of a new executor.
+
+    Returns:
+        A TaskExecutor object.
+    """
+    global _executor
+    if getattr(_local, "in_task", False):
+        return TaskExecutor(num_workers)
+    with _executor_lock:
+        if _executor is None:
+            _executor = TaskExecutor(num_workers)
+        return _executor
+
+
+def shutdown_task_executor():
+    """Shuts down the shared task executor, waiting for running tasks."""
+    global _executor
+    with _executor_lock:
+        if _executor:
+            _executor.shutdown()
+            _executor = None
+
+
+def run_tasks(tasks, fail_fast=False, log=None):
+    """Runs tasks in parallel on the shared task executor.
+
+    At most as many tasks as the executor has threads run at once, the others
+    are queued until a thread is free.
+
+    Args:
+        tasks: A list of (function, arguments) tuples.
+        fail_fast: If True, cancel the remaining tasks once one fails, see
+            TaskExecutor.run.
+        log: Optional log object to warn on when tasks are queued.
+
+    Returns:
+        A list of TaskResult objects, in the order of tasks.
+    """
+    if not tasks:
+        return []
+    nested = getattr(_local, "in_task", False)
+    executor = get_task_executor(len(tasks))
+    if log and len(tasks) > executor.max_workers:
+        log.warning("Running {} tasks on {} threads, the others are queued. "
+                    "Size the executor with start_task_executor.".format(
+                        len(tasks), executor.max_workers))
+    try:
+        return executor.run(tasks, fail_fast)
+    finally:
+        if nested:
+            executor.shutdown()
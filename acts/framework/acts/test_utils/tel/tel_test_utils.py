@@ -17,13 +17,26 @@
 from future import standard_library
 standard_library.install_aliases()
 
-import concurrent.futures
+import functools
+import threading
 import urllib.parse
 import time
 
 from queue import Empty
+from acts import tracing
 from acts.controllers.android_device import AndroidDevice
 from acts.controllers.event_dispatcher import EventDispatcher
+from acts.test_utils.tel.tel_call_kpi import CALL_KPI_ANSWER
+from acts.test_utils.tel.tel_call_kpi import CALL_KPI_CALLEE
+from acts.test_utils.tel.tel_call_kpi import CALL_KPI_CALLEE_OFFHOOK
+from acts.test_utils.tel.tel_call_kpi import CALL_KPI_CALLER
+from acts.test_utils.tel.tel_call_kpi import CALL_KPI_CALLER_OFFHOOK
+from acts.test_utils.tel.tel_call_kpi import CALL_KPI_DIAL
+from acts.test_utils.tel.tel_call_kpi import CALL_KPI_HANGUP
+from acts.test_utils.tel.tel_call_kpi import CALL_KPI_IDLE
+from acts.test_utils.tel.tel_call_kpi import CALL_KPI_RINGING
+from acts.test_utils.tel.tel_call_kpi import CallKpi
+from acts.test_utils.tel.tel_call_kpi import report_call_kpi
 from acts.test_utils.tel.tel_defines import AOSP_PREFIX
 from acts.test_utils.tel.tel_defines import CARRIER_UNKNOWN
 from acts.test_utils.tel.tel_defines import DATA_STATE_CONNECTED
@@ -56,6 +69,7 @@ from acts.test_utils.tel.tel_defines import NETWORK_CONNECTION_TYPE_CELL
 from acts.test_utils.tel.tel_defines import NETWORK_CONNECTION_TYPE_WIFI
 from acts.test_utils.tel.tel_defines import NETWORK_SERVICE_DATA
 from acts.test_utils.tel.tel_defines import NETWORK_SERVICE_VOICE
+from acts.test_utils.tel.tel_defines import PHONE_NUMBER_CACHE_SIZE
 from acts.test_utils.tel.tel_defines import PHONE_NUMBER_STRING_FORMAT_7_DIGIT
 from acts.test_utils.tel.tel_defines import PHONE_NUMBER_STRING_FORMAT_10_DIGIT
 from acts.test_utils.tel.tel_defines import PHONE_NUMBER_STRING_FORMAT_11_DIGIT
@@ -81,6 +95,8 @@ from acts.test_utils.tel.tel_defines import WAIT_TIME_CHANGE_DATA_SUB_ID
 from acts.test_utils.tel.tel_defines import WAIT_TIME_IN_CALL
 from acts.test_utils.tel.tel_defines import WAIT_TIME_LEAVE_VOICE_MAIL
 from acts.test_utils.tel.tel_defines import WAIT_TIME_REJECT_CALL
+from acts.test_utils.tel.tel_defines import WAIT_TIME_STATE_POLL_INITIAL
+from acts.test_utils.tel.tel_defines import WAIT_TIME_STATE_POLL_MAX
 from acts.test_utils.tel.tel_defines import WAIT_TIME_VOICE_MAIL_SERVER_RESPONSE
 from acts.test_utils.tel.tel_defines import WFC_MODE_DISABLED
 from acts.test_utils.tel.tel_defines import EventCallStateChanged
@@ -91,7 +107,6 @@ from acts.test_utils.tel.tel_defines import EventMessageWaitingIndicatorChanged
 from acts.test_utils.tel.tel_defines import EventServiceStateChanged
 from acts.test_utils.tel.tel_defines import EventMmsSentSuccess
 from acts.test_utils.tel.tel_defines import EventSmsReceived
-from acts.test_utils.tel.tel_defines import EventSmsSentSuccess
 from acts.test_utils.tel.tel_defines import CallStateContainer
 from acts.test_utils.tel.tel_defines import DataConnectionStateContainer
 from acts.test_utils.tel.tel_defines import MessageWaitingIndicatorContainer
@@ -122,6 +137,23 @@ from acts.test_utils.tel.tel_subscription_utils import \
     get_incoming_voice_sub_id
 from acts.test_utils.tel.tel_subscription_utils import \
     get_incoming_message_sub_id
+from acts.test_utils.tel.tel_subscription_utils import get_subscription_cache
+from acts.test_utils.tel.tel_subscription_utils import \
+    invalidate_subscription_cache
+from acts.test_utils.tel.tel_message_engine import MessageEngine
+from acts.test_utils.tel.tel_state_utils import STATE_CHANGE_EVENTS
+from acts.test_utils.tel.tel_state_utils import get_telephony_state
+from acts.test_utils.tel.tel_state_utils import invalidate_telephony_state
+from acts.test_utils.tel.tel_task_executor import get_task_deadline
+from acts.test_utils.tel.tel_task_executor import is_task_cancelled
+from acts.test_utils.tel.tel_task_executor import run_tasks
+from acts.test_utils.tel.tel_transition_recorder import \
+    TRANSITION_AIRPLANE_MODE
+from acts.test_utils.tel.tel_transition_recorder import \
+    TRANSITION_WIFI_ENABLED
+from acts.test_utils.tel.tel_transition_recorder import record_transition
+from acts.test_utils.tel.tel_transition_recorder import \
+    resume_transition_tracking
 from acts.utils import load_config
 from acts.logger import LoggerProxy
 log = LoggerProxy()
@@ -131,6 +163,32 @@ class TelTestUtilsError(Exception):
     pass
 
 
+# Contents of the SIM files loaded in this run, by file name. The devices
+# are set up from several threads at once.
+_sim_data_cache = {}
+_sim_data_lock = threading.Lock()
+
+
+def _load_sim_data(log, sim_filename):
+    """Load a SIM file, once per run.
+
+    Args:
+        log: log object.
+        sim_filename: path of the SIM file.
+
+    Returns:
+        The SIM data, or None if the file could not be loaded.
+    """
+    with _sim_data_lock:
+        if sim_filename not in _sim_data_cache:
+            try:
+                _sim_data_cache[sim_filename] = load_config(sim_filename)
+            except Exception:
+                log.warning("Failed to load {}!".format(sim_filename))
+                _sim_data_cache[sim_filename] = None
+        return _sim_data_cache[sim_filename]
+
+
 def setup_droid_properties(log, ad, sim_filename):
 
     # Check to see if droid already has this property
@@ -140,47 +198,47 @@ def setup_droid_properties(log, ad, sim_filename):
     device_props = {}
     device_props['subscription'] = {}
 
-    try:
-        sim_data = load_config(sim_filename)
-    except Exception:
-        log.warning("Failed to load {}!".format(sim_filename))
-        sim_data = None
-    sub_info_list = ad.droid.subscriptionGetAllSubInfoList()
-    found_sims = 0
-    for sub_info in sub_info_list:
-        sub_id = sub_info['subscriptionId']
-        if sub_info['simSlotIndex'] is not INVALID_SIM_SLOT_INDEX:
-            found_sims += 1
-            sim_record = {}
-            try:
-                sim_serial = ad.droid.telephonyGetSimSerialNumberForSubscription(
-                    sub_id)
-                if not sim_serial:
-                    log.error("Unable to find ICC-ID for SIM on {}!".format(
-                        ad.serial))
-                if sim_data is not None:
-                    number = sim_data[sim_serial]["phone_num"]
-                else:
-                    raise KeyError("No file to load phone number info!")
-            except KeyError:
-                number = ad.droid.telephonyGetLine1NumberForSubscription(
-                    sub_id)
-            if not number or number == "":
-                raise TelTestUtilsError(
-                    "Failed to find valid phone number for {}"
-                    .format(ad.serial))
-
-            sim_record['phone_num'] = number
-            sim_record['operator'] = get_operator_name(log, ad, sub_id)
-            device_props['subscription'][sub_id] = sim_record
-            log.info(
-                "phone_info: <{}:{}>, <subId:{}> {} <{}>, ICC-ID:<{}>".format(
-                    ad.model, ad.serial, sub_id, number, get_operator_name(
-                        log, ad, sub_id),
-                    ad.droid.telephonyGetSimSerialNumberForSubscription(
-                        sub_id)))
+    sim_data = _load_sim_data(log, sim_filename)
+    sub_ids = [sub_info['subscriptionId']
+               for sub_info in get_subscription_cache(ad).sub_info_list
+               if sub_info['simSlotIndex'] is not INVALID_SIM_SLOT_INDEX]
+    # Read the serial and operator of all SIMs in one round trip.
+    calls = []
+    for sub_id in sub_ids:
+        calls.append(("telephonyGetSimSerialNumberForSubscription", (sub_id,)))
+        calls.append(("telephonyGetSimOperatorForSubscription", (sub_id,)))
+    results = ad.droid.rpc_batch(calls) if calls else []
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    for sub_id, sim_serial, plmn_id in zip(sub_ids, results[0::2],
+                                           results[1::2]):
+        sim_record = {}
+        try:
+            if not sim_serial:
+                log.error("Unable to find ICC-ID for SIM on {}!".format(
+                    ad.serial))
+            if sim_data is not None:
+                number = sim_data[sim_serial]["phone_num"]
+            else:
+                raise KeyError("No file to load phone number info!")
+        except KeyError:
+            number = ad.droid.telephonyGetLine1NumberForSubscription(
+                sub_id)
+        if not number or number == "":
+            raise TelTestUtilsError(
+                "Failed to find valid phone number for {}"
+                .format(ad.serial))
+
+        sim_record['phone_num'] = number
+        sim_record['operator'] = _get_operator_name_from_plmn_id(plmn_id)
+        device_props['subscription'][sub_id] = sim_record
+        log.info(
+            "phone_info: <{}:{}>, <subId:{}> {} <{}>, ICC-ID:<{}>".format(
+                ad.model, ad.serial, sub_id, number,
+                sim_record['operator'], sim_serial))
 
-    if found_sims == 0:
+    if not sub_ids:
         log.warning("No Valid SIMs found in device {}".format(ad.serial))
 
     setattr(ad, 'cfg', device_props)
@@ -230,7 +288,7 @@ def get_num_active_sims(log, ad):
     # in the situation where multiple subscriptions are on the same SIM.
     # yes, this is a corner corner case.
     valid_sims = {}
-    subInfo = ad.droid.subscriptionGetAllSubInfoList()
+    subInfo = get_subscription_cache(ad).sub_info_list
     for info in subInfo:
         ssidx = info['simSlotIndex']
         if ssidx == INVALID_SIM_SLOT_INDEX:
@@ -335,7 +393,7 @@ def toggle_airplane_mode_msim(log, ad, new_state=None):
     ad.ed.clear_all_events()
     sub_id_list = []
 
-    active_sub_info = ad.droid.subscriptionGetAllSubInfoList()
+    active_sub_info = get_subscription_cache(ad).sub_info_list
     for info in active_sub_info:
         sub_id_list.append(info['subscriptionId'])
 
@@ -364,10 +422,15 @@ def toggle_airplane_mode_msim(log, ad, new_state=None):
         service_state_list.append(SERVICE_STATE_EMERGENCY_ONLY)
         log.info("Turn off airplane mode: " + serial_number)
 
+    # The recorder may have been tracking service state changes already.
+    ad.ed.clear_events(EventServiceStateChanged)
     for sub_id in sub_id_list:
         ad.droid.telephonyStartTrackingServiceStateChangeForSubscription(
             sub_id)
+    record_transition(ad, TRANSITION_AIRPLANE_MODE, new_state)
     ad.droid.connectivityToggleAirplaneMode(new_state)
+    invalidate_subscription_cache(ad)
+    invalidate_telephony_state(ad)
 
     event = None
 
@@ -389,6 +452,10 @@ def toggle_airplane_mode_msim(log, ad, new_state=None):
         for sub_id in sub_id_list:
             ad.droid.telephonyStopTrackingServiceStateChangeForSubscription(
                 sub_id)
+        resume_transition_tracking(log, ad)
+        # The state may have been read before the SIM reloaded.
+        invalidate_subscription_cache(ad)
+        invalidate_telephony_state(ad)
 
     if new_state:
         if (not ad.droid.connectivityCheckAirplaneMode() or
@@ -405,7 +472,8 @@ def toggle_airplane_mode_msim(log, ad, new_state=None):
 def wait_and_answer_call(log,
                          ad,
                          incoming_number=None,
-                         incall_ui_display=INCALL_UI_DISPLAY_FOREGROUND):
+                         incall_ui_display=INCALL_UI_DISPLAY_FOREGROUND,
+                         kpi=None):
     """Wait for an incoming call on default voice subscription and
        accepts the call.
 
@@ -418,6 +486,8 @@ def wait_and_answer_call(log,
             if = INCALL_UI_DISPLAY_FOREGROUND, bring in-call UI to foreground.
             if = INCALL_UI_DISPLAY_BACKGROUND, bring in-call UI to background.
             else, do nothing.
+        kpi: The CallKpi object of the call to mark the callee phases on.
+            Optional, default is a new one.
 
     Returns:
         True: if incoming call is received and answered successfully.
@@ -425,7 +495,7 @@ def wait_and_answer_call(log,
         """
     return wait_and_answer_call_for_subscription(
         log, ad, get_incoming_voice_sub_id(ad), incoming_number,
-        incall_ui_display)
+        incall_ui_display, kpi)
 
 
 def wait_for_ringing_event(log, ad, wait_time):
@@ -475,7 +545,8 @@ def wait_and_answer_call_for_subscription(
         ad,
         sub_id,
         incoming_number=None,
-        incall_ui_display=INCALL_UI_DISPLAY_FOREGROUND):
+        incall_ui_display=INCALL_UI_DISPLAY_FOREGROUND,
+        kpi=None):
     """Wait for an incoming call on specified subscription and
        accepts the call.
 
@@ -489,11 +560,16 @@ def wait_and_answer_call_for_subscription(
             if = INCALL_UI_DISPLAY_FOREGROUND, bring in-call UI to foreground.
             if = INCALL_UI_DISPLAY_BACKGROUND, bring in-call UI to background.
             else, do nothing.
+        kpi: The CallKpi object of the call to mark the callee phases on.
+            Optional, default is a new one, which is kept on the device for
+            hangup_call once the call is answered.
 
     Returns:
         True: if incoming call is received and answered successfully.
         False: for errors
     """
+    if kpi is None:
+        kpi = CallKpi(callee=ad.serial)
     ad.ed.clear_all_events()
     ad.droid.telephonyStartTrackingCallStateForSubscription(sub_id)
     if (not ad.droid.telecomIsRinging() and
@@ -504,10 +580,12 @@ def wait_and_answer_call_for_subscription(
                 log, ad, MAX_WAIT_TIME_CALLEE_RINGING)
             if event_ringing is None:
                 log.error("No Ringing Event.")
+                _end_call_kpi(kpi, "No Ringing Event.")
                 return False
         finally:
             ad.droid.telephonyStopTrackingCallStateChangeForSubscription(
                 sub_id)
+            resume_transition_tracking(log, ad)
 
         if not incoming_number:
             result = True
@@ -521,14 +599,19 @@ def wait_and_answer_call_for_subscription(
             log.error("Expected number:{}, actual number:{}".format(
                 incoming_number, event_ringing['data'][
                     CallStateContainer.INCOMING_NUMBER]))
+            _end_call_kpi(kpi, "Incoming Number not match")
             return False
+    kpi.mark(CALL_KPI_RINGING)
+    _set_call_kpi_rat(log, kpi, CALL_KPI_CALLEE, CALL_KPI_RINGING, ad, sub_id)
 
     ad.ed.clear_all_events()
     ad.droid.telephonyStartTrackingCallStateForSubscription(sub_id)
     if not wait_for_telecom_ringing(log, ad, MAX_WAIT_TIME_TELECOM_RINGING):
         log.error("Telecom is not ringing.")
+        _end_call_kpi(kpi, "Telecom is not ringing.")
         return False
     log.info("Accept on callee.")
+    kpi.mark(CALL_KPI_ANSWER)
     ad.droid.telecomAcceptRingingCall()
     try:
         ad.ed.wait_for_event(
@@ -540,9 +623,15 @@ def wait_and_answer_call_for_subscription(
     except Empty:
         if not ad.droid.telecomIsInCall():
             log.error("Accept call failed.")
+            _end_call_kpi(kpi, "Accept call failed.")
             return False
     finally:
         ad.droid.telephonyStopTrackingCallStateChangeForSubscription(sub_id)
+        resume_transition_tracking(log, ad)
+    kpi.mark(CALL_KPI_CALLEE_OFFHOOK)
+    _set_call_kpi_rat(log, kpi, CALL_KPI_CALLEE, CALL_KPI_CALLEE_OFFHOOK, ad,
+                      sub_id)
+    _keep_call_kpi(ad, kpi)
     if incall_ui_display == INCALL_UI_DISPLAY_FOREGROUND:
         ad.droid.telecomShowInCallScreen()
     elif incall_ui_display == INCALL_UI_DISPLAY_BACKGROUND:
@@ -609,6 +698,7 @@ def wait_and_reject_call_for_subscription(log,
         finally:
             ad.droid.telephonyStopTrackingCallStateChangeForSubscription(
                 sub_id)
+            resume_transition_tracking(log, ad)
 
         if not incoming_number:
             result = True
@@ -656,15 +746,39 @@ def wait_and_reject_call_for_subscription(log,
         return False
     finally:
         ad.droid.telephonyStopTrackingCallStateChangeForSubscription(sub_id)
+        resume_transition_tracking(log, ad)
     return True
 
 
-def hangup_call(log, ad):
+def hangup_call(log, ad, kpi=None):
     """Hang up ongoing active call.
+
+    The hang up is timed on the KPI of the call, which is then reported.
+
+    Args:
+        ad: android device object.
+        kpi: The CallKpi object of the call. Optional, default is the KPI
+            kept on the device by the util that set up its last call, if
+            that call is still in progress.
+
+    Returns:
+        True if the call is hung up, False for errors.
     """
+    if kpi is None:
+        kpi = _get_kept_call_kpi(ad)
+    if kpi is not None and kpi.reported:
+        kpi = None
     ad.ed.clear_all_events()
     ad.droid.telephonyStartTrackingCallState()
     log.info("Hangup call.")
+    if kpi:
+        if ad.serial == kpi.caller:
+            _set_call_kpi_rat(log, kpi, CALL_KPI_CALLER, CALL_KPI_HANGUP, ad,
+                              get_outgoing_voice_sub_id(ad))
+        else:
+            _set_call_kpi_rat(log, kpi, CALL_KPI_CALLEE, CALL_KPI_HANGUP, ad,
+                              get_incoming_voice_sub_id(ad))
+        kpi.mark(CALL_KPI_HANGUP)
     ad.droid.telecomEndCall()
 
     try:
@@ -676,9 +790,17 @@ def hangup_call(log, ad):
     except Empty:
         if ad.droid.telecomIsInCall():
             log.error("Hangup call failed.")
+            if kpi:
+                _end_call_kpi(kpi, "Hangup call failed.")
             return False
     finally:
         ad.droid.telephonyStopTrackingCallStateChange()
+        resume_transition_tracking(log, ad)
+    if kpi:
+        kpi.mark(CALL_KPI_IDLE)
+        report_call_kpi(kpi)
+    if kpi is getattr(ad, "call_kpi", None):
+        clear_call_kpi(ad)
     return True
 
 
@@ -719,6 +841,7 @@ def _phone_number_remove_prefix(number):
     return number, None
 
 
+@functools.lru_cache(maxsize=PHONE_NUMBER_CACHE_SIZE)
 def check_phone_number_match(number1, number2):
     """Check whether two input phone numbers match or not.
 
@@ -740,6 +863,8 @@ def check_phone_number_match(number1, number2):
             number1 = +15555555555, number2 = 5555555555
             (number2 have no country code)
 
+    The results are cached, so the numbers must be hashable.
+
     Args:
         number1: 1st phone number to be compared.
         number2: 2nd phone number to be compared.
@@ -760,7 +885,7 @@ def check_phone_number_match(number1, number2):
     return number1 == number2
 
 
-def initiate_call(log, ad_caller, callee_number, emergency=False):
+def initiate_call(log, ad_caller, callee_number, emergency=False, kpi=None):
     """Make phone call from caller to callee.
 
     Args:
@@ -768,18 +893,26 @@ def initiate_call(log, ad_caller, callee_number, emergency=False):
         callee_number: Callee phone number.
         emergency : specify the call is emergency.
             Optional. Default value is False.
+        kpi: The CallKpi object of the call to mark the caller phases on.
+            Optional, default is a new one, which is kept on the caller for
+            hangup_call once the call is placed.
 
     Returns:
         result: if phone call is placed successfully.
     """
+    if kpi is None:
+        kpi = CallKpi(caller=ad_caller.serial)
     ad_caller.ed.clear_all_events()
     sub_id = get_outgoing_voice_sub_id(ad_caller)
     ad_caller.droid.telephonyStartTrackingCallStateForSubscription(sub_id)
+    _set_call_kpi_rat(log, kpi, CALL_KPI_CALLER, CALL_KPI_DIAL, ad_caller,
+                      sub_id)
 
     wait_time_for_incall_state = MAX_WAIT_TIME_CALL_INITIATION
 
     try:
         # Make a Call
+        kpi.mark(CALL_KPI_DIAL)
         if emergency:
             ad_caller.droid.telecomCallEmergencyNumber(callee_number)
         else:
@@ -793,12 +926,15 @@ def initiate_call(log, ad_caller, callee_number, emergency=False):
                 timeout=wait_time_for_incall_state,
                 field=CallStateContainer.CALL_STATE,
                 value=TELEPHONY_STATE_OFFHOOK)
+        kpi.mark(CALL_KPI_CALLER_OFFHOOK)
     except Empty:
         log.error("initiate_call did not receive Telephony OFFHOOK event.")
+        _end_call_kpi(kpi, "No Telephony OFFHOOK event.")
         return False
     finally:
         ad_caller.droid.telephonyStopTrackingCallStateChangeForSubscription(
             sub_id)
+        resume_transition_tracking(log, ad_caller)
 
     # Verify call state
     while wait_time_for_incall_state > 0:
@@ -808,21 +944,73 @@ def initiate_call(log, ad_caller, callee_number, emergency=False):
              TELEPHONY_STATE_OFFHOOK) and
             (ad_caller.droid.telecomGetCallState() ==
              TELEPHONY_STATE_OFFHOOK)):
+            _set_call_kpi_rat(log, kpi, CALL_KPI_CALLER,
+                              CALL_KPI_CALLER_OFFHOOK, ad_caller, sub_id)
+            _keep_call_kpi(ad_caller, kpi)
             return True
         time.sleep(1)
     log.error("Make call fail. telecomIsInCall:{}, Telecom State:{},"
               " Telephony State:{}".format(ad_caller.droid.telecomIsInCall(
               ), ad_caller.droid.telephonyGetCallState(
               ), ad_caller.droid.telecomGetCallState()))
+    _end_call_kpi(kpi, "Make call fail.")
     return False
 
 
+def _set_call_kpi_rat(log, kpi, side, phase, ad, sub_id):
+    """Records the voice RAT of a device in a call on the KPI of the call.
+    """
+    kpi.set_rat(side, phase, get_network_rat_for_subscription(
+        log, ad, sub_id, NETWORK_SERVICE_VOICE))
+
+
+def _end_call_kpi(kpi, failure):
+    """Reports the KPI of a call that failed.
+    """
+    kpi.fail(failure)
+    report_call_kpi(kpi)
+
+
+def _keep_call_kpi(ad, kpi):
+    """Keeps the KPI of the call just set up on a device, along with the
+    telecom calls it belongs to, for hangup_call to time the hang up on.
+    """
+    ad.call_kpi = kpi
+    ad.call_kpi_call_ids = set(ad.droid.telecomCallGetCallIds())
+
+
+def _get_kept_call_kpi(ad):
+    """Returns the KPI kept on a device if its call is still in progress.
+
+    A KPI whose calls ended without hangup_call, e.g. hung up by the far
+    end, is dropped so that it is not timed on an unrelated call.
+    """
+    kpi = getattr(ad, "call_kpi", None)
+    if kpi is None or kpi.reported:
+        clear_call_kpi(ad)
+        return None
+    if not ad.call_kpi_call_ids & set(ad.droid.telecomCallGetCallIds()):
+        clear_call_kpi(ad)
+        return None
+    return kpi
+
+
+def clear_call_kpi(ad):
+    """Forgets the KPI kept on a device for its last call.
+
+    Args:
+        ad: android device object.
+    """
+    ad.call_kpi = None
+    ad.call_kpi_call_ids = set()
+
+
 def call_reject(log, ad_caller, ad_callee, reject=True):
     """Caller call Callee, then reject on callee.
 
 
     """
-    subid_caller = ad_caller.droid.subscriptionGetDefaultVoiceSubId()
+    subid_caller = get_subscription_cache(ad_caller).default_voice_sub_id
     subid_callee = ad_callee.incoming_voice_sub_id
     log.info("Sub-ID Caller {}, Sub-ID Callee {}".format(subid_caller,
                                                          subid_callee))
@@ -1161,6 +1349,9 @@ def call_setup_teardown_for_subscription(
             if = INCALL_UI_DISPLAY_BACKGROUND, bring in-call UI to background.
             else, do nothing.
 
+    The timings of the call are reported as a CallKpi once the call is hung
+    up, or once it is set up if it is left in progress.
+
     Returns:
         True if call process without any error.
         False if error happened.
@@ -1175,9 +1366,10 @@ def call_setup_teardown_for_subscription(
     callee_number = ad_callee.cfg['subscription'][subid_callee]['phone_num']
 
     log.info("Call from {} to {}".format(caller_number, callee_number))
+    kpi = CallKpi(ad_caller.serial, ad_callee.serial)
 
     try:
-        if not initiate_call(log, ad_caller, callee_number):
+        if not initiate_call(log, ad_caller, callee_number, kpi=kpi):
             raise _CallSequenceException("Initiate call failed.")
 
         if not wait_and_answer_call_for_subscription(
@@ -1185,7 +1377,8 @@ def call_setup_teardown_for_subscription(
                 ad_callee,
                 subid_callee,
                 incoming_number=caller_number,
-                incall_ui_display=incall_ui_display):
+                incall_ui_display=incall_ui_display,
+                kpi=kpi):
             raise _CallSequenceException("Answer call fail.")
 
         # ensure that all internal states are updated in telecom
@@ -1222,15 +1415,17 @@ def call_setup_teardown_for_subscription(
         if not ad_hangup:
             return True
 
-        if not hangup_call(log, ad_hangup):
+        if not hangup_call(log, ad_hangup, kpi=kpi):
             raise _CallSequenceException("Error in Hanging-Up Call")
 
         return True
 
     except _CallSequenceException as e:
         log.error(e)
+        kpi.fail(e)
         return False
     finally:
+        report_call_kpi(kpi)
         if ad_hangup:
             for ad in [ad_caller, ad_callee]:
                 try:
@@ -1240,6 +1435,7 @@ def call_setup_teardown_for_subscription(
                     log.error(str(e))
 
 
+@functools.lru_cache(maxsize=PHONE_NUMBER_CACHE_SIZE)
 def phone_number_formatter(input_string, format=None):
     """Get expected format of input phone number string.
 
@@ -1254,7 +1450,7 @@ def phone_number_formatter(input_string, format=None):
 
     Returns:
         If no error happen, return phone number in expected format.
-        Else, return None.
+        Else, return None. The results are cached.
     """
     # make sure input_string is 10 digital
     # Remove white spaces, dashes, dots
@@ -1474,6 +1670,7 @@ def wait_for_cell_data_connection_for_subscription(
     finally:
         ad.droid.telephonyStopTrackingDataConnectionStateChangeForSubscription(
             sub_id)
+        resume_transition_tracking(log, ad)
 
 
 def wait_for_wifi_data_connection(
@@ -1624,6 +1821,7 @@ def _wait_for_nw_data_connection(
         return False
     finally:
         ad.droid.connectivityStopTrackingConnectivityStateChange()
+        resume_transition_tracking(log, ad)
 
 
 def verify_incall_state(log, ads, expected_status):
@@ -1640,9 +1838,10 @@ def verify_incall_state(log, ads, expected_status):
     """
     result = True
     for ad in ads:
-        if ad.droid.telecomIsInCall() is not expected_status:
+        in_call = get_telephony_state(ad).in_call
+        if in_call is not expected_status:
             log.error("Verify_incall_state: {} status:{}, expected:{}".format(
-                ad.serial, ad.droid.telecomIsInCall(), expected_status))
+                ad.serial, in_call, expected_status))
             result = False
     return result
 
@@ -1755,45 +1954,162 @@ def set_wfc_mode(log, ad, wfc_mode):
     return True
 
 
-def _wait_for_droid_in_state(log, ad, max_time, state_check_func, *args,
-                             **kwargs):
-    while max_time > 0:
-        if state_check_func(log, ad, *args, **kwargs):
-            return True
+def _has_event_dispatcher(ad):
+    ed = getattr(ad, "ed", None)
+    return ed is not None and ed.started
 
-        time.sleep(1)
-        max_time -= 1
 
-    return False
+def _start_tracking_service_state(log, ad, sub_id=None):
+    """Start tracking service state changes of android device.
 
+    Args:
+        log: log object.
+        ad: android device.
+        sub_id: subscription id, None for the default subscription.
 
-def _wait_for_droid_in_state_for_subscription(
-        log, ad, sub_id, max_time, state_check_func, *args, **kwargs):
-    while max_time > 0:
-        if state_check_func(log, ad, sub_id, *args, **kwargs):
-            return True
+    Returns:
+        True if tracking started.
+    """
+    if not _has_event_dispatcher(ad):
+        return False
+    try:
+        if sub_id is None:
+            ad.droid.telephonyStartTrackingServiceStateChange()
+        else:
+            ad.droid.telephonyStartTrackingServiceStateChangeForSubscription(
+                sub_id)
+        return True
+    except Exception as e:
+        log.debug("Failed to track service state on {}: {}".format(
+            ad.serial, e))
+        return False
 
-        time.sleep(1)
-        max_time -= 1
 
-    return False
+def _stop_tracking_service_state(log, ad, sub_id=None):
+    try:
+        if sub_id is None:
+            ad.droid.telephonyStopTrackingServiceStateChange()
+        else:
+            ad.droid.telephonyStopTrackingServiceStateChangeForSubscription(
+                sub_id)
+    except Exception as e:
+        log.debug("Failed to stop tracking service state on {}: {}".format(
+            ad.serial, e))
+    # Leftover events would be taken as new by the next code waiting on them.
+    ad.ed.clear_events(EventServiceStateChanged)
+    resume_transition_tracking(log, ad)
 
 
-def _wait_for_droids_in_state(log, ads, max_time, state_check_func, *args,
-                              **kwargs):
-    while max_time > 0:
-        success = True
-        for ad in ads:
-            if not state_check_func(log, ad, *args, **kwargs):
-                success = False
+def _get_state_name(state_check_func, args):
+    return " ".join([state_check_func.__name__.strip("_")] +
+                    [str(arg) for arg in args])
+
+
+def _wait_for_state(log, ads, max_time, check_func, state_name, sub_id=None):
+    """Wait for all android devices to be in a state.
+
+    The state is checked again whenever a device receives a state change
+    event. Without events, it is polled at an interval starting at
+    WAIT_TIME_STATE_POLL_INITIAL and doubling up to WAIT_TIME_STATE_POLL_MAX.
+    The time it took to reach the state is logged and added to the timeline
+    of the test run. Called from a task, the wait also ends at the deadline
+    of the task or once the task is cancelled.
+
+    Args:
+        log: log object.
+        ads: list of android devices.
+        max_time: maximal wait time in seconds.
+        check_func: function that takes an android device and returns True
+            if the device is in the state.
+        state_name: name of the state, for logging.
+        sub_id: subscription id whose service state changes are tracked,
+            None for the default subscription.
+
+    Returns:
+        Return True if all devices are in the state within max_time.
+        Return False if timeout.
+    """
+    begin_time = time.time()
+    deadline = time.monotonic() + max_time
+    task_deadline = get_task_deadline()
+    if task_deadline is not None:
+        deadline = min(deadline, task_deadline)
+    interval = WAIT_TIME_STATE_POLL_INITIAL
+    tracked_ads = []
+    waited = False
+    try:
+        while True:
+            pending_ad = None
+            for ad in ads:
+                # Count the events before the check, so events received
+                # during the check are not missed.
+                if _has_event_dispatcher(ad):
+                    event_count = ad.ed.get_event_count(STATE_CHANGE_EVENTS)
+                if not check_func(ad):
+                    pending_ad = ad
+                    break
+            if not pending_ad:
                 break
-        if success:
-            return True
+            if not waited:
+                waited = True
+                tracked_ads = [ad for ad in ads
+                               if _start_tracking_service_state(log, ad,
+                                                                sub_id)]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                log.debug("Timeout after {}s waiting for {}.".format(
+                    max_time, state_name))
+                return False
+            if is_task_cancelled():
+                log.debug("Task cancelled waiting for {}.".format(state_name))
+                return False
+            timeout = min(interval, remaining)
+            if _has_event_dispatcher(pending_ad):
+                new_count = pending_ad.ed.wait_for_new_events(
+                    STATE_CHANGE_EVENTS, event_count, timeout)
+                if new_count != event_count:
+                    # Woken up by an event, check again right away.
+                    continue
+            else:
+                time.sleep(timeout)
+            interval = min(interval * 2, WAIT_TIME_STATE_POLL_MAX)
+    finally:
+        for ad in tracked_ads:
+            _stop_tracking_service_state(log, ad, sub_id)
+    if waited:
+        end_time = time.time()
+        serials = [getattr(ad, "serial", None) for ad in ads]
+        log.info("{} reached {} in {:.3f}s.".format(serials, state_name,
+                                                    end_time - begin_time))
+        timeline = tracing.get_current_timeline()
+        if timeline:
+            timeline.add_span(state_name, "state_wait", begin_time, end_time,
+                              devices=serials)
+    return True
 
-        time.sleep(1)
-        max_time -= 1
 
-    return False
+def _wait_for_droid_in_state(log, ad, max_time, state_check_func, *args,
+                             **kwargs):
+    return _wait_for_state(
+        log, [ad], max_time,
+        lambda ad: state_check_func(log, ad, *args, **kwargs),
+        _get_state_name(state_check_func, args))
+
+
+def _wait_for_droid_in_state_for_subscription(
+        log, ad, sub_id, max_time, state_check_func, *args, **kwargs):
+    return _wait_for_state(
+        log, [ad], max_time,
+        lambda ad: state_check_func(log, ad, sub_id, *args, **kwargs),
+        _get_state_name(state_check_func, (sub_id,) + args), sub_id)
+
+
+def _wait_for_droids_in_state(log, ads, max_time, state_check_func, *args,
+                              **kwargs):
+    return _wait_for_state(
+        log, ads, max_time,
+        lambda ad: state_check_func(log, ad, *args, **kwargs),
+        _get_state_name(state_check_func, args))
 
 
 def is_phone_in_call(log, ad):
@@ -1803,7 +2119,7 @@ def is_phone_in_call(log, ad):
         log: log object.
         ad:  android device.
     """
-    return ad.droid.telecomIsInCall()
+    return get_telephony_state(ad).in_call
 
 
 def is_phone_not_in_call(log, ad):
@@ -1813,7 +2129,7 @@ def is_phone_not_in_call(log, ad):
         log: log object.
         ad:  android device.
     """
-    return not ad.droid.telecomIsInCall()
+    return not get_telephony_state(ad).in_call
 
 
 def wait_for_droid_in_call(log, ad, max_time):
@@ -1865,7 +2181,7 @@ def wait_for_droid_not_in_call(log, ad, max_time):
 
 def _is_attached(log, ad, voice_or_data):
     return _is_attached_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), voice_or_data)
+        log, ad, get_subscription_cache(ad).default_sub_id, voice_or_data)
 
 
 def _is_attached_for_subscription(log, ad, sub_id, voice_or_data):
@@ -1962,7 +2278,7 @@ def is_ims_registered(log, ad):
         Return True if IMS registered.
         Return False if IMS not registered.
     """
-    return ad.droid.telephonyIsImsRegistered()
+    return get_telephony_state(ad).ims_registered
 
 
 def wait_for_ims_registered(log, ad, max_time):
@@ -1991,7 +2307,7 @@ def is_volte_enabled(log, ad):
         Return True if VoLTE feature bit is True and IMS registered.
         Return False if VoLTE feature bit is False or IMS not registered.
     """
-    volte_status = ad.droid.telephonyIsVolteAvailable()
+    volte_status = get_telephony_state(ad).volte_available
     ims_status = is_ims_registered(log, ad)
     if volte_status is True and ims_status is False:
         log.error("Error! VoLTE is Available, but IMS is not registered.")
@@ -2010,7 +2326,7 @@ def is_video_enabled(log, ad):
         Return True if Video Calling feature bit is True and IMS registered.
         Return False if Video Calling feature bit is False or IMS not registered.
     """
-    video_status = ad.droid.telephonyIsVideoCallingAvailable()
+    video_status = get_telephony_state(ad).video_calling_available
     ims_status = is_ims_registered(log, ad)
     if video_status is True and ims_status is False:
         log.error("Error! Video Call is Available, but IMS is not registered.")
@@ -2059,7 +2375,7 @@ def is_wfc_enabled(log, ad):
         Return True if WiFi Calling feature bit is True and IMS registered.
         Return False if WiFi Calling feature bit is False or IMS not registered.
     """
-    wfc_status = ad.droid.telephonyIsWifiCallingAvailable()
+    wfc_status = get_telephony_state(ad).wfc_available
     ims_status = is_ims_registered(log, ad)
     if wfc_status is True and ims_status is False:
         log.error(
@@ -2179,16 +2495,18 @@ def get_operator_name(log, ad, subId=None):
     Returns:
         Operator name.
     """
+    if subId is not None:
+        plmn_id = ad.droid.telephonyGetSimOperatorForSubscription(subId)
+    else:
+        plmn_id = ad.droid.telephonyGetSimOperator()
+    return _get_operator_name_from_plmn_id(plmn_id)
+
+
+def _get_operator_name_from_plmn_id(plmn_id):
     try:
-        if subId is not None:
-            result = operator_name_from_plmn_id(
-                ad.droid.telephonyGetSimOperatorForSubscription(subId))
-        else:
-            result = operator_name_from_plmn_id(
-                ad.droid.telephonyGetSimOperator())
+        return operator_name_from_plmn_id(plmn_id)
     except KeyError:
-        result = CARRIER_UNKNOWN
-    return result
+        return CARRIER_UNKNOWN
 
 
 def get_model_name(ad):
@@ -2279,32 +2597,35 @@ def wait_for_matching_sms(log,
 
     Returns:
         True if matching incoming SMS is received.
+
+    Received SMS that do not match are left in the event queue.
     """
-    if not allow_multi_part_long_sms:
-        try:
-            ad_rx.ed.wait_for_event(EventSmsReceived, is_sms_match,
-                                    MAX_WAIT_TIME_SMS_RECEIVE, phonenumber_tx,
-                                    text)
-            return True
-        except Empty:
-            log.error("No matched SMS received event.")
+    remaining = [text]
+
+    def _match(event):
+        if not allow_multi_part_long_sms:
+            return is_sms_match(event, phonenumber_tx, remaining[0])
+        if (not remaining[0] or
+                not is_sms_partial_match(event, phonenumber_tx, remaining[0])):
             return False
-    else:
-        try:
-            received_sms = ''
-            while (text != ''):
-                event = ad_rx.ed.wait_for_event(
-                    EventSmsReceived, is_sms_partial_match,
-                    MAX_WAIT_TIME_SMS_RECEIVE, phonenumber_tx, text)
-                text = text[len(event['data']['Text']):]
-                received_sms += event['data']['Text']
+        remaining[0] = remaining[0][len(event['data']['Text']):]
+        return True
+
+    deadline = time.time() + MAX_WAIT_TIME_SMS_RECEIVE
+    count = ad_rx.ed.get_event_count([EventSmsReceived])
+    while True:
+        matched = ad_rx.ed.pop_matching_events(EventSmsReceived, _match)
+        if matched and (not allow_multi_part_long_sms or not remaining[0]):
             return True
-        except Empty:
-            log.error("No matched SMS received event.")
-            if received_sms != '':
-                log.error("Only received partial matched SMS: {}".format(
-                    received_sms))
-            return False
+        if time.time() > deadline:
+            break
+        count = ad_rx.ed.wait_for_new_events([EventSmsReceived], count,
+                                             deadline - time.time())
+    log.error("No matched SMS received event.")
+    if remaining[0] != text:
+        log.error("Only received partial matched SMS: {}".format(
+            text[:len(text) - len(remaining[0])]))
+    return False
 
 
 def sms_send_receive_verify_for_subscription(log, ad_tx, ad_rx, subid_tx,
@@ -2322,35 +2643,13 @@ def sms_send_receive_verify_for_subscription(log, ad_tx, ad_rx, subid_tx,
         subid_tx: Sender's subsciption ID to be used for SMS
         subid_rx: Receiver's subsciption ID to be used for SMS
         array_message: the array of message to send/receive
-    """
-
-    phonenumber_tx = ad_tx.cfg['subscription'][subid_tx]['phone_num']
-    phonenumber_rx = ad_rx.cfg['subscription'][subid_rx]['phone_num']
-    for text in array_message:
-        log.info("Sending SMS {} to {}, len: {}, content: {}.".format(
-            phonenumber_tx, phonenumber_rx, len(text), text))
-        result = False
-        ad_rx.ed.clear_all_events()
-        ad_rx.droid.smsStartTrackingIncomingSmsMessage()
-        try:
-            ad_tx.droid.smsSendTextMessage(phonenumber_rx, text, True)
-
-            try:
-                ad_tx.ed.pop_event(EventSmsSentSuccess,
-                                   MAX_WAIT_TIME_SMS_SENT_SUCCESS)
-            except Empty:
-                log.error("No sent_success event.")
-                return False
 
-            if not wait_for_matching_sms(log,
-                                         ad_rx,
-                                         phonenumber_tx,
-                                         text,
-                                         allow_multi_part_long_sms=True):
-                return False
-        finally:
-            ad_rx.droid.smsStopTrackingIncomingSmsMessage()
-    return True
+    The messages are sent without waiting for the previous ones to be
+    received, up to MAX_OUTSTANDING_SMS at a time.
+    """
+    engine = MessageEngine(log, check_phone_number_match)
+    engine.add_flow(ad_tx, ad_rx, subid_tx, subid_rx, array_message)
+    return engine.run()
 
 
 def mms_send_receive_verify(log, ad_tx, ad_rx, array_message):
@@ -2446,7 +2745,7 @@ def ensure_network_rat(log,
     """Ensure ad's current network is in expected rat_family.
     """
     return ensure_network_rat_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), network_preference,
+        log, ad, get_subscription_cache(ad).default_sub_id, network_preference,
         rat_family, voice_or_data, max_wait_time, toggle_apm_after_setting)
 
 
@@ -2503,7 +2802,7 @@ def ensure_network_preference(log,
     """Ensure that current rat is within the device's preferred network rats.
     """
     return ensure_network_preference_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), network_preference,
+        log, ad, get_subscription_cache(ad).default_sub_id, network_preference,
         voice_or_data, max_wait_time, toggle_apm_after_setting)
 
 
@@ -2564,7 +2863,7 @@ def ensure_network_generation(log,
     Wait for ad in expected network type.
     """
     return ensure_network_generation_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), generation,
+        log, ad, get_subscription_cache(ad).default_sub_id, generation,
         max_wait_time, voice_or_data, toggle_apm_after_setting)
 
 
@@ -2635,7 +2934,7 @@ def wait_for_network_rat(log,
                          max_wait_time=MAX_WAIT_TIME_NW_SELECTION,
                          voice_or_data=None):
     return wait_for_network_rat_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), rat_family,
+        log, ad, get_subscription_cache(ad).default_sub_id, rat_family,
         max_wait_time, voice_or_data)
 
 
@@ -2657,7 +2956,7 @@ def wait_for_not_network_rat(log,
                              max_wait_time=MAX_WAIT_TIME_NW_SELECTION,
                              voice_or_data=None):
     return wait_for_not_network_rat_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), rat_family,
+        log, ad, get_subscription_cache(ad).default_sub_id, rat_family,
         max_wait_time, voice_or_data)
 
 
@@ -2679,7 +2978,7 @@ def wait_for_preferred_network(log,
                                max_wait_time=MAX_WAIT_TIME_NW_SELECTION,
                                voice_or_data=None):
     return wait_for_preferred_network_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), network_preference,
+        log, ad, get_subscription_cache(ad).default_sub_id, network_preference,
         max_wait_time, voice_or_data)
 
 
@@ -2703,7 +3002,7 @@ def wait_for_network_generation(log,
                                 max_wait_time=MAX_WAIT_TIME_NW_SELECTION,
                                 voice_or_data=None):
     return wait_for_network_generation_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), generation,
+        log, ad, get_subscription_cache(ad).default_sub_id, generation,
         max_wait_time, voice_or_data)
 
 
@@ -2722,7 +3021,7 @@ def wait_for_network_generation_for_subscription(
 
 def is_droid_in_rat_family(log, ad, rat_family, voice_or_data=None):
     return is_droid_in_rat_family_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), rat_family,
+        log, ad, get_telephony_state(ad).default_sub_id, rat_family,
         voice_or_data)
 
 
@@ -2737,7 +3036,7 @@ def is_droid_in_rat_family_for_subscription(log,
 
 def is_droid_in_rat_familiy_list(log, ad, rat_family_list, voice_or_data=None):
     return is_droid_in_rat_family_list_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), rat_family_list,
+        log, ad, get_telephony_state(ad).default_sub_id, rat_family_list,
         voice_or_data)
 
 
@@ -2774,7 +3073,7 @@ def is_droid_in_network_generation(log, ad, nw_gen, voice_or_data):
         True if droid in expected network generation. Otherwise False.
     """
     return is_droid_in_network_generation_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), nw_gen, voice_or_data)
+        log, ad, get_telephony_state(ad).default_sub_id, nw_gen, voice_or_data)
 
 
 def is_droid_in_network_generation_for_subscription(log, ad, sub_id, nw_gen,
@@ -2824,7 +3123,7 @@ def get_network_rat(log, ad, voice_or_data):
         Current voice/data network type.
     """
     return get_network_rat_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), voice_or_data)
+        log, ad, get_telephony_state(ad).default_sub_id, voice_or_data)
 
 
 def get_network_rat_for_subscription(log, ad, sub_id, voice_or_data):
@@ -2840,14 +3139,13 @@ def get_network_rat_for_subscription(log, ad, sub_id, voice_or_data):
     Returns:
         Current voice/data network type.
     """
+    sub_state = get_telephony_state(ad, sub_id).get_subscription_state(sub_id)
     if voice_or_data == NETWORK_SERVICE_VOICE:
-        ret_val = ad.droid.telephonyGetCurrentVoiceNetworkTypeForSubscription(
-            sub_id)
+        ret_val = sub_state.voice_rat
     elif voice_or_data == NETWORK_SERVICE_DATA:
-        ret_val = ad.droid.telephonyGetCurrentDataNetworkTypeForSubscription(
-            sub_id)
+        ret_val = sub_state.data_rat
     else:
-        ret_val = ad.droid.telephonyGetNetworkTypeForSubscription(sub_id)
+        ret_val = sub_state.rat
 
     if ret_val is None:
         log.error("get_network_rat(): Unexpected null return value")
@@ -2868,7 +3166,7 @@ def get_network_gen(log, ad, voice_or_data):
         Current voice/data network generation.
     """
     return get_network_gen_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId(), voice_or_data)
+        log, ad, get_telephony_state(ad).default_sub_id, voice_or_data)
 
 
 def get_network_gen_for_subscription(log, ad, sub_id, voice_or_data):
@@ -3015,7 +3313,7 @@ def reset_preferred_network_type_to_allowable_range(log, ad):
     Returns:
         None
     """
-    sub_info_list = ad.droid.subscriptionGetAllSubInfoList()
+    sub_info_list = get_subscription_cache(ad).sub_info_list
     for sub_info in sub_info_list:
         sub_id = sub_info['subscriptionId']
         operator = get_operator_name(log, ad, sub_id)
@@ -3047,6 +3345,27 @@ def task_wrapper(task):
     return func(*params)
 
 
+def run_multithread_func(log, tasks, fail_fast=False):
+    """Multi-thread function wrapper reporting the outcome of each task.
+
+    Tasks run on the shared task executor, at most as many at once as it has
+    threads. A warning is logged when some of them are queued.
+
+    Args:
+        log: log object.
+        tasks: tasks to be executed in parallel, a list of
+            (function, arguments) tuples.
+        fail_fast: cancel the tasks not started yet once one task fails.
+
+    Returns:
+        A list of tel_task_executor.TaskResult objects with the result,
+        exception and timing of each task, in the order of tasks.
+    """
+    results = run_tasks(tasks, fail_fast, log)
+    log.info("multithread_func results: {}".format(results))
+    return results
+
+
 def multithread_func(log, tasks):
     """Multi-thread function wrapper.
 
@@ -3057,16 +3376,16 @@ def multithread_func(log, tasks):
     Returns:
         True if all tasks return True.
         False if any task return False.
+
+    Raises:
+        The first exception raised by a task, after all tasks ended.
     """
-    MAX_NUMBER_OF_WORKERS = 4
-    number_of_workers = min(MAX_NUMBER_OF_WORKERS, len(tasks))
-    executor = concurrent.futures.ThreadPoolExecutor(
-        max_workers=number_of_workers)
-    results = list(executor.map(task_wrapper, tasks))
-    executor.shutdown()
-    log.info("multithread_func result: {}".format(results))
+    results = run_multithread_func(log, tasks)
+    for r in results:
+        if r.exception is not None:
+            raise r.exception
     for r in results:
-        if not r:
+        if not r.result:
             return False
     return True
 
@@ -3113,6 +3432,8 @@ def set_preferred_subid_for_sms(log, ad, sub_id):
     log.info("Setting subscription:{} as Message SIM for {}".format(sub_id,
                                                                     ad.serial))
     ad.droid.subscriptionSetDefaultSmsSubId(sub_id)
+    invalidate_subscription_cache(ad)
+    invalidate_telephony_state(ad)
     # Wait to make sure settings take effect
     time.sleep(WAIT_TIME_ANDROID_STATE_SETTLING)
     return sub_id == ad.droid.subscriptionGetDefaultSmsSubId()
@@ -3130,6 +3451,8 @@ def set_preferred_subid_for_data(log, ad, sub_id):
     log.info("Setting subscription:{} as Data SIM for {}".format(sub_id,
                                                                  ad.serial))
     ad.droid.subscriptionSetDefaultDataSubId(sub_id)
+    invalidate_subscription_cache(ad)
+    invalidate_telephony_state(ad)
     time.sleep(WAIT_TIME_ANDROID_STATE_SETTLING)
     # Wait to make sure settings take effect
     # Data SIM change takes around 1 min
@@ -3154,6 +3477,8 @@ def set_preferred_subid_for_voice(log, ad, sub_id):
                                                                   ad.serial))
     ad.droid.subscriptionSetDefaultVoiceSubId(sub_id)
     ad.droid.telecomSetUserSelectedOutgoingPhoneAccountBySubId(sub_id)
+    invalidate_subscription_cache(ad)
+    invalidate_telephony_state(ad)
     # Wait to make sure settings take effect
     time.sleep(WAIT_TIME_ANDROID_STATE_SETTLING)
     return True
@@ -3381,6 +3706,7 @@ class WifiUtils():
 
     @staticmethod
     def wifi_toggle_state(log, ad, state):
+        record_transition(ad, TRANSITION_WIFI_ENABLED, state)
         try:
             WifiUtils._wifi_toggle_state(ad, state)
         except Exception as e:
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - Google
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""A timeline of the network state transitions of each device, to measure
+things like the time from WiFi off to cell data connected after the fact.
+
+A TransitionRecorder listens to the events received by the event dispatcher
+of a device, and is told the values read by telephony state snapshots and
+the actions of the utils, like toggling airplane mode. Each change of a value
+is stored as a Transition in a ring buffer.
+
+For the timeline to have no gaps, the recorder tracks the service state,
+data connection state, call state and connectivity events of the device for
+the whole test. The utils track the same events while they wait for a state,
+and stopping their tracking stops the recorder's too, so they call
+resume_transition_tracking once they are done.
+
+Recording a transition is a dict lookup and an append, cheap enough to leave
+on for every test.
+"""
+
+import collections
+import json
+import threading
+import time
+
+from acts.test_utils.tel.tel_defines import CallStateContainer
+from acts.test_utils.tel.tel_defines import DataConnectionStateContainer
+from acts.test_utils.tel.tel_defines import EventCallStateChanged
+from acts.test_utils.tel.tel_defines import EventConnectivityChanged
+from acts.test_utils.tel.tel_defines import EventDataConnectionStateChanged
+from acts.test_utils.tel.tel_defines import EventServiceStateChanged
+from acts.test_utils.tel.tel_defines import ServiceStateContainer
+
+# Fields of the transitions.
+TRANSITION_AIRPLANE_MODE = "airplane_mode"
+TRANSITION_WIFI_ENABLED = "wifi_enabled"
+TRANSITION_WFC_MODE = "wfc_mode"
+TRANSITION_SERVICE_STATE = "service_state"
+TRANSITION_VOICE_REG_STATE = "voice_reg_state"
+TRANSITION_DATA_REG_STATE = "data_reg_state"
+TRANSITION_VOICE_RAT = "voice_rat"
+TRANSITION_DATA_RAT = "data_rat"
+TRANSITION_OPERATOR_ID = "operator_id"
+TRANSITION_DATA_CONNECTION_STATE = "data_connection_state"
+TRANSITION_CALL_STATE = "call_state"
+# The connected state of each connectivity type is recorded in its own
+# field, e.g. "wifi_connected" and "mobile_connected".
+TRANSITION_CONNECTED_TEMPLATE = "{}_connected"
+
+TRANSITION_RING_SIZE = 4096
+TRANSITION_FILE_NAME_TEMPLATE = "{}_{}_transitions.json"
+
+# The values of the state change events to record, as (event data key, field)
+# tuples per event name.
+_EVENT_FIELDS = {
+    EventServiceStateChanged: (
+        (ServiceStateContainer.SERVICE_STATE, TRANSITION_SERVICE_STATE),
+        (ServiceStateContainer.VOICE_REG_STATE, TRANSITION_VOICE_REG_STATE),
+        (ServiceStateContainer.DATA_REG_STATE, TRANSITION_DATA_REG_STATE),
+        (ServiceStateContainer.VOICE_NETWORK_TYPE, TRANSITION_VOICE_RAT),
+        (ServiceStateContainer.DATA_NETWORK_TYPE, TRANSITION_DATA_RAT),
+        (ServiceStateContainer.OPERATOR_ID, TRANSITION_OPERATOR_ID),
+    ),
+    EventDataConnectionStateChanged: (
+        (DataConnectionStateContainer.DATA_CONNECTION_STATE,
+         TRANSITION_DATA_CONNECTION_STATE),
+        (DataConnectionStateContainer.DATA_NETWORK_TYPE, TRANSITION_DATA_RAT),
+    ),
+    EventCallStateChanged: (
+        (CallStateContainer.CALL_STATE, TRANSITION_CALL_STATE),
+    ),
+}
+
+# The events the recorder tracks for the whole test.
+TRACKED_EVENTS = (EventServiceStateChanged, EventDataConnectionStateChanged,
+                  EventCallStateChanged, EventConnectivityChanged)
+
+# The (start, stop) RPCs of the events tracked for each subscription.
+_SUBSCRIPTION_TRACKING_RPCS = (
+    ("telephonyStartTrackingServiceStateChangeForSubscription",
+     "telephonyStopTrackingServiceStateChangeForSubscription"),
+    ("telephonyStartTrackingDataConnectionStateChangeForSubscription",
+     "telephonyStopTrackingDataConnectionStateChangeForSubscription"),
+    ("telephonyStartTrackingCallStateForSubscription",
+     "telephonyStopTrackingCallStateChangeForSubscription"),
+)
+
+# Matches any value in queries.
+ANY = object()
+
+Transition = collections.namedtuple("Transition",
+                                    ["time", "sub_id", "field", "old", "new"])
+Transition.__doc__ = """A change of a value of the state of a device.
+
+Attributes:
+    time: Epoch time in seconds the host saw the new value at.
+    sub_id: The subscription id the value is for, None for the device.
+    field: The name of the value, one of the TRANSITION_* fields.
+    old: The previous value, None if it was not known.
+    new: The new value.
+"""
+
+
+def _matches(value, expected):
+    return expected is ANY or value == expected
+
+
+class TransitionTimeline(object):
+    """A list of transitions of one device, in the order they were seen.
+
+    Attributes:
+        serial: The serial of the device.
+        transitions: A list of Transition objects.
+    """
+
+    def __init__(self, serial, transitions):
+        self.serial = serial
+        self.transitions = list(transitions)
+
+    def find(self, field, new=ANY, sub_id=ANY, begin_time=None):
+        """Finds the first transition of a field to a value.
+
+        Args:
+            field: The field of the transition.
+            new: The value the field changed to, ANY for any value.
+            sub_id: The subscription id of the transition, ANY for any.
+            begin_time: Epoch time in seconds to search from, None for the
+                beginning of the timeline.
+
+        Returns:
+            A Transition object, None if not found.
+        """
+        for transition in self.transitions:
+            if ((begin_time is None or transition.time >= begin_time) and
+                    transition.field == field and
+                    _matches(transition.new, new) and
+                    _matches(transition.sub_id, sub_id)):
+                return transition
+        return None
+
+    def get_transition_time(self, from_field, from_value, to_field, to_value,
+                            sub_id=ANY, begin_time=None):
+        """Measures the time from a transition to the next transition of
+        another field, e.g. from "wifi_enabled" becoming False to
+        "data_connection_state" becoming DATA_STATE_CONNECTED.
+
+        Args:
+            from_field: The field of the first transition.
+            from_value: The value from_field changed to, ANY for any value.
+            to_field: The field of the second transition.
+            to_value: The value to_field changed to, ANY for any value.
+            sub_id: The subscription id of the second transition, ANY for any.
+            begin_time: Epoch time in seconds to search the first transition
+                from, None for the beginning of the timeline.
+
+        Returns:
+            The time between the two transitions in seconds, None if either
+            was not found.
+        """
+        begin = self.find(from_field, from_value, begin_time=begin_time)
+        if begin is None:
+            return None
+        end = self.find(to_field, to_value, sub_id, begin.time)
+        if end is None:
+            return None
+        return end.time - begin.time
+
+    def to_dict(self):
+        return {"serial": self.serial,
+                "fields": list(Transition._fields),
+                "transitions": [list(t) for t in self.transitions]}
+
+    def write(self, path):
+        """Writes the timeline to a json file.
+
+        Args:
+            path: The path of the file to write.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+
+def read_transition_timeline(path):
+    """Reads a timeline written by TransitionTimeline.write.
+
+    Args:
+        path: The path of the file to read.
+
+    Returns:
+        A TransitionTimeline object.
+    """
+    with open(path) as f:
+        timeline = json.load(f)
+    return TransitionTimeline(
+        timeline["serial"],
+        [Transition(*t) for t in timeline["transitions"]])
+
+
+class TransitionRecorder(object):
+    """Records the transitions of one device in a ring buffer.
+
+    Attributes:
+        ad: The android device.
+    """
+
+    def __init__(self, ad, max_transitions=TRANSITION_RING_SIZE):
+        self.ad = ad
+        self._transitions = collections.deque(maxlen=max_transitions)
+        self._values = {}
+        self._lock = threading.Lock()
+        self._ed = None
+        self._tracked_sub_ids = None
+
+    def start(self):
+        """Starts recording the events received by the device's event
+        dispatcher. The transitions recorded with record are stored
+        regardless.
+        """
+        ed = getattr(self.ad, "ed", None)
+        if ed is not None and ed is not self._ed:
+            self.stop()
+            ed.add_listener(self.on_event)
+            self._ed = ed
+
+    def stop(self):
+        """Stops recording the events of the event dispatcher."""
+        if self._ed is not None:
+            self._ed.remove_listener(self.on_event)
+            self._ed = None
+
+    @property
+    def tracking(self):
+        """Whether the recorder tracks the events of the device."""
+        return self._tracked_sub_ids is not None
+
+    def start_tracking(self):
+        """Starts tracking the events of TRACKED_EVENTS on the device, for
+        all its subscriptions.
+        """
+        sub_info_list = self.ad.droid.subscriptionGetAllSubInfoList()
+        self._tracked_sub_ids = [info["subscriptionId"]
+                                 for info in sub_info_list]
+        self.resume_tracking()
+
+    def resume_tracking(self):
+        """Starts the tracking again after a util stopped tracking the same
+        events. Does nothing if the recorder is not tracking.
+        """
+        if not self.tracking:
+            return
+        droid = self.ad.droid
+        for sub_id in self._tracked_sub_ids:
+            for start_rpc, _ in _SUBSCRIPTION_TRACKING_RPCS:
+                getattr(droid, start_rpc)(sub_id)
+        droid.connectivityStartTrackingConnectivityStateChange()
+
+    def stop_tracking(self):
+        """Stops tracking the events of the device, and drops the ones no
+        util took, so they are not taken as new by the next test.
+        """
+        if not self.tracking:
+            return
+        sub_ids = self._tracked_sub_ids
+        self._tracked_sub_ids = None
+        droid = self.ad.droid
+        for sub_id in sub_ids:
+            for _, stop_rpc in _SUBSCRIPTION_TRACKING_RPCS:
+                getattr(droid, stop_rpc)(sub_id)
+        droid.connectivityStopTrackingConnectivityStateChange()
+        if self._ed is not None:
+            for name in TRACKED_EVENTS:
+                self._ed.clear_events(name)
+
+    def record(self, field, new, sub_id=None, timestamp=None):
+        """Records the value of a field, if it changed.
+
+        Args:
+            field: The name of the value, one of the TRANSITION_* fields.
+            new: The value.
+            sub_id: The subscription id the value is for, None for the
+                device.
+            timestamp: Epoch time in seconds the value was seen at, None for
+                now.
+        """
+        key = (sub_id, field)
+        with self._lock:
+            old = self._values.get(key)
+            if key in self._values and old == new:
+                return
+            self._values[key] = new
+            self._transitions.append(Transition(
+                timestamp or time.time(), sub_id, field, old, new))
+
+    def on_event(self, event):
+        """Records the values of a state change event.
+
+        Args:
+            event: An event dict received by the event dispatcher.
+        """
+        name = event.get("name")
+        data = event.get("data")
+        if not isinstance(data, dict):
+            return
+        timestamp = time.time()
+        if name == EventConnectivityChanged:
+            if "TypeName" in data and "isConnected" in data:
+                self.record(TRANSITION_CONNECTED_TEMPLATE.format(
+                    data["TypeName"].lower()), data["isConnected"],
+                    timestamp=timestamp)
+            return
+        fields = _EVENT_FIELDS.get(name)
+        if not fields:
+            return
+        sub_id = data.get("subscriptionId")
+        for key, field in fields:
+            if key in data:
+                self.record(field, data[key], sub_id, timestamp)
+
+    def get_timeline(self, begin_time=None, end_time=None):
+        """Gets the transitions recorded in a time range.
+
+        Args:
+            begin_time: Epoch time in seconds, None for the oldest
+                transition kept.
+            end_time: Epoch time in seconds, None for now.
+
+        Returns:
+            A TransitionTimeline object.
+        """
+        with self._lock:
+            transitions = list(self._transitions)
+        return TransitionTimeline(
+            getattr(self.ad, "serial", None),
+            [t for t in transitions
+             if (begin_time is None or t.time >= begin_time) and
+             (end_time is None or t.time <= end_time)])
+
+
+def get_transition_recorder(ad):
+    """Gets the transition recorder of a device, creating and starting it on
+    first use.
+
+    Args:
+        ad: The android device.
+
+    Returns:
+        A TransitionRecorder object.
+    """
+    recorder = getattr(ad, "transition_recorder", None)
+    if not isinstance(recorder, TransitionRecorder):
+        recorder = TransitionRecorder(ad)
+        ad.transition_recorder = recorder
+    recorder.start()
+    return recorder
+
+
+def record_transition(ad, field, new, sub_id=None, timestamp=None):
+    """Records the value of a field on the recorder of a device, if the
+    device has one.
+
+    Args:
+        ad: The android device.
+        field: The name of the value, one of the TRANSITION_* fields.
+        new: The value.
+        sub_id: The subscription id the value is for, None for the device.
+        timestamp: Epoch time in seconds the value was seen at, None for now.
+    """
+    recorder = getattr(ad, "transition_recorder", None)
+    if isinstance(recorder, TransitionRecorder):
+        recorder.record(field, new, sub_id, timestamp)
+
+
+def start_transition_tracking(log, ad):
+    """Makes the recorder of a device track its events for the whole test.
+
+    Args:
+        log: Log object.
+        ad: The android device.
+
+    Returns:
+        True if the tracking started, False otherwise.
+    """
+    try:
+        get_transition_recorder(ad).start_tracking()
+        return True
+    except Exception as e:
+        log.error("{} failed to track network state changes: {}".format(
+            ad.serial, e))
+        return False
+
+
+def resume_transition_tracking(log, ad):
+    """Restores the tracking of the recorder of a device, if it has one,
+    after a util stopped tracking the same events.
+
+    Args:
+        log: Log object.
+        ad: The android device.
+    """
+    recorder = getattr(ad, "transition_recorder", None)
+    if not isinstance(recorder, TransitionRecorder):
+        return
+    try:
+        recorder.resume_tracking()
+    except Exception as e:
+        log.debug("{} failed to resume tracking network state changes: "
+                  "{}".format(ad.serial, e))
+
+
+def stop_transition_tracking(log, ad):
+    """Stops the tracking started by start_transition_tracking.
+
+    Args:
+        log: Log object.
+        ad: The android device.
+    """
+    recorder = getattr(ad, "transition_recorder", None)
+    if not isinstance(recorder, TransitionRecorder):
+        return
+    try:
+        recorder.stop_tracking()
+    except Exception as e:
+        log.debug("{} failed to stop tracking network state changes: "
+                  "{}".format(ad.serial, e))
@@ -66,6 +66,8 @@ from acts.test_utils.tel.tel_test_utils import wait_for_network_rat_for_subscrip
 from acts.test_utils.tel.tel_test_utils import wait_for_ringing_event
 from acts.test_utils.tel.tel_test_utils import wait_for_telecom_ringing
 from acts.test_utils.tel.tel_test_utils import wait_for_video_enabled
+from acts.test_utils.tel.tel_transition_recorder import \
+    resume_transition_tracking
 from acts.test_utils.tel.tel_voice_utils import is_call_hd
 
 
@@ -436,6 +438,7 @@ def wait_and_answer_video_call_for_subscription(
         finally:
             ad.droid.telephonyStopTrackingCallStateChangeForSubscription(
                 sub_id)
+            resume_transition_tracking(log, ad)
 
         if not incoming_number:
             result = True
@@ -473,6 +476,7 @@ def wait_and_answer_video_call_for_subscription(
             return False
     finally:
         ad.droid.telephonyStopTrackingCallStateChangeForSubscription(sub_id)
+        resume_transition_tracking(log, ad)
     if incall_ui_display == INCALL_UI_DISPLAY_FOREGROUND:
         ad.droid.telecomShowInCallScreen()
     elif incall_ui_display == INCALL_UI_DISPLAY_BACKGROUND:
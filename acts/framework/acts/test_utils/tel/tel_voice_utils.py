@@ -47,6 +47,8 @@ from acts.test_utils.tel.tel_defines import NETWORK_MODE_LTE_CDMA_EVDO
 from acts.test_utils.tel.tel_defines import NETWORK_MODE_LTE_GSM_WCDMA
 from acts.test_utils.tel.tel_subscription_utils import get_outgoing_voice_sub_id
 from acts.test_utils.tel.tel_subscription_utils import get_default_data_sub_id
+from acts.test_utils.tel.tel_subscription_utils import get_subscription_cache
+from acts.test_utils.tel.tel_state_utils import get_telephony_state
 from acts.test_utils.tel.tel_test_utils import call_reject_leave_message
 from acts.test_utils.tel.tel_test_utils import call_setup_teardown
 from acts.test_utils.tel.tel_test_utils import ensure_network_generation
@@ -709,7 +711,7 @@ def phone_setup_data_general(log, ad):
         False for errors.
     """
     return phone_setup_data_general_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultDataSubId())
+        log, ad, get_subscription_cache(ad).default_data_sub_id)
 
 def phone_setup_data_general_for_subscription(log, ad, sub_id):
     """Setup phone for data general test for subscription id.
@@ -746,7 +748,7 @@ def phone_setup_rat_for_subscription(log, ad, sub_id, network_preference,
 
 def phone_setup_lte_gsm_wcdma(log, ad):
     return phone_setup_lte_gsm_wcdma_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId())
+        log, ad, get_subscription_cache(ad).default_sub_id)
 
 
 def phone_setup_lte_gsm_wcdma_for_subscription(log, ad, sub_id):
@@ -756,7 +758,7 @@ def phone_setup_lte_gsm_wcdma_for_subscription(log, ad, sub_id):
 
 def phone_setup_gsm_umts(log, ad):
     return phone_setup_gsm_umts_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId())
+        log, ad, get_subscription_cache(ad).default_sub_id)
 
 
 def phone_setup_gsm_umts_for_subscription(log, ad, sub_id):
@@ -766,7 +768,7 @@ def phone_setup_gsm_umts_for_subscription(log, ad, sub_id):
 
 def phone_setup_gsm_only(log, ad):
     return phone_setup_gsm_only_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId())
+        log, ad, get_subscription_cache(ad).default_sub_id)
 
 
 def phone_setup_gsm_only_for_subscription(log, ad, sub_id):
@@ -776,7 +778,7 @@ def phone_setup_gsm_only_for_subscription(log, ad, sub_id):
 
 def phone_setup_lte_cdma_evdo(log, ad):
     return phone_setup_lte_cdma_evdo_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId())
+        log, ad, get_subscription_cache(ad).default_sub_id)
 
 
 def phone_setup_lte_cdma_evdo_for_subscription(log, ad, sub_id):
@@ -786,7 +788,7 @@ def phone_setup_lte_cdma_evdo_for_subscription(log, ad, sub_id):
 
 def phone_setup_cdma(log, ad):
     return phone_setup_cdma_for_subscription(
-        log, ad, ad.droid.subscriptionGetDefaultSubId())
+        log, ad, get_subscription_cache(ad).default_sub_id)
 
 
 def phone_setup_cdma_for_subscription(log, ad, sub_id):
@@ -954,7 +956,7 @@ def is_phone_in_call_volte_for_subscription(log, ad, sub_id):
         ad: Android device object.
         sub_id: subscription id.
     """
-    if not ad.droid.telecomIsInCall():
+    if not get_telephony_state(ad, sub_id).in_call:
         log.error("{} not in call.".format(ad.serial))
         return False
     nw_type = get_network_rat_for_subscription(log, ad, sub_id,
@@ -983,7 +985,7 @@ def is_phone_in_call_csfb_for_subscription(log, ad, sub_id):
         ad: Android device object.
         sub_id: subscription id.
     """
-    if not ad.droid.telecomIsInCall():
+    if not get_telephony_state(ad, sub_id).in_call:
         log.error("{} not in call.".format(ad.serial))
         return False
     nw_type = get_network_rat_for_subscription(log, ad, sub_id,
@@ -1012,7 +1014,7 @@ def is_phone_in_call_3g_for_subscription(log, ad, sub_id):
         ad: Android device object.
         sub_id: subscription id.
     """
-    if not ad.droid.telecomIsInCall():
+    if not get_telephony_state(ad, sub_id).in_call:
         log.error("{} not in call.".format(ad.serial))
         return False
     nw_gen = get_network_gen_for_subscription(log, ad, sub_id,
@@ -1041,7 +1043,7 @@ def is_phone_in_call_2g_for_subscription(log, ad, sub_id):
         ad: Android device object.
         sub_id: subscription id.
     """
-    if not ad.droid.telecomIsInCall():
+    if not get_telephony_state(ad, sub_id).in_call:
         log.error("{} not in call.".format(ad.serial))
         return False
     nw_gen = get_network_gen_for_subscription(log, ad, sub_id,
@@ -1070,7 +1072,7 @@ def is_phone_in_call_1x_for_subscription(log, ad, sub_id):
         ad: Android device object.
         sub_id: subscription id.
     """
-    if not ad.droid.telecomIsInCall():
+    if not get_telephony_state(ad, sub_id).in_call:
         log.error("{} not in call.".format(ad.serial))
         return False
     nw_type = get_network_rat_for_subscription(log, ad, sub_id,
@@ -1101,7 +1103,7 @@ def is_phone_in_call_wcdma_for_subscription(log, ad, sub_id):
     """
     # Currently checking 'umts'.
     # Changes may needed in the future.
-    if not ad.droid.telecomIsInCall():
+    if not get_telephony_state(ad, sub_id).in_call:
         log.error("{} not in call.".format(ad.serial))
         return False
     nw_type = get_network_rat_for_subscription(log, ad, sub_id,
@@ -1119,7 +1121,7 @@ def is_phone_in_call_iwlan(log, ad):
     Args:
         ad: Android device object.
     """
-    if not ad.droid.telecomIsInCall():
+    if not get_telephony_state(ad).in_call:
         log.error("{} not in call.".format(ad.serial))
         return False
     nw_type = get_network_rat(log, ad, NETWORK_SERVICE_DATA)
@@ -1140,7 +1142,7 @@ def is_phone_in_call_not_iwlan(log, ad):
         ad: Android device object.
         sub_id: subscription id.
     """
-    if not ad.droid.telecomIsInCall():
+    if not get_telephony_state(ad).in_call:
         log.error("{} not in call.".format(ad.serial))
         return False
     nw_type = get_network_rat(log, ad, NETWORK_SERVICE_DATA)
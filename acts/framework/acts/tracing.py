@@ -0,0 +1,149 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""This module records where a test run spends its time, as a timeline that
+can be exported in the Chrome trace event format and opened in
+chrome://tracing.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+TIMELINE_FILE_NAME = "timeline.json"
+
+_current = threading.local()
+
+
+class Timeline(object):
+    """A thread safe collection of timed spans.
+
+    Each span is stored as a Chrome trace "complete" event, with timestamps
+    in microseconds since the epoch, so timelines of test runs executed in
+    different processes can be merged.
+
+    Attributes:
+        name: A string shown as the process name in trace viewers.
+        events: A list of trace event dicts.
+    """
+
+    def __init__(self, name=None):
+        self.name = name
+        self.events = []
+        self._lock = threading.Lock()
+
+    def add_span(self, name, category, begin_time, end_time, **kwargs):
+        """Adds a span that already happened.
+
+        Args:
+            name: A string describing the span, e.g. the name of a test case.
+            category: A string used to group spans, e.g. "controller".
+            begin_time: Epoch time in seconds at which the span started.
+            end_time: Epoch time in seconds at which the span ended.
+            kwargs: Extra information shown with the span.
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": int(begin_time * 1000000),
+            "dur": int((end_time - begin_time) * 1000000),
+            "pid": os.getpid(),
+            "tid": threading.current_thread().ident
+        }
+        if kwargs:
+            event["args"] = kwargs
+        with self._lock:
+            self.events.append(event)
+
+    @contextlib.contextmanager
+    def span(self, name, category, **kwargs):
+        """A context manager that adds a span covering its body.
+
+        Args:
+            name: A string describing the span.
+            category: A string used to group spans.
+            kwargs: Extra information shown with the span.
+        """
+        begin_time = time.time()
+        try:
+            yield
+        finally:
+            self.add_span(name, category, begin_time, time.time(), **kwargs)
+
+    def to_dict(self):
+        """Gets the timeline in the Chrome trace event format.
+
+        Returns:
+            A dict with a "traceEvents" list.
+        """
+        with self._lock:
+            events = list(self.events)
+        if self.name:
+            events.insert(0, {"name": "process_name", "ph": "M",
+                              "pid": os.getpid(),
+                              "args": {"name": self.name}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path):
+        """Writes the timeline to a json file.
+
+        Args:
+            path: The path of the file to write.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+
+def set_current_timeline(timeline):
+    """Sets the timeline that span() records to in the calling thread.
+
+    Args:
+        timeline: A Timeline object, or None to stop recording.
+    """
+    _current.timeline = timeline
+
+
+def get_current_timeline():
+    """Gets the timeline that span() records to in the calling thread.
+
+    Returns:
+        A Timeline object, or None.
+    """
+    return getattr(_current, "timeline", None)
+
+
+@contextlib.contextmanager
+def span(name, category, **kwargs):
+    """Adds a span covering the body of this context manager to the current
+    timeline of the calling thread, if any.
+
+    This lets code that has no reference to the test run, like controller
+    modules, show up on its timeline.
+
+    Args:
+        name: A string describing the span.
+        category: A string used to group spans.
+        kwargs: Extra information shown with the span.
+    """
+    timeline = get_current_timeline()
+    if not timeline:
+        yield
+        return
+    with timeline.span(name, category, **kwargs):
+        yield
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import tempfile
+import unittest
+
+from acts import keys
+from acts.bin import act
+from acts.test_runner import USERError
+import mock_controller
+
+
+class ActsActTest(unittest.TestCase):
+    """This test class has unit tests for the implementation of everything
+    under acts.bin.act.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def get_mock_config(self, testbed_name):
+        tb_key = keys.Config.key_testbed.value
+        return {
+            tb_key: {
+                keys.Config.key_testbed_name.value: testbed_name,
+                mock_controller.ACTS_CONTROLLER_CONFIG_NAME: [
+                    {"serial": "xxxx", "magic": "Magic1"}
+                ]
+            },
+            "logpath": self.tmp_dir,
+            "cli_args": None,
+            "testpaths": ["./"],
+            "icecream": 42,
+            "extra_param": "haha"
+        }
+
+    def test_run_test_process(self):
+        """Verifies that a child streams one batch of records per iteration
+        followed by a done message.
+        """
+        recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+        handlers = (signal.getsignal(signal.SIGTERM),
+                    signal.getsignal(signal.SIGINT))
+        try:
+            act._run_test_process(self.get_mock_config("Bed1"),
+                                  [("IntegrationTest", None)], 2, False,
+                                  send_conn)
+        finally:
+            signal.signal(signal.SIGTERM, handlers[0])
+            signal.signal(signal.SIGINT, handlers[1])
+        msgs = []
+        while recv_conn.poll():
+            try:
+                msgs.append(recv_conn.recv())
+            except EOFError:
+                break
+        self.assertEqual([m[0] for m in msgs], ["results", "results", "done"])
+        for _, testbed_name, requested, executed in msgs[:2]:
+            self.assertEqual(testbed_name, "Bed1")
+            self.assertEqual(len(requested), 1)
+            self.assertEqual(len(executed), 1)
+            self.assertEqual(executed[0].result, "PASS")
+        self.assertEqual(msgs[2], ("done", "Bed1", True))
+
+    def test_run_tests_parallel(self):
+        configs = [self.get_mock_config("Bed1"),
+                   self.get_mock_config("Bed2")]
+        self.assertTrue(act._run_tests_parallel(configs,
+                                                [("IntegrationTest", None)]))
+
+    def test_run_tests_parallel_bad_test_class(self):
+        configs = [self.get_mock_config("Bed1"),
+                   self.get_mock_config("Bed2")]
+        self.assertFalse(act._run_tests_parallel(configs,
+                                                 [("NoSuchTest", None)]))
+
+    def test_gen_work_items(self):
+        test_identifiers = [("ATest", None),
+                            ("BTest", ["test_a", "test_b"]),
+                            ("CTest", None)]
+        durations = {"ATest": 10, "BTest:test_a": 30, "BTest:test_b": 1}
+        items = act._gen_work_items(test_identifiers, 1, durations)
+        self.assertEqual(items, [("CTest", None),
+                                 ("BTest", ["test_a"]),
+                                 ("ATest", None),
+                                 ("BTest", ["test_b"])])
+
+    def test_gen_work_items_repeat(self):
+        items = act._gen_work_items([("ATest", None)], 3)
+        self.assertEqual(items, [("ATest", None)] * 3)
+
+    def test_validate_testbed_pool_mismatch(self):
+        configs = [self.get_mock_config("Bed1"),
+                   self.get_mock_config("Bed2")]
+        configs[1][keys.Config.key_testbed.value]["AndroidDevice"] = ["1"]
+        with self.assertRaisesRegexp(USERError,
+                                     "Bed2 is not interchangeable with Bed1"):
+            act._validate_testbed_pool(configs)
+
+    def test_run_tests_sharded(self):
+        configs = [self.get_mock_config("Bed1"),
+                   self.get_mock_config("Bed2")]
+        test_identifiers = [("IntegrationTest", None),
+                            ("IntegrationTest", ["test_hello_world"])]
+        self.assertTrue(act._run_tests_sharded(configs, test_identifiers, 2))
+        path = os.path.join(self.tmp_dir, "test_durations.json")
+        with open(path, 'r') as f:
+            durations = json.load(f)
+        self.assertEqual(sorted(durations.keys()),
+                         ["IntegrationTest",
+                          "IntegrationTest:test_hello_world"])
+        executed = 0
+        for bed in ("Bed1", "Bed2"):
+            summary_path = os.path.join(self.tmp_dir, bed, "latest",
+                                        "test_run_summary.json")
+            with open(summary_path, 'r') as f:
+                executed += json.load(f)["Summary"]["Executed"]
+        # Each of the four work items ran exactly once across the pool.
+        self.assertEqual(executed, 4)
+
+    def test_set_resume_log_paths(self):
+        configs = [self.get_mock_config("Bed1"),
+                   self.get_mock_config("Bed2")]
+        log_path = os.path.join(self.tmp_dir, "Bed2", "10-19-2016_11-00-00-000")
+        os.makedirs(log_path)
+        latest = os.path.join(self.tmp_dir, "Bed2", "latest")
+        os.symlink(log_path, latest)
+        act._set_resume_log_paths(configs, [latest])
+        resume_key = keys.Config.ikey_resume_log_path.value
+        self.assertFalse(resume_key in configs[0])
+        self.assertEqual(configs[1][resume_key], os.path.realpath(log_path))
+
+    def test_set_resume_log_paths_unknown_testbed(self):
+        configs = [self.get_mock_config("Bed1"),
+                   self.get_mock_config("Bed2")]
+        log_path = os.path.join(self.tmp_dir, "Bed3", "10-19-2016_11-00-00-000")
+        with self.assertRaisesRegexp(USERError, "does not belong"):
+            act._set_resume_log_paths(configs, [log_path])
+
+
+if __name__ == "__main__":
+    unittest.main()
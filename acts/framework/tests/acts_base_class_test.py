@@ -15,10 +15,13 @@
 #   limitations under the License.
 
 import mock
+import threading
+import time
 import unittest
 
 from acts import asserts
 from acts import base_test
+from acts import records
 from acts import signals
 from acts import test_runner
 
@@ -59,6 +62,34 @@ class ActsBaseClassTest(unittest.TestCase):
         self.assertIsNone(actual_record.details)
         self.assertIsNone(actual_record.extras)
 
+    def test_current_record_metrics(self):
+        class MockBaseTest(base_test.BaseTestClass):
+            def test_func(self):
+                records.get_current_record().add_metric("latency", 1.5)
+        bt_cls = MockBaseTest(self.mock_test_cls_configs)
+        bt_cls.run(test_names=["test_func"])
+        actual_record = bt_cls.results.passed[0]
+        self.assertEqual(actual_record.metrics, {"latency": [1.5]})
+        self.assertIsNone(records.get_current_record())
+
+    def test_phase_durations(self):
+        class MockBaseTest(base_test.BaseTestClass):
+            def test_func(self):
+                asserts.fail(MSG_EXPECTED_TEST_FAILURE)
+        bt_cls = MockBaseTest(self.mock_test_cls_configs)
+        bt_cls.run(test_names=["test_func"])
+        actual_record = bt_cls.results.failed[0]
+        self.assertEqual(sorted(actual_record.phases.keys()),
+                         ["on_fail", "setup_test", "teardown_test", "test"])
+        spans = [(e["cat"], e["name"]) for e in bt_cls.timeline.events]
+        self.assertEqual(spans, [("test_class", "setup_class"),
+                                 ("test_phase", "setup_test"),
+                                 ("test_phase", "test"),
+                                 ("test_phase", "teardown_test"),
+                                 ("test_phase", "on_fail"),
+                                 ("test_case", "test_func"),
+                                 ("test_class", "teardown_class")])
+
     def test_self_tests_list(self):
         class MockBaseTest(base_test.BaseTestClass):
             def __init__(self, controllers):
@@ -614,5 +645,66 @@ class ActsBaseClassTest(unittest.TestCase):
         self.assertEqual(fail_record.details, MSG_EXPECTED_EXCEPTION)
         self.assertEqual(fail_record.extras, MOCK_EXTRA)
 
+    def test_generated_tests_lazy_settings(self):
+        """Verifies that settings are consumed one at a time, so they can be
+        produced by a generator.
+        """
+        consumed = []
+        def gen_settings():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+        class MockBaseTest(base_test.BaseTestClass):
+            def logic(self, setting):
+                # Only the setting being executed has been produced.
+                asserts.assert_equal(consumed[-1], setting)
+                asserts.assert_true(setting != 1, MSG_EXPECTED_TEST_FAILURE)
+            @signals.generated_test
+            def test_func(self):
+                failed = self.run_generated_testcases(
+                    test_func=self.logic,
+                    settings=gen_settings(),
+                    tag="gen")
+                asserts.assert_equal(failed, [1])
+        bt_cls = MockBaseTest(self.mock_test_cls_configs)
+        bt_cls.run(test_names=["test_func"])
+        self.assertEqual(len(bt_cls.results.requested), 3)
+        self.assertEqual(len(bt_cls.results.passed), 2)
+        self.assertEqual(bt_cls.results.failed[0].test_name, "gen 1")
+
+    def test_generated_tests_device_pool(self):
+        """Verifies that generated test cases run concurrently on distinct
+        devices from the pool, according to their device requirements.
+        """
+        lock = threading.Lock()
+        in_use = set()
+        max_in_use = []
+        class MockBaseTest(base_test.BaseTestClass):
+            def logic(self, setting, devices=None):
+                asserts.assert_equal(len(devices), setting)
+                with lock:
+                    asserts.assert_true(not in_use & set(devices),
+                                         "Device used by two test cases.")
+                    in_use.update(devices)
+                    max_in_use.append(len(in_use))
+                time.sleep(0.05)
+                with lock:
+                    in_use.difference_update(devices)
+            @signals.generated_test
+            def test_func(self):
+                failed = self.run_generated_testcases(
+                    test_func=self.logic,
+                    settings=iter([1, 1, 2, 1, 1, 4]),
+                    tag="pool",
+                    device_pool=["d1", "d2", "d3"],
+                    device_count_func=lambda setting: setting)
+                asserts.assert_equal(failed, [4])
+        bt_cls = MockBaseTest(self.mock_test_cls_configs)
+        bt_cls.run(test_names=["test_func"])
+        self.assertEqual(len(bt_cls.results.requested), 6)
+        self.assertEqual(len(bt_cls.results.passed), 5)
+        self.assertEqual(bt_cls.results.failed[0].test_name, "pool 4")
+        self.assertTrue(max(max_in_use) > 1)
+
 if __name__ == "__main__":
    unittest.main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import mock
+import threading
+import time
+import unittest
+
+from acts.test_utils.tel import tel_test_utils
+from acts.test_utils.tel.tel_defines import EventServiceStateChanged
+from mock_sl4a import FakeDroid
+from mock_sl4a import start_event_dispatcher
+
+
+class ActsEventDispatcherTest(unittest.TestCase):
+    """This test class has unit tests for the event dispatcher and the event
+    driven state waiters built on it.
+    """
+
+    def setUp(self):
+        self.droid = FakeDroid()
+        self.ed = start_event_dispatcher(self, self.droid)
+
+    def test_wait_for_new_events(self):
+        count = self.ed.get_event_count(["Foo", "Bar"])
+        self.assertEqual(count, 0)
+        self.assertEqual(self.ed.wait_for_new_events(["Foo"], count, 0.1), 0)
+        self.droid.post("Bar")
+        self.assertEqual(self.ed.wait_for_new_events(["Foo", "Bar"], count,
+                                                     5), 1)
+        # Waiting does not consume the events.
+        self.assertEqual(self.ed.pop_event("Bar", 1)["name"], "Bar")
+
+    def test_pop_matching_events(self):
+        for i in range(5):
+            self.droid.post("Foo", i)
+        count = 0
+        while count < 5:
+            count = self.ed.wait_for_new_events(["Foo"], count, 5)
+        matched = self.ed.pop_matching_events(
+            "Foo", lambda event, odd: event["data"] % 2 == odd, 1)
+        self.assertEqual([e["data"] for e in matched], [1, 3])
+        # The other events are kept, in order.
+        self.assertEqual([e["data"] for e in self.ed.pop_all("Foo")],
+                         [0, 2, 4])
+
+    def test_wait_for_droid_in_state_event(self):
+        ad = mock.Mock(serial="1234", droid=self.droid, ed=self.ed)
+        self.droid.telephonyStartTrackingServiceStateChange = mock.Mock()
+        self.droid.telephonyStopTrackingServiceStateChange = mock.Mock()
+        attached = []
+        def check(log, ad, service):
+            return bool(attached)
+        def attach():
+            time.sleep(0.5)
+            attached.append(True)
+            self.droid.post(EventServiceStateChanged)
+        threading.Thread(target=attach).start()
+        begin_time = time.time()
+        self.assertTrue(tel_test_utils._wait_for_droid_in_state(
+            mock.Mock(), ad, 10, check, "voice"))
+        # With polling only, this would have taken 0.25 + 0.5 + 1 seconds.
+        self.assertLess(time.time() - begin_time, 1.5)
+        self.droid.telephonyStartTrackingServiceStateChange.assert_called_once_with()
+        self.droid.telephonyStopTrackingServiceStateChange.assert_called_once_with()
+        self.assertEqual(self.ed.pop_all(EventServiceStateChanged), [])
+
+    def test_wait_for_droid_in_state_timeout(self):
+        ad = mock.Mock(serial="1234", ed=None)
+        check = mock.Mock(return_value=False, __name__="check")
+        begin_time = time.time()
+        self.assertFalse(tel_test_utils._wait_for_droid_in_state(
+            mock.Mock(), ad, 1, check))
+        elapsed = time.time() - begin_time
+        self.assertGreaterEqual(elapsed, 1)
+        self.assertLess(elapsed, 1.5)
+        # Polled at 0, 0.25 and 0.75 seconds, then at the deadline.
+        self.assertEqual(check.call_count, 4)
+
+if __name__ == "__main__":
+   unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from acts import history
+from acts import records
+
+
+def make_record(test_name, result, duration, details=None,
+                test_class="SomeTest", days_ago=0):
+    record = records.TestResultRecord(test_name, test_class)
+    record.begin_time = int((time.time() - days_ago * 24 * 60 * 60) * 1000)
+    record.end_time = record.begin_time + int(duration * 1000)
+    record.result = result
+    record.details = details
+    return record
+
+
+class ActsHistoryTest(unittest.TestCase):
+    """This test class has unit tests for the implementation of everything
+    under acts.history.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.history = history.TestHistory(
+            os.path.join(self.tmp_dir, history.HISTORY_FILE_NAME))
+
+    def tearDown(self):
+        self.history.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_percentile(self):
+        self.assertIsNone(history.percentile([], 95))
+        self.assertEqual(history.percentile([3], 95), 3)
+        self.assertEqual(history.percentile([1, 2, 3, 4, 5], 50), 3)
+        self.assertAlmostEqual(history.percentile(list(range(1, 101)), 95),
+                               95.05)
+
+    def test_failure_signature(self):
+        sig1 = history.get_failure_signature(
+            "Call from 12345 dropped after 3.5s at 0x7f3a2c")
+        sig2 = history.get_failure_signature(
+            "Call from 67890 dropped after 12.25s at 0x11aa")
+        self.assertEqual(sig1, sig2)
+        self.assertIsNone(history.get_failure_signature(None))
+
+    def test_duration_percentile(self):
+        self.history.add_records("Bed1", [
+            make_record("test_call", "PASS", d) for d in range(1, 101)])
+        # Results older than the window are ignored.
+        self.history.add_records("Bed1", [
+            make_record("test_call", "PASS", 1000, days_ago=40)])
+        p95 = self.history.get_duration_percentile("test_call", 95)
+        self.assertAlmostEqual(p95, 95.05)
+        self.assertIsNone(self.history.get_duration_percentile("test_x", 95))
+
+    def test_estimate_duration(self):
+        self.history.add_records("Bed1", [
+            make_record("test_a", "PASS", 10),
+            make_record("test_a", "PASS", 20),
+            make_record("test_a", "PASS", 30),
+            make_record("test_b", "PASS", 5)])
+        self.assertEqual(self.history.estimate_duration("SomeTest"), 25)
+        self.assertEqual(self.history.estimate_duration("SomeTest",
+                                                        ["test_b"]), 5)
+        self.assertIsNone(self.history.estimate_duration("OtherTest"))
+
+    def test_flaky_tests(self):
+        self.history.add_records("Bed1", [
+            make_record("test_flaky", "PASS", 1),
+            make_record("test_flaky", "FAIL", 1, "Timed out")],
+            build="A1")
+        # A regression fixed by a new build is not flakiness.
+        self.history.add_records("Bed1", [
+            make_record("test_fixed", "FAIL", 1, "Wrong value")], build="A1")
+        self.history.add_records("Bed1", [
+            make_record("test_fixed", "PASS", 1)], build="A2")
+        self.assertEqual(self.history.get_flaky_tests(),
+                         set([("SomeTest", "test_flaky")]))
+        self.assertEqual(self.history.get_failure_signatures("test_flaky"),
+                         [("Timed out", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import glob
+import gzip
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import unittest
+
+from acts import logger
+
+
+class ActsLoggerTest(unittest.TestCase):
+    """This test class has unit tests for the implementation of everything
+    under acts.logger.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def get_logger(self, name, **kwargs):
+        log = logger.get_test_logger(self.tmp_dir, name, **kwargs)
+        self.addCleanup(logger.kill_test_logger, log)
+        return log
+
+    def read_log(self):
+        with open(os.path.join(self.tmp_dir, "test_run_details.txt")) as f:
+            return f.read()
+
+    def test_test_logger_writes_on_kill(self):
+        log = self.get_logger("ActsLoggerTest.write")
+        log.debug("debug line")
+        log.info("info line")
+        logger.kill_test_logger(log)
+        content = self.read_log()
+        self.assertIn("DEBUG debug line", content)
+        self.assertIn("INFO info line", content)
+        self.assertFalse(log.handlers)
+
+    def test_test_logger_rotation(self):
+        log = self.get_logger("ActsLoggerTest.rotate", max_bytes=1000,
+                              backup_count=2)
+        for i in range(100):
+            log.debug("line %d %s", i, "x" * 50)
+        logger.kill_test_logger(log)
+        backups = sorted(glob.glob(os.path.join(self.tmp_dir,
+                                                "test_run_details.txt.*")))
+        self.assertEqual([os.path.basename(b) for b in backups],
+                         ["test_run_details.txt.1.gz",
+                          "test_run_details.txt.2.gz"])
+        with gzip.open(backups[0], 'rt') as f:
+            newest_backup = f.read()
+        self.assertIn("x" * 50, newest_backup)
+        self.assertIn("line 99", self.read_log())
+
+    def test_test_logger_debug_rate_limit(self):
+        log = self.get_logger("ActsLoggerTest.rate", debug_rate_limit=3)
+        for i in range(10):
+            log.debug("hot loop %d", i)
+            log.info("important %d", i)
+        logger.kill_test_logger(log)
+        content = self.read_log()
+        self.assertEqual(content.count("hot loop"), 3)
+        self.assertEqual(content.count("important"), 10)
+
+    def test_sampling_filter(self):
+        f = logger.SamplingFilter(4)
+        debug = logging.LogRecord("l", logging.DEBUG, "f.py", 1, "m", None,
+                                  None)
+        error = logging.LogRecord("l", logging.ERROR, "f.py", 2, "m", None,
+                                  None)
+        self.assertEqual([f.filter(debug) for _ in range(8)],
+                         [True, False, False, False] * 2)
+        self.assertTrue(all(f.filter(error) for _ in range(8)))
+
+    def test_queue_handler_drops_when_full(self):
+        handler = logger.QueueHandler(queue.Queue(1))
+        record = logging.LogRecord("l", logging.INFO, "f.py", 1, "m", None,
+                                   None)
+        orig_timeout = logger.QUEUE_PUT_TIMEOUT
+        logger.QUEUE_PUT_TIMEOUT = 0.01
+        try:
+            handler.handle(record)
+            handler.handle(record)
+        finally:
+            logger.QUEUE_PUT_TIMEOUT = orig_timeout
+        self.assertEqual(handler.dropped, 1)
+        self.assertEqual(handler.queue.qsize(), 1)
+
+if __name__ == "__main__":
+   unittest.main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import mock
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from acts.controllers import monsoon
+from acts.controllers.monsoon_lib import simulator
+
+# Native sample rate of the mock monsoon, in kHz.
+MOCK_SAMPLE_RATE = 5
+# Number of raw samples in each data packet returned by the mock monsoon.
+MOCK_PACKET_SIZE = 10
+
+
+class MockMonsoonProxy(object):
+    """Mock class that swaps out the serial connection to a monsoon.
+
+    Every raw sample reads as MOCK_CURRENT Amp.
+    """
+    MOCK_CURRENT = 0.5
+
+    def __init__(self, serialno=None, device=None):
+        self.serial = serialno
+        self.collecting = False
+
+    def GetStatus(self):
+        return {"sampleRate": MOCK_SAMPLE_RATE, "outputVoltageSetting": 4.2}
+
+    def GetVoltage(self):
+        return 4.2
+
+    def StartDataCollection(self):
+        self.collecting = True
+
+    def StopDataCollection(self):
+        self.collecting = False
+
+    def CollectData(self):
+        if not self.collecting:
+            return None
+        return [self.MOCK_CURRENT] * MOCK_PACKET_SIZE
+
+
+class ActsMonsoonTest(unittest.TestCase):
+    """This test class has unit tests for the implementation of everything
+    under acts.controllers.monsoon.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.trace_path = os.path.join(self.tmp_dir, "trace.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    @mock.patch.object(monsoon, "MonsoonProxy", new=MockMonsoonProxy)
+    def get_mock_monsoon(self):
+        return monsoon.Monsoon(serial=1)
+
+    def test_trace_round_trip(self):
+        with monsoon.MonsoonTraceWriter(self.trace_path, 10, 4.2, offset=2,
+                                        chunk_size=3) as writer:
+            for i in range(10):
+                writer.append(i, i / 10)
+        self.assertEqual(writer.num_samples, 10)
+        self.assertEqual(len(writer), 8)
+        self.assertEqual(writer.stats.min_value, 0.2)
+        self.assertEqual(writer.stats.max_value, 0.9)
+        with monsoon.MonsoonTraceReader(self.trace_path) as reader:
+            self.assertEqual(reader.hz, 10)
+            self.assertEqual(reader.offset, 2)
+            self.assertEqual(reader.voltage, 4.2)
+            data = reader.to_monsoon_data()
+        self.assertEqual(data.timestamps, list(range(2, 10)))
+        self.assertEqual(data.average_current, writer.average_current)
+        self.assertEqual(data.total_charge, writer.total_charge)
+        self.assertEqual(data.total_power, writer.total_power)
+
+    def test_trace_read_while_writing(self):
+        writer = monsoon.MonsoonTraceWriter(self.trace_path, 10, 4.2,
+                                            chunk_size=4)
+        reader = monsoon.MonsoonTraceReader(self.trace_path)
+        try:
+            for i in range(6):
+                writer.append(i, 0.1)
+            # Only the first full chunk has been written out.
+            self.assertEqual(reader.num_available(), 4)
+            chunks = list(reader.iter_chunks(chunk_size=3))
+            self.assertEqual([len(c) for c in chunks], [3, 1])
+            self.assertEqual(reader.num_available(), 0)
+            writer.flush()
+            chunks = list(reader.iter_chunks())
+            self.assertEqual(chunks, [[(4, 0.1), (5, 0.1)]])
+        finally:
+            writer.close()
+            reader.close()
+
+    def test_trace_reader_bad_file(self):
+        with open(self.trace_path, 'wb') as f:
+            f.write(b"Not a monsoon trace file at all.")
+        with self.assertRaisesRegex(monsoon.MonsoonError,
+                                    "not a monsoon trace file"):
+            monsoon.MonsoonTraceReader(self.trace_path)
+
+    def test_take_samples(self):
+        mon = self.get_mock_monsoon()
+        data = mon.take_samples(100, 20, sample_offset=5)
+        self.assertEqual(len(data), 20)
+        self.assertEqual(data.average_current,
+                         MockMonsoonProxy.MOCK_CURRENT * 1000)
+        self.assertFalse(mon.mon.collecting)
+
+    def test_take_samples_to_file(self):
+        mon = self.get_mock_monsoon()
+        writer = mon.take_samples_to_file(100, 20, self.trace_path,
+                                          sample_offset=5, chunk_size=8)
+        self.assertEqual(writer.num_samples, 25)
+        self.assertEqual(len(writer), 20)
+        self.assertFalse(mon.mon.collecting)
+        expected = mon.take_samples(100, 20, sample_offset=5)
+        self.assertEqual(writer.average_current, expected.average_current)
+        self.assertEqual(writer.total_charge, expected.total_charge)
+        with monsoon.MonsoonTraceReader(self.trace_path) as reader:
+            self.assertEqual(len(reader.to_monsoon_data()), 20)
+
+    def test_monsoon_data_segments(self):
+        data = monsoon.MonsoonData([0.1] * 5 + [0.3] * 5,
+                                   [i / 10 for i in range(10)], 10, 4.2,
+                                   offset=2,
+                                   markers=[(0.5, "b"), (0.05, "a")])
+        segments = data.get_segments()
+        self.assertEqual([s.name for s in segments], ["a", "b"])
+        self.assertEqual(segments[0].end_time, 0.5)
+        self.assertIsNone(segments[1].end_time)
+        # The first two data points are within the offset.
+        self.assertEqual(len(segments[0]), 3)
+        self.assertEqual(segments[0].average_current, 100)
+        self.assertEqual(len(segments[1]), 5)
+        self.assertEqual(segments[1].average_current, 300)
+
+    def test_monsoon_data_text_round_trip(self):
+        data = monsoon.MonsoonData([0.1, 0.2, 0.3], [1.5, 1.6, 1.7], 10, 4.2,
+                                   markers=[(1.55, "call connected")])
+        data.tag = "test_tag"
+        loaded = monsoon.MonsoonData.from_string(str(data))
+        self.assertEqual(loaded.hz, 10)
+        self.assertEqual(loaded.voltage, 4.2)
+        self.assertEqual(loaded.timestamps, [1.5, 1.6, 1.7])
+        self.assertEqual(loaded.markers, [(1.55, "call connected")])
+
+    def test_trace_markers(self):
+        with monsoon.MonsoonTraceWriter(self.trace_path, 10, 4.2,
+                                        offset=1) as writer:
+            writer.append(0.0, 0.1)
+            writer.mark(0.05, "a")
+            writer.append(0.1, 0.1)
+            writer.append(0.2, 0.1)
+            writer.mark(0.25, "b")
+            writer.append(0.3, 0.5)
+        segments = writer.get_segments()
+        self.assertEqual([len(s) for s in segments], [2, 1])
+        self.assertEqual(segments[0].end_time, 0.25)
+        with monsoon.MonsoonTraceReader(self.trace_path) as reader:
+            data = reader.to_monsoon_data()
+        self.assertEqual(data.markers, [(0.05, "a"), (0.25, "b")])
+        self.assertEqual([len(s) for s in data.get_segments()], [2, 1])
+
+    def test_mark_without_capture(self):
+        mon = self.get_mock_monsoon()
+        with self.assertRaisesRegex(monsoon.MonsoonError, "No capture"):
+            mon.mark("nothing")
+
+    def test_start_stop_capture(self):
+        mon = self.get_mock_monsoon()
+        mon.start_capture(100)
+        t = mon.mark("something")
+        data = mon.stop_capture()
+        self.assertFalse(mon.mon.collecting)
+        self.assertEqual(data.markers, [(t, "something")])
+        self.assertTrue(len(data))
+        # Timestamps are derived from the sample count.
+        self.assertAlmostEqual(data.timestamps[1] - data.timestamps[0], 0.01)
+        with self.assertRaisesRegex(monsoon.MonsoonError, "No capture"):
+            mon.mark("too late")
+
+    def test_take_samples_after_capture(self):
+        mon = self.get_mock_monsoon()
+        mon.start_capture(100)
+        mon.stop_capture()
+        self.assertEqual(len(mon.take_samples(10, 20)), 20)
+        writer = mon.take_samples_to_file(10, 20, self.trace_path)
+        self.assertEqual(len(writer), 20)
+
+    def test_start_capture_twice(self):
+        mon = self.get_mock_monsoon()
+        mon.start_capture(100)
+        try:
+            with self.assertRaisesRegex(monsoon.MonsoonError,
+                                        "already ongoing"):
+                mon.start_capture(100)
+        finally:
+            mon.stop_capture()
+
+    def test_start_stop_capture_to_file(self):
+        mon = self.get_mock_monsoon()
+        mon.start_capture(100, file_path=self.trace_path)
+        mon.mark("something")
+        writer = mon.stop_capture()
+        self.assertEqual(len(writer.get_segments()), 1)
+        with monsoon.MonsoonTraceReader(self.trace_path) as reader:
+            self.assertEqual(len(reader.read_markers()), 1)
+
+    @mock.patch.object(monsoon, "MonsoonProxy", new=MockMonsoonProxy)
+    def test_group_capture(self):
+        mons = [monsoon.Monsoon(serial=1), monsoon.Monsoon(serial=2)]
+        group = monsoon.MonsoonGroup(mons)
+        group.start_capture(100, file_dir=self.tmp_dir)
+        t = group.mark("something")
+        result = group.stop_capture()
+        self.assertEqual(list(result.traces.keys()), [1, 2])
+        self.assertEqual(result.markers, [(t, "something")])
+        for serial in (1, 2):
+            self.assertEqual(result[serial].markers, [(t, "something")])
+            self.assertTrue(os.path.exists(
+                os.path.join(self.tmp_dir, "monsoon_%s.bin" % serial)))
+        self.assertEqual(len(result.get_segments()[1]), 1)
+        for mon in mons:
+            self.assertFalse(mon.mon.collecting)
+
+    @mock.patch.object(monsoon, "MonsoonProxy", new=MockMonsoonProxy)
+    def test_group_capture_shared_clock(self):
+        mons = [monsoon.Monsoon(serial=1), monsoon.Monsoon(serial=2)]
+        group = monsoon.MonsoonGroup(mons)
+        group.start_capture(100, sample_num=10)
+        for mon in mons:
+            self.assertTrue(mon.wait_for_capture(timeout=10))
+        result = group.stop_capture()
+        first = [result[s].timestamps[0] for s in (1, 2)]
+        # Both monsoons start collecting right away on the same clock.
+        self.assertAlmostEqual(first[0], first[1], delta=1)
+        self.assertEqual([len(result[s]) for s in (1, 2)], [10, 10])
+
+    def test_group_mark_without_capture(self):
+        group = monsoon.MonsoonGroup([self.get_mock_monsoon()])
+        with self.assertRaisesRegex(monsoon.MonsoonError, "No capture"):
+            group.mark("nothing")
+
+    def test_pyramid_range_stats(self):
+        rand = random.Random(0)
+        values = [rand.random() for _ in range(12345)]
+        data = monsoon.MonsoonData(values, [i / 100 for i in range(12345)],
+                                   100, 4.2, offset=45)
+        pyramid = data.get_pyramid()
+        self.assertEqual([l[0] for l in pyramid.levels], [10, 100, 1000])
+        self.assertEqual(len(pyramid.levels[0][3]), 1230)
+        points = data.data_points
+        for begin, end in ((0, 12300), (3, 7), (17, 12300), (1234, 5678),
+                           (999, 1001), (12299, 12300)):
+            stats = pyramid.get_stats(data.timestamps[begin],
+                                      data.timestamps[end]
+                                      if end < len(points) else None)
+            expected = points[begin:end]
+            self.assertEqual(stats.count, len(expected))
+            self.assertAlmostEqual(stats.total, sum(expected))
+            self.assertEqual(stats.min_value, min(expected))
+            self.assertEqual(stats.max_value, max(expected))
+        self.assertEqual(pyramid.get_average_current(), data.average_current)
+
+    def test_pyramid_render(self):
+        values = [0.1] * 5000 + [0.3] * 5000
+        data = monsoon.MonsoonData(values, [i / 100 for i in range(10000)],
+                                   100, 4.2)
+        points = data.get_pyramid().render(20)
+        self.assertEqual(len(points), 20)
+        self.assertEqual(points[1][0], 5.0)
+        self.assertAlmostEqual(points[0][2], 0.1)
+        self.assertAlmostEqual(points[-1][2], 0.3)
+        # Ranges shorter than the finest bins are rendered from raw samples.
+        points = data.get_pyramid().render(10, 49.95, 50.05)
+        self.assertEqual([p[1] for p in points], [0.1] * 5 + [0.3] * 5)
+
+    def test_trace_pyramid_persisted(self):
+        with monsoon.MonsoonTraceWriter(self.trace_path, 10, 4.2,
+                                        offset=5) as writer:
+            for i in range(2005):
+                writer.append(i / 10, (i % 7) / 10)
+        with monsoon.MonsoonTraceReader(self.trace_path) as reader:
+            pyramid = reader.get_pyramid()
+            pyramid_path = self.trace_path + ".pyramid"
+            self.assertTrue(os.path.exists(pyramid_path))
+            self.assertEqual(pyramid.num_samples, 2000)
+            self.assertEqual(pyramid.begin_time, 0.5)
+            self.assertEqual(pyramid.get_average_current(),
+                             writer.average_current)
+            with mock.patch.object(monsoon.MonsoonTracePyramid,
+                                   "build") as build:
+                loaded = reader.get_pyramid()
+                self.assertFalse(build.called)
+            self.assertEqual(loaded.levels, pyramid.levels)
+            stats = loaded.get_stats(10.05, 20.05)
+            self.assertEqual(stats.count, 100)
+
+    def test_simulator_status(self):
+        with simulator.MonsoonSimulator(serial_number=42) as sim:
+            mon = monsoon.Monsoon(serial=42, device=sim.device)
+            try:
+                mon.set_voltage(4.2)
+                mon.set_max_current(7.8)
+                status = mon.status
+            finally:
+                mon.mon.ser.close()
+        self.assertEqual(status["serialNumber"], 42)
+        self.assertEqual(status["sampleRate"], sim.sample_rate)
+        self.assertAlmostEqual(status["outputVoltageSetting"], 4.2)
+        self.assertAlmostEqual(status["runTimeCurrentLimit"], 7.8, places=1)
+
+    def test_simulator_take_samples(self):
+        # 10mA in the fine range, then 1A in the coarse range.
+        def waveform(t):
+            return 0.01 if t < 0.1 else 1
+
+        num, _, data = simulator.measure_throughput(1000, 0.2,
+                                                    current=waveform)
+        self.assertEqual(num, 200)
+        self.assertAlmostEqual(data.data_points[50], 0.01, places=5)
+        self.assertAlmostEqual(data.data_points[150], 1, places=3)
+
+    def test_simulator_packet_loss(self):
+        with simulator.MonsoonSimulator(loss_rate=0.5, seed=0) as sim:
+            mon = monsoon.Monsoon(serial=1, device=sim.device)
+            try:
+                data = mon.take_samples(1000, 100)
+            finally:
+                mon.mon.ser.close()
+        self.assertEqual(len(data), 100)
+        self.assertTrue(sim.packets_dropped)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,9 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from acts import records
@@ -50,6 +53,8 @@ class ActsRecordsTest(unittest.TestCase):
         d[records.TestResultEnums.RECORD_UID] = None
         d[records.TestResultEnums.RECORD_CLASS] = None
         d[records.TestResultEnums.RECORD_EXTRA_ERRORS] = {}
+        d[records.TestResultEnums.RECORD_PHASES] = {}
+        d[records.TestResultEnums.RECORD_METRICS] = {}
         actual_d = record.to_dict()
         self.assertDictEqual(actual_d, d)
         # Verify that these code paths do not cause crashes and yield non-empty
@@ -147,5 +152,53 @@ class ActsRecordsTest(unittest.TestCase):
                            details=self.details,
                            extras=self.json_extra)
 
+    def test_result_iadd(self):
+        record1 = records.TestResultRecord(self.tn)
+        record1.test_begin()
+        record1.test_pass()
+        record2 = records.TestResultRecord(self.tn)
+        record2.test_begin()
+        record2.test_fail()
+        tr1 = records.TestResult()
+        tr1.add_record(record1)
+        tr2 = records.TestResult()
+        tr2.requested.append(self.tn)
+        tr2.add_record(record2)
+        merged = tr1
+        merged += tr2
+        self.assertIs(merged, tr1)
+        self.assertEqual(tr2.executed, [record2])
+        self.assertEqual(merged.passed, [record1])
+        self.assertEqual(merged.failed, [record2])
+        self.assertEqual(merged.requested, [self.tn])
+
+    def test_result_stream(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = os.path.join(tmp_dir, "results.jsonl")
+        stream = records.TestResultStream(path)
+        stream.add_requested([self.tn, "test_other"])
+        record1 = records.TestResultRecord(self.tn, "SomeTest")
+        record1.test_begin()
+        record1.add_phase_duration("test", 1.5)
+        record1.add_metric("latency", {"dial": 0.5})
+        record1.add_metric("latency", {"dial": 0.25})
+        record1.test_pass(signals.TestPass(self.details, self.json_extra))
+        stream.add_record(record1)
+        record2 = records.TestResultRecord("test_other", "SomeTest")
+        record2.test_begin()
+        record2.test_fail()
+        stream.add_record(record2)
+        stream.close()
+        # A run killed while writing leaves a partial line behind.
+        with open(path, 'a') as f:
+            f.write('{"Record": {"Test Na')
+        result = records.TestResultStream.load(path)
+        self.assertEqual(result.requested, [self.tn, "test_other"])
+        self.assertEqual(result.summary_dict()["Passed"], 1)
+        self.assertEqual(result.summary_dict()["Failed"], 1)
+        self.assertEqual(result.passed[0].to_dict(), record1.to_dict())
+        self.assertEqual(result.failed[0].to_dict(), record2.to_dict())
+
 if __name__ == "__main__":
    unittest.main()
\ No newline at end of file
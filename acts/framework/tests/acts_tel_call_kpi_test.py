@@ -0,0 +1,153 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import mock
+import unittest
+
+from acts import records
+from acts.test_utils.tel import tel_call_kpi
+from acts.test_utils.tel import tel_test_utils
+from acts.test_utils.tel.tel_defines import TELEPHONY_STATE_OFFHOOK
+
+
+def make_kpi(caller_rat, callee_rat, dial_to_ringing, failure=None):
+    kpi = tel_call_kpi.CallKpi("caller", "callee")
+    kpi.times = {tel_call_kpi.CALL_KPI_DIAL: 100.0,
+                 tel_call_kpi.CALL_KPI_RINGING: 100.0 + dial_to_ringing}
+    kpi.set_rat(tel_call_kpi.CALL_KPI_CALLER, tel_call_kpi.CALL_KPI_DIAL,
+                caller_rat)
+    kpi.set_rat(tel_call_kpi.CALL_KPI_CALLEE, tel_call_kpi.CALL_KPI_RINGING,
+                callee_rat)
+    if failure:
+        kpi.fail(failure)
+    return kpi
+
+
+def make_ad(serial):
+    ad = mock.MagicMock()
+    ad.serial = serial
+    ad.cfg = {"subscription": {1: {"phone_num": serial}}}
+    ad.droid.telecomIsRinging.return_value = True
+    ad.droid.telecomIsInCall.return_value = True
+    ad.droid.telephonyGetCallState.return_value = TELEPHONY_STATE_OFFHOOK
+    ad.droid.telecomGetCallState.return_value = TELEPHONY_STATE_OFFHOOK
+    return ad
+
+
+class ActsTelCallKpiTest(unittest.TestCase):
+    """This test class has unit tests for the call setup KPIs in
+    acts.test_utils.tel.tel_call_kpi.
+    """
+
+    def setUp(self):
+        tel_call_kpi.get_call_kpi_collector().clear()
+        self.addCleanup(tel_call_kpi.get_call_kpi_collector().clear)
+
+    def test_intervals_and_rat_combination(self):
+        kpi = make_kpi("lte", "umts", 2.5)
+        kpi.set_rat(tel_call_kpi.CALL_KPI_CALLER,
+                    tel_call_kpi.CALL_KPI_CALLER_OFFHOOK, "gsm")
+        kpi.set_rat(tel_call_kpi.CALL_KPI_CALLER,
+                    tel_call_kpi.CALL_KPI_HANGUP, "lte")
+        self.assertEqual(kpi.get_intervals(), {"dial_to_ringing": 2.5})
+        # The caller fell back to gsm to set up the call.
+        self.assertEqual(kpi.rat_combination, "gsm->umts")
+        self.assertEqual(tel_call_kpi.CallKpi().rat_combination,
+                         "none->none")
+
+    def test_summary(self):
+        collector = tel_call_kpi.CallKpiCollector()
+        for i in range(1, 101):
+            collector.add(make_kpi("lte", "lte", i / 100.0))
+        collector.add(make_kpi("lte", "lte", 60, failure="Answer call fail."))
+        collector.add(make_kpi("lte", "umts", 3))
+        summary = collector.get_summary()
+        self.assertEqual(summary["lte->lte"]["calls"], 101)
+        self.assertEqual(summary["lte->lte"]["failures"], 1)
+        dial_to_ringing = summary["lte->lte"]["dial_to_ringing"]
+        self.assertEqual(dial_to_ringing["count"], 100)
+        self.assertEqual(dial_to_ringing["max"], 1.0)
+        self.assertAlmostEqual(dial_to_ringing["p50"], 0.505)
+        self.assertAlmostEqual(dial_to_ringing["p95"], 0.9505)
+        self.assertEqual(summary["lte->umts"]["dial_to_ringing"]["p99"], 3)
+
+    def test_report_once(self):
+        record = records.TestResultRecord("test_call")
+        records.set_current_record(record)
+        self.addCleanup(records.set_current_record, None)
+        kpi = make_kpi("lte", "lte", 1)
+        tel_call_kpi.report_call_kpi(kpi)
+        tel_call_kpi.report_call_kpi(kpi)
+        self.assertEqual(record.metrics[tel_call_kpi.CALL_KPI_METRIC],
+                         [kpi.to_dict()])
+        self.assertEqual(tel_call_kpi.get_call_kpi_collector().kpis, [kpi])
+
+    def test_call_setup_teardown(self):
+        ad_caller = make_ad("5555550100")
+        ad_callee = make_ad("5555550101")
+        record = records.TestResultRecord("test_call")
+        records.set_current_record(record)
+        self.addCleanup(records.set_current_record, None)
+        with mock.patch.multiple(
+                tel_test_utils,
+                get_outgoing_voice_sub_id=mock.Mock(return_value=1),
+                get_incoming_voice_sub_id=mock.Mock(return_value=1),
+                get_network_rat_for_subscription=mock.Mock(
+                    return_value="lte"),
+                wait_for_telecom_ringing=mock.Mock(return_value=True)), \
+                mock.patch("time.sleep"):
+            self.assertTrue(tel_test_utils.call_setup_teardown_for_subscription(
+                mock.Mock(), ad_caller, ad_callee, 1, 1, ad_hangup=ad_caller,
+                wait_time_in_call=0))
+        kpi = record.metrics[tel_call_kpi.CALL_KPI_METRIC][0]
+        self.assertEqual(kpi["rat_combination"], "lte->lte")
+        self.assertIsNone(kpi["failure"])
+        self.assertEqual(sorted(kpi["intervals"]),
+                         ["answer_to_offhook", "dial_to_offhook",
+                          "dial_to_ringing", "hangup_to_idle",
+                          "ringing_to_answer"])
+        self.assertIn("caller_hangup", kpi["rats"])
+        self.assertEqual(len(tel_call_kpi.get_call_kpi_collector().kpis), 1)
+
+    def answer_and_hang_up(self, ad, answered_call_ids, hangup_call_ids):
+        ad.droid.telecomCallGetCallIds.return_value = answered_call_ids
+        with mock.patch.multiple(
+                tel_test_utils,
+                get_incoming_voice_sub_id=mock.Mock(return_value=1),
+                get_network_rat_for_subscription=mock.Mock(
+                    return_value="lte")), \
+                mock.patch("time.sleep"):
+            self.assertTrue(
+                tel_test_utils.wait_and_answer_call_for_subscription(
+                    mock.Mock(), ad, 1))
+            ad.droid.telecomCallGetCallIds.return_value = hangup_call_ids
+            self.assertTrue(tel_test_utils.hangup_call(mock.Mock(), ad))
+        self.assertIsNone(ad.call_kpi)
+
+    def test_hangup_call_times_kept_kpi(self):
+        ad = make_ad("5555550101")
+        self.answer_and_hang_up(ad, ["call1"], ["call1"])
+        kpi = tel_call_kpi.get_call_kpi_collector().kpis[0]
+        self.assertIn("hangup_to_idle", kpi.get_intervals())
+
+    def test_hangup_call_drops_stale_kpi(self):
+        ad = make_ad("5555550101")
+        # The answered call ended on the far end and another call is up.
+        self.answer_and_hang_up(ad, ["call1"], ["call2"])
+        self.assertEqual(tel_call_kpi.get_call_kpi_collector().kpis, [])
+
+if __name__ == "__main__":
+   unittest.main()
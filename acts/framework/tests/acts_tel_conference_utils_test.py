@@ -0,0 +1,246 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import mock
+import unittest
+
+from acts.test_utils.tel import tel_conference_utils
+from acts.test_utils.tel.tel_conference_utils import ConferenceScenario
+from acts.test_utils.tel.tel_defines import CALL_CAPABILITY_MANAGE_CONFERENCE
+from acts.test_utils.tel.tel_defines import CALL_PROPERTY_CONFERENCE
+from acts.test_utils.tel.tel_defines import CALL_STATE_ACTIVE
+from acts.test_utils.tel.tel_defines import CALL_STATE_HOLDING
+from acts.test_utils.tel.tel_defines import PHONE_TYPE_CDMA
+from acts.test_utils.tel.tel_defines import PHONE_TYPE_GSM
+from acts.test_utils.tel.tel_defines import WFC_MODE_WIFI_PREFERRED
+
+
+class FakeConferenceNetwork(object):
+    """Plays the calls of a host and two participants on mocked ads.
+
+    The host's call ids map to the participants they connect to, so calls,
+    swaps, merges and drops change the states the utils read back.
+    """
+
+    def __init__(self, phone_type=PHONE_TYPE_GSM):
+        self.ads = []
+        for i in range(3):
+            ad = mock.MagicMock()
+            ad.serial = "phone{}".format(i)
+            ad.droid.telephonyGetPhoneType.return_value = phone_type
+            self.ads.append(ad)
+        host = self.ads[0].droid
+        host.telecomCallGetCallIds.side_effect = lambda: list(self.calls)
+        host.telecomCallGetCallState.side_effect = (
+            lambda call_id: self.calls[call_id]["state"])
+        host.telecomCallGetCallChildren.side_effect = (
+            lambda call_id: list(self.calls[call_id]["children"]))
+        host.telecomCallGetProperties.return_value = [CALL_PROPERTY_CONFERENCE]
+        host.telecomCallGetCapabilities.return_value = [
+            CALL_CAPABILITY_MANAGE_CONFERENCE]
+        host.telecomCallGetDetails.side_effect = (
+            lambda call_id: {"Handle": {"Uri": self.calls[call_id]["uri"]}})
+        host.telecomCallJoinCallsInConf.side_effect = self.merge
+        host.telecomCallDisconnect.side_effect = self.disconnect
+        for index in (1, 2):
+            self.ads[index].droid.telecomEndCall.side_effect = (
+                lambda index=index: self.drop(index))
+        self.merge_kind = tel_conference_utils.CONFERENCE_MERGE_IMS
+        self.calls = {}
+        self.in_call = [False] * 3
+        self.call_directions = []
+        self.host_drops = []
+        self.next_id = 0
+
+    def _add_call(self, index, state, children=()):
+        self.next_id += 1
+        call_id = "call{}".format(self.next_id)
+        self.calls[call_id] = {"index": index,
+                               "state": state,
+                               "uri": "tel:{}".format(index),
+                               "children": list(children)}
+        return call_id
+
+    def call_setup_teardown(self, log, ad_caller, ad_callee, **kwargs):
+        self.call_directions.append((self.ads.index(ad_caller),
+                                     self.ads.index(ad_callee)))
+        participant = ad_callee if ad_caller is self.ads[0] else ad_caller
+        for call in self.calls.values():
+            call["state"] = CALL_STATE_HOLDING
+        self._add_call(self.ads.index(participant), CALL_STATE_ACTIVE)
+        self.in_call[0] = True
+        self.in_call[self.ads.index(participant)] = True
+        return True
+
+    def swap_calls(self, log, ads, call_hold_id, call_active_id, num_swaps):
+        for _ in range(num_swaps):
+            for call in self.calls.values():
+                call["state"] = (CALL_STATE_HOLDING
+                                 if call["state"] == CALL_STATE_ACTIVE else
+                                 CALL_STATE_ACTIVE)
+        return True
+
+    def merge(self, call_ab_id, call_ac_id):
+        if self.merge_kind == tel_conference_utils.CONFERENCE_MERGE_CS:
+            for call in self.calls.values():
+                call["state"] = CALL_STATE_ACTIVE
+            self._add_call(None, CALL_STATE_ACTIVE)
+            return
+        self.calls = {}
+        if self.merge_kind == tel_conference_utils.CONFERENCE_MERGE_IMS:
+            self._add_call(None, CALL_STATE_ACTIVE)
+            return
+        children = [self._add_call(index, CALL_STATE_ACTIVE)
+                    for index in (1, 2)]
+        self._add_call(None, CALL_STATE_ACTIVE, children)
+
+    def disconnect(self, call_id):
+        index = self.calls[call_id]["index"]
+        self.host_drops.append(index)
+        self.drop(index)
+
+    def drop(self, index):
+        self.in_call[index] = False
+        for call_id, call in list(self.calls.items()):
+            if call["index"] == index:
+                del self.calls[call_id]
+        participants = [c for c in self.calls.values()
+                        if c["index"] is not None]
+        if self.merge_kind == tel_conference_utils.CONFERENCE_MERGE_CS:
+            # A CS conference falls back to the call that is left.
+            if len(participants) == 1:
+                self.calls = {k: v for k, v in self.calls.items()
+                              if v["index"] is not None}
+        if not any(self.in_call[1:]):
+            self.in_call[0] = False
+            self.calls = {}
+
+    def verify_incall_state(self, log, ads, expected_status):
+        return all(self.in_call[self.ads.index(ad)] is expected_status
+                   for ad in ads)
+
+    def run(self, scenario, merge_kind=None):
+        self.merge_kind = merge_kind or scenario.merge
+        self.setup_phones = mock.MagicMock(return_value=True)
+        module = "acts.test_utils.tel.tel_conference_utils."
+        with mock.patch(module + "call_setup_teardown",
+                        self.call_setup_teardown), \
+                mock.patch(module + "swap_calls", self.swap_calls), \
+                mock.patch(module + "verify_incall_state",
+                           self.verify_incall_state), \
+                mock.patch(module + "setup_phones", self.setup_phones), \
+                mock.patch(module + "time.sleep"):
+            return tel_conference_utils.run_conference_scenario(
+                mock.MagicMock(), self.ads, scenario)
+
+
+class ActsTelConferenceUtilsTest(unittest.TestCase):
+    """This test class has unit tests for the conference scenarios in
+    acts.test_utils.tel.tel_conference_utils.
+    """
+
+    def test_scenario_description(self):
+        scenario = ConferenceScenario(
+            "volte", ["wcdma", "1x"], tel_conference_utils.CONFERENCE_MO_MT,
+            num_swaps=1,
+            drops=tel_conference_utils.CONFERENCE_DROP_HELD_FROM_PARTICIPANT)
+        self.assertEqual([rat.name for rat in scenario.participants],
+                         ["wcdma", "1x"])
+        # After one swap the first call is active again.
+        self.assertEqual(scenario.get_call_index(
+            tel_conference_utils.CONFERENCE_ACTIVE_CALL), 1)
+        self.assertEqual(scenario.get_call_index(
+            tel_conference_utils.CONFERENCE_HELD_CALL), 2)
+        with self.assertRaises(ValueError):
+            ConferenceScenario("lte", "volte")
+        with self.assertRaises(ValueError):
+            ConferenceScenario("volte", "volte", "mo")
+        with self.assertRaises(ValueError):
+            ConferenceScenario(
+                "volte", "volte",
+                merge=tel_conference_utils.CONFERENCE_MERGE_IMS,
+                drops=tel_conference_utils.
+                CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT)
+        with self.assertRaises(ValueError):
+            ConferenceScenario(
+                "volte", "volte",
+                drops=(tel_conference_utils.
+                       CONFERENCE_DROP_HELD_FROM_PARTICIPANT * 2))
+
+    def test_swap_drop_held(self):
+        network = FakeConferenceNetwork()
+        scenario = ConferenceScenario(
+            "volte", "volte", tel_conference_utils.CONFERENCE_MO_MT,
+            num_swaps=2,
+            drops=tel_conference_utils.CONFERENCE_DROP_HELD_FROM_PARTICIPANT)
+        self.assertTrue(network.run(scenario))
+        # All phones are set up in a single parallel batch.
+        network.setup_phones.assert_called_once_with(mock.ANY, [
+            (rat.setup_func, (mock.ANY, ad))
+            for rat, ad in zip([scenario.host] + scenario.participants,
+                               network.ads)
+        ])
+        self.assertEqual(network.call_directions, [(0, 1), (2, 0)])
+        # PhoneB was held, so the call with PhoneC is the one left active.
+        self.assertEqual(network.in_call, [True, False, True])
+        self.assertEqual([c["state"] for c in network.calls.values()],
+                         [CALL_STATE_ACTIVE])
+
+    def test_cs_merge_drop(self):
+        network = FakeConferenceNetwork()
+        scenario = ConferenceScenario(
+            "3g", "general", tel_conference_utils.CONFERENCE_MT_MT,
+            num_swaps=1,
+            merge=tel_conference_utils.CONFERENCE_MERGE_CS,
+            drops=tel_conference_utils.
+            CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT)
+        self.assertTrue(network.run(scenario))
+        self.assertEqual(network.call_directions, [(1, 0), (2, 0)])
+        self.assertEqual(network.in_call, [False, False, False])
+
+    def test_cep_merge_drop_from_host(self):
+        network = FakeConferenceNetwork()
+        wfc_rat = tel_conference_utils.get_wfc_conference_rat(
+            True, WFC_MODE_WIFI_PREFERRED, "ssid", "password")
+        scenario = ConferenceScenario(
+            wfc_rat, wfc_rat, tel_conference_utils.CONFERENCE_MO_MO,
+            merge=tel_conference_utils.CONFERENCE_MERGE_CEP,
+            drops=tel_conference_utils.CONFERENCE_DROP_FIRST_CALL_FROM_HOST)
+        self.assertTrue(network.run(scenario))
+        tasks = network.setup_phones.call_args[0][1]
+        self.assertEqual(tasks[0][1][2:], (True, WFC_MODE_WIFI_PREFERRED,
+                                           "ssid", "password"))
+        # The host found the children of the conference by their uris.
+        self.assertEqual(network.host_drops, [1, 2])
+        self.assertEqual(network.in_call, [False, False, False])
+
+    def test_ims_merge_fails_with_cep(self):
+        network = FakeConferenceNetwork()
+        scenario = ConferenceScenario(
+            "volte", "volte",
+            merge=tel_conference_utils.CONFERENCE_MERGE_IMS)
+        self.assertFalse(network.run(
+            scenario, merge_kind=tel_conference_utils.CONFERENCE_MERGE_CEP))
+
+    def test_wrong_phone_type(self):
+        network = FakeConferenceNetwork(phone_type=PHONE_TYPE_CDMA)
+        self.assertFalse(network.run(ConferenceScenario("wcdma", "general")))
+        network.setup_phones.assert_not_called()
+        self.assertEqual(network.call_directions, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
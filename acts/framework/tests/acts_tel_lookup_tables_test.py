@@ -0,0 +1,80 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import unittest
+
+from acts.test_utils.tel import tel_lookup_tables
+from acts.test_utils.tel import tel_test_utils
+from acts.test_utils.tel.tel_defines import CARRIER_EEUK
+from acts.test_utils.tel.tel_defines import CARRIER_TMO
+from acts.test_utils.tel.tel_defines import CARRIER_VFUK
+from acts.test_utils.tel.tel_defines import GEN_4G
+from acts.test_utils.tel.tel_defines import RAT_FAMILY_LTE
+from acts.test_utils.tel.tel_defines import RAT_LTE
+
+
+class ActsTelLookupTablesTest(unittest.TestCase):
+    """This test class has unit tests for the implementation of everything
+    under acts.test_utils.tel.tel_lookup_tables.
+    """
+
+    def test_rat_tables(self):
+        self.assertEqual(tel_lookup_tables.rat_family_from_rat(RAT_LTE),
+                         RAT_FAMILY_LTE)
+        self.assertEqual(tel_lookup_tables.rat_generation_from_rat(RAT_LTE),
+                         GEN_4G)
+        self.assertTrue(tel_lookup_tables.is_valid_rat(RAT_LTE))
+        self.assertFalse(tel_lookup_tables.is_valid_rat("NOT_A_RAT"))
+        with self.assertRaises(KeyError):
+            tel_lookup_tables.rat_family_from_rat("NOT_A_RAT")
+        # The tables are built once and can not be changed.
+        with self.assertRaises(TypeError):
+            tel_lookup_tables._RAT_FAMILIES[RAT_LTE] = None
+
+    def test_operator_name_from_plmn_id(self):
+        operator_name = tel_lookup_tables.operator_name_from_plmn_id
+        # 3 and 2 digit MNCs.
+        self.assertEqual(operator_name("310260"), CARRIER_TMO)
+        self.assertEqual(operator_name("23430"), CARRIER_EEUK)
+        # IMSIs, resolved with the MNC lengths of their MCC.
+        self.assertEqual(operator_name("310260123456789"), CARRIER_TMO)
+        self.assertEqual(operator_name("234151234567890"), CARRIER_VFUK)
+        # A 6 digit PLMN id is not resolved by its first 5 digits.
+        with self.assertRaises(KeyError):
+            operator_name("234150")
+        with self.assertRaises(KeyError):
+            operator_name("999991234567890")
+        # No SIM operator.
+        with self.assertRaises(KeyError):
+            operator_name(None)
+        with self.assertRaises(KeyError):
+            operator_name("")
+
+    def test_phone_number_cache(self):
+        tel_test_utils.phone_number_formatter.cache_clear()
+        for _ in range(3):
+            self.assertEqual(tel_test_utils.phone_number_formatter(
+                "+1 650-555.1234", 10), "6505551234")
+        info = tel_test_utils.phone_number_formatter.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+        self.assertTrue(tel_test_utils.check_phone_number_match(
+            "+16505551234", "650-555-1234"))
+        self.assertFalse(tel_test_utils.check_phone_number_match(
+            "+446505551234", "+16505551234"))
+
+
+if __name__ == "__main__":
+    unittest.main()
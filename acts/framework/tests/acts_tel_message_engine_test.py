@@ -0,0 +1,120 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import mock
+import unittest
+
+from acts import records
+from acts.test_utils.tel import tel_message_engine
+from acts.test_utils.tel import tel_test_utils
+from acts.test_utils.tel.tel_defines import EventSmsReceived
+from acts.test_utils.tel.tel_defines import EventSmsSentSuccess
+from mock_sl4a import FakeDroid
+from mock_sl4a import start_event_dispatcher
+
+SMS_PART_LENGTH = 153
+
+
+class FakeSmsDroid(FakeDroid):
+    """An sl4a client of a device on a fake network that delivers SMS to
+    the other devices immediately, in parts like a real network.
+    """
+
+    def __init__(self, number, network):
+        super(FakeSmsDroid, self).__init__()
+        self.number = number
+        self.network = network
+        self.tracking = False
+        network[number] = self
+
+    def smsStartTrackingIncomingSmsMessage(self):
+        self.tracking = True
+
+    def smsStopTrackingIncomingSmsMessage(self):
+        self.tracking = False
+
+    def smsSendTextMessage(self, number, text, delivery_report):
+        self.post(EventSmsSentSuccess)
+        receiver = self.network[number]
+        for i in range(0, len(text), SMS_PART_LENGTH):
+            receiver.post(EventSmsReceived,
+                          {"Sender": self.number,
+                           "Text": text[i:i + SMS_PART_LENGTH]})
+
+
+class ActsTelMessageEngineTest(unittest.TestCase):
+    """This test class has unit tests for the SMS engine in
+    acts.test_utils.tel.tel_message_engine.
+    """
+
+    def setUp(self):
+        self.network = {}
+        self.ads = [self._make_ad("5555550100"), self._make_ad("5555550101")]
+
+    def _make_ad(self, number):
+        droid = FakeSmsDroid(number, self.network)
+        return mock.Mock(droid=droid, ed=start_event_dispatcher(self, droid),
+                         cfg={"subscription": {1: {"phone_num": number}}})
+
+    def test_send_receive_both_ways(self):
+        record = records.TestResultRecord("test_sms")
+        records.set_current_record(record)
+        self.addCleanup(records.set_current_record, None)
+        # A message from someone else, which the engine must leave alone.
+        self.ads[1].droid.post(EventSmsReceived, {"Sender": "5555550199",
+                                                  "Text": "Hello"})
+        engine = tel_message_engine.MessageEngine(
+            mock.Mock(), tel_test_utils.check_phone_number_match,
+            max_outstanding=3)
+        for ad_tx, ad_rx in ((self.ads[0], self.ads[1]),
+                             (self.ads[1], self.ads[0])):
+            engine.add_flow(ad_tx, ad_rx, 1, 1,
+                            ["a" * 50, "b" * 160, "c" * 400, "d" * 10])
+        self.assertTrue(engine.run())
+        summary = record.metrics[tel_message_engine.MESSAGE_METRIC][0]
+        self.assertEqual(summary["messages"], 8)
+        self.assertEqual(summary["received"], 8)
+        self.assertEqual(summary["failed"], 0)
+        self.assertEqual(summary["send_to_received"]["count"], 8)
+        self.assertNotIn("send_to_delivered", summary)
+        self.assertFalse(self.ads[1].droid.tracking)
+        events = self.ads[1].ed.pop_all(EventSmsReceived)
+        self.assertEqual([e["data"]["Sender"] for e in events],
+                         ["5555550199"])
+
+    def test_reassemble_interleaved_parts(self):
+        flow = tel_message_engine.MessageFlow(self.ads[0], self.ads[1], 1, 1,
+                                              ["x" * 200, "y" * 200])
+        flow.outstanding = list(flow.messages)
+        parts = ["x" * 153, "y" * 153, "y" * 47, "z", "x" * 47]
+        matched = [flow.match_received(
+            {"data": {"Sender": "5555550100", "Text": part}},
+            tel_test_utils.check_phone_number_match) for part in parts]
+        self.assertEqual(matched, [True, True, True, False, True])
+        for message in flow.messages:
+            self.assertIsNotNone(message.received_time)
+
+    def test_wait_for_matching_sms_keeps_other_events(self):
+        self.ads[1].droid.post(EventSmsReceived, {"Sender": "5555550199",
+                                                  "Text": "Hello"})
+        self.ads[0].droid.smsSendTextMessage("5555550101", "e" * 200, True)
+        self.assertTrue(tel_test_utils.wait_for_matching_sms(
+            mock.Mock(), self.ads[1], "5555550100", "e" * 200))
+        events = self.ads[1].ed.pop_all(EventSmsReceived)
+        self.assertEqual([e["data"]["Text"] for e in events], ["Hello"])
+
+if __name__ == "__main__":
+   unittest.main()
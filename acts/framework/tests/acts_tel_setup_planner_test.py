@@ -0,0 +1,155 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import time
+import unittest
+
+import mock
+
+from acts.test_utils.tel import tel_setup_planner
+from acts.test_utils.tel import tel_state_utils
+from acts.test_utils.tel import tel_test_utils
+from acts.test_utils.tel.tel_defines import RAT_IWLAN
+from acts.test_utils.tel.tel_defines import RAT_LTE
+from acts.test_utils.tel.tel_defines import RAT_UMTS
+from acts.test_utils.tel.tel_defines import WFC_MODE_DISABLED
+from acts.test_utils.tel.tel_defines import WFC_MODE_WIFI_PREFERRED
+from acts.test_utils.tel.tel_voice_utils import phone_setup_csfb
+from acts.test_utils.tel.tel_voice_utils import phone_setup_iwlan
+from acts.test_utils.tel.tel_voice_utils import phone_setup_voice_3g
+from acts.test_utils.tel.tel_voice_utils import phone_setup_volte
+
+
+class FakeDroid(object):
+    """An sl4a client answering the telephony state RPCs from a dict."""
+
+    def __init__(self, results):
+        self.results = results
+        self.state_changing_rpc_count = 0
+
+    def rpc_batch(self, calls):
+        return [self.results[method] for method, _ in calls]
+
+
+def get_fake_ad(serial, airplane_mode=False, wfc_mode=WFC_MODE_DISABLED,
+                voice_rat=RAT_LTE, data_rat=RAT_LTE, ims_registered=True,
+                volte_setting=True):
+    results = {rpc: False for _, rpc in tel_state_utils.DEVICE_FIELDS}
+    results.update({
+        "subscriptionGetDefaultSubId": 1,
+        "connectivityCheckAirplaneMode": airplane_mode,
+        "imsGetWfcMode": wfc_mode,
+        "imsIsEnhanced4gLteModeSettingEnabledByUser": volte_setting,
+        "imsIsEnhanced4gLteModeSettingEnabledByPlatform": True,
+        "telephonyIsImsRegistered": ims_registered,
+        "telephonyIsVolteAvailable": ims_registered and voice_rat == RAT_LTE,
+        "telephonyIsWifiCallingAvailable": (ims_registered and
+                                            data_rat == RAT_IWLAN),
+        "telephonyGetCurrentVoiceNetworkTypeForSubscription": voice_rat,
+        "telephonyGetCurrentDataNetworkTypeForSubscription": data_rat,
+        "telephonyGetNetworkTypeForSubscription": data_rat,
+        "telephonyGetCallStateForSubscription": "IDLE",
+    })
+    return mock.Mock(serial=serial, droid=FakeDroid(results), ed=None,
+                     telephony_state=None, outgoing_voice_sub_id=1,
+                     default_data_sub_id=1)
+
+
+class ActsTelSetupPlannerTest(unittest.TestCase):
+    """This test class has unit tests for the implementation of everything
+    under acts.test_utils.tel.tel_setup_planner.
+    """
+
+    def setUp(self):
+        self.log = mock.Mock()
+
+    def test_is_phone_setup_done(self):
+        volte_ad = get_fake_ad("volte")
+        self.assertTrue(tel_setup_planner.is_phone_setup_done(
+            self.log, phone_setup_volte, (self.log, volte_ad)))
+        self.assertFalse(tel_setup_planner.is_phone_setup_done(
+            self.log, phone_setup_voice_3g, (self.log, volte_ad)))
+        # Not registered on IMS yet.
+        ad = get_fake_ad("lte", ims_registered=False)
+        self.assertFalse(tel_setup_planner.is_phone_setup_done(
+            self.log, phone_setup_volte, (self.log, ad)))
+        ad = get_fake_ad("umts", voice_rat=RAT_UMTS, data_rat=RAT_UMTS)
+        self.assertTrue(tel_setup_planner.is_phone_setup_done(
+            self.log, phone_setup_voice_3g, (self.log, ad)))
+        # Setups without a check always run.
+        self.assertFalse(tel_setup_planner.is_phone_setup_done(
+            self.log, mock.Mock(return_value=True), (self.log, ad)))
+
+    def test_is_csfb_setup_done(self):
+        ad = get_fake_ad("csfb", voice_rat=RAT_UMTS, ims_registered=False,
+                         volte_setting=False)
+        self.assertTrue(tel_setup_planner.is_phone_setup_done(
+            self.log, phone_setup_csfb, (self.log, ad)))
+        # VoLTE is turned on but not registered yet.
+        ad = get_fake_ad("lte", voice_rat=RAT_UMTS, ims_registered=False)
+        self.assertFalse(tel_setup_planner.is_phone_setup_done(
+            self.log, phone_setup_csfb, (self.log, ad)))
+
+    def test_is_iwlan_setup_done(self):
+        ad = get_fake_ad("iwlan", airplane_mode=True,
+                         wfc_mode=WFC_MODE_WIFI_PREFERRED, data_rat=RAT_IWLAN)
+        args = (self.log, ad, True, WFC_MODE_WIFI_PREFERRED, "ssid", "pwd")
+        self.assertTrue(tel_setup_planner.is_phone_setup_done(
+            self.log, phone_setup_iwlan, args))
+        # The same state with airplane mode off needs a setup.
+        args = (self.log, ad, False, WFC_MODE_WIFI_PREFERRED, "ssid", "pwd")
+        self.assertFalse(tel_setup_planner.is_phone_setup_done(
+            self.log, phone_setup_iwlan, args))
+
+    def test_setup_phones_skips_ready_phones(self):
+        setup_func = mock.Mock(return_value=True, __name__="setup_func")
+        tasks = [(setup_func, (self.log, get_fake_ad("ready"))),
+                 (setup_func, (self.log, get_fake_ad("new",
+                                                     ims_registered=False)))]
+        checks = {setup_func:
+                  tel_setup_planner._SETUP_CHECKS[phone_setup_volte]}
+        with mock.patch.dict(tel_setup_planner._SETUP_CHECKS, checks):
+            self.assertTrue(tel_setup_planner.setup_phones(self.log, tasks))
+        setup_func.assert_called_once_with(self.log, tasks[1][1][1])
+        self.assertTrue(tel_setup_planner.setup_phones(self.log, []))
+
+    def test_setup_phones_deadline(self):
+        def wait_forever(log, ad):
+            return tel_test_utils._wait_for_state(
+                log, [ad], 60, lambda ad: False, "forever")
+
+        def fail(log, ad):
+            raise ValueError("no sim")
+
+        begin_time = time.time()
+        self.assertFalse(tel_setup_planner.setup_phones(
+            self.log, [(wait_forever, (self.log, get_fake_ad("a"))),
+                       (fail, (self.log, get_fake_ad("b"))),
+                       (mock.Mock(return_value=True),
+                        (self.log, get_fake_ad("c")))],
+            timeout=0.2))
+        # The wait gave up at the deadline of its setup, not after 60s.
+        self.assertLess(time.time() - begin_time, 5)
+        # Both failed devices are reported in one message.
+        self.log.error.assert_called_once_with(mock.ANY)
+        message = self.log.error.call_args[0][0]
+        self.assertIn("2 of 3 devices", message)
+        self.assertIn("a wait_forever timed out", message)
+        self.assertIn("b fail raised ValueError", message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import json
+import socket
+import threading
+import unittest
+
+import mock
+
+from acts.controllers import android
+from acts.test_utils.tel import tel_state_utils
+from acts.test_utils.tel import tel_test_utils
+from acts.test_utils.tel.tel_defines import NETWORK_SERVICE_VOICE
+from acts.test_utils.tel.tel_defines import RAT_LTE
+
+
+class FakeSl4aServer(object):
+    """Answers sl4a requests with the values of a dict of RPC results."""
+
+    def __init__(self, results):
+        self.results = results
+        self.methods = []
+        self.sock = socket.socket()
+        self.sock.bind(("localhost", 0))
+        self.sock.listen(1)
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self.serve)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def serve(self):
+        conn, _ = self.sock.accept()
+        with conn, conn.makefile(mode="brw") as f:
+            for line in f:
+                request = json.loads(line.decode("utf8"))
+                if "cmd" in request:
+                    response = {"status": True, "uid": 1}
+                else:
+                    method = request["method"]
+                    self.methods.append(method)
+                    response = {"id": request["id"], "result": None,
+                                "error": None}
+                    if method in self.results:
+                        response["result"] = self.results[method]
+                    else:
+                        response["error"] = "Unknown RPC " + method
+                f.write(json.dumps(response).encode("utf8") + b"\n")
+                f.flush()
+
+    def close(self):
+        self.sock.close()
+
+
+class FakeDroid(object):
+    def __init__(self, results):
+        self.results = results
+        self.state_changing_rpc_count = 0
+        self.batches = []
+
+    def rpc_batch(self, calls):
+        self.batches.append(calls)
+        return [self.results[method] for method, _ in calls]
+
+
+class FakeSl4aClient(object):
+    """Answers the requests written to it, except for one response it does
+    not get.
+    """
+
+    def __init__(self, missing_response):
+        self.missing_response = missing_response
+        self.requests = []
+        self.num_responses = 0
+
+    def write(self, data):
+        self.requests.append(json.loads(data.decode("utf8")))
+
+    def flush(self):
+        pass
+
+    def readline(self):
+        if self.num_responses == self.missing_response:
+            return b""
+        request = self.requests[self.num_responses]
+        self.num_responses += 1
+        return json.dumps({"id": request["id"], "result": True,
+                           "error": None}).encode("utf8")
+
+
+class ActsTelStateUtilsTest(unittest.TestCase):
+    """This test class has unit tests for the implementation of everything
+    under acts.test_utils.tel.tel_state_utils.
+    """
+
+    def setUp(self):
+        results = {rpc: False for _, rpc in tel_state_utils.DEVICE_FIELDS}
+        results.update({rpc: "unknown"
+                        for _, rpc in tel_state_utils.SUBSCRIPTION_FIELDS})
+        results["subscriptionGetDefaultSubId"] = 1
+        results["telecomIsInCall"] = True
+        results["telephonyGetCurrentVoiceNetworkTypeForSubscription"] = RAT_LTE
+        self.droid = FakeDroid(results)
+        self.ad = mock.Mock(serial="1234", droid=self.droid, ed=None,
+                            telephony_state=None)
+
+    def test_rpc_batch(self):
+        server = FakeSl4aServer({"telecomIsInCall": True,
+                                 "telephonyGetCallState": "IDLE"})
+        self.addCleanup(server.close)
+        droid = android.Android(port=server.port, addr="localhost")
+        self.addCleanup(droid.close)
+        results = droid.rpc_batch([("telecomIsInCall", ()),
+                                   ("telephonyNoSuchRpc", (1,)),
+                                   ("telephonyGetCallState", ())])
+        self.assertEqual(results[0], True)
+        self.assertIsInstance(results[1], android.SL4AAPIError)
+        self.assertEqual(results[2], "IDLE")
+        # Only the RPC that is not known to be read-only may change the
+        # device state.
+        self.assertEqual(droid.state_changing_rpc_count, 1)
+        self.assertEqual(droid.telecomIsInCall(), True)
+        self.assertEqual(droid.state_changing_rpc_count, 1)
+
+    def test_rpc_batch_closes_session_on_error(self):
+        droid = android.Android.__new__(android.Android)
+        droid.lock = threading.RLock()
+        droid.state_changing_rpc_count = 0
+        droid.client = FakeSl4aClient(missing_response=1)
+        conn = mock.Mock()
+        droid.conn = conn
+        with self.assertRaises(android.SL4AProtocolError):
+            droid.rpc_batch([("telecomIsInCall", ()),
+                             ("telecomIsRinging", ()),
+                             ("telephonyGetCallState", ())])
+        # The responses left unread must not be read by the next RPCs.
+        conn.shutdown.assert_called_once_with(socket.SHUT_RDWR)
+        conn.close.assert_called_once_with()
+        self.assertIsNone(droid.conn)
+
+    def test_read_only_rpcs(self):
+        # Fetching a snapshot must not make it stale.
+        for _, rpc in (tel_state_utils.DEVICE_FIELDS +
+                       tel_state_utils.SUBSCRIPTION_FIELDS):
+            self.assertIn(rpc, android._READ_ONLY_RPCS)
+
+    def test_snapshot_single_batch(self):
+        self.assertTrue(tel_test_utils.is_phone_in_call(None, self.ad))
+        self.assertEqual(tel_test_utils.get_network_rat(
+            None, self.ad, NETWORK_SERVICE_VOICE), RAT_LTE)
+        self.assertFalse(tel_test_utils.is_ims_registered(None, self.ad))
+        self.assertTrue(tel_test_utils.verify_incall_state(None, [self.ad],
+                                                           True))
+        # One batch for the device, one for its default subscription.
+        self.assertEqual(len(self.droid.batches), 2)
+        self.assertEqual(self.droid.batches[1][0],
+                         ("telephonyGetCurrentVoiceNetworkTypeForSubscription",
+                          (1,)))
+
+    def test_snapshot_with_subscription(self):
+        state = tel_state_utils.get_telephony_state(self.ad, 2)
+        self.assertEqual(state.get_subscription_state(2).voice_rat, RAT_LTE)
+        self.assertEqual(len(self.droid.batches), 1)
+
+    def test_snapshot_expires(self):
+        state = tel_state_utils.get_telephony_state(self.ad)
+        self.assertIs(tel_state_utils.get_telephony_state(self.ad), state)
+        self.droid.state_changing_rpc_count += 1
+        state2 = tel_state_utils.get_telephony_state(self.ad)
+        self.assertIsNot(state2, state)
+        state2.fetch_time -= 1
+        self.assertIsNot(tel_state_utils.get_telephony_state(self.ad),
+                         state2)
+        self.assertEqual(len(self.droid.batches), 3)
+
+    def test_snapshot_rpc_error(self):
+        self.droid.results["telephonyIsImsRegistered"] = (
+            android.SL4AAPIError("Not supported"))
+        state = tel_state_utils.get_telephony_state(self.ad)
+        self.assertTrue(state.in_call)
+        with self.assertRaises(android.SL4AAPIError):
+            state.ims_registered
+
+if __name__ == "__main__":
+   unittest.main()
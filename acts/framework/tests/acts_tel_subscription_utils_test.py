@@ -0,0 +1,133 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from acts.test_utils.tel import tel_subscription_utils
+from acts.test_utils.tel import tel_test_utils
+
+
+class FakeDroid(object):
+    """An sl4a client answering RPCs from a dict, recording the calls."""
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+        self.batches = 0
+
+    def rpc_batch(self, calls):
+        self.batches += 1
+        self.calls.extend(method for method, _ in calls)
+        return [self.results[method] for method, _ in calls]
+
+    def __getattr__(self, name):
+        def rpc_call(*args):
+            self.calls.append(name)
+            return self.results.get(name)
+        return rpc_call
+
+
+class ActsTelSubscriptionUtilsTest(unittest.TestCase):
+    """This test class has unit tests for the subscription metadata cache
+    under acts.test_utils.tel.tel_subscription_utils.
+    """
+
+    def setUp(self):
+        self.droid = FakeDroid({
+            "subscriptionGetAllSubInfoList": [
+                {"subscriptionId": 1, "simSlotIndex": 0},
+                {"subscriptionId": 2, "simSlotIndex": 1}],
+            "subscriptionGetDefaultSubId": 1,
+            "subscriptionGetDefaultVoiceSubId": 1,
+            "subscriptionGetDefaultSmsSubId": 2,
+            "subscriptionGetDefaultDataSubId": 1,
+            "telephonyGetSimSerialNumberForSubscription": "8901",
+            "telephonyGetSimOperatorForSubscription": "310260",
+        })
+        self.ad = mock.Mock(spec=["droid", "serial", "model"],
+                            droid=self.droid, serial="1234", model="bullhead")
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+    def test_sub_id_getters_use_cache(self):
+        self.assertEqual(
+            tel_subscription_utils.get_outgoing_voice_sub_id(self.ad), 1)
+        self.assertEqual(
+            tel_subscription_utils.get_incoming_message_sub_id(self.ad), 2)
+        self.assertEqual(
+            tel_subscription_utils.get_default_data_sub_id(self.ad), 1)
+        self.assertEqual(
+            tel_subscription_utils.get_subid_from_slot_index(None, self.ad,
+                                                             1), 2)
+        self.assertEqual(self.droid.batches, 1)
+
+    def test_cache_invalidated_by_setter(self):
+        tel_subscription_utils.get_outgoing_message_sub_id(self.ad)
+        self.ad.telephony_state = mock.Mock()
+        tel_subscription_utils.set_subid_for_message(self.ad, 1)
+        self.assertIsNone(self.ad.telephony_state)
+        self.droid.results["subscriptionGetDefaultSmsSubId"] = 1
+        self.assertEqual(
+            tel_subscription_utils.get_outgoing_message_sub_id(self.ad), 1)
+        self.assertEqual(self.droid.batches, 2)
+
+    def test_cache_invalidated_by_new_session(self):
+        tel_subscription_utils.get_subscription_cache(self.ad)
+        self.ad.droid = FakeDroid(self.droid.results)
+        tel_subscription_utils.get_subscription_cache(self.ad)
+        self.assertEqual(self.ad.droid.batches, 1)
+
+    def test_cache_invalidated_by_airplane_mode(self):
+        def wait_for_event(*args, **kwargs):
+            self.droid.results["connectivityCheckAirplaneMode"] = True
+            # Something reads the subscriptions while the SIM reloads.
+            tel_subscription_utils.get_subscription_cache(self.ad)
+        self.ad.ed = mock.Mock()
+        self.ad.ed.wait_for_event.side_effect = wait_for_event
+        self.ad.telephony_state = mock.Mock()
+        self.assertTrue(tel_test_utils.toggle_airplane_mode_msim(
+            mock.Mock(), self.ad, True))
+        self.assertIsNone(self.ad.subscription_cache)
+        self.assertIsNone(self.ad.telephony_state)
+
+    def test_setup_droid_properties(self):
+        sim_file = os.path.join(self.tmp_dir, "sim.json")
+        with open(sim_file, "w") as f:
+            json.dump({"8901": {"phone_num": "5555550100"}}, f)
+        with mock.patch.object(tel_test_utils, "load_config",
+                               wraps=tel_test_utils.load_config) as load:
+            tel_test_utils.setup_droid_properties(mock.Mock(), self.ad,
+                                                  sim_file)
+            ad2 = mock.Mock(spec=["droid", "serial", "model"],
+                            droid=FakeDroid(self.droid.results))
+            tel_test_utils.setup_droid_properties(mock.Mock(), ad2, sim_file)
+        load.assert_called_once_with(sim_file)
+        self.assertEqual(self.ad.cfg["subscription"][1]["phone_num"],
+                         "5555550100")
+        self.assertEqual(self.ad.cfg["subscription"][2]["operator"], "tmo")
+        # Subscriptions, then the SIM serial and operator of both SIMs.
+        self.assertEqual(self.droid.batches, 2)
+        self.assertEqual(self.droid.calls.count(
+            "telephonyGetSimSerialNumberForSubscription"), 2)
+
+if __name__ == "__main__":
+   unittest.main()
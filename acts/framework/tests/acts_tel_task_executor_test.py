@@ -0,0 +1,118 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import threading
+import time
+import unittest
+
+import mock
+
+from acts.test_utils.tel import tel_task_executor
+from acts.test_utils.tel import tel_test_utils
+
+
+class ActsTelTaskExecutorTest(unittest.TestCase):
+    """This test class has unit tests for the implementation of everything
+    under acts.test_utils.tel.tel_task_executor.
+    """
+
+    def tearDown(self):
+        tel_task_executor.shutdown_task_executor()
+
+    def test_run_tasks_all_at_once(self):
+        barrier = threading.Barrier(8, timeout=5)
+        def task(i):
+            barrier.wait()
+            return i + 1
+        results = tel_task_executor.run_tasks([(task, (i,)) for i in range(8)])
+        self.assertEqual([r.result for r in results], list(range(1, 9)))
+        self.assertTrue(all(r.succeeded for r in results))
+        self.assertTrue(all(r.duration is not None for r in results))
+
+    def test_run_tasks_shared_executor(self):
+        executor = tel_task_executor.get_task_executor(2)
+        tel_task_executor.run_tasks([(int, ("1",))])
+        self.assertIs(tel_task_executor.get_task_executor(2), executor)
+        # A larger batch does not replace the executor other threads hold.
+        self.assertIs(tel_task_executor.get_task_executor(3), executor)
+        results = tel_task_executor.run_tasks([(bool, (i,)) for i in range(3)])
+        self.assertEqual([r.result for r in results], [False, True, True])
+        self.assertEqual(executor.run([(int, ("1",))])[0].result, 1)
+        executor = tel_task_executor.start_task_executor(3)
+        self.assertEqual(executor.max_workers, 3)
+        self.assertIs(tel_task_executor.get_task_executor(), executor)
+
+    def test_run_tasks_queued_warning(self):
+        tel_task_executor.start_task_executor(2)
+        log = mock.Mock()
+        tel_task_executor.run_tasks([(int, ("1",))] * 2, log=log)
+        self.assertFalse(log.warning.called)
+        results = tel_task_executor.run_tasks([(int, ("1",))] * 3, log=log)
+        self.assertEqual([r.result for r in results], [1, 1, 1])
+        self.assertEqual(log.warning.call_count, 1)
+
+    def test_run_tasks_exceptions(self):
+        def fail():
+            raise ValueError("boom")
+        results = tel_task_executor.run_tasks([(fail, ()), (bool, (1,))])
+        self.assertIsInstance(results[0].exception, ValueError)
+        self.assertFalse(results[0].succeeded)
+        self.assertTrue(results[1].succeeded)
+
+    def test_run_tasks_fail_fast(self):
+        stopped = []
+        def fail():
+            return False
+        def slow():
+            for _ in range(100):
+                if tel_task_executor.is_task_cancelled():
+                    stopped.append(True)
+                    return False
+                time.sleep(0.01)
+            return True
+        results = tel_task_executor.run_tasks(
+            [(slow, ()), (fail, ()), (slow, ())], fail_fast=True)
+        # Running tasks are told to stop, the others do not start.
+        self.assertEqual(len(stopped) + sum(r.cancelled for r in results), 2)
+        self.assertFalse(any(r.succeeded for r in results))
+        del stopped[:]
+        # Tasks that have not started yet do not run.
+        executor = tel_task_executor.TaskExecutor(1)
+        self.addCleanup(executor.shutdown)
+        results = executor.run([(fail, ()), (slow, ())], fail_fast=True)
+        self.assertFalse(results[0].cancelled)
+        self.assertTrue(results[1].cancelled)
+        self.assertIsNone(results[1].begin_time)
+        self.assertFalse(stopped)
+
+    def test_run_tasks_nested(self):
+        tel_task_executor.get_task_executor(1)
+        def outer():
+            return tel_task_executor.run_tasks([(bool, (1,))])[0].result
+        results = tel_task_executor.run_tasks([(outer, ())])
+        self.assertTrue(results[0].result)
+
+    def test_multithread_func(self):
+        log = mock.Mock()
+        self.assertTrue(tel_test_utils.multithread_func(
+            log, [(bool, (1,)), (bool, (2,))]))
+        self.assertFalse(tel_test_utils.multithread_func(
+            log, [(bool, (1,)), (bool, (0,))]))
+        with self.assertRaises(ZeroDivisionError):
+            tel_test_utils.multithread_func(log, [(divmod, (1, 0))])
+
+if __name__ == "__main__":
+   unittest.main()
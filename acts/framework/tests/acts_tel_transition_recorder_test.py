@@ -0,0 +1,267 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from acts.test_utils.tel import tel_state_utils
+from acts.test_utils.tel import tel_test_utils
+from acts.test_utils.tel import tel_transition_recorder
+from acts.test_utils.tel.tel_defines import CallStateContainer
+from acts.test_utils.tel.tel_defines import DATA_STATE_CONNECTED
+from acts.test_utils.tel.tel_defines import DATA_STATE_DISCONNECTED
+from acts.test_utils.tel.tel_defines import EventCallStateChanged
+from acts.test_utils.tel.tel_defines import EventConnectivityChanged
+from acts.test_utils.tel.tel_defines import EventDataConnectionStateChanged
+from acts.test_utils.tel.tel_defines import EventServiceStateChanged
+from acts.test_utils.tel.tel_defines import RAT_LTE
+from acts.test_utils.tel.tel_defines import RAT_UMTS
+from acts.test_utils.tel.tel_defines import TELEPHONY_STATE_IDLE
+from acts.test_utils.tel.tel_defines import TELEPHONY_STATE_OFFHOOK
+from acts.test_utils.tel.tel_transition_recorder import ANY
+from acts.test_utils.tel.tel_transition_recorder import Transition
+from acts.test_utils.tel.tel_transition_recorder import TransitionRecorder
+from mock_sl4a import FakeDroid
+from mock_sl4a import start_event_dispatcher
+
+# The (start, stop) tracking RPCs the recorder calls for each subscription.
+SUBSCRIPTION_TRACKING_RPCS = (
+    ("telephonyStartTrackingServiceStateChangeForSubscription",
+     "telephonyStopTrackingServiceStateChangeForSubscription"),
+    ("telephonyStartTrackingDataConnectionStateChangeForSubscription",
+     "telephonyStopTrackingDataConnectionStateChangeForSubscription"),
+    ("telephonyStartTrackingCallStateForSubscription",
+     "telephonyStopTrackingCallStateChangeForSubscription"),
+)
+CONNECTIVITY_TRACKING_RPCS = (
+    "connectivityStartTrackingConnectivityStateChange",
+    "connectivityStopTrackingConnectivityStateChange")
+SUB_IDS = (1, 2)
+
+
+class ActsTelTransitionRecorderTest(unittest.TestCase):
+    """This test class has unit tests for the implementation of everything
+    under acts.test_utils.tel.tel_transition_recorder.
+    """
+
+    def setUp(self):
+        self.ad = mock.Mock(serial="1234", ed=None)
+        self.recorder = TransitionRecorder(self.ad)
+
+    def test_record_changes_only(self):
+        self.recorder.record("wifi_enabled", True, timestamp=1)
+        self.recorder.record("wifi_enabled", True, timestamp=2)
+        self.recorder.record("voice_rat", RAT_LTE, 1, timestamp=3)
+        self.recorder.record("wifi_enabled", False, timestamp=4)
+        self.assertEqual(self.recorder.get_timeline().transitions, [
+            Transition(1, None, "wifi_enabled", None, True),
+            Transition(3, 1, "voice_rat", None, RAT_LTE),
+            Transition(4, None, "wifi_enabled", True, False)])
+        self.assertEqual(
+            len(self.recorder.get_timeline(begin_time=2).transitions), 2)
+
+    def test_ring_buffer(self):
+        recorder = TransitionRecorder(self.ad, max_transitions=3)
+        for i in range(5):
+            recorder.record("call_state", i, timestamp=i + 1)
+        self.assertEqual([t.new for t in recorder.get_timeline().transitions],
+                         [2, 3, 4])
+
+    def test_events(self):
+        droid = FakeDroid()
+        ed = start_event_dispatcher(self, droid)
+        self.ad.ed = ed
+        self.recorder.start()
+        droid.post(EventServiceStateChanged, {"subscriptionId": 1,
+                                              "voiceNetworkType": RAT_LTE,
+                                              "dataNetworkType": RAT_LTE})
+        droid.post(EventDataConnectionStateChanged,
+                   {"subscriptionId": 1,
+                    "dataConnectionState": DATA_STATE_CONNECTED,
+                    "dataNetworkType": RAT_UMTS})
+        droid.post(EventConnectivityChanged, {"TypeName": "WIFI",
+                                              "isConnected": False})
+        droid.post("SomethingElse", {"subscriptionId": 1})
+        count = 0
+        while count < 3:
+            count = ed.wait_for_new_events(
+                [EventServiceStateChanged, EventDataConnectionStateChanged,
+                 EventConnectivityChanged], count, 5)
+        # The events are still there for the utils.
+        ed.clear_all_events()
+        self.recorder.stop()
+        droid.post(EventConnectivityChanged, {"TypeName": "WIFI",
+                                              "isConnected": True})
+        ed.wait_for_new_events([EventConnectivityChanged], count, 5)
+        ed.started = False
+        ed.poller.result()
+        self.assertEqual(
+            [(t.sub_id, t.field, t.old, t.new)
+             for t in self.recorder.get_timeline().transitions],
+            [(1, "voice_rat", None, RAT_LTE),
+             (1, "data_rat", None, RAT_LTE),
+             (1, "data_connection_state", None, DATA_STATE_CONNECTED),
+             (1, "data_rat", RAT_LTE, RAT_UMTS),
+             (None, "wifi_connected", None, False)])
+
+    def _start_tracking(self, log):
+        """Starts the tracking of the recorder on a fake droid whose
+        tracking RPCs are recorded by the returned mock.
+        """
+        droid = FakeDroid()
+        rpcs = mock.Mock()
+        for pair in SUBSCRIPTION_TRACKING_RPCS + (CONNECTIVITY_TRACKING_RPCS,):
+            for name in pair:
+                setattr(droid, name, getattr(rpcs, name))
+        droid.subscriptionGetAllSubInfoList = mock.Mock(
+            return_value=[{"subscriptionId": sub_id} for sub_id in SUB_IDS])
+        self.ad.droid = droid
+        self.ad.ed = start_event_dispatcher(self, droid)
+        self.ad.transition_recorder = self.recorder
+        self.recorder.start()
+        self.assertTrue(
+            tel_transition_recorder.start_transition_tracking(log, self.ad))
+        return droid, rpcs
+
+    def _get_start_calls(self):
+        return ([getattr(mock.call, start_rpc)(sub_id)
+                 for sub_id in SUB_IDS
+                 for start_rpc, _ in SUBSCRIPTION_TRACKING_RPCS] +
+                [getattr(mock.call, CONNECTIVITY_TRACKING_RPCS[0])()])
+
+    def test_tracking(self):
+        log = mock.Mock()
+        droid, rpcs = self._start_tracking(log)
+        start_calls = self._get_start_calls()
+        self.assertEqual(rpcs.mock_calls, start_calls)
+        # A util stopping its tracking restores the recorder's.
+        rpcs.reset_mock()
+        tel_test_utils._stop_tracking_service_state(log, self.ad, 1)
+        stop_call = getattr(mock.call, SUBSCRIPTION_TRACKING_RPCS[0][1])(1)
+        self.assertEqual(rpcs.mock_calls, [stop_call] + start_calls)
+        # The events no util took are dropped when the tracking stops.
+        droid.post(EventServiceStateChanged, {"subscriptionId": 1,
+                                              "voiceNetworkType": RAT_LTE})
+        self.ad.ed.wait_for_new_events([EventServiceStateChanged], 0, 5)
+        rpcs.reset_mock()
+        tel_transition_recorder.stop_transition_tracking(log, self.ad)
+        self.assertEqual(len(rpcs.mock_calls),
+                         len(SUB_IDS) * len(SUBSCRIPTION_TRACKING_RPCS) + 1)
+        self.assertEqual(self.ad.ed.pop_all(EventServiceStateChanged), [])
+        rpcs.reset_mock()
+        tel_transition_recorder.resume_transition_tracking(log, self.ad)
+        self.assertEqual(rpcs.mock_calls, [])
+
+    def test_call_state_tracked(self):
+        log = mock.Mock()
+        droid, rpcs = self._start_tracking(log)
+        droid.post(EventCallStateChanged,
+                   {"subscriptionId": 1,
+                    CallStateContainer.CALL_STATE: TELEPHONY_STATE_OFFHOOK})
+        self.ad.ed.wait_for_new_events([EventCallStateChanged], 0, 5)
+        droid.telephonyStartTrackingCallState = mock.Mock()
+        droid.telephonyStopTrackingCallStateChange = mock.Mock()
+        droid.telecomEndCall = lambda: droid.post(
+            EventCallStateChanged,
+            {"subscriptionId": 1,
+             CallStateContainer.CALL_STATE: TELEPHONY_STATE_IDLE})
+        self.ad.call_kpi = None
+        rpcs.reset_mock()
+        self.assertTrue(tel_test_utils.hangup_call(log, self.ad))
+        # hangup_call stopped tracking the call state, the recorder's is
+        # restored.
+        self.assertEqual(rpcs.mock_calls, self._get_start_calls())
+        self.assertEqual(
+            [(t.sub_id, t.old, t.new)
+             for t in self.recorder.get_timeline().transitions
+             if t.field == tel_transition_recorder.TRANSITION_CALL_STATE],
+            [(1, None, TELEPHONY_STATE_OFFHOOK),
+             (1, TELEPHONY_STATE_OFFHOOK, TELEPHONY_STATE_IDLE)])
+
+    def test_tracking_failure(self):
+        log = mock.Mock()
+        self.ad.transition_recorder = self.recorder
+        self.ad.droid.subscriptionGetAllSubInfoList.side_effect = Exception(
+            "no sl4a")
+        self.assertFalse(
+            tel_transition_recorder.start_transition_tracking(log, self.ad))
+        self.assertTrue(log.error.called)
+        self.assertFalse(self.recorder.tracking)
+
+    def test_snapshot_values(self):
+        results = {rpc: False for _, rpc in tel_state_utils.DEVICE_FIELDS}
+        results.update({rpc: RAT_LTE
+                        for _, rpc in tel_state_utils.SUBSCRIPTION_FIELDS})
+        results["connectivityCheckAirplaneMode"] = Exception("no rpc")
+        results["subscriptionGetDefaultSubId"] = 1
+        droid = mock.Mock(state_changing_rpc_count=0)
+        droid.rpc_batch = lambda calls: [results[m] for m, _ in calls]
+        self.ad.droid = droid
+        self.ad.telephony_state = None
+        self.ad.transition_recorder = self.recorder
+        tel_state_utils.get_telephony_state(self.ad, 1)
+        fields = [(t.sub_id, t.field)
+                  for t in self.recorder.get_timeline().transitions]
+        # The values that could not be read are not recorded.
+        self.assertNotIn((None, "airplane_mode"), fields)
+        self.assertIn((None, "wfc_mode"), fields)
+        self.assertIn((1, "voice_rat"), fields)
+
+    def test_transition_time(self):
+        for timestamp, field, value in (
+                (10, "wifi_enabled", True),
+                (11, "wifi_connected", True),
+                (20, "wifi_enabled", False),
+                (21, "data_connection_state", DATA_STATE_DISCONNECTED),
+                (23.5, "data_connection_state", DATA_STATE_CONNECTED),
+                (30, "wifi_enabled", True),
+                (40, "wifi_enabled", False),
+                (41, "data_connection_state", DATA_STATE_DISCONNECTED),
+                (42, "data_connection_state", DATA_STATE_CONNECTED)):
+            self.recorder.record(field, value, 1, timestamp)
+        timeline = self.recorder.get_timeline()
+        self.assertEqual(timeline.get_transition_time(
+            "wifi_enabled", False, "data_connection_state",
+            DATA_STATE_CONNECTED), 3.5)
+        self.assertEqual(timeline.get_transition_time(
+            "wifi_enabled", False, "data_connection_state",
+            DATA_STATE_CONNECTED, begin_time=30), 2)
+        self.assertEqual(
+            timeline.find("wifi_enabled", ANY, begin_time=25).time, 30)
+        self.assertIsNone(timeline.get_transition_time(
+            "wifi_enabled", True, "wifi_connected", False))
+
+    def test_write_and_read(self):
+        self.recorder.record("airplane_mode", True, timestamp=1)
+        self.recorder.record("service_state", "POWER_OFF", 2, timestamp=2)
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = os.path.join(tmp_dir, "transitions.json")
+        self.recorder.get_timeline().write(path)
+        timeline = tel_transition_recorder.read_transition_timeline(path)
+        self.assertEqual(timeline.serial, "1234")
+        self.assertEqual(timeline.transitions,
+                         self.recorder.get_timeline().transitions)
+        self.assertEqual(timeline.get_transition_time(
+            "airplane_mode", True, "service_state", "POWER_OFF"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
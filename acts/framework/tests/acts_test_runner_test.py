@@ -16,14 +16,20 @@
 
 
 
+import json
 import mock
+import os
 import shutil
+import sys
 import tempfile
 import unittest
 
+from acts import history
 from acts import keys
+from acts import records
 from acts import signals
 from acts import test_runner
+import acts_android_device_test
 import mock_controller
 
 
@@ -165,6 +171,158 @@ class ActsTestRunnerTest(unittest.TestCase):
         self.assertEqual(results["Executed"], 2)
         self.assertEqual(results["Passed"], 2)
 
+    def test_run_timeline(self):
+        """Verifies that a test run writes a timeline covering controller
+        creation and test phases.
+        """
+        mock_test_config = dict(self.base_mock_test_config)
+        tb_key = keys.Config.key_testbed.value
+        mock_ctrlr_config_name = mock_controller.ACTS_CONTROLLER_CONFIG_NAME
+        my_config = [{"serial": "xxxx", "magic": "Magic1"}]
+        mock_test_config[tb_key][mock_ctrlr_config_name] = my_config
+        tr = test_runner.TestRunner(mock_test_config,
+                                    [('IntegrationTest', None)])
+        tr.run()
+        tr.stop()
+        with open(os.path.join(tr.log_path, "timeline.json"), 'r') as f:
+            events = json.load(f)["traceEvents"]
+        names = [e["name"] for e in events]
+        for name in ("create mock_controller", "destroy mock_controller",
+                     "IntegrationTest", "setup_class", "test_hello_world",
+                     "setup_test", "test", "teardown_test", "on_pass"):
+            self.assertTrue(name in names, name)
+        record = tr.results.passed[0]
+        self.assertTrue(record.phases["test"] >= 0)
+
+    def test_resume(self):
+        """Verifies that a resumed test run only executes the tests that did
+        not reach a terminal result, and merges the previous results.
+        """
+        test_dir = self._write_test_script("ResumeTest", "\n".join([
+            "from acts import base_test",
+            "class ResumeTest(base_test.BaseTestClass):",
+            "    def test_a(self):",
+            "        raise Exception('Should not be executed again.')",
+            "    def test_b(self):",
+            "        pass",
+            "    def test_c(self):",
+            "        pass",
+            ""]))
+        previous_dir = os.path.join(self.tmp_dir, "previous")
+        os.mkdir(previous_dir)
+        stream = records.TestResultStream(
+            os.path.join(previous_dir, test_runner.RESULTS_STREAM_FILE_NAME))
+        for test_name, result in (("test_a", "PASS"), ("test_b", "UNKNOWN")):
+            record = records.TestResultRecord(test_name, "ResumeTest")
+            record.test_begin()
+            record._test_end(result, None)
+            stream.add_record(record)
+        stream.close()
+        mock_test_config = dict(self.base_mock_test_config)
+        mock_test_config["testpaths"] = [test_dir]
+        mock_test_config[keys.Config.ikey_resume_log_path.value] = (
+            previous_dir)
+        tr = test_runner.TestRunner(mock_test_config, [("ResumeTest", None)])
+        self.assertEqual(tr.completed_tests, {"ResumeTest": {"test_a": "PASS"}})
+        tr.run()
+        tr.stop()
+        results = tr.results.summary_dict()
+        self.assertEqual(results["Requested"], 3)
+        self.assertEqual(results["Executed"], 3)
+        self.assertEqual(results["Passed"], 3)
+        summary_path = os.path.join(tr.log_path, "test_run_summary.json")
+        with open(summary_path, 'r') as f:
+            self.assertEqual(json.load(f)["Summary"]["Passed"], 3)
+
+    def test_retry_flaky_test(self):
+        """Verifies that a failed test known to be flaky is retried once and
+        the retry's result replaces the failure.
+        """
+        test_dir = self._write_test_script("FlakyTest", "\n".join([
+            "from acts import asserts",
+            "from acts import base_test",
+            "calls = []",
+            "class FlakyTest(base_test.BaseTestClass):",
+            "    def test_flaky(self):",
+            "        calls.append(1)",
+            "        asserts.assert_true(len(calls) > 1, 'First call fails.')",
+            ""]))
+        mock_test_config = dict(self.base_mock_test_config)
+        mock_test_config["testpaths"] = [test_dir]
+        tr = test_runner.TestRunner(mock_test_config, [("FlakyTest", None)])
+        past = []
+        for result in ("PASS", "FAIL"):
+            record = records.TestResultRecord("test_flaky", "FlakyTest")
+            record.test_begin()
+            record._test_end(result, None)
+            past.append(record)
+        tr.history.add_records("SampleTestBed", past)
+        tr.run()
+        tr.stop()
+        results = tr.results.summary_dict()
+        self.assertEqual(results["Executed"], 1)
+        self.assertEqual(results["Passed"], 1)
+        summary_path = os.path.join(tr.log_path, "test_run_summary.json")
+        with open(summary_path, 'r') as f:
+            self.assertEqual(json.load(f)["Summary"]["Passed"], 1)
+        path = os.path.join(self.tmp_dir, history.HISTORY_FILE_NAME)
+        with history.TestHistory(path) as test_history:
+            # Both the failure and the retry are kept in history.
+            self.assertEqual(len(test_history.get_durations("test_flaky")), 4)
+
+    def test_resume_no_results(self):
+        mock_test_config = dict(self.base_mock_test_config)
+        mock_test_config[keys.Config.ikey_resume_log_path.value] = (
+            self.tmp_dir)
+        with self.assertRaisesRegexp(test_runner.USERError,
+                                     "No test results to resume from"):
+            test_runner.TestRunner(mock_test_config, self.mock_run_list)
+
+    def _run_twice_reusing_controllers(self):
+        mock_test_config = dict(self.base_mock_test_config)
+        tb_key = keys.Config.key_testbed.value
+        mock_ctrlr_config_name = mock_controller.ACTS_CONTROLLER_CONFIG_NAME
+        my_config = [{"serial": "xxxx", "magic": "Magic1"}]
+        mock_test_config[tb_key][mock_ctrlr_config_name] = my_config
+        tr = test_runner.TestRunner(mock_test_config,
+                                    [('IntegrationTest', None),
+                                     ('IntegrationTest', None)],
+                                    reuse_controllers=True)
+        with mock.patch.object(mock_controller, "create",
+                               wraps=mock_controller.create) as create:
+            with mock.patch.object(mock_controller, "destroy") as destroy:
+                tr.run()
+                tr.run()
+                self.assertTrue(tr.controller_registry)
+                destroy_calls_before_stop = destroy.call_count
+                tr.stop()
+                self.assertFalse(tr.controller_registry)
+                self.assertFalse(tr.controller_destructors)
+        results = tr.results.summary_dict()
+        self.assertEqual(results["Passed"], 4)
+        return create.call_count, destroy_calls_before_stop
+
+    def test_run_twice_reuse_controllers(self):
+        """Verifies that controllers are created once and shared by all test
+        classes and iterations when reusing controllers.
+        """
+        create_count, destroy_count = self._run_twice_reusing_controllers()
+        self.assertEqual(create_count, 1)
+        self.assertEqual(destroy_count, 0)
+
+    def test_run_twice_reuse_controllers_failed_health_check(self):
+        """Verifies that controllers failing their health check between
+        iterations are re-created.
+        """
+        mock_controller.health_check = lambda objs: False
+        try:
+            create_count, destroy_count = (
+                self._run_twice_reusing_controllers())
+        finally:
+            del mock_controller.health_check
+        self.assertEqual(create_count, 2)
+        self.assertEqual(destroy_count, 1)
+
     @mock.patch('acts.controllers.adb.AdbProxy',
                 return_value=acts_android_device_test.MockAdbProxy(1))
     @mock.patch('acts.controllers.android_device.list_adb_devices',
@@ -200,6 +358,58 @@ class ActsTestRunnerTest(unittest.TestCase):
         self.assertEqual(results["Executed"], 2)
         self.assertEqual(results["Passed"], 2)
 
+    def _write_test_script(self, name, content):
+        test_dir = os.path.join(self.tmp_dir, "tests")
+        if not os.path.exists(test_dir):
+            os.mkdir(test_dir)
+        with open(os.path.join(test_dir, name + ".py"), 'w') as f:
+            f.write(content)
+        self.addCleanup(sys.modules.pop, name, None)
+        return test_dir
+
+    def test_import_test_modules_lazy(self):
+        """Verifies that only the test scripts defining test classes on the
+        run list are imported.
+        """
+        self._write_test_script("LazyOneTest",
+                                "class LazyOneTest(object):\n    pass\n")
+        test_dir = self._write_test_script("LazyTwoTest",
+                                           "raise Exception('imported')\n"
+                                           "class LazyTwoTest(object):\n"
+                                           "    pass\n")
+        tr = test_runner.TestRunner(self.base_mock_test_config,
+                                    [("LazyOneTest", None)])
+        test_classes = tr.import_test_modules([test_dir])
+        self.assertEqual(list(test_classes.keys()), ["LazyOneTest"])
+        self.assertFalse("LazyTwoTest" in sys.modules)
+        index_path = os.path.join(self.tmp_dir,
+                                  test_runner.TEST_INDEX_FILE_NAME)
+        self.assertTrue(os.path.exists(index_path))
+
+    def test_import_test_modules_cached_index(self):
+        test_dir = self._write_test_script(
+            "CachedTest", "class CachedTest(object):\n    pass\n")
+        tr = test_runner.TestRunner(self.base_mock_test_config,
+                                    [("CachedTest", None)])
+        tr.import_test_modules([test_dir])
+        with mock.patch.object(test_runner, "_scan_test_classes") as scan:
+            test_classes = tr.import_test_modules([test_dir])
+            self.assertFalse(scan.called)
+        self.assertTrue("CachedTest" in test_classes)
+
+    def test_import_test_modules_not_in_index(self):
+        """Verifies that a test class imported into a test script, instead of
+        being defined there, is still found.
+        """
+        self._write_test_script("ReexportedBase",
+                                "class ReexportedTest(object):\n    pass\n")
+        test_dir = self._write_test_script(
+            "reexport_test", "from ReexportedBase import ReexportedTest\n")
+        tr = test_runner.TestRunner(self.base_mock_test_config,
+                                    [("ReexportedTest", None)])
+        test_classes = tr.import_test_modules([test_dir])
+        self.assertTrue("ReexportedTest" in test_classes)
+
     def test_verify_controller_module(self):
         test_runner.TestRunner.verify_controller_module(mock_controller)
 
@@ -17,10 +17,24 @@
 import sys
 import unittest
 
+import acts_act_test
 import acts_adb_test
 import acts_android_device_test
 import acts_base_class_test
+import acts_event_dispatcher_test
+import acts_history_test
+import acts_logger_test
+import acts_monsoon_test
 import acts_records_test
+import acts_tel_call_kpi_test
+import acts_tel_conference_utils_test
+import acts_tel_lookup_tables_test
+import acts_tel_setup_planner_test
+import acts_tel_transition_recorder_test
+import acts_tel_message_engine_test
+import acts_tel_state_utils_test
+import acts_tel_subscription_utils_test
+import acts_tel_task_executor_test
 import acts_test_runner_test
 
 def compile_suite():
@@ -29,7 +43,21 @@ def compile_suite():
         acts_base_class_test.ActsBaseClassTest,
         acts_test_runner_test.ActsTestRunnerTest,
         acts_android_device_test.ActsAndroidDeviceTest,
-        acts_records_test.ActsRecordsTest
+        acts_records_test.ActsRecordsTest,
+        acts_monsoon_test.ActsMonsoonTest,
+        acts_act_test.ActsActTest,
+        acts_history_test.ActsHistoryTest,
+        acts_logger_test.ActsLoggerTest,
+        acts_event_dispatcher_test.ActsEventDispatcherTest,
+        acts_tel_task_executor_test.ActsTelTaskExecutorTest,
+        acts_tel_call_kpi_test.ActsTelCallKpiTest,
+        acts_tel_conference_utils_test.ActsTelConferenceUtilsTest,
+        acts_tel_lookup_tables_test.ActsTelLookupTablesTest,
+        acts_tel_setup_planner_test.ActsTelSetupPlannerTest,
+        acts_tel_transition_recorder_test.ActsTelTransitionRecorderTest,
+        acts_tel_message_engine_test.ActsTelMessageEngineTest,
+        acts_tel_state_utils_test.ActsTelStateUtilsTest,
+        acts_tel_subscription_utils_test.ActsTelSubscriptionUtilsTest
     ]
 
     loader = unittest.TestLoader()
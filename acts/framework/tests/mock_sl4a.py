@@ -0,0 +1,69 @@
+#!/usr/bin/env python3.4
+#
+#   Copyright 2016 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+# Fakes of an sl4a client and its event dispatcher, shared by the unit tests
+# of the event driven utils.
+
+import queue
+import time
+
+from acts.controllers.event_dispatcher import EventDispatcher
+
+
+class FakeDroid(object):
+    """An sl4a client whose events are posted by the test."""
+
+    def __init__(self):
+        self.uid = 1
+        self.events = queue.Queue()
+
+    def eventWait(self, timeout):
+        try:
+            return self.events.get(timeout=0.05)
+        except queue.Empty:
+            return None
+
+    def post(self, name, data=None):
+        self.events.put({"name": name, "data": data, "time": time.time()})
+
+    def close(self):
+        pass
+
+
+def stop_event_dispatcher(ed):
+    """Stops an event dispatcher and waits for its polling thread to end,
+    which clean_up does not do.
+    """
+    ed.started = False
+    ed.poller.result()
+    ed.executor.shutdown()
+
+
+def start_event_dispatcher(test_case, droid):
+    """Starts an event dispatcher on a fake droid, stopped when the test
+    case ends.
+
+    Args:
+        test_case: The unittest.TestCase the dispatcher is used by.
+        droid: A FakeDroid object.
+
+    Returns:
+        The started EventDispatcher object.
+    """
+    ed = EventDispatcher(droid)
+    ed.start()
+    test_case.addCleanup(stop_event_dispatcher, ed)
+    return ed
@@ -30,12 +30,12 @@ from acts.test_utils.tel.tel_defines import NETWORK_SERVICE_VOICE
 from acts.test_utils.tel.tel_defines import WAIT_TIME_IN_CALL_FOR_IMS
 from acts.test_utils.tel.tel_defines import WFC_MODE_WIFI_PREFERRED
 from acts.test_utils.tel.tel_lookup_tables import is_rat_svd_capable
+from acts.test_utils.tel.tel_setup_planner import setup_phones
 from acts.test_utils.tel.tel_test_utils import WifiUtils
 from acts.test_utils.tel.tel_test_utils import call_setup_teardown
 from acts.test_utils.tel.tel_test_utils import ensure_phones_default_state
 from acts.test_utils.tel.tel_test_utils import get_network_rat
 from acts.test_utils.tel.tel_test_utils import hangup_call
-from acts.test_utils.tel.tel_test_utils import multithread_func
 from acts.test_utils.tel.tel_test_utils import sms_send_receive_verify
 from acts.test_utils.tel.tel_test_utils import verify_http_connection
 from acts.test_utils.tel.tel_test_utils import wait_for_cell_data_connection
@@ -86,7 +86,7 @@ class TelLiveSmokeTest(TelephonyBaseTest):
             ensure_phones_default_state(self.log, ads)
             tasks = [(phone_setup_volte, (self.log, ads[0])),
                      (phone_setup_volte, (self.log, ads[1]))]
-            if not multithread_func(self.log, tasks):
+            if not setup_phones(self.log, tasks):
                 self.log.error("Phone Failed to Set Up VoLTE.")
                 return False
 
@@ -156,7 +156,7 @@ class TelLiveSmokeTest(TelephonyBaseTest):
             ensure_phones_default_state(self.log, ads)
             tasks = [(phone_setup_csfb, (self.log, ads[0])),
                      (phone_setup_csfb, (self.log, ads[1]))]
-            if not multithread_func(self.log, tasks):
+            if not setup_phones(self.log, tasks):
                 self.log.error("Phone Failed to Set Up CSFB_3G.")
                 return False
 
@@ -231,7 +231,7 @@ class TelLiveSmokeTest(TelephonyBaseTest):
             ensure_phones_default_state(self.log, ads)
             tasks = [(phone_setup_voice_3g, (self.log, ads[0])),
                      (phone_setup_voice_3g, (self.log, ads[1]))]
-            if not multithread_func(self.log, tasks):
+            if not setup_phones(self.log, tasks):
                 self.log.error("Phone Failed to Set Up 3G.")
                 return False
             self.log.info("1. SMS in 3G idle.")
@@ -307,7 +307,7 @@ class TelLiveSmokeTest(TelephonyBaseTest):
                      (phone_setup_iwlan,
                       (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
                        self.wifi_network_ssid, self.wifi_network_pass))]
-            if not multithread_func(self.log, tasks):
+            if not setup_phones(self.log, tasks):
                 self.log.error("Phone Failed to Set Up WiFI Calling.")
                 return False
 
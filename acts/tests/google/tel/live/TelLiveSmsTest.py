@@ -28,12 +28,18 @@ from acts.test_utils.tel.tel_defines import RAT_3G
 from acts.test_utils.tel.tel_defines import VT_STATE_BIDIRECTIONAL
 from acts.test_utils.tel.tel_defines import WAIT_TIME_ANDROID_STATE_SETTLING
 from acts.test_utils.tel.tel_defines import WFC_MODE_WIFI_PREFERRED
+from acts.test_utils.tel.tel_message_engine import MessageEngine
+from acts.test_utils.tel.tel_setup_planner import setup_phones
+from acts.test_utils.tel.tel_subscription_utils import \
+    get_incoming_message_sub_id
+from acts.test_utils.tel.tel_subscription_utils import \
+    get_outgoing_message_sub_id
+from acts.test_utils.tel.tel_test_utils import check_phone_number_match
 from acts.test_utils.tel.tel_test_utils import call_setup_teardown
 from acts.test_utils.tel.tel_test_utils import \
     ensure_network_generation_for_subscription
 from acts.test_utils.tel.tel_test_utils import ensure_network_generation
 from acts.test_utils.tel.tel_test_utils import mms_send_receive_verify
-from acts.test_utils.tel.tel_test_utils import multithread_func
 from acts.test_utils.tel.tel_test_utils import set_call_state_listen_level
 from acts.test_utils.tel.tel_test_utils import setup_sim
 from acts.test_utils.tel.tel_test_utils import sms_send_receive_verify
@@ -57,6 +63,14 @@ from acts.utils import load_config
 from acts.utils import rand_ascii_str
 
 
+# Lengths of the messages sent by the tests: a short message, a message that
+# fills one SMS, and a message sent in two parts.
+SMS_MESSAGE_LENGTHS = (50, 160, 180)
+
+# Default number of messages sent each way by the throughput test.
+SMS_THROUGHPUT_MESSAGE_COUNT = 100
+
+
 class TelLiveSmsTest(TelephonyBaseTest):
     def __init__(self, controllers):
         TelephonyBaseTest.__init__(self, controllers)
@@ -84,6 +98,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
                       "test_sms_mt_in_call_iwlan",
                       "test_sms_mo_in_call_vt",
                       "test_sms_mt_in_call_vt",
+                      "test_sms_throughput_general",
                     )
         # The path for "sim config file" should be set
         # in "testbed.config" entry "sim_conf_file".
@@ -104,8 +119,9 @@ class TelLiveSmsTest(TelephonyBaseTest):
         """
 
         sms_params = [(ads[0], ads[1])]
-        message_arrays = [[rand_ascii_str(50)], [rand_ascii_str(160)],
-                          [rand_ascii_str(180)]]
+        # All messages are sent at once, without waiting for each other.
+        message_arrays = [[rand_ascii_str(length)
+                           for length in SMS_MESSAGE_LENGTHS]]
 
         for outer_param in sms_params:
             outer_param = (self.log, ) + outer_param
@@ -202,7 +218,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_general, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -224,7 +240,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_general, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -246,7 +262,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_2g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -268,7 +284,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_2g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -291,7 +307,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -314,7 +330,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -386,7 +402,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_volte,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -420,7 +436,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_volte,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -458,7 +474,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -483,7 +499,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -508,7 +524,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_csfb, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -546,7 +562,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_csfb, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -584,7 +600,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -622,7 +638,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -660,7 +676,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_csfb, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -698,7 +714,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_csfb, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -736,7 +752,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -761,7 +777,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -787,7 +803,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -822,7 +838,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -852,7 +868,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -884,7 +900,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -921,7 +937,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_csfb, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -949,7 +965,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_csfb, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -976,7 +992,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_2g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1014,7 +1030,7 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_2g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1033,4 +1049,35 @@ class TelLiveSmsTest(TelephonyBaseTest):
 
         return True
 
+    @TelephonyBaseTest.tel_test_wrap
+    def test_sms_throughput_general(self):
+        """Test SMS throughput between two phones, in both directions at once.
+
+        Airplane mode is off.
+        Send "sms_throughput_message_count" SMS from PhoneA to PhoneB, and as
+        many from PhoneB to PhoneA, keeping several in flight on each phone.
+        Verify all messages are received and correct.
+
+        Returns:
+            True if success.
+            False if failed.
+        """
+        ads = self.android_devices
+
+        tasks = [(phone_setup_voice_general, (self.log, ads[0])),
+                 (phone_setup_voice_general, (self.log, ads[1]))]
+        if not setup_phones(self.log, tasks):
+            self.log.error("Phone Failed to Set Up Properly.")
+            return False
+
+        count = self.user_params.get("sms_throughput_message_count",
+                                     SMS_THROUGHPUT_MESSAGE_COUNT)
+        engine = MessageEngine(self.log, check_phone_number_match)
+        for ad_tx, ad_rx in ((ads[0], ads[1]), (ads[1], ads[0])):
+            message_array = [rand_ascii_str(SMS_MESSAGE_LENGTHS[
+                i % len(SMS_MESSAGE_LENGTHS)]) for i in range(count)]
+            engine.add_flow(ad_tx, ad_rx, get_outgoing_message_sub_id(ad_tx),
+                            get_incoming_message_sub_id(ad_rx), message_array)
+        return engine.run()
+
     """ Tests End """
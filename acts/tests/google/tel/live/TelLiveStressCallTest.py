@@ -21,6 +21,7 @@ import time
 from acts.base_test import BaseTestClass
 from queue import Empty
 from acts.test_utils.tel import tel_defines
+from acts.test_utils.tel.tel_call_kpi import write_call_kpi_report
 from acts.test_utils.tel.tel_test_utils import initiate_call
 from acts.test_utils.tel.tel_test_utils import hangup_call
 from acts.test_utils.tel.tel_test_utils import ensure_phone_default_state
@@ -45,6 +46,9 @@ class TelLiveStressCallTest(BaseTestClass):
         self.phone_call_iteration = self.user_params["phone_call_iteration"]
         return True
 
+    def teardown_class(self):
+        write_call_kpi_report(self.log, self.log_path, self.TAG)
+
     def setup_test(self):
         # try removing lock
         self.android_devices[0].droid.wakeLockAcquireBright()
@@ -18,8 +18,8 @@
 """
 from acts.test_utils.tel.TelephonyBaseTest import TelephonyBaseTest
 from acts.test_utils.tel.tel_defines import VT_STATE_BIDIRECTIONAL
+from acts.test_utils.tel.tel_setup_planner import setup_phones
 from acts.test_utils.tel.tel_test_utils import hangup_call
-from acts.test_utils.tel.tel_test_utils import multithread_func
 from acts.test_utils.tel.tel_test_utils import verify_http_connection
 from acts.test_utils.tel.tel_video_utils import \
     is_phone_in_call_video_bidirectional
@@ -63,7 +63,7 @@ class TelLiveVideoDataTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
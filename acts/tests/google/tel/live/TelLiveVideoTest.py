@@ -42,10 +42,10 @@ from acts.test_utils.tel.tel_defines import EVENT_VIDEO_SESSION_EVENT
 from acts.test_utils.tel.tel_defines import EventTelecomVideoCallSessionEvent
 from acts.test_utils.tel.tel_defines import SESSION_EVENT_RX_PAUSE
 from acts.test_utils.tel.tel_defines import SESSION_EVENT_RX_RESUME
+from acts.test_utils.tel.tel_setup_planner import setup_phones
 from acts.test_utils.tel.tel_test_utils import call_setup_teardown
 from acts.test_utils.tel.tel_test_utils import disconnect_call_by_id
 from acts.test_utils.tel.tel_test_utils import hangup_call
-from acts.test_utils.tel.tel_test_utils import multithread_func
 from acts.test_utils.tel.tel_test_utils import num_active_calls
 from acts.test_utils.tel.tel_test_utils import verify_http_connection
 from acts.test_utils.tel.tel_test_utils import verify_incall_state
@@ -144,7 +144,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -176,7 +176,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -210,7 +210,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -253,7 +253,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -298,7 +298,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -352,7 +352,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -449,7 +449,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         if not video_call_setup_teardown(
@@ -481,7 +481,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         if not call_setup_teardown(self.log, ads[0], ads[1], None,
@@ -546,7 +546,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         if not call_setup_teardown(self.log, ads[0], ads[1], None,
@@ -575,7 +575,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         if not video_call_setup_teardown(
@@ -690,7 +690,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -715,7 +715,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads = self.android_devices
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -769,7 +769,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_video, (self.log, ads[1])), (phone_setup_volte,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -837,7 +837,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_video, (self.log, ads[1])), (phone_setup_volte,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -907,7 +907,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_volte, (self.log, ads[1])), (phone_setup_video,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -980,7 +980,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_volte, (self.log, ads[1])), (phone_setup_video,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1055,7 +1055,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_video, (self.log, ads[1])), (phone_setup_volte,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1164,7 +1164,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_video, (self.log, ads[1])), (phone_setup_volte,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1308,7 +1308,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_video, (self.log, ads[1])), (phone_setup_video,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1381,7 +1381,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_video, (self.log, ads[1])), (phone_setup_video,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1466,7 +1466,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_video, (self.log, ads[1])), (phone_setup_video,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1548,7 +1548,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_video, (self.log, ads[1])), (phone_setup_video,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1787,7 +1787,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_volte, (self.log, ads[1])), (phone_setup_video,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         self.log.info("Step1: Initiate VoLTE Call PhoneA->PhoneB.")
@@ -1881,7 +1881,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_volte, (self.log, ads[1])), (phone_setup_video,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         self.log.info("Step1: Initiate VoLTE Call PhoneA->PhoneB.")
@@ -1977,7 +1977,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_video, (self.log, ads[1])), (phone_setup_volte,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2125,7 +2125,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_video, (self.log, ads[1])), (phone_setup_volte,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2269,7 +2269,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_volte, (self.log, ads[1])), (phone_setup_video,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2396,7 +2396,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         tasks = [(phone_setup_video, (self.log, ads[0])),
                  (phone_setup_volte, (self.log, ads[1])), (phone_setup_video,
                                                            (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2498,7 +2498,7 @@ class TelLiveVideoTest(TelephonyBaseTest):
         ads[0], ads[1] = ads[1], ads[0]
         tasks = [(phone_setup_video, (self.log, ads[0])), (phone_setup_video,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -19,45 +19,55 @@
 
 import time
 from acts.test_utils.tel.TelephonyBaseTest import TelephonyBaseTest
-from acts.test_utils.tel.tel_defines import CALL_CAPABILITY_MANAGE_CONFERENCE
+from acts.test_utils.tel.tel_conference_utils import \
+    CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT
+from acts.test_utils.tel.tel_conference_utils import \
+    CONFERENCE_DROP_FIRST_CALL_FROM_HOST
+from acts.test_utils.tel.tel_conference_utils import \
+    CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT
+from acts.test_utils.tel.tel_conference_utils import \
+    CONFERENCE_DROP_HELD_FROM_PARTICIPANT
+from acts.test_utils.tel.tel_conference_utils import \
+    CONFERENCE_DROP_SECOND_CALL_FROM_HOST
+from acts.test_utils.tel.tel_conference_utils import \
+    CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT
+from acts.test_utils.tel.tel_conference_utils import CONFERENCE_MERGE_CEP
+from acts.test_utils.tel.tel_conference_utils import CONFERENCE_MERGE_CS
+from acts.test_utils.tel.tel_conference_utils import CONFERENCE_MERGE_IMS
+from acts.test_utils.tel.tel_conference_utils import CONFERENCE_MO_MO
+from acts.test_utils.tel.tel_conference_utils import CONFERENCE_MO_MT
+from acts.test_utils.tel.tel_conference_utils import CONFERENCE_MT_MT
+from acts.test_utils.tel.tel_conference_utils import ConferenceScenario
+from acts.test_utils.tel.tel_conference_utils import get_wfc_conference_rat
+from acts.test_utils.tel.tel_conference_utils import run_conference_scenario
+from acts.test_utils.tel.tel_conference_utils import \
+    setup_and_swap_conference_calls
+from acts.test_utils.tel.tel_conference_utils import setup_conference_calls
 from acts.test_utils.tel.tel_defines import CALL_CAPABILITY_MERGE_CONFERENCE
 from acts.test_utils.tel.tel_defines import CALL_CAPABILITY_SWAP_CONFERENCE
-from acts.test_utils.tel.tel_defines import CALL_PROPERTY_CONFERENCE
 from acts.test_utils.tel.tel_defines import CALL_STATE_ACTIVE
 from acts.test_utils.tel.tel_defines import CALL_STATE_HOLDING
 from acts.test_utils.tel.tel_defines import CARRIER_VZW
 from acts.test_utils.tel.tel_defines import GEN_3G
 from acts.test_utils.tel.tel_defines import RAT_3G
-from acts.test_utils.tel.tel_defines import PHONE_TYPE_CDMA
-from acts.test_utils.tel.tel_defines import PHONE_TYPE_GSM
 from acts.test_utils.tel.tel_defines import WAIT_TIME_ANDROID_STATE_SETTLING
 from acts.test_utils.tel.tel_defines import WAIT_TIME_IN_CALL
 from acts.test_utils.tel.tel_defines import WFC_MODE_WIFI_ONLY
 from acts.test_utils.tel.tel_defines import WFC_MODE_WIFI_PREFERRED
+from acts.test_utils.tel.tel_setup_planner import setup_phones
 from acts.test_utils.tel.tel_test_utils import call_reject
 from acts.test_utils.tel.tel_test_utils import call_setup_teardown
 from acts.test_utils.tel.tel_test_utils import \
     ensure_network_generation_for_subscription
-from acts.test_utils.tel.tel_test_utils import get_call_uri
 from acts.test_utils.tel.tel_test_utils import get_phone_number
-from acts.test_utils.tel.tel_test_utils import is_uri_equivalent
-from acts.test_utils.tel.tel_test_utils import multithread_func
 from acts.test_utils.tel.tel_test_utils import num_active_calls
 from acts.test_utils.tel.tel_test_utils import set_call_state_listen_level
 from acts.test_utils.tel.tel_test_utils import setup_sim
 from acts.test_utils.tel.tel_test_utils import verify_incall_state
 from acts.test_utils.tel.tel_test_utils import wait_and_answer_call
-from acts.test_utils.tel.tel_voice_utils import get_cep_conference_call_id
 from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_1x
-from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_2g
-from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_3g
-from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_csfb
-from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_iwlan
 from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_volte
 from acts.test_utils.tel.tel_voice_utils import is_phone_in_call_wcdma
-from acts.test_utils.tel.tel_voice_utils import phone_setup_voice_2g
-from acts.test_utils.tel.tel_voice_utils import phone_setup_voice_3g
-from acts.test_utils.tel.tel_voice_utils import phone_setup_csfb
 from acts.test_utils.tel.tel_voice_utils import phone_setup_iwlan
 from acts.test_utils.tel.tel_voice_utils import phone_setup_voice_general
 from acts.test_utils.tel.tel_voice_utils import phone_setup_volte
@@ -397,145 +407,25 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
 
     """ Private Test Utils """
 
-    def _three_phone_call_mo_add_mo(self, ads, phone_setups, verify_funcs):
-        """Use 3 phones to make MO calls.
-
-        Call from PhoneA to PhoneB, accept on PhoneB.
-        Call from PhoneA to PhoneC, accept on PhoneC.
-
-        Args:
-            ads: list of ad object.
-                The list should have three objects.
-            phone_setups: list of phone setup functions.
-                The list should have three objects.
-            verify_funcs: list of phone call verify functions.
-                The list should have three objects.
-
-        Returns:
-            If success, return 'call_AB' id in PhoneA.
-            if fail, return None.
+    def _get_wfc_rat(self, is_airplane_mode, wfc_mode):
+        """Gets the conference RAT of a phone in WiFi calling on the test
+        WiFi network.
         """
+        return get_wfc_conference_rat(is_airplane_mode, wfc_mode,
+                                      self.wifi_network_ssid,
+                                      self.wifi_network_pass)
 
-        class _CallException(Exception):
-            pass
-
-        try:
-            verify_func_a, verify_func_b, verify_func_c = verify_funcs
-            tasks = []
-            for ad, setup_func in zip(ads, phone_setups):
-                if setup_func is not None:
-                    tasks.append((setup_func, (self.log, ad)))
-            if tasks != [] and not multithread_func(self.log, tasks):
-                self.log.error("Phone Failed to Set Up Properly.")
-                raise _CallException("Setup failed.")
-            for ad in ads:
-                ad.droid.telecomCallClearCallList()
-                if num_active_calls(self.log, ad) != 0:
-                    self.log.error("Phone {} Call List is not empty."
-                                   .format(ad.serial))
-                    raise _CallException("Clear call list failed.")
-
-            self.log.info("Step1: Call From PhoneA to PhoneB.")
-            if not call_setup_teardown(self.log,
-                                       ads[0],
-                                       ads[1],
-                                       ad_hangup=None,
-                                       verify_caller_func=verify_func_a,
-                                       verify_callee_func=verify_func_b):
-                raise _CallException("PhoneA call PhoneB failed.")
-
-            calls = ads[0].droid.telecomCallGetCallIds()
-            self.log.info("Calls in PhoneA{}".format(calls))
-            if num_active_calls(self.log, ads[0]) != 1:
-                raise _CallException("Call list verify failed.")
-            call_ab_id = calls[0]
-
-            self.log.info("Step2: Call From PhoneA to PhoneC.")
-            if not call_setup_teardown(self.log,
-                                       ads[0],
-                                       ads[2],
-                                       ad_hangup=None,
-                                       verify_caller_func=verify_func_a,
-                                       verify_callee_func=verify_func_c):
-                raise _CallException("PhoneA call PhoneC failed.")
-            if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]],
-                                       True):
-                raise _CallException("Not All phones are in-call.")
-
-        except _CallException:
-            return None
-
-        return call_ab_id
-
-    def _three_phone_call_mo_add_mt(self, ads, phone_setups, verify_funcs):
-        """Use 3 phones to make MO call and MT call.
-
-        Call from PhoneA to PhoneB, accept on PhoneB.
-        Call from PhoneC to PhoneA, accept on PhoneA.
+    def _test_conference(self, scenario):
+        """Runs a conference scenario on PhoneA, PhoneB and PhoneC.
 
         Args:
-            ads: list of ad object.
-                The list should have three objects.
-            phone_setups: list of phone setup functions.
-                The list should have three objects.
-            verify_funcs: list of phone call verify functions.
-                The list should have three objects.
+            scenario: A ConferenceScenario object.
 
         Returns:
-            If success, return 'call_AB' id in PhoneA.
-            if fail, return None.
+            True if pass; False if fail.
         """
-
-        class _CallException(Exception):
-            pass
-
-        try:
-            verify_func_a, verify_func_b, verify_func_c = verify_funcs
-            tasks = []
-            for ad, setup_func in zip(ads, phone_setups):
-                if setup_func is not None:
-                    tasks.append((setup_func, (self.log, ad)))
-            if tasks != [] and not multithread_func(self.log, tasks):
-                self.log.error("Phone Failed to Set Up Properly.")
-                raise _CallException("Setup failed.")
-            for ad in ads:
-                ad.droid.telecomCallClearCallList()
-                if num_active_calls(self.log, ad) != 0:
-                    self.log.error("Phone {} Call List is not empty."
-                                   .format(ad.serial))
-                    raise _CallException("Clear call list failed.")
-
-            self.log.info("Step1: Call From PhoneA to PhoneB.")
-            if not call_setup_teardown(self.log,
-                                       ads[0],
-                                       ads[1],
-                                       ad_hangup=None,
-                                       verify_caller_func=verify_func_a,
-                                       verify_callee_func=verify_func_b):
-                raise _CallException("PhoneA call PhoneB failed.")
-
-            calls = ads[0].droid.telecomCallGetCallIds()
-            self.log.info("Calls in PhoneA{}".format(calls))
-            if num_active_calls(self.log, ads[0]) != 1:
-                raise _CallException("Call list verify failed.")
-            call_ab_id = calls[0]
-
-            self.log.info("Step2: Call From PhoneC to PhoneA.")
-            if not call_setup_teardown(self.log,
-                                       ads[2],
-                                       ads[0],
-                                       ad_hangup=None,
-                                       verify_caller_func=verify_func_c,
-                                       verify_callee_func=verify_func_a):
-                raise _CallException("PhoneA call PhoneC failed.")
-            if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]],
-                                       True):
-                raise _CallException("Not All phones are in-call.")
-
-        except _CallException:
-            return None
-
-        return call_ab_id
+        return run_conference_scenario(self.log, self.android_devices,
+                                        scenario)
 
     def _three_phone_call_mo_add_mt_reject(self, ads, verify_funcs, reject):
         """Use 3 phones to make MO call and MT call.
@@ -581,76 +471,6 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
 
         return True
 
-    def _three_phone_call_mt_add_mt(self, ads, phone_setups, verify_funcs):
-        """Use 3 phones to make MT call and MT call.
-
-        Call from PhoneB to PhoneA, accept on PhoneA.
-        Call from PhoneC to PhoneA, accept on PhoneA.
-
-        Args:
-            ads: list of ad object.
-                The list should have three objects.
-            phone_setups: list of phone setup functions.
-                The list should have three objects.
-            verify_funcs: list of phone call verify functions.
-                The list should have three objects.
-
-        Returns:
-            If success, return 'call_AB' id in PhoneA.
-            if fail, return None.
-        """
-
-        class _CallException(Exception):
-            pass
-
-        try:
-            verify_func_a, verify_func_b, verify_func_c = verify_funcs
-            tasks = []
-            for ad, setup_func in zip(ads, phone_setups):
-                if setup_func is not None:
-                    tasks.append((setup_func, (self.log, ad)))
-            if tasks != [] and not multithread_func(self.log, tasks):
-                self.log.error("Phone Failed to Set Up Properly.")
-                raise _CallException("Setup failed.")
-            for ad in ads:
-                ad.droid.telecomCallClearCallList()
-                if num_active_calls(self.log, ad) != 0:
-                    self.log.error("Phone {} Call List is not empty."
-                                   .format(ad.serial))
-                    raise _CallException("Clear call list failed.")
-
-            self.log.info("Step1: Call From PhoneB to PhoneA.")
-            if not call_setup_teardown(self.log,
-                                       ads[1],
-                                       ads[0],
-                                       ad_hangup=None,
-                                       verify_caller_func=verify_func_b,
-                                       verify_callee_func=verify_func_a):
-                raise _CallException("PhoneB call PhoneA failed.")
-
-            calls = ads[0].droid.telecomCallGetCallIds()
-            self.log.info("Calls in PhoneA{}".format(calls))
-            if num_active_calls(self.log, ads[0]) != 1:
-                raise _CallException("Call list verify failed.")
-            call_ab_id = calls[0]
-
-            self.log.info("Step2: Call From PhoneC to PhoneA.")
-            if not call_setup_teardown(self.log,
-                                       ads[2],
-                                       ads[0],
-                                       ad_hangup=None,
-                                       verify_caller_func=verify_func_c,
-                                       verify_callee_func=verify_func_a):
-                raise _CallException("PhoneA call PhoneC failed.")
-            if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]],
-                                       True):
-                raise _CallException("Not All phones are in-call.")
-
-        except _CallException:
-            return None
-
-        return call_ab_id
-
     def _test_1x_mo_mo_add(self):
         """Test multi call feature in 1x call.
 
@@ -664,16 +484,8 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         """
         ads = self.android_devices
 
-        # make sure PhoneA is CDMA phone before proceed.
-        if (ads[0].droid.telephonyGetPhoneType() != PHONE_TYPE_CDMA):
-            self.log.error("{} not CDMA phone, abort this 1x test.".format(ads[
-                0].serial))
-            return None, None, None
-
-        call_ab_id = self._three_phone_call_mo_add_mo(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_voice_3g, phone_setup_voice_general,
-             phone_setup_voice_general], [is_phone_in_call_1x, None, None])
+        scenario = ConferenceScenario("1x", "general", CONFERENCE_MO_MO)
+        call_ab_id = setup_conference_calls(self.log, ads, scenario)
         if call_ab_id is None:
             self.log.error("Failed to get call_ab_id")
             return None, None, None
@@ -705,16 +517,8 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         """
         ads = self.android_devices
 
-        # make sure PhoneA is CDMA phone before proceed.
-        if (ads[0].droid.telephonyGetPhoneType() != PHONE_TYPE_CDMA):
-            self.log.error("{} not CDMA phone, abort this 1x test.".format(ads[
-                0].serial))
-            return None, None, None
-
-        call_ab_id = self._three_phone_call_mo_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_voice_3g, phone_setup_voice_general,
-             phone_setup_voice_general], [is_phone_in_call_1x, None, None])
+        scenario = ConferenceScenario("1x", "general", CONFERENCE_MO_MT)
+        call_ab_id = setup_conference_calls(self.log, ads, scenario)
         if call_ab_id is None:
             self.log.error("Failed to get call_ab_id")
             return None, None, None
@@ -758,16 +562,8 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         """
         ads = self.android_devices
 
-        # make sure PhoneA is CDMA phone before proceed.
-        if (ads[0].droid.telephonyGetPhoneType() != PHONE_TYPE_CDMA):
-            self.log.error("{} not CDMA phone, abort this 1x test.".format(ads[
-                0].serial))
-            return None, None, None
-
-        call_ab_id = self._three_phone_call_mt_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_voice_3g, phone_setup_voice_general,
-             phone_setup_voice_general], [is_phone_in_call_1x, None, None])
+        scenario = ConferenceScenario("1x", "general", CONFERENCE_MT_MT)
+        call_ab_id = setup_conference_calls(self.log, ads, scenario)
         if call_ab_id is None:
             self.log.error("Failed to get call_ab_id")
             return None, None, None
@@ -931,5013 +727,1982 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
             return False
         return True
 
-    def _test_volte_mo_mo_add_volte_swap_x(self, num_swaps):
-        """Test swap feature in VoLTE call.
+    def _three_phone_hangup_call_verify_call_state(
+            self, ad_hangup, ad_verify, call_id, call_state, ads_active):
+        """Private Test utility for swap test.
 
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        Swap active call on PhoneA.(N times)
+        Hangup on 'ad_hangup'.
+        Verify 'call_id' on 'ad_verify' is in expected 'call_state'
+        Verify each ad in ads_active are 'in-call'.
 
         Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+            ad_hangup: android object to hangup call.
+            ad_verify: android object to verify call id state.
+            call_id: call id in 'ad_verify'.
+            call_state: expected state for 'call_id'.
+                'call_state' is either CALL_STATE_HOLDING or CALL_STATE_ACTIVE.
+            ads_active: list of android object.
+                Each one of them should be 'in-call' after 'hangup' operation.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
+            True if no error happened. Otherwise False.
 
         """
-        ads = self.android_devices
 
-        call_ab_id = self._three_phone_call_mo_add_mo(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_volte, phone_setup_volte, phone_setup_volte],
-            [is_phone_in_call_volte, is_phone_in_call_volte,
-             is_phone_in_call_volte])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+        self.log.info("Hangup at {}, verify call continues.".format(
+            ad_hangup.serial))
+        ad_hangup.droid.telecomEndCall()
+        time.sleep(WAIT_TIME_IN_CALL)
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        if ad_verify.droid.telecomCallGetCallState(call_id) != call_state:
+            self.log.error("Call_id:{}, state:{}, expected: {}".format(
+                call_id, ad_verify.droid.telecomCallGetCallState(
+                    call_id), call_state))
+            return False
+        # TODO: b/26296375 add voice check.
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        if not verify_incall_state(self.log, ads_active, True):
+            return False
+        if not verify_incall_state(self.log, [ad_hangup], False):
+            return False
 
-        return call_ab_id, call_ac_id
+        return True
 
-    def _test_volte_mo_mt_add_volte_swap_x(self, num_swaps):
-        """Test swap feature in VoLTE call.
+    """ Tests Begin """
 
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA. (N times)
+    @TelephonyBaseTest.tel_test_wrap
+    def test_wcdma_mo_mo_add_merge_drop(self):
+        """ Test Conf Call among three phones.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Call from PhoneA to PhoneB, accept on PhoneB.
+        Call from PhoneA to PhoneC, accept on PhoneC.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        call_ab_id = self._three_phone_call_mo_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_volte, phone_setup_volte, phone_setup_volte],
-            [is_phone_in_call_volte, is_phone_in_call_volte,
-             is_phone_in_call_volte])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+        return self._test_conference(ConferenceScenario(
+            "3g", "general", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+    @TelephonyBaseTest.tel_test_wrap
+    def test_wcdma_mt_mt_add_merge_drop(self):
+        """ Test Conf Call among three phones.
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        Call from PhoneB to PhoneA, accept on PhoneA.
+        Call from PhoneC to PhoneA, accept on PhoneA.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        return call_ab_id, call_ac_id
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "3g", "general", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-    def _test_volte_mt_mt_add_volte_swap_x(self, num_swaps):
-        """Test swap feature in VoLTE call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mo_mo_add_merge_drop_from_participant(self):
+        """ Test 1x Conf Call among three phones.
 
-        PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA. (N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. Call from DUT to PhoneB, accept on PhoneB.
+        3. Call from DUT to PhoneC, accept on PhoneC.
+        4. On DUT, merge to conference call.
+        5. End call PhoneC, verify call continues on DUT and PhoneB.
+        6. End call on PhoneB, verify call end on PhoneA.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. Merge Call succeed on DUT.
+        5. PhoneC drop call, DUT and PhoneB call continues.
+        6. PhoneB drop call, call also end on DUT.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
 
-        call_ab_id = self._three_phone_call_mt_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_volte, phone_setup_volte, phone_setup_volte],
-            [is_phone_in_call_volte, is_phone_in_call_volte,
-             is_phone_in_call_volte])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+        ads = self.android_devices
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mo_add()
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        self.log.info("Merge to Conf Call and verify Conf Call.")
+        if not self._test_1x_merge_conference(ads[0], [ads[1], ads[2]],
+                                              call_conf_id):
+            self.log.error("1x Conference merge failed.")
 
-        return call_ab_id, call_ac_id
+        self.log.info("End call on PhoneC, and end call on PhoneB.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
+                                                              ads[1])
 
-    def _test_volte_mo_mo_add_wcdma_swap_x(self, num_swaps):
-        """Test swap feature in VoLTE call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mo_mo_add_merge_drop_from_host(self):
+        """ Test 1x Conf Call among three phones.
 
-        PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
-        Swap active call on PhoneA.(N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. Call from DUT to PhoneB, accept on PhoneB.
+        3. Call from DUT to PhoneC, accept on PhoneC.
+        4. On DUT, merge to conference call.
+        5. End call on DUT, make sure all participants drop.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. Merge Call succeed on DUT.
+        5. Make sure DUT and all participants drop call.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
+
         ads = self.android_devices
 
-        # make sure PhoneB and PhoneC are GSM phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-                self.log.error(
-                    "{} not GSM phone, abort wcdma swap test.".format(
-                        ad.serial))
-                return None, None
-
-        call_ab_id = self._three_phone_call_mo_add_mo(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_volte, phone_setup_voice_3g, phone_setup_voice_3g],
-            [is_phone_in_call_volte, is_phone_in_call_wcdma,
-             is_phone_in_call_wcdma])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mo_add()
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        self.log.info("Merge to Conf Call and verify Conf Call.")
+        if not self._test_1x_merge_conference(ads[0], [ads[1], ads[2]],
+                                              call_conf_id):
+            self.log.error("1x Conference merge failed.")
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
-
-        return call_ab_id, call_ac_id
+        self.log.info("End call on PhoneC, and end call on PhoneB.")
+        return self._test_1x_conf_call_drop_from_host(ads[0], [ads[2], ads[1]])
 
-    def _test_volte_mo_mt_add_wcdma_swap_x(self, num_swaps):
-        """Test swap feature in VoLTE call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mo_mt_add_drop_active(self):
+        """ Test 1x MO+MT call among three phones.
 
-        PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. Call from DUT to PhoneB, accept on PhoneB.
+        3. Call from PhoneC to DUT, accept on DUT.
+        4. End call PhoneC, verify call continues on DUT and PhoneB.
+        5. End call on PhoneB, verify call end on PhoneA.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. PhoneC drop call, DUT and PhoneB call continues.
+        5. PhoneB drop call, call also end on DUT.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        # make sure PhoneB and PhoneC are GSM phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-                self.log.error(
-                    "{} not GSM phone, abort wcdma swap test.".format(
-                        ad.serial))
-                return None, None
-
-        call_ab_id = self._three_phone_call_mo_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_volte, phone_setup_voice_3g, phone_setup_voice_3g],
-            [is_phone_in_call_volte, is_phone_in_call_wcdma,
-             is_phone_in_call_wcdma])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
+            0)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
+            return False
 
-        return call_ab_id, call_ac_id
+        self.log.info("End call on PhoneC, and end call on PhoneB.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
+                                                              ads[1])
 
-    def _test_volte_mt_mt_add_wcdma_swap_x(self, num_swaps):
-        """Test swap feature in VoLTE call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mo_mt_add_swap_twice_drop_active(self):
+        """ Test 1x MO+MT call among three phones.
 
-        PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. DUT MO call to PhoneB, answer on PhoneB.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Swap active call on DUT.
+        6. Drop on PhoneC.
+        7. Drop on PhoneB.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. Swap call succeed.
+        5. Swap call succeed.
+        6. Call between DUT and PhoneB continues.
+        7. All participant call end.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        # make sure PhoneB and PhoneC are GSM phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-                self.log.error(
-                    "{} not GSM phone, abort wcdma swap test.".format(
-                        ad.serial))
-                return None, None
-
-        call_ab_id = self._three_phone_call_mt_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_volte, phone_setup_voice_3g, phone_setup_voice_3g],
-            [is_phone_in_call_volte, is_phone_in_call_wcdma,
-             is_phone_in_call_wcdma])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
+            2)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
+            return False
 
-        return call_ab_id, call_ac_id
+        self.log.info("End call on PhoneC, and end call on PhoneB.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
+                                                              ads[1])
 
-    def _test_volte_mo_mo_add_1x_swap_x(self, num_swaps):
-        """Test swap feature in VoLTE call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mo_mt_add_swap_once_drop_active(self):
+        """ Test 1x MO+MT call among three phones.
 
-        PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
-        Swap active call on PhoneA.(N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. DUT MO call to PhoneB, answer on PhoneB.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Drop on PhoneB.
+        6. Drop on PhoneC.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. Swap call succeed.
+        5. Call between DUT and PhoneC continues.
+        6. All participant call end.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        # make sure PhoneB and PhoneC are CDMA phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_CDMA):
-                self.log.error("{} not CDMA phone, abort 1x swap test.".format(
-                    ad.serial))
-                return None, None
-
-        call_ab_id = self._three_phone_call_mo_add_mo(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_volte, phone_setup_voice_3g, phone_setup_voice_3g],
-            [is_phone_in_call_volte, is_phone_in_call_1x, is_phone_in_call_1x])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
+            1)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
+            return False
 
-        return call_ab_id, call_ac_id
+        self.log.info("End call on PhoneB, and end call on PhoneC.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
+                                                              ads[2])
 
-    def _test_volte_mo_mt_add_1x_swap_x(self, num_swaps):
-        """Test swap feature in VoLTE call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mo_mt_add_drop_held(self):
+        """ Test 1x MO+MT call among three phones.
 
-        PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. Call from DUT to PhoneB, accept on PhoneB.
+        3. Call from PhoneC to DUT, accept on DUT.
+        4. End call PhoneB, verify call continues on DUT and PhoneC.
+        5. End call on PhoneC, verify call end on PhoneA.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. DUT drop call, PhoneC also end. Then DUT receive callback from PhoneB.
+        5. DUT drop call, call also end on PhoneB.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        # make sure PhoneB and PhoneC are CDMA phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_CDMA):
-                self.log.error("{} not CDMA phone, abort 1x swap test.".format(
-                    ad.serial))
-                return None, None
-
-        call_ab_id = self._three_phone_call_mo_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_volte, phone_setup_voice_3g, phone_setup_voice_3g],
-            [is_phone_in_call_volte, is_phone_in_call_1x, is_phone_in_call_1x])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
+            0)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
+            return False
 
-        return call_ab_id, call_ac_id
+        self.log.info("End call on PhoneB, and end call on PhoneC.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
+                                                              ads[2])
 
-    def _test_volte_mt_mt_add_1x_swap_x(self, num_swaps):
-        """Test swap feature in VoLTE call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mo_mt_add_swap_twice_drop_held(self):
+        """ Test 1x MO+MT call among three phones.
 
-        PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
-        PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. DUT MO call to PhoneB, answer on PhoneB.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Swap active call on DUT.
+        6. Drop on PhoneB.
+        7. Drop on PhoneC.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. Swap call succeed.
+        5. Swap call succeed.
+        6. Call between DUT and PhoneC continues.
+        7. All participant call end.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        # make sure PhoneB and PhoneC are CDMA phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_CDMA):
-                self.log.error("{} not CDMA phone, abort 1x swap test.".format(
-                    ad.serial))
-                return None, None
-
-        call_ab_id = self._three_phone_call_mt_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_volte, phone_setup_voice_3g, phone_setup_voice_3g],
-            [is_phone_in_call_volte, is_phone_in_call_1x, is_phone_in_call_1x])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
+            2)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
+            return False
 
-        return call_ab_id, call_ac_id
+        self.log.info("End call on PhoneB, and end call on PhoneC.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
+                                                              ads[2])
 
-    def _test_wcdma_mo_mo_add_swap_x(self, num_swaps):
-        """Test swap feature in WCDMA call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mo_mt_add_swap_once_drop_held(self):
+        """ Test 1x MO+MT call among three phones.
 
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA. (N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. DUT MO call to PhoneB, answer on PhoneB.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Drop on PhoneC.
+        6. Drop on PhoneB.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. Swap call succeed.
+        5. Call between DUT and PhoneB continues.
+        6. All participant call end.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        # make sure PhoneA is GSM phone before proceed.
-        if (ads[0].droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-            self.log.error("{} not GSM phone, abort wcdma swap test.".format(
-                ads[0].serial))
-            return None, None
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
+            1)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        call_ab_id = self._three_phone_call_mo_add_mo(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_voice_3g, phone_setup_voice_general,
-             phone_setup_voice_general], [is_phone_in_call_3g, None, None])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
+            return False
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
-
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
-
-        return call_ab_id, call_ac_id
+        self.log.info("End call on PhoneC, and end call on PhoneB.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
+                                                              ads[1])
 
-    def _test_wcdma_mt_mt_add_swap_x(self, num_swaps):
-        """Test swap feature in WCDMA call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mo_mt_add_drop_on_dut(self):
+        """ Test 1x MO+MT call among three phones.
 
-        PhoneB call PhoneA (WCDMA), accept on PhoneA.
-        PhoneC call PhoneA (WCDMA), accept on PhoneA.
-        Swap active call on PhoneA. (N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. Call from DUT to PhoneB, accept on PhoneB.
+        3. Call from PhoneC to DUT, accept on DUT.
+        4. End call on DUT.
+        5. End call on DUT.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. DUT drop call, PhoneC also end. Then DUT receive callback from PhoneB.
+        5. DUT drop call, call also end on PhoneB.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        # make sure PhoneA is GSM phone before proceed.
-        if (ads[0].droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-            self.log.error("{} not GSM phone, abort wcdma swap test.".format(
-                ads[0].serial))
-            return None, None
-
-        call_ab_id = self._three_phone_call_mt_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_voice_3g, phone_setup_voice_general,
-             phone_setup_voice_general], [is_phone_in_call_3g, None, None])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
+            0)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
+            return False
 
-        return call_ab_id, call_ac_id
+        self.log.info("End call on DUT, DUT should receive callback.")
+        return self._test_1x_multi_call_drop_from_host(ads[0], ads[2], ads[1])
 
-    def _test_wcdma_mo_mt_add_swap_x(self, num_swaps):
-        """Test swap feature in WCDMA call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mo_mt_add_swap_twice_drop_on_dut(self):
+        """ Test 1x MO+MT call among three phones.
 
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (WCDMA), accept on PhoneA.
-        Swap active call on PhoneA. (N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. DUT MO call to PhoneB, answer on PhoneB.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Swap active call on DUT.
+        6. Drop current call on DUT.
+        7. Drop current call on DUT.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. Swap call succeed.
+        5. Swap call succeed.
+        6. DUT drop call, PhoneC also end. Then DUT receive callback from PhoneB.
+        7. DUT drop call, call also end on PhoneB.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        # make sure PhoneA is GSM phone before proceed.
-        if (ads[0].droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-            self.log.error("{} not GSM phone, abort wcdma swap test.".format(
-                ads[0].serial))
-            return None, None
-
-        call_ab_id = self._three_phone_call_mo_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_voice_3g, phone_setup_voice_general,
-             phone_setup_voice_general], [is_phone_in_call_wcdma, None, None])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
+            2)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
+            return False
 
-        return call_ab_id, call_ac_id
+        self.log.info("End call on DUT, DUT should receive callback.")
+        return self._test_1x_multi_call_drop_from_host(ads[0], ads[2], ads[1])
 
-    def _test_csfb_wcdma_mo_mo_add_swap_x(self, num_swaps):
-        """Test swap feature in CSFB WCDMA call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mo_mt_add_swap_once_drop_on_dut(self):
+        """ Test 1x MO+MT call among three phones.
 
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (CSFB WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA. (N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. DUT MO call to PhoneB, answer on PhoneB.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Drop current call on DUT.
+        6. Drop current call on DUT.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. Swap call succeed.
+        5. DUT drop call, PhoneB also end. Then DUT receive callback from PhoneC.
+        6. DUT drop call, call also end on PhoneC.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        # make sure PhoneA is GSM phone before proceed.
-        if (ads[0].droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-            self.log.error("{} not GSM phone, abort wcdma swap test.".format(
-                ads[0].serial))
-            return None, None
-
-        call_ab_id = self._three_phone_call_mo_add_mo(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_csfb, phone_setup_voice_general,
-             phone_setup_voice_general], [is_phone_in_call_csfb, None, None])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
+            1)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
+            return False
 
-        return call_ab_id, call_ac_id
+        self.log.info("End call on DUT, DUT should receive callback.")
+        return self._test_1x_multi_call_drop_from_host(ads[0], ads[1], ads[2])
 
-    def _test_csfb_wcdma_mo_mt_add_swap_x(self, num_swaps):
-        """Test swap feature in CSFB WCDMA call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mt_mt_add_drop_active(self):
+        """ Test 1x MT+MT call among three phones.
 
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
-        Swap active call on PhoneA. (N times)
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. Call from PhoneB to DUT, accept on DUT.
+        3. Call from PhoneC to DUT, accept on DUT.
+        4. End call PhoneC, verify call continues on DUT and PhoneB.
+        5. End call on PhoneB, verify call end on PhoneA.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Expected Results:
+        4. PhoneC drop call, DUT and PhoneB call continues.
+        5. PhoneB drop call, call also end on DUT.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        # make sure PhoneA is GSM phone before proceed.
-        if (ads[0].droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-            self.log.error("{} not GSM phone, abort wcdma swap test.".format(
-                ads[0].serial))
-            return None, None
-
-        call_ab_id = self._three_phone_call_mo_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_csfb, phone_setup_voice_general,
-             phone_setup_voice_general], [is_phone_in_call_csfb, None, None])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
+            0)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
+            return False
 
-        return call_ab_id, call_ac_id
+        self.log.info("End call on PhoneC, and end call on PhoneB.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
+                                                              ads[1])
 
-    def _test_ims_conference_merge_drop_second_call_no_cep(self, call_ab_id,
-                                                           call_ac_id):
-        """Test conference merge and drop in VoLTE call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mt_mt_add_swap_twice_drop_active(self):
+        """ Test 1x MT+MT call among three phones.
 
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneB.
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneC.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. PhoneB call to DUT, answer on DUT.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Swap active call on DUT.
+        6. Drop on PhoneC.
+        7. Drop on PhoneB.
 
-        Args:
-            call_ab_id: call id for call_AB on PhoneA.
-            call_ac_id: call id for call_AC on PhoneA.
+        Expected Results:
+        4. Swap call succeed.
+        5. Swap call succeed.
+        6. Call between DUT and PhoneB continues.
+        7. All participant call end.
 
         Returns:
-            True if succeed;
-            False if failed.
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        self.log.info("Step4: Merge to Conf Call and verify Conf Call.")
-        ads[0].droid.telecomCallJoinCallsInConf(call_ab_id, call_ac_id)
-        time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 1:
-            self.log.error("Total number of call ids in {} is not 1.".format(
-                ads[0].serial))
-            if get_cep_conference_call_id(ads[0]) is not None:
-                self.log.error("CEP enabled.")
-            else:
-                self.log.error("Merge failed.")
-            return False
-        call_conf_id = None
-        for call_id in calls:
-            if call_id != call_ab_id and call_id != call_ac_id:
-                call_conf_id = call_id
-        if not call_conf_id:
-            self.log.error("Merge call fail, no new conference call id.")
-            return False
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        # Check if Conf Call is currently active
-        if ads[0].droid.telecomCallGetCallState(
-                call_conf_id) != CALL_STATE_ACTIVE:
-            self.log.error(
-                "Call_id:{}, state:{}, expected: STATE_ACTIVE".format(
-                    call_conf_id, ads[0].droid.telecomCallGetCallState(
-                        call_conf_id)))
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
+            2)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
             return False
 
-        self.log.info("Step5: End call on PhoneC and verify call continues.")
-        ads[2].droid.telecomEndCall()
+        self.log.info("Verify no one dropped call.")
         time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if not verify_incall_state(self.log, [ads[0], ads[1]], True):
-            return False
-        if not verify_incall_state(self.log, [ads[2]], False):
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
             return False
 
-        # Because of b/18413009, VZW VoLTE conference host will not drop call
-        # even if all participants drop. The reason is VZW network is not
-        # providing such information to DUT.
-        # So this test probably will fail on the last step for VZW.
-        self.log.info("Step6: End call on PhoneB and verify PhoneA end.")
-        ads[1].droid.telecomEndCall()
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], False):
-            return False
-        return True
+        self.log.info("End call on PhoneC, and end call on PhoneB.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
+                                                              ads[1])
 
-    def _merge_cep_conference_call(self, call_ab_id, call_ac_id):
-        """Merge CEP conference call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mt_mt_add_swap_once_drop_active(self):
+        """ Test 1x MT+MT call among three phones.
 
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneB.
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneC.
-        Merge calls to conference on PhoneA (CEP enabled IMS conference).
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. PhoneB call to DUT, answer on DUT.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Drop on PhoneB.
+        6. Drop on PhoneC.
 
-        Args:
-            call_ab_id: call id for call_AB on PhoneA.
-            call_ac_id: call id for call_AC on PhoneA.
+        Expected Results:
+        4. Swap call succeed.
+        5. Call between DUT and PhoneC continues.
+        6. All participant call end.
 
         Returns:
-            call_id for conference
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        self.log.info("Step4: Merge to Conf Call and verify Conf Call.")
-        ads[0].droid.telecomCallJoinCallsInConf(call_ab_id, call_ac_id)
-        time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-
-        call_conf_id = get_cep_conference_call_id(ads[0])
-        if call_conf_id is None:
-            self.log.error(
-                "No call with children. Probably CEP not enabled or merge failed.")
-            return None
-        calls.remove(call_conf_id)
-        if (set(ads[0].droid.telecomCallGetCallChildren(call_conf_id)) !=
-                set(calls)):
-            self.log.error(
-                "Children list<{}> for conference call is not correct.".format(
-                    ads[0].droid.telecomCallGetCallChildren(call_conf_id)))
-            return None
-
-        if (CALL_PROPERTY_CONFERENCE not in
-                ads[0].droid.telecomCallGetProperties(call_conf_id)):
-            self.log.error("Conf call id properties wrong: {}".format(ads[
-                0].droid.telecomCallGetProperties(call_conf_id)))
-            return None
-
-        if (CALL_CAPABILITY_MANAGE_CONFERENCE not in
-                ads[0].droid.telecomCallGetCapabilities(call_conf_id)):
-            self.log.error("Conf call id capabilities wrong: {}".format(ads[
-                0].droid.telecomCallGetCapabilities(call_conf_id)))
-            return None
-
-        if (call_ab_id in calls) or (call_ac_id in calls):
-            self.log.error(
-                "Previous call ids should not in new call list after merge.")
-            return None
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
+            1)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
+            return False
 
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
         if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return None
-
-        # Check if Conf Call is currently active
-        if ads[0].droid.telecomCallGetCallState(
-                call_conf_id) != CALL_STATE_ACTIVE:
-            self.log.error(
-                "Call_id:{}, state:{}, expected: STATE_ACTIVE".format(
-                    call_conf_id, ads[0].droid.telecomCallGetCallState(
-                        call_conf_id)))
-            return None
+            return False
 
-        return call_conf_id
+        self.log.info("End call on PhoneB, and end call on PhoneC.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
+                                                              ads[2])
 
-    def _test_ims_conference_merge_drop_second_call_from_participant_cep(
-            self, call_ab_id, call_ac_id):
-        """Test conference merge and drop in IMS (VoLTE or WiFi Calling) call.
-        (CEP enabled).
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mt_mt_add_drop_held(self):
+        """ Test 1x MT+MT call among three phones.
 
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneB.
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneC.
-        Merge calls to conference on PhoneA (CEP enabled IMS conference).
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. Call from PhoneB to DUT, accept on DUT.
+        3. Call from PhoneC to DUT, accept on DUT.
+        4. End call PhoneB, verify call continues on DUT and PhoneC.
+        5. End call on PhoneC, verify call end on PhoneA.
 
-        Args:
-            call_ab_id: call id for call_AB on PhoneA.
-            call_ac_id: call id for call_AC on PhoneA.
+        Expected Results:
+        4. PhoneB drop call, DUT and PhoneC call continues.
+        5. PhoneC drop call, call also end on DUT.
 
         Returns:
-            True if succeed;
-            False if failed.
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        call_conf_id = self._merge_cep_conference_call(call_ab_id, call_ac_id)
-        if call_conf_id is None:
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
+            0)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
             return False
 
-        self.log.info("Step5: End call on PhoneC and verify call continues.")
-        ads[2].droid.telecomEndCall()
+        self.log.info("Verify no one dropped call.")
         time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if not verify_incall_state(self.log, [ads[0], ads[1]], True):
-            return False
-        if not verify_incall_state(self.log, [ads[2]], False):
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
             return False
 
-        self.log.info("Step6: End call on PhoneB and verify PhoneA end.")
-        ads[1].droid.telecomEndCall()
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], False):
-            return False
-        return True
+        self.log.info("End call on PhoneB, and end call on PhoneC.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
+                                                              ads[2])
 
-    def _test_ims_conference_merge_drop_first_call_from_participant_cep(
-            self, call_ab_id, call_ac_id):
-        """Test conference merge and drop in IMS (VoLTE or WiFi Calling) call.
-        (CEP enabled).
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mt_mt_add_swap_twice_drop_held(self):
+        """ Test 1x MT+MT call among three phones.
 
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneB.
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneC.
-        Merge calls to conference on PhoneA (CEP enabled IMS conference).
-        Hangup on PhoneB, check call continues between AC.
-        Hangup on PhoneC, check A ends.
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. PhoneB call to DUT, answer on DUT.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Swap active call on DUT.
+        6. Drop on PhoneB.
+        7. Drop on PhoneC.
 
-        Args:
-            call_ab_id: call id for call_AB on PhoneA.
-            call_ac_id: call id for call_AC on PhoneA.
+        Expected Results:
+        4. Swap call succeed.
+        5. Swap call succeed.
+        6. Call between DUT and PhoneC continues.
+        7. All participant call end.
 
         Returns:
-            True if succeed;
-            False if failed.
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        call_conf_id = self._merge_cep_conference_call(call_ab_id, call_ac_id)
-        if call_conf_id is None:
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
+            2)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
             return False
 
-        self.log.info("Step5: End call on PhoneB and verify call continues.")
-        ads[1].droid.telecomEndCall()
+        self.log.info("Verify no one dropped call.")
         time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[2]], True):
-            return False
-        if not verify_incall_state(self.log, [ads[1]], False):
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
             return False
 
-        self.log.info("Step6: End call on PhoneC and verify PhoneA end.")
-        ads[2].droid.telecomEndCall()
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], False):
-            return False
-        return True
+        self.log.info("End call on PhoneB, and end call on PhoneC.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
+                                                              ads[2])
 
-    def _test_ims_conference_merge_drop_second_call_from_host_cep(
-            self, call_ab_id, call_ac_id):
-        """Test conference merge and drop in IMS (VoLTE or WiFi Calling) call.
-        (CEP enabled).
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mt_mt_add_swap_once_drop_held(self):
+        """ Test 1x MT+MT call among three phones.
 
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneB.
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneC.
-        Merge calls to conference on PhoneA (CEP enabled IMS conference).
-        On PhoneA, disconnect call between A-C, verify PhoneA PhoneB still in call.
-        On PhoneA, disconnect call between A-B, verify PhoneA PhoneB disconnected.
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. PhoneB call to DUT, answer on DUT.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Drop on PhoneC.
+        6. Drop on PhoneB.
 
-        Args:
-            call_ab_id: call id for call_AB on PhoneA.
-            call_ac_id: call id for call_AC on PhoneA.
+        Expected Results:
+        4. Swap call succeed.
+        5. Call between DUT and PhoneB continues.
+        6. All participant call end.
 
         Returns:
-            True if succeed;
-            False if failed.
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        call_ab_uri = get_call_uri(ads[0], call_ab_id)
-        call_ac_uri = get_call_uri(ads[0], call_ac_id)
-
-        call_conf_id = self._merge_cep_conference_call(call_ab_id, call_ac_id)
-        if call_conf_id is None:
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
+            1)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
             return False
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        calls.remove(call_conf_id)
-
-        self.log.info("Step5: Disconnect call A-C and verify call continues.")
-        call_to_disconnect = None
-        for call in calls:
-            if is_uri_equivalent(call_ac_uri, get_call_uri(ads[0], call)):
-                call_to_disconnect = call
-                calls.remove(call_to_disconnect)
-                break
-        if call_to_disconnect is None:
-            self.log.error("Can NOT find call on host represents A-C.")
-            return False
-        else:
-            ads[0].droid.telecomCallDisconnect(call_to_disconnect)
+        self.log.info("Verify no one dropped call.")
         time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1]], True):
-            return False
-        if not verify_incall_state(self.log, [ads[2]], False):
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
             return False
 
-        self.log.info(
-            "Step6: Disconnect call A-B and verify PhoneA PhoneB end.")
-        call_to_disconnect = None
-        for call in calls:
-            if is_uri_equivalent(call_ab_uri, get_call_uri(ads[0], call)):
-                call_to_disconnect = call
-                calls.remove(call_to_disconnect)
-                break
-        if call_to_disconnect is None:
-            self.log.error("Can NOT find call on host represents A-B.")
-            return False
-        else:
-            ads[0].droid.telecomCallDisconnect(call_to_disconnect)
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], False):
-            return False
-        return True
+        self.log.info("End call on PhoneC, and end call on PhoneB.")
+        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
+                                                              ads[1])
 
-    def _test_ims_conference_merge_drop_first_call_from_host_cep(
-            self, call_ab_id, call_ac_id):
-        """Test conference merge and drop in IMS (VoLTE or WiFi Calling) call.
-        (CEP enabled).
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mt_mt_add_drop_on_dut(self):
+        """ Test 1x MT+MT call among three phones.
 
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneB.
-        PhoneA in IMS (VoLTE or WiFi Calling) call with PhoneC.
-        Merge calls to conference on PhoneA (CEP enabled IMS conference).
-        On PhoneA, disconnect call between A-B, verify PhoneA PhoneC still in call.
-        On PhoneA, disconnect call between A-C, verify PhoneA PhoneC disconnected.
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. Call from PhoneB to DUT, accept on DUT.
+        3. Call from PhoneC to DUT, accept on DUT.
+        4. End call on DUT.
+        5. End call on DUT.
 
-        Args:
-            call_ab_id: call id for call_AB on PhoneA.
-            call_ac_id: call id for call_AC on PhoneA.
+        Expected Results:
+        4. DUT drop call, PhoneC also end. Then DUT receive callback from PhoneB.
+        5. DUT drop call, call also end on PhoneB.
 
         Returns:
-            True if succeed;
-            False if failed.
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        call_ab_uri = get_call_uri(ads[0], call_ab_id)
-        call_ac_uri = get_call_uri(ads[0], call_ac_id)
-
-        call_conf_id = self._merge_cep_conference_call(call_ab_id, call_ac_id)
-        if call_conf_id is None:
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
+            0)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
             return False
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        calls.remove(call_conf_id)
-
-        self.log.info("Step5: Disconnect call A-B and verify call continues.")
-        call_to_disconnect = None
-        for call in calls:
-            if is_uri_equivalent(call_ab_uri, get_call_uri(ads[0], call)):
-                call_to_disconnect = call
-                calls.remove(call_to_disconnect)
-                break
-        if call_to_disconnect is None:
-            self.log.error("Can NOT find call on host represents A-B.")
-            return False
-        else:
-            ads[0].droid.telecomCallDisconnect(call_to_disconnect)
+        self.log.info("Verify no one dropped call.")
         time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[2]], True):
-            return False
-        if not verify_incall_state(self.log, [ads[1]], False):
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
             return False
 
-        self.log.info(
-            "Step6: Disconnect call A-C and verify PhoneA PhoneC end.")
-        call_to_disconnect = None
-        for call in calls:
-            if is_uri_equivalent(call_ac_uri, get_call_uri(ads[0], call)):
-                call_to_disconnect = call
-                calls.remove(call_to_disconnect)
-                break
-        if call_to_disconnect is None:
-            self.log.error("Can NOT find call on host represents A-C.")
-            return False
-        else:
-            ads[0].droid.telecomCallDisconnect(call_to_disconnect)
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], False):
-            return False
-        return True
+        self.log.info("End call on DUT, DUT should receive callback.")
+        return self._test_1x_multi_call_drop_from_host(ads[0], ads[2], ads[1])
 
-    def _test_wcdma_conference_merge_drop(self, call_ab_id, call_ac_id):
-        """Test conference merge and drop in WCDMA/CSFB_WCDMA call.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mt_mt_add_swap_twice_drop_on_dut(self):
+        """ Test 1x MT+MT call among three phones.
 
-        PhoneA in WCDMA (or CSFB_WCDMA) call with PhoneB.
-        PhoneA in WCDMA (or CSFB_WCDMA) call with PhoneC.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. PhoneB call to DUT, answer on DUT.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Swap active call on DUT.
+        6. Drop current call on DUT.
+        7. Drop current call on DUT.
 
-        Args:
-            call_ab_id: call id for call_AB on PhoneA.
-            call_ac_id: call id for call_AC on PhoneA.
+        Expected Results:
+        4. Swap call succeed.
+        5. Swap call succeed.
+        6. DUT drop call, PhoneC also end. Then DUT receive callback from PhoneB.
+        7. DUT drop call, call also end on PhoneB.
 
         Returns:
-            True if succeed;
-            False if failed.
+            True if pass; False if fail.
         """
         ads = self.android_devices
 
-        self.log.info("Step4: Merge to Conf Call and verify Conf Call.")
-        ads[0].droid.telecomCallJoinCallsInConf(call_ab_id, call_ac_id)
-        time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 3:
-            self.log.error("Total number of call ids in {} is not 3.".format(
-                ads[0].serial))
-            return False
-        call_conf_id = None
-        for call_id in calls:
-            if call_id != call_ab_id and call_id != call_ac_id:
-                call_conf_id = call_id
-        if not call_conf_id:
-            self.log.error("Merge call fail, no new conference call id.")
-            return False
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        # Check if Conf Call is currently active
-        if ads[0].droid.telecomCallGetCallState(
-                call_conf_id) != CALL_STATE_ACTIVE:
-            self.log.error(
-                "Call_id:{}, state:{}, expected: STATE_ACTIVE".format(
-                    call_conf_id, ads[0].droid.telecomCallGetCallState(
-                        call_conf_id)))
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
+            2)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
             return False
 
-        self.log.info("Step5: End call on PhoneC and verify call continues.")
-        ads[2].droid.telecomEndCall()
+        self.log.info("Verify no one dropped call.")
         time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 1:
-            return False
-        if not verify_incall_state(self.log, [ads[0], ads[1]], True):
-            return False
-        if not verify_incall_state(self.log, [ads[2]], False):
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
             return False
 
-        self.log.info("Step6: End call on PhoneB and verify PhoneA end.")
-        ads[1].droid.telecomEndCall()
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], False):
-            return False
-        return True
+        self.log.info("End call on DUT, DUT should receive callback.")
+        return self._test_1x_multi_call_drop_from_host(ads[0], ads[2], ads[1])
 
-    def _three_phone_hangup_call_verify_call_state(
-            self, ad_hangup, ad_verify, call_id, call_state, ads_active):
-        """Private Test utility for swap test.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_1x_mt_mt_add_swap_once_drop_on_dut(self):
+        """ Test 1x MT+MT call among three phones.
 
-        Hangup on 'ad_hangup'.
-        Verify 'call_id' on 'ad_verify' is in expected 'call_state'
-        Verify each ad in ads_active are 'in-call'.
+        Steps:
+        1. DUT in 1x idle, PhoneB and PhoneC idle.
+        2. PhoneB call to DUT, answer on DUT.
+        3. PhoneC call to DUT, answer on DUT
+        4. Swap active call on DUT.
+        5. Drop current call on DUT.
+        6. Drop current call on DUT.
 
-        Args:
-            ad_hangup: android object to hangup call.
-            ad_verify: android object to verify call id state.
-            call_id: call id in 'ad_verify'.
-            call_state: expected state for 'call_id'.
-                'call_state' is either CALL_STATE_HOLDING or CALL_STATE_ACTIVE.
-            ads_active: list of android object.
-                Each one of them should be 'in-call' after 'hangup' operation.
+        Expected Results:
+        4. Swap call succeed.
+        5. DUT drop call, PhoneB also end. Then DUT receive callback from PhoneC.
+        6. DUT drop call, call also end on PhoneC.
 
         Returns:
-            True if no error happened. Otherwise False.
-
+            True if pass; False if fail.
         """
+        ads = self.android_devices
 
-        self.log.info("Hangup at {}, verify call continues.".format(
-            ad_hangup.serial))
-        ad_hangup.droid.telecomEndCall()
-        time.sleep(WAIT_TIME_IN_CALL)
-
-        if ad_verify.droid.telecomCallGetCallState(call_id) != call_state:
-            self.log.error("Call_id:{}, state:{}, expected: {}".format(
-                call_id, ad_verify.droid.telecomCallGetCallState(
-                    call_id), call_state))
+        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
+            1)
+        if ((call_ab_id is None) or (call_ac_id is None) or
+            (call_conf_id is None)):
+            self.log.error("Failed to setup 3 way call.")
             return False
-        # TODO: b/26296375 add voice check.
 
-        if not verify_incall_state(self.log, ads_active, True):
-            return False
-        if not verify_incall_state(self.log, [ad_hangup], False):
+        self.log.info("Verify no one dropped call.")
+        time.sleep(WAIT_TIME_IN_CALL)
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
             return False
 
-        return True
-
-    def _test_epdg_mo_mo_add_epdg_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
+        self.log.info("End call on DUT, DUT should receive callback.")
+        return self._test_1x_multi_call_drop_from_host(ads[0], ads[1], ads[2])
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
-        Swap active call on PhoneA.(N times)
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_volte_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
+        Call from PhoneA (VoLTE) to PhoneC (VoLTE), accept on PhoneC.
+        On PhoneA, merge to conference call (No CEP).
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mo_mo_add_epdg_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mo_add_mo(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_iwlan,
-             is_phone_in_call_iwlan])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
-
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
-
-        return call_ab_id, call_ac_id
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-    def _test_epdg_mo_mt_add_epdg_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
-
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_volte_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (VoLTE), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneC, verify call continues.
+        5. End call on PhoneB, verify call end on PhoneA.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mo_mt_add_epdg_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mo_add_mt(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_iwlan,
-             is_phone_in_call_iwlan])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_volte_merge_drop_second_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        return call_ab_id, call_ac_id
+        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (VoLTE), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-C, verify call continues.
+        5. On PhoneA disconnect call between A-B, verify call continues.
 
-    def _test_epdg_mt_mt_add_epdg_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
-        PhoneB (epdg) call PhoneA (epdg), accept on PhoneA.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_volte_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (VoLTE), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneB, verify call continues.
+        5. End call on PhoneC, verify call end on PhoneA.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mt_mt_add_epdg_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mt_add_mt(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_iwlan,
-             is_phone_in_call_iwlan])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_volte_merge_drop_first_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        return call_ab_id, call_ac_id
+        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (VoLTE), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-B, verify call continues.
+        5. On PhoneA disconnect call between A-C, verify call continues.
 
-    def _test_epdg_mo_mo_add_volte_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
-        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (VoLTE), accept on PhoneC.
-        Swap active call on PhoneA.(N times)
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_volte_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
+        Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mo_mo_add_volte_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mo_add_mo(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_volte,
-             is_phone_in_call_volte])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
-
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_volte_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        return call_ab_id, call_ac_id
+        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
+        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneC, verify call continues.
+        5. End call on PhoneB, verify call end on PhoneA.
 
-    def _test_epdg_mo_mt_add_volte_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_volte_merge_drop_second_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
+        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-C, verify call continues.
+        5. On PhoneA disconnect call between A-B, verify call continues.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mo_mt_add_volte_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mo_add_mt(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_volte,
-             is_phone_in_call_volte])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_volte_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        return call_ab_id, call_ac_id
+        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
+        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneB, verify call continues.
+        5. End call on PhoneC, verify call end on PhoneA.
 
-    def _test_epdg_mt_mt_add_volte_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        PhoneB (VoLTE) call PhoneA (epdg), accept on PhoneA.
-        PhoneC (VoLTE) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_volte_merge_drop_first_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
+        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-B, verify call continues.
+        5. On PhoneA disconnect call between A-C, verify call continues.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mt_mt_add_volte_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mt_add_mt(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_volte,
-             is_phone_in_call_volte])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
-
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_volte_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        return call_ab_id, call_ac_id
+        Call from PhoneB (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-    def _test_epdg_mo_mo_add_wcdma_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (WCDMA), accept on PhoneC.
-        Swap active call on PhoneA.(N times)
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_volte_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        1. Call from PhoneB (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneC, verify call continues.
+        5. End call on PhoneB, verify call end on PhoneA.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        # make sure PhoneB and PhoneC are GSM phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-                self.log.error(
-                    "{} not GSM phone, abort wcdma swap test.".format(
-                        ad.serial))
-                return None, None
-
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mo_mo_add_wcdma_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mo_add_mo(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_wcdma,
-             is_phone_in_call_wcdma])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
-
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_volte_merge_drop_second_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        return call_ab_id, call_ac_id
+        1. Call from PhoneB (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-C, verify call continues.
+        5. On PhoneA disconnect call between A-B, verify call continues.
 
-    def _test_epdg_mo_mt_add_wcdma_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
-        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneC (WCDMA) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_volte_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        1. Call from PhoneB (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneB, verify call continues.
+        5. End call on PhoneC, verify call end on PhoneA.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        # make sure PhoneB and PhoneC are GSM phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-                self.log.error(
-                    "{} not GSM phone, abort wcdma swap test.".format(
-                        ad.serial))
-                return None, None
-
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mo_mt_add_wcdma_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mo_add_mt(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_wcdma,
-             is_phone_in_call_wcdma])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
-
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_volte_merge_drop_first_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        return call_ab_id, call_ac_id
+        1. Call from PhoneB (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-B, verify call continues.
+        5. On PhoneA disconnect call between A-C, verify call continues.
 
-    def _test_epdg_mt_mt_add_wcdma_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
-        PhoneB (WCDMA) call PhoneA (epdg), accept on PhoneA.
-        PhoneC (WCDMA) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_wcdma_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
+        Call from PhoneA (VOLTE) to PhoneC (WCDMA), accept on PhoneC.
+        On PhoneA, merge to conference call (No CEP).
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        # make sure PhoneB and PhoneC are GSM phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-                self.log.error(
-                    "{} not GSM phone, abort wcdma swap test.".format(
-                        ad.serial))
-                return None, None
-
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mo_mt_add_wcdma_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mt_add_mt(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_wcdma,
-             is_phone_in_call_wcdma])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
-
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_wcdma_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        return call_ab_id, call_ac_id
+        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (WCDMA), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneC, verify call continues.
+        5. End call on PhoneB, verify call end on PhoneA.
 
-    def _test_epdg_mo_mo_add_1x_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (1x), accept on PhoneC.
-        Swap active call on PhoneA.(N times)
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_wcdma_merge_drop_second_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (WCDMA), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-C, verify call continues.
+        5. On PhoneA disconnect call between A-B, verify call continues.
 
         Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
-
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
-        # make sure PhoneB and PhoneC are CDMA phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_CDMA):
-                self.log.error("{} not CDMA phone, abort 1x swap test.".format(
-                    ad.serial))
-                return None, None
-
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mo_mo_add_1x_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mo_add_mo(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_1x, is_phone_in_call_1x])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_wcdma_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (WCDMA), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneB, verify call continues.
+        5. End call on PhoneC, verify call end on PhoneA.
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        return call_ab_id, call_ac_id
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_wcdma_merge_drop_first_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-    def _test_epdg_mo_mt_add_1x_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
+        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (WCDMA), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-B, verify call continues.
+        5. On PhoneA disconnect call between A-C, verify call continues.
 
-        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
-        PhoneC (1x) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_wcdma_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
+        Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
+        Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        # make sure PhoneB and PhoneC are CDMA phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_CDMA):
-                self.log.error("{} not CDMA phone, abort 1x swap test.".format(
-                    ad.serial))
-                return None, None
-
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mo_mt_add_1x_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mo_add_mt(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_1x, is_phone_in_call_1x])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_wcdma_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
+        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneC, verify call continues.
+        5. End call on PhoneB, verify call end on PhoneA.
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        return call_ab_id, call_ac_id
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_wcdma_merge_drop_second_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-    def _test_epdg_mt_mt_add_1x_swap_x(self, num_swaps):
-        """Test swap feature in epdg call.
+        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
+        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-C, verify call continues.
+        5. On PhoneA disconnect call between A-B, verify call continues.
 
-        PhoneB (1x) call PhoneA (epdg), accept on PhoneA.
-        PhoneC (1x) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.(N times)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_wcdma_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
+        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
+        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneB, verify call continues.
+        5. End call on PhoneC, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        # make sure PhoneB and PhoneC are CDMA phone before proceed.
-        for ad in [ads[1], ads[2]]:
-            if (ad.droid.telephonyGetPhoneType() != PHONE_TYPE_CDMA):
-                self.log.error("{} not CDMA phone, abort 1x swap test.".format(
-                    ad.serial))
-                return None, None
-
-        # To make thing simple, for epdg, setup should be called before calling
-        # _test_epdg_mo_mt_add_1x_swap_x in test cases.
-        call_ab_id = self._three_phone_call_mt_add_mt(
-            [ads[0], ads[1], ads[2]], [None, None, None],
-            [is_phone_in_call_iwlan, is_phone_in_call_1x, is_phone_in_call_1x])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_wcdma_merge_drop_first_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
+        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-B, verify call continues.
+        5. On PhoneA disconnect call between A-C, verify call continues.
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
-        return call_ab_id, call_ac_id
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_wcdma_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-    def _test_epdg_conference_merge_drop(self, call_ab_id, call_ac_id):
-        """Test conference merge and drop in epdg call.
+        Call from PhoneB (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        PhoneA in epdg call with PhoneB.
-        PhoneA in epdg call with PhoneC.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        Args:
-            call_ab_id: call id for call_AB on PhoneA.
-            call_ac_id: call id for call_AC on PhoneA.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_wcdma_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
+
+        1. Call from PhoneB (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneC, verify call continues.
+        5. End call on PhoneB, verify call end on PhoneA.
 
         Returns:
-            True if succeed;
-            False if failed.
+            True if pass; False if fail.
         """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        ads = self.android_devices
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_wcdma_merge_drop_second_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        self.log.info("Step4: Merge to Conf Call and verify Conf Call.")
-        ads[0].droid.telecomCallJoinCallsInConf(call_ab_id, call_ac_id)
-        time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 1:
-            self.log.error("Total number of call ids in {} is not 1.".format(
-                ads[0].serial))
-            return False
-        call_conf_id = None
-        for call_id in calls:
-            if call_id != call_ab_id and call_id != call_ac_id:
-                call_conf_id = call_id
-        if not call_conf_id:
-            self.log.error("Merge call fail, no new conference call id.")
-            return False
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
+        1. Call from PhoneB (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-C, verify call continues.
+        5. On PhoneA disconnect call between A-B, verify call continues.
 
-        # Check if Conf Call is currently active
-        if ads[0].droid.telecomCallGetCallState(
-                call_conf_id) != CALL_STATE_ACTIVE:
-            self.log.error(
-                "Call_id:{}, state:{}, expected: STATE_ACTIVE".format(
-                    call_conf_id, ads[0].droid.telecomCallGetCallState(
-                        call_conf_id)))
-            return False
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
-        self.log.info("Step5: End call on PhoneC and verify call continues.")
-        ads[2].droid.telecomEndCall()
-        time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if not verify_incall_state(self.log, [ads[0], ads[1]], True):
-            return False
-        if not verify_incall_state(self.log, [ads[2]], False):
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_wcdma_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        self.log.info("Step6: End call on PhoneB and verify PhoneA end.")
-        ads[1].droid.telecomEndCall()
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], False):
-            return False
-        return True
+        1. Call from PhoneB (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneB, verify call continues.
+        5. End call on PhoneC, verify call end on PhoneA.
 
-    """ Tests Begin """
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mo_add_merge_drop(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mt_mt_add_wcdma_merge_drop_first_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Call from PhoneA to PhoneB, accept on PhoneB.
-        Call from PhoneA to PhoneC, accept on PhoneC.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. Call from PhoneB (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-B, verify call continues.
+        5. On PhoneA disconnect call between A-C, verify call continues.
 
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mo_add_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mt_mt_add_merge_drop(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mo_add_1x_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        Call from PhoneB to PhoneA, accept on PhoneA.
-        Call from PhoneC to PhoneA, accept on PhoneA.
-        On PhoneA, merge to conference call.
+        Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
+        Call from PhoneA (VOLTE) to PhoneC (1x), accept on PhoneC.
+        On PhoneA, merge to conference call (No CEP).
         End call on PhoneC, verify call continues.
         End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_wcdma_mt_mt_add_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mo_mo_add_merge_drop_from_participant(self):
-        """ Test 1x Conf Call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. Call from DUT to PhoneB, accept on PhoneB.
-        3. Call from DUT to PhoneC, accept on PhoneC.
-        4. On DUT, merge to conference call.
-        5. End call PhoneC, verify call continues on DUT and PhoneB.
-        6. End call on PhoneB, verify call end on PhoneA.
+    def test_volte_mo_mo_add_1x_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Expected Results:
-        4. Merge Call succeed on DUT.
-        5. PhoneC drop call, DUT and PhoneB call continues.
-        6. PhoneB drop call, call also end on DUT.
+        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (1x), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneC, verify call continues.
+        5. End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mo_add()
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_1x_merge_drop_second_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        self.log.info("Merge to Conf Call and verify Conf Call.")
-        if not self._test_1x_merge_conference(ads[0], [ads[1], ads[2]],
-                                              call_conf_id):
-            self.log.error("1x Conference merge failed.")
+        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (1x), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-C, verify call continues.
+        5. On PhoneA disconnect call between A-B, verify call continues.
 
-        self.log.info("End call on PhoneC, and end call on PhoneB.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
-                                                              ads[1])
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mo_mo_add_merge_drop_from_host(self):
-        """ Test 1x Conf Call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. Call from DUT to PhoneB, accept on PhoneB.
-        3. Call from DUT to PhoneC, accept on PhoneC.
-        4. On DUT, merge to conference call.
-        5. End call on DUT, make sure all participants drop.
+    def test_volte_mo_mo_add_1x_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Expected Results:
-        4. Merge Call succeed on DUT.
-        5. Make sure DUT and all participants drop call.
+        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (1x), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneB, verify call continues.
+        5. End call on PhoneC, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mo_add()
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_1x_merge_drop_first_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        self.log.info("Merge to Conf Call and verify Conf Call.")
-        if not self._test_1x_merge_conference(ads[0], [ads[1], ads[2]],
-                                              call_conf_id):
-            self.log.error("1x Conference merge failed.")
+        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
+        2. Call from PhoneA (VoLTE) to PhoneC (1x), accept on PhoneC.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-B, verify call continues.
+        5. On PhoneA disconnect call between A-C, verify call continues.
 
-        self.log.info("End call on PhoneC, and end call on PhoneB.")
-        return self._test_1x_conf_call_drop_from_host(ads[0], [ads[2], ads[1]])
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mo_mt_add_drop_active(self):
-        """ Test 1x MO+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. Call from DUT to PhoneB, accept on PhoneB.
-        3. Call from PhoneC to DUT, accept on DUT.
-        4. End call PhoneC, verify call continues on DUT and PhoneB.
-        5. End call on PhoneB, verify call end on PhoneA.
+    def test_volte_mo_mt_add_1x_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        Expected Results:
-        4. PhoneC drop call, DUT and PhoneB call continues.
-        5. PhoneB drop call, call also end on DUT.
+        Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
+        Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
-            0)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_1x_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
+        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
+        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneC, verify call continues.
+        5. End call on PhoneB, verify call end on PhoneA.
 
-        self.log.info("End call on PhoneC, and end call on PhoneB.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
-                                                              ads[1])
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mo_mt_add_swap_twice_drop_active(self):
-        """ Test 1x MO+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. DUT MO call to PhoneB, answer on PhoneB.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Swap active call on DUT.
-        6. Drop on PhoneC.
-        7. Drop on PhoneB.
+    def test_volte_mo_mt_add_1x_merge_drop_second_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Expected Results:
-        4. Swap call succeed.
-        5. Swap call succeed.
-        6. Call between DUT and PhoneB continues.
-        7. All participant call end.
+        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
+        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-C, verify call continues.
+        5. On PhoneA disconnect call between A-B, verify call continues.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
-            2)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on PhoneC, and end call on PhoneB.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
-                                                              ads[1])
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mo_mt_add_swap_once_drop_active(self):
-        """ Test 1x MO+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. DUT MO call to PhoneB, answer on PhoneB.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Drop on PhoneB.
-        6. Drop on PhoneC.
+    def test_volte_mo_mt_add_1x_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Expected Results:
-        4. Swap call succeed.
-        5. Call between DUT and PhoneC continues.
-        6. All participant call end.
+        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
+        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneB, verify call continues.
+        5. End call on PhoneC, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
-            1)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_1x_merge_drop_first_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
+        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
+        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-B, verify call continues.
+        5. On PhoneA disconnect call between A-C, verify call continues.
 
-        self.log.info("End call on PhoneB, and end call on PhoneC.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
-                                                              ads[2])
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mo_mt_add_drop_held(self):
-        """ Test 1x MO+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. Call from DUT to PhoneB, accept on PhoneB.
-        3. Call from PhoneC to DUT, accept on DUT.
-        4. End call PhoneB, verify call continues on DUT and PhoneC.
-        5. End call on PhoneC, verify call end on PhoneA.
+    def test_volte_mt_mt_add_1x_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        Expected Results:
-        4. DUT drop call, PhoneC also end. Then DUT receive callback from PhoneB.
-        5. DUT drop call, call also end on PhoneB.
+        Call from PhoneB (1x) to PhoneA (VoLTE), accept on PhoneA.
+        Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
-            0)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_1x_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
+        1. Call from PhoneB (1x) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneC, verify call continues.
+        5. End call on PhoneB, verify call end on PhoneA.
 
-        self.log.info("End call on PhoneB, and end call on PhoneC.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
-                                                              ads[2])
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mo_mt_add_swap_twice_drop_held(self):
-        """ Test 1x MO+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. DUT MO call to PhoneB, answer on PhoneB.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Swap active call on DUT.
-        6. Drop on PhoneB.
-        7. Drop on PhoneC.
+    def test_volte_mt_mt_add_1x_merge_drop_second_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Expected Results:
-        4. Swap call succeed.
-        5. Swap call succeed.
-        6. Call between DUT and PhoneC continues.
-        7. All participant call end.
+        1. Call from PhoneB (1x) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-C, verify call continues.
+        5. On PhoneA disconnect call between A-B, verify call continues.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
-            2)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_1x_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
+        1. Call from PhoneB (1x) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. End call on PhoneB, verify call continues.
+        5. End call on PhoneC, verify call end on PhoneA.
 
-        self.log.info("End call on PhoneB, and end call on PhoneC.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
-                                                              ads[2])
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mo_mt_add_swap_once_drop_held(self):
-        """ Test 1x MO+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. DUT MO call to PhoneB, answer on PhoneB.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Drop on PhoneC.
-        6. Drop on PhoneB.
+    def test_volte_mt_mt_add_1x_merge_drop_first_call_from_host_cep(self):
+        """ Test VoLTE Conference Call among three phones. CEP enabled.
 
-        Expected Results:
-        4. Swap call succeed.
-        5. Call between DUT and PhoneB continues.
-        6. All participant call end.
+        1. Call from PhoneB (1x) to PhoneA (VoLTE), accept on PhoneA.
+        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
+        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        4. On PhoneA disconnect call between A-B, verify call continues.
+        5. On PhoneA disconnect call between A-C, verify call continues.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
-            1)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_volte_swap_twice_drop_held(self):
+        """Test swap feature in VoLTE call.
 
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        self.log.info("End call on PhoneC, and end call on PhoneB.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
-                                                              ads[1])
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=2,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mo_mt_add_drop_on_dut(self):
-        """ Test 1x MO+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. Call from DUT to PhoneB, accept on PhoneB.
-        3. Call from PhoneC to DUT, accept on DUT.
-        4. End call on DUT.
-        5. End call on DUT.
+    def test_volte_mo_mo_add_volte_swap_twice_drop_active(self):
+        """Test swap feature in VoLTE call.
 
-        Expected Results:
-        4. DUT drop call, PhoneC also end. Then DUT receive callback from PhoneB.
-        5. DUT drop call, call also end on PhoneB.
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=2,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
-            0)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_volte_swap_twice_drop_held(self):
+        """Test swap feature in VoLTE call.
 
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        self.log.info("End call on DUT, DUT should receive callback.")
-        return self._test_1x_multi_call_drop_from_host(ads[0], ads[2], ads[1])
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=2,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mo_mt_add_swap_twice_drop_on_dut(self):
-        """ Test 1x MO+MT call among three phones.
+    def test_volte_mo_mt_add_volte_swap_twice_drop_active(self):
+        """Test swap feature in VoLTE call.
 
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. DUT MO call to PhoneB, answer on PhoneB.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Swap active call on DUT.
-        6. Drop current call on DUT.
-        7. Drop current call on DUT.
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Expected Results:
-        4. Swap call succeed.
-        5. Swap call succeed.
-        6. DUT drop call, PhoneC also end. Then DUT receive callback from PhoneB.
-        7. DUT drop call, call also end on PhoneB.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
-            2)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on DUT, DUT should receive callback.")
-        return self._test_1x_multi_call_drop_from_host(ads[0], ads[2], ads[1])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mo_mt_add_swap_once_drop_on_dut(self):
-        """ Test 1x MO+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. DUT MO call to PhoneB, answer on PhoneB.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Drop current call on DUT.
-        6. Drop current call on DUT.
-
-        Expected Results:
-        4. Swap call succeed.
-        5. DUT drop call, PhoneB also end. Then DUT receive callback from PhoneC.
-        6. DUT drop call, call also end on PhoneC.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mo_mt_add_swap_x(
-            1)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on DUT, DUT should receive callback.")
-        return self._test_1x_multi_call_drop_from_host(ads[0], ads[1], ads[2])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mt_mt_add_drop_active(self):
-        """ Test 1x MT+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. Call from PhoneB to DUT, accept on DUT.
-        3. Call from PhoneC to DUT, accept on DUT.
-        4. End call PhoneC, verify call continues on DUT and PhoneB.
-        5. End call on PhoneB, verify call end on PhoneA.
-
-        Expected Results:
-        4. PhoneC drop call, DUT and PhoneB call continues.
-        5. PhoneB drop call, call also end on DUT.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
-            0)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on PhoneC, and end call on PhoneB.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
-                                                              ads[1])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mt_mt_add_swap_twice_drop_active(self):
-        """ Test 1x MT+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. PhoneB call to DUT, answer on DUT.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Swap active call on DUT.
-        6. Drop on PhoneC.
-        7. Drop on PhoneB.
-
-        Expected Results:
-        4. Swap call succeed.
-        5. Swap call succeed.
-        6. Call between DUT and PhoneB continues.
-        7. All participant call end.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
-            2)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on PhoneC, and end call on PhoneB.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
-                                                              ads[1])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mt_mt_add_swap_once_drop_active(self):
-        """ Test 1x MT+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. PhoneB call to DUT, answer on DUT.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Drop on PhoneB.
-        6. Drop on PhoneC.
-
-        Expected Results:
-        4. Swap call succeed.
-        5. Call between DUT and PhoneC continues.
-        6. All participant call end.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
-            1)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on PhoneB, and end call on PhoneC.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
-                                                              ads[2])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mt_mt_add_drop_held(self):
-        """ Test 1x MT+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. Call from PhoneB to DUT, accept on DUT.
-        3. Call from PhoneC to DUT, accept on DUT.
-        4. End call PhoneB, verify call continues on DUT and PhoneC.
-        5. End call on PhoneC, verify call end on PhoneA.
-
-        Expected Results:
-        4. PhoneB drop call, DUT and PhoneC call continues.
-        5. PhoneC drop call, call also end on DUT.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
-            0)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on PhoneB, and end call on PhoneC.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
-                                                              ads[2])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mt_mt_add_swap_twice_drop_held(self):
-        """ Test 1x MT+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. PhoneB call to DUT, answer on DUT.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Swap active call on DUT.
-        6. Drop on PhoneB.
-        7. Drop on PhoneC.
-
-        Expected Results:
-        4. Swap call succeed.
-        5. Swap call succeed.
-        6. Call between DUT and PhoneC continues.
-        7. All participant call end.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
-            2)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on PhoneB, and end call on PhoneC.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[1],
-                                                              ads[2])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mt_mt_add_swap_once_drop_held(self):
-        """ Test 1x MT+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. PhoneB call to DUT, answer on DUT.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Drop on PhoneC.
-        6. Drop on PhoneB.
-
-        Expected Results:
-        4. Swap call succeed.
-        5. Call between DUT and PhoneB continues.
-        6. All participant call end.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
-            1)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on PhoneC, and end call on PhoneB.")
-        return self._test_1x_multi_call_drop_from_participant(ads[0], ads[2],
-                                                              ads[1])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mt_mt_add_drop_on_dut(self):
-        """ Test 1x MT+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. Call from PhoneB to DUT, accept on DUT.
-        3. Call from PhoneC to DUT, accept on DUT.
-        4. End call on DUT.
-        5. End call on DUT.
-
-        Expected Results:
-        4. DUT drop call, PhoneC also end. Then DUT receive callback from PhoneB.
-        5. DUT drop call, call also end on PhoneB.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
-            0)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on DUT, DUT should receive callback.")
-        return self._test_1x_multi_call_drop_from_host(ads[0], ads[2], ads[1])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mt_mt_add_swap_twice_drop_on_dut(self):
-        """ Test 1x MT+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. PhoneB call to DUT, answer on DUT.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Swap active call on DUT.
-        6. Drop current call on DUT.
-        7. Drop current call on DUT.
-
-        Expected Results:
-        4. Swap call succeed.
-        5. Swap call succeed.
-        6. DUT drop call, PhoneC also end. Then DUT receive callback from PhoneB.
-        7. DUT drop call, call also end on PhoneB.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
-            2)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on DUT, DUT should receive callback.")
-        return self._test_1x_multi_call_drop_from_host(ads[0], ads[2], ads[1])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_1x_mt_mt_add_swap_once_drop_on_dut(self):
-        """ Test 1x MT+MT call among three phones.
-
-        Steps:
-        1. DUT in 1x idle, PhoneB and PhoneC idle.
-        2. PhoneB call to DUT, answer on DUT.
-        3. PhoneC call to DUT, answer on DUT
-        4. Swap active call on DUT.
-        5. Drop current call on DUT.
-        6. Drop current call on DUT.
-
-        Expected Results:
-        4. Swap call succeed.
-        5. DUT drop call, PhoneB also end. Then DUT receive callback from PhoneC.
-        6. DUT drop call, call also end on PhoneC.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id, call_conf_id = self._test_1x_mt_mt_add_swap_x(
-            1)
-        if ((call_ab_id is None) or (call_ac_id is None) or
-            (call_conf_id is None)):
-            self.log.error("Failed to setup 3 way call.")
-            return False
-
-        self.log.info("Verify no one dropped call.")
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
-
-        self.log.info("End call on DUT, DUT should receive callback.")
-        return self._test_1x_multi_call_drop_from_host(ads[0], ads[1], ads[2])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
-
-        Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
-        Call from PhoneA (VoLTE) to PhoneC (VoLTE), accept on PhoneC.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (VoLTE), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneC, verify call continues.
-        5. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_merge_drop_second_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (VoLTE), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-C, verify call continues.
-        5. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (VoLTE), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneB, verify call continues.
-        5. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_merge_drop_first_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (VoLTE), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-B, verify call continues.
-        5. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
-
-        Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
-        Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
-        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneC, verify call continues.
-        5. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_merge_drop_second_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
-        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-C, verify call continues.
-        5. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
-        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneB, verify call continues.
-        5. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_merge_drop_first_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (VoLTE), accept on PhoneB.
-        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-B, verify call continues.
-        5. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
-
-        Call from PhoneB (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneC, verify call continues.
-        5. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_merge_drop_second_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-C, verify call continues.
-        5. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneB, verify call continues.
-        5. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_merge_drop_first_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (VoLTE) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-B, verify call continues.
-        5. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
-
-        Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
-        Call from PhoneA (VOLTE) to PhoneC (WCDMA), accept on PhoneC.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (WCDMA), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneC, verify call continues.
-        5. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_merge_drop_second_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (WCDMA), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-C, verify call continues.
-        5. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (WCDMA), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneB, verify call continues.
-        5. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_merge_drop_first_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (WCDMA), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-B, verify call continues.
-        5. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
-
-        Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
-        Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
-        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneC, verify call continues.
-        5. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_merge_drop_second_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
-        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-C, verify call continues.
-        5. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
-        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneB, verify call continues.
-        5. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_merge_drop_first_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (WCDMA), accept on PhoneB.
-        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-B, verify call continues.
-        5. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
-
-        Call from PhoneB (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneC, verify call continues.
-        5. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_merge_drop_second_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-C, verify call continues.
-        5. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneB, verify call continues.
-        5. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_merge_drop_first_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (WCDMA) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-B, verify call continues.
-        5. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
-
-        Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
-        Call from PhoneA (VOLTE) to PhoneC (1x), accept on PhoneC.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (1x), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneC, verify call continues.
-        5. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_merge_drop_second_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (1x), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-C, verify call continues.
-        5. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (1x), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneB, verify call continues.
-        5. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_merge_drop_first_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
-        2. Call from PhoneA (VoLTE) to PhoneC (1x), accept on PhoneC.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-B, verify call continues.
-        5. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
-
-        Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
-        Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
-        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneC, verify call continues.
-        5. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_merge_drop_second_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
-        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-C, verify call continues.
-        5. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
-        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneB, verify call continues.
-        5. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_merge_drop_first_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneA (VoLTE) to PhoneB (1x), accept on PhoneB.
-        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-B, verify call continues.
-        5. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
-
-        Call from PhoneB (1x) to PhoneA (VoLTE), accept on PhoneA.
-        Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (1x) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneC, verify call continues.
-        5. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_merge_drop_second_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (1x) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-C, verify call continues.
-        5. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (1x) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. End call on PhoneB, verify call continues.
-        5. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_merge_drop_first_call_from_host_cep(self):
-        """ Test VoLTE Conference Call among three phones. CEP enabled.
-
-        1. Call from PhoneB (1x) to PhoneA (VoLTE), accept on PhoneA.
-        2. Call from PhoneC (1x) to PhoneA (VoLTE), accept on PhoneA.
-        3. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        4. On PhoneA disconnect call between A-B, verify call continues.
-        5. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_twice_drop_held(self):
-        """Test swap feature in VoLTE call.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_twice_drop_active(self):
-        """Test swap feature in VoLTE call.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_twice_drop_held(self):
-        """Test swap feature in VoLTE call.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_twice_drop_active(self):
-        """Test swap feature in VoLTE call.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_once_drop_held(self):
-        """Test swap feature in VoLTE call.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_once_drop_active(self):
-        """Test swap feature in VoLTE call.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_once_drop_held(self):
-        """Test swap feature in VoLTE call.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_once_drop_active(self):
-        """Test swap feature in VoLTE call.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mo_add_swap_twice_drop_held(self):
-        """Test swap feature in WCDMA call.
-
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mo_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mo_add_swap_twice_drop_active(self):
-        """Test swap feature in WCDMA call.
-
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mo_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mt_add_swap_twice_drop_held(self):
-        """Test swap feature in WCDMA call.
-
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mt_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mt_add_swap_twice_drop_active(self):
-        """Test swap feature in WCDMA call.
-
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mt_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mo_add_swap_once_drop_held(self):
-        """Test swap feature in WCDMA call.
-
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mo_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mo_add_swap_once_drop_active(self):
-        """Test swap feature in WCDMA call.
-
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mo_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mt_add_swap_once_drop_held(self):
-        """Test swap feature in WCDMA call.
-
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mt_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mt_add_swap_once_drop_active(self):
-        """Test swap feature in WCDMA call.
-
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mt_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mo_add_swap_twice_drop_held(self):
-        """Test swap feature in CSFB WCDMA call.
-
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (CSFB WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mo_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mo_add_swap_twice_drop_active(self):
-        """Test swap feature in CSFB WCDMA call.
-
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (CSFB WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mo_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mt_add_swap_twice_drop_held(self):
-        """Test swap feature in CSFB WCDMA call.
-
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mt_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mt_add_swap_twice_drop_active(self):
-        """Test swap feature in CSFB WCDMA call.
-
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mt_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mo_add_swap_once_drop_held(self):
-        """Test swap feature in CSFB WCDMA call.
-
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (CSFB WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mo_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mo_add_swap_once_drop_active(self):
-        """Test swap feature in CSFB WCDMA call.
-
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (CSFB WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mo_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mt_add_swap_once_drop_held(self):
-        """Test swap feature in CSFB WCDMA call.
-
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mt_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mt_add_swap_once_drop_active(self):
-        """Test swap feature in CSFB WCDMA call.
-
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
-
-        """
-        ads = self.android_devices
-
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mt_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[2]])
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_once_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. No CEP.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        Swap active call on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_once_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. End call on PhoneC, verify call continues.
-        6. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_once_merge_drop_second_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. On PhoneA disconnect call between A-C, verify call continues.
-        6. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_once_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. End call on PhoneB, verify call continues.
-        6. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_once_merge_drop_first_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. On PhoneA disconnect call between A-B, verify call continues.
-        6. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_twice_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. No CEP.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_twice_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. End call on PhoneC, verify call continues.
-        7. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_twice_merge_drop_second_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. On PhoneA disconnect call between A-C, verify call continues.
-        7. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_twice_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. End call on PhoneB, verify call continues.
-        7. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_volte_swap_twice_merge_drop_first_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. On PhoneA disconnect call between A-B, verify call continues.
-        7. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_once_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. No CEP.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_once_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. End call on PhoneC, verify call continues.
-        6. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_once_merge_drop_second_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. On PhoneA disconnect call between A-C, verify call continues.
-        6. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_once_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. End call on PhoneB, verify call continues.
-        6. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_once_merge_drop_first_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. On PhoneA disconnect call between A-B, verify call continues.
-        6. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_twice_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. No CEP.
-
-        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_twice_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. End call on PhoneC, verify call continues.
-        7. End call on PhoneB, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_twice_merge_drop_second_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. On PhoneA disconnect call between A-C, verify call continues.
-        7. On PhoneA disconnect call between A-B, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_twice_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. End call on PhoneB, verify call continues.
-        7. End call on PhoneC, verify call end on PhoneA.
-
-        Returns:
-            True if pass; False if fail.
-        """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_volte_swap_twice_merge_drop_first_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. On PhoneA disconnect call between A-B, verify call continues.
-        7. On PhoneA disconnect call between A-C, verify call continues.
-
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=2,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_swap_once_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. No CEP.
+    def test_volte_mo_mo_add_volte_swap_once_drop_held(self):
+        """Test swap feature in VoLTE call.
 
-        PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
         Swap active call on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_swap_once_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_volte_mo_mo_add_volte_swap_once_drop_active(self):
+        """Test swap feature in VoLTE call.
 
-        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. End call on PhoneC, verify call continues.
-        6. End call on PhoneB, verify call end on PhoneA.
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_swap_once_merge_drop_second_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_volte_mo_mt_add_volte_swap_once_drop_held(self):
+        """Test swap feature in VoLTE call.
 
-        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. On PhoneA disconnect call between A-C, verify call continues.
-        6. On PhoneA disconnect call between A-B, verify call continues.
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_swap_once_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_volte_mo_mt_add_volte_swap_once_drop_active(self):
+        """Test swap feature in VoLTE call.
 
-        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. End call on PhoneB, verify call continues.
-        6. End call on PhoneC, verify call end on PhoneA.
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=1,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_swap_once_merge_drop_first_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_wcdma_mo_mo_add_swap_twice_drop_held(self):
+        """Test swap feature in WCDMA call.
 
-        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. On PhoneA disconnect call between A-B, verify call continues.
-        6. On PhoneA disconnect call between A-C, verify call continues.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "3g", "general", CONFERENCE_MO_MO, num_swaps=2,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_swap_twice_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. No CEP.
+    def test_wcdma_mo_mo_add_swap_twice_drop_active(self):
+        """Test swap feature in WCDMA call.
 
-        PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "3g", "general", CONFERENCE_MO_MO, num_swaps=2,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_swap_twice_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_wcdma_mo_mt_add_swap_twice_drop_held(self):
+        """Test swap feature in WCDMA call.
 
-        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. End call on PhoneC, verify call continues.
-        7. End call on PhoneB, verify call end on PhoneA.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (WCDMA), accept on PhoneA.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "wcdma", "general", CONFERENCE_MO_MT, num_swaps=2,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_swap_twice_merge_drop_second_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_wcdma_mo_mt_add_swap_twice_drop_active(self):
+        """Test swap feature in WCDMA call.
 
-        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. On PhoneA disconnect call between A-C, verify call continues.
-        7. On PhoneA disconnect call between A-B, verify call continues.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (WCDMA), accept on PhoneA.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "wcdma", "general", CONFERENCE_MO_MT, num_swaps=2,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_swap_twice_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_wcdma_mo_mo_add_swap_once_drop_held(self):
+        """Test swap feature in WCDMA call.
 
-        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. End call on PhoneB, verify call continues.
-        7. End call on PhoneC, verify call end on PhoneA.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "3g", "general", CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_volte_swap_twice_merge_drop_first_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_wcdma_mo_mo_add_swap_once_drop_active(self):
+        """Test swap feature in WCDMA call.
 
-        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. On PhoneA disconnect call between A-B, verify call continues.
-        7. On PhoneA disconnect call between A-C, verify call continues.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "3g", "general", CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_swap_once_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
+    def test_wcdma_mo_mt_add_swap_once_drop_held(self):
+        """Test swap feature in WCDMA call.
 
-        PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (WCDMA), accept on PhoneA.
         Swap active call on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "wcdma", "general", CONFERENCE_MO_MT, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_swap_once_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_wcdma_mo_mt_add_swap_once_drop_active(self):
+        """Test swap feature in WCDMA call.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. End call on PhoneC, verify call continues.
-        6. End call on PhoneB, verify call end on PhoneA.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (WCDMA), accept on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "wcdma", "general", CONFERENCE_MO_MT, num_swaps=1,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_swap_once_merge_drop_second_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_csfb_wcdma_mo_mo_add_swap_twice_drop_held(self):
+        """Test swap feature in CSFB WCDMA call.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. On PhoneA disconnect call between A-C, verify call continues.
-        6. On PhoneA disconnect call between A-B, verify call continues.
+        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (CSFB WCDMA) call PhoneC, accept on PhoneC.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MO, num_swaps=2,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_swap_once_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_csfb_wcdma_mo_mo_add_swap_twice_drop_active(self):
+        """Test swap feature in CSFB WCDMA call.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. End call on PhoneB, verify call continues.
-        6. End call on PhoneC, verify call end on PhoneA.
+        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (CSFB WCDMA) call PhoneC, accept on PhoneC.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MO, num_swaps=2,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_swap_once_merge_drop_first_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_csfb_wcdma_mo_mt_add_swap_twice_drop_held(self):
+        """Test swap feature in CSFB WCDMA call.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        5. On PhoneA disconnect call between A-B, verify call continues.
-        6. On PhoneA disconnect call between A-C, verify call continues.
+        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MT, num_swaps=2,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_swap_twice_merge_drop_second_call_from_participant_no_cep(
-            self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
+    def test_csfb_wcdma_mo_mt_add_swap_twice_drop_active(self):
+        """Test swap feature in CSFB WCDMA call.
 
-        PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
+        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
-        On PhoneA, merge to conference call (No CEP).
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MT, num_swaps=2,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_swap_twice_merge_drop_second_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_csfb_wcdma_mo_mo_add_swap_once_drop_held(self):
+        """Test swap feature in CSFB WCDMA call.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. End call on PhoneC, verify call continues.
-        7. End call on PhoneB, verify call end on PhoneA.
+        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (CSFB WCDMA) call PhoneC, accept on PhoneC.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_swap_twice_merge_drop_second_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_csfb_wcdma_mo_mo_add_swap_once_drop_active(self):
+        """Test swap feature in CSFB WCDMA call.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. On PhoneA disconnect call between A-C, verify call continues.
-        7. On PhoneA disconnect call between A-B, verify call continues.
+        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (CSFB WCDMA) call PhoneC, accept on PhoneC.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_swap_twice_merge_drop_first_call_from_participant_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_csfb_wcdma_mo_mt_add_swap_once_drop_held(self):
+        """Test swap feature in CSFB WCDMA call.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. End call on PhoneB, verify call continues.
-        7. End call on PhoneC, verify call end on PhoneA.
+        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MT, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_wcdma_swap_twice_merge_drop_first_call_from_host_cep(
-            self):
-        """ Test swap and merge features in VoLTE call. CEP enabled.
+    def test_csfb_wcdma_mo_mt_add_swap_once_drop_active(self):
+        """Test swap feature in CSFB WCDMA call.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
-        3. Swap active call on PhoneA.
-        4. Swap active call on PhoneA.
-        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
-        6. On PhoneA disconnect call between A-B, verify call continues.
-        7. On PhoneA disconnect call between A-C, verify call continues.
+        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        Returns:
-            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MT, num_swaps=1,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_swap_once_merge_drop_second_call_from_participant_no_cep(
+    def test_volte_mo_mo_add_volte_swap_once_merge_drop_second_call_from_participant_no_cep(
             self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
+        """ Test swap and merge features in VoLTE call. No CEP.
 
-        PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
         Swap active call on PhoneA.
         On PhoneA, merge to conference call (No CEP).
         End call on PhoneC, verify call continues.
@@ -5946,20 +2711,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_swap_once_merge_drop_second_call_from_participant_cep(
+    def test_volte_mo_mo_add_volte_swap_once_merge_drop_second_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. End call on PhoneC, verify call continues.
@@ -5968,20 +2731,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_swap_once_merge_drop_second_call_from_host_cep(
+    def test_volte_mo_mo_add_volte_swap_once_merge_drop_second_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. On PhoneA disconnect call between A-C, verify call continues.
@@ -5990,20 +2751,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_swap_once_merge_drop_first_call_from_participant_cep(
+    def test_volte_mo_mo_add_volte_swap_once_merge_drop_first_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. End call on PhoneB, verify call continues.
@@ -6012,20 +2771,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_swap_once_merge_drop_first_call_from_host_cep(
+    def test_volte_mo_mo_add_volte_swap_once_merge_drop_first_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. On PhoneA disconnect call between A-B, verify call continues.
@@ -6034,20 +2791,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_swap_twice_merge_drop_second_call_from_participant_no_cep(
+    def test_volte_mo_mo_add_volte_swap_twice_merge_drop_second_call_from_participant_no_cep(
             self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
+        """ Test swap and merge features in VoLTE call. No CEP.
 
-        PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         On PhoneA, merge to conference call (No CEP).
@@ -6057,20 +2812,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_swap_twice_merge_drop_second_call_from_participant_cep(
+    def test_volte_mo_mo_add_volte_swap_twice_merge_drop_second_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6080,20 +2833,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_swap_twice_merge_drop_second_call_from_host_cep(
+    def test_volte_mo_mo_add_volte_swap_twice_merge_drop_second_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6103,20 +2854,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_swap_twice_merge_drop_first_call_from_participant_cep(
+    def test_volte_mo_mo_add_volte_swap_twice_merge_drop_first_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6126,20 +2875,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_wcdma_swap_twice_merge_drop_first_call_from_host_cep(
+    def test_volte_mo_mo_add_volte_swap_twice_merge_drop_first_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (VoLTE), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6149,20 +2896,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_swap_once_merge_drop_second_call_from_participant_no_cep(
+    def test_volte_mo_mt_add_volte_swap_once_merge_drop_second_call_from_participant_no_cep(
             self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
+        """ Test swap and merge features in VoLTE call. No CEP.
 
-        PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         Swap active call on PhoneA.
         On PhoneA, merge to conference call (No CEP).
         End call on PhoneC, verify call continues.
@@ -6171,20 +2916,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_swap_once_merge_drop_second_call_from_participant_cep(
+    def test_volte_mo_mt_add_volte_swap_once_merge_drop_second_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. End call on PhoneC, verify call continues.
@@ -6193,20 +2936,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_swap_once_merge_drop_second_call_from_host_cep(
+    def test_volte_mo_mt_add_volte_swap_once_merge_drop_second_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. On PhoneA disconnect call between A-C, verify call continues.
@@ -6215,20 +2956,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_swap_once_merge_drop_first_call_from_participant_cep(
+    def test_volte_mo_mt_add_volte_swap_once_merge_drop_first_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. End call on PhoneB, verify call continues.
@@ -6237,20 +2976,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_swap_once_merge_drop_first_call_from_host_cep(
+    def test_volte_mo_mt_add_volte_swap_once_merge_drop_first_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. On PhoneA disconnect call between A-B, verify call continues.
@@ -6259,20 +2996,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_swap_twice_merge_drop_second_call_from_participant_no_cep(
+    def test_volte_mo_mt_add_volte_swap_twice_merge_drop_second_call_from_participant_no_cep(
             self):
-        """ Test VoLTE Conference Call among three phones. No CEP.
+        """ Test swap and merge features in VoLTE call. No CEP.
 
-        PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         On PhoneA, merge to conference call (No CEP).
@@ -6282,20 +3017,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_swap_twice_merge_drop_second_call_from_participant_cep(
+    def test_volte_mo_mt_add_volte_swap_twice_merge_drop_second_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6305,20 +3038,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_swap_twice_merge_drop_second_call_from_host_cep(
+    def test_volte_mo_mt_add_volte_swap_twice_merge_drop_second_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6328,20 +3059,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_swap_twice_merge_drop_first_call_from_participant_cep(
+    def test_volte_mo_mt_add_volte_swap_twice_merge_drop_first_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6351,20 +3080,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_wcdma_swap_twice_merge_drop_first_call_from_host_cep(
+    def test_volte_mo_mt_add_volte_swap_twice_merge_drop_first_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (VoLTE), accept on PhoneB.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6374,20 +3101,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_swap_once_merge_drop_second_call_from_participant_no_cep(
+    def test_volte_mt_mt_add_volte_swap_once_merge_drop_second_call_from_participant_no_cep(
             self):
         """ Test swap and merge features in VoLTE call. No CEP.
 
-        PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         Swap active call on PhoneA.
         On PhoneA, merge to conference call (No CEP).
         End call on PhoneC, verify call continues.
@@ -6396,20 +3121,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_swap_once_merge_drop_second_call_from_participant_cep(
+    def test_volte_mt_mt_add_volte_swap_once_merge_drop_second_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. End call on PhoneC, verify call continues.
@@ -6418,20 +3141,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_swap_once_merge_drop_second_call_from_host_cep(
+    def test_volte_mt_mt_add_volte_swap_once_merge_drop_second_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. On PhoneA disconnect call between A-C, verify call continues.
@@ -6440,20 +3161,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_swap_once_merge_drop_first_call_from_participant_cep(
+    def test_volte_mt_mt_add_volte_swap_once_merge_drop_first_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. End call on PhoneB, verify call continues.
@@ -6462,20 +3181,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_swap_once_merge_drop_first_call_from_host_cep(
+    def test_volte_mt_mt_add_volte_swap_once_merge_drop_first_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. On PhoneA disconnect call between A-B, verify call continues.
@@ -6484,20 +3201,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_swap_twice_merge_drop_second_call_from_participant_no_cep(
+    def test_volte_mt_mt_add_volte_swap_twice_merge_drop_second_call_from_participant_no_cep(
             self):
         """ Test swap and merge features in VoLTE call. No CEP.
 
-        PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         On PhoneA, merge to conference call (No CEP).
@@ -6507,20 +3222,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_swap_twice_merge_drop_second_call_from_participant_cep(
+    def test_volte_mt_mt_add_volte_swap_twice_merge_drop_second_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6530,20 +3243,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_swap_twice_merge_drop_second_call_from_host_cep(
+    def test_volte_mt_mt_add_volte_swap_twice_merge_drop_second_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6553,20 +3264,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_swap_twice_merge_drop_first_call_from_participant_cep(
+    def test_volte_mt_mt_add_volte_swap_twice_merge_drop_first_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6576,20 +3285,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mo_add_1x_swap_twice_merge_drop_first_call_from_host_cep(
+    def test_volte_mt_mt_add_volte_swap_twice_merge_drop_first_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        1. PhoneB (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (VoLTE) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6599,20 +3306,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mo_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "volte", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_swap_once_merge_drop_second_call_from_participant_no_cep(
+    def test_volte_mo_mo_add_wcdma_swap_once_merge_drop_second_call_from_participant_no_cep(
             self):
-        """ Test swap and merge features in VoLTE call. No CEP.
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
         Swap active call on PhoneA.
         On PhoneA, merge to conference call (No CEP).
         End call on PhoneC, verify call continues.
@@ -6621,20 +3326,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_swap_once_merge_drop_second_call_from_participant_cep(
+    def test_volte_mo_mo_add_wcdma_swap_once_merge_drop_second_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. End call on PhoneC, verify call continues.
@@ -6643,20 +3346,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_swap_once_merge_drop_second_call_from_host_cep(
+    def test_volte_mo_mo_add_wcdma_swap_once_merge_drop_second_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. On PhoneA disconnect call between A-C, verify call continues.
@@ -6665,20 +3366,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_swap_once_merge_drop_first_call_from_participant_cep(
+    def test_volte_mo_mo_add_wcdma_swap_once_merge_drop_first_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. End call on PhoneB, verify call continues.
@@ -6687,20 +3386,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_swap_once_merge_drop_first_call_from_host_cep(
+    def test_volte_mo_mo_add_wcdma_swap_once_merge_drop_first_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. On PhoneA disconnect call between A-B, verify call continues.
@@ -6709,20 +3406,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_swap_twice_merge_drop_second_call_from_participant_no_cep(
+    def test_volte_mo_mo_add_wcdma_swap_twice_merge_drop_second_call_from_participant_no_cep(
             self):
-        """ Test swap and merge features in VoLTE call. No CEP.
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         On PhoneA, merge to conference call (No CEP).
@@ -6732,20 +3427,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_swap_twice_merge_drop_second_call_from_participant_cep(
+    def test_volte_mo_mo_add_wcdma_swap_twice_merge_drop_second_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
-
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6755,20 +3448,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_swap_twice_merge_drop_second_call_from_host_cep(
+    def test_volte_mo_mo_add_wcdma_swap_twice_merge_drop_second_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6778,20 +3469,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_swap_twice_merge_drop_first_call_from_participant_cep(
+    def test_volte_mo_mo_add_wcdma_swap_twice_merge_drop_first_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6801,20 +3490,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mo_mt_add_1x_swap_twice_merge_drop_first_call_from_host_cep(
+    def test_volte_mo_mo_add_wcdma_swap_twice_merge_drop_first_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (WCDMA), accept on PhoneC.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6824,20 +3511,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mo_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_swap_once_merge_drop_second_call_from_participant_no_cep(
+    def test_volte_mo_mt_add_wcdma_swap_once_merge_drop_second_call_from_participant_no_cep(
             self):
-        """ Test swap and merge features in VoLTE call. No CEP.
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
-        PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         Swap active call on PhoneA.
         On PhoneA, merge to conference call (No CEP).
         End call on PhoneC, verify call continues.
@@ -6846,20 +3531,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_swap_once_merge_drop_second_call_from_participant_cep(
+    def test_volte_mo_mt_add_wcdma_swap_once_merge_drop_second_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. End call on PhoneC, verify call continues.
@@ -6868,20 +3551,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_swap_once_merge_drop_second_call_from_host_cep(
+    def test_volte_mo_mt_add_wcdma_swap_once_merge_drop_second_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. On PhoneA disconnect call between A-C, verify call continues.
@@ -6890,20 +3571,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_swap_once_merge_drop_first_call_from_participant_cep(
+    def test_volte_mo_mt_add_wcdma_swap_once_merge_drop_first_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. End call on PhoneB, verify call continues.
@@ -6912,20 +3591,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_swap_once_merge_drop_first_call_from_host_cep(
+    def test_volte_mo_mt_add_wcdma_swap_once_merge_drop_first_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. On PhoneA, merge to conference call (VoLTE CEP conference call).
         5. On PhoneA disconnect call between A-B, verify call continues.
@@ -6934,20 +3611,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_swap_twice_merge_drop_second_call_from_participant_no_cep(
+    def test_volte_mo_mt_add_wcdma_swap_twice_merge_drop_second_call_from_participant_no_cep(
             self):
-        """ Test swap and merge features in VoLTE call. No CEP.
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
-        PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         On PhoneA, merge to conference call (No CEP).
@@ -6957,20 +3632,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_swap_twice_merge_drop_second_call_from_participant_cep(
+    def test_volte_mo_mt_add_wcdma_swap_twice_merge_drop_second_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -6980,20 +3653,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_swap_twice_merge_drop_second_call_from_host_cep(
+    def test_volte_mo_mt_add_wcdma_swap_twice_merge_drop_second_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -7003,20 +3674,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_swap_twice_merge_drop_first_call_from_participant_cep(
+    def test_volte_mo_mt_add_wcdma_swap_twice_merge_drop_first_call_from_participant_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -7026,20 +3695,18 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_volte_mt_mt_add_1x_swap_twice_merge_drop_first_call_from_host_cep(
+    def test_volte_mo_mt_add_wcdma_swap_twice_merge_drop_first_call_from_host_cep(
             self):
         """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
-        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (WCDMA), accept on PhoneB.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         3. Swap active call on PhoneA.
         4. Swap active call on PhoneA.
         5. On PhoneA, merge to conference call (VoLTE CEP conference call).
@@ -7049,969 +3716,889 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_volte_mt_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mo_add_swap_once_merge_drop(self):
-        """Test swap and merge feature in CSFB WCDMA call.
-
-        PhoneA (CSFB_WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (CSFB_WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
-
-        """
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mo_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mo_add_swap_twice_merge_drop(self):
-        """Test swap and merge feature in CSFB WCDMA call.
-
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (CSFB WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
-
-        """
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mo_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mt_add_swap_once_merge_drop(self):
-        """Test swap and merge feature in CSFB WCDMA call.
-
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
-
-        """
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mt_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
-
-    @TelephonyBaseTest.tel_test_wrap
-    def test_csfb_wcdma_mo_mt_add_swap_twice_merge_drop(self):
-        """Test swap and merge feature in CSFB WCDMA call.
-
-        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
-
-        """
-        call_ab_id, call_ac_id = self._test_csfb_wcdma_mo_mt_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mo_add_swap_once_merge_drop(self):
-        """Test swap and merge feature in WCDMA call.
+    def test_volte_mt_mt_add_wcdma_swap_once_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
+        PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        On PhoneA, merge to conference call (No CEP).
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mo_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mo_add_swap_twice_merge_drop(self):
-        """Test swap and merge feature in WCDMA call.
+    def test_volte_mt_mt_add_wcdma_swap_once_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. End call on PhoneC, verify call continues.
+        6. End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mo_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mt_add_swap_once_merge_drop(self):
-        """Test swap and merge feature in WCDMA call.
-
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+    def test_volte_mt_mt_add_wcdma_swap_once_merge_drop_second_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        """
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mt_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. On PhoneA disconnect call between A-C, verify call continues.
+        6. On PhoneA disconnect call between A-B, verify call continues.
 
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mo_mt_add_swap_twice_merge_drop(self):
-        """Test swap and merge feature in WCDMA call.
+    def test_volte_mt_mt_add_wcdma_swap_once_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
-        PhoneC call PhoneA (WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. End call on PhoneB, verify call continues.
+        6. End call on PhoneC, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_wcdma_mo_mt_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mt_mt_add_swap_once_merge_drop(self):
-        """Test swap and merge feature in WCDMA call.
+    def test_volte_mt_mt_add_wcdma_swap_once_merge_drop_first_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        PhoneB call PhoneA (WCDMA), accept on PhoneA.
-        PhoneC call PhoneA (WCDMA), accept on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. On PhoneA disconnect call between A-B, verify call continues.
+        6. On PhoneA disconnect call between A-C, verify call continues.
 
+        Returns:
+            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_wcdma_mt_mt_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mt_mt_add_swap_twice_merge_drop(self):
-        """Test swap and merge feature in WCDMA call.
+    def test_volte_mt_mt_add_wcdma_swap_twice_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test VoLTE Conference Call among three phones. No CEP.
 
-        PhoneB call PhoneA (WCDMA), accept on PhoneA.
-        PhoneC call PhoneA (WCDMA), accept on PhoneA.
+        PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        On PhoneA, merge to conference call (No CEP).
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_wcdma_mt_mt_add_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_wcdma_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_wcdma_mt_mt_add_merge_unmerge_swap_drop(self):
-        """Test Conference Call Unmerge operation.
+    def test_volte_mt_mt_add_wcdma_swap_twice_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Phones A, B, C are in WCDMA Conference call (MT-MT-Merge)
-        Unmerge call with B on PhoneA
-        Check the number of Call Ids to be 2 on PhoneA
-        Check if call AB is active since 'B' was unmerged
-        Swap call to C
-        Check if call AC is active
-        Tear down calls
-        All Phones should be in Idle
+        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. End call on PhoneC, verify call continues.
+        7. End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_wcdma_mt_mt_add_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            self.log.error("Either of Call AB ID or Call AC ID is None.")
-            return False
-
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        self.log.info("Step4: Merge to Conf Call and verify Conf Call.")
-        ads[0].droid.telecomCallJoinCallsInConf(call_ab_id, call_ac_id)
-        time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 3:
-            self.log.error("Total number of call ids in {} is not 3.".format(
-                ads[0].serial))
-            return False
-        call_conf_id = None
-        for call_id in calls:
-            if call_id != call_ab_id and call_id != call_ac_id:
-                call_conf_id = call_id
-        if not call_conf_id:
-            self.log.error("Merge call fail, no new conference call id.")
-            return False
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_wcdma_swap_twice_merge_drop_second_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        # Check if Conf Call currently active
-        if ads[0].droid.telecomCallGetCallState(
-                call_conf_id) != CALL_STATE_ACTIVE:
-            self.log.error(
-                "Call_id:{}, state:{}, expected: STATE_ACTIVE".format(
-                    call_conf_id, ads[0].droid.telecomCallGetCallState(
-                        call_conf_id)))
-            return False
+        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. On PhoneA disconnect call between A-C, verify call continues.
+        7. On PhoneA disconnect call between A-B, verify call continues.
 
-        # Unmerge
-        self.log.info("Step5: UnMerge Conf Call into individual participants.")
-        ads[0].droid.telecomCallSplitFromConf(call_ab_id)
-        time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
-        # Are there 2 calls?
-        if num_active_calls(self.log, ads[0]) != 2:
-            self.log.error("Total number of call ids in {} is not 2".format(
-                ads[0].serial))
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_wcdma_swap_twice_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        # Unmerged calls not dropped?
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            self.log.error("Either Call_AB or Call_AC was dropped")
-            return False
+        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. End call on PhoneB, verify call continues.
+        7. End call on PhoneC, verify call end on PhoneA.
 
-        # Unmerged call in call state ACTIVE?
-        if ads[0].droid.telecomCallGetCallState(
-                call_ab_id) != CALL_STATE_ACTIVE:
-            self.log.error(
-                "Call_id:{}, state:{}, expected: STATE_ACTIVE".format(
-                    call_ab_id, ads[0].droid.telecomCallGetCallState(
-                        call_ab_id)))
-            return False
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        # Swap call
-        self.log.info("Step6: Swap call and see if Call_AC is ACTIVE.")
-        num_swaps = 1
-        if not swap_calls(self.log, ads, call_ac_id, call_ab_id, num_swaps):
-            self.log.error("Failed to swap calls.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_wcdma_swap_twice_merge_drop_first_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        # Other call in call state ACTIVE?
-        if ads[0].droid.telecomCallGetCallState(
-                call_ac_id) != CALL_STATE_ACTIVE:
-            self.log.error(
-                "Call_id:{}, state:{}, expected: STATE_ACTIVE".format(
-                    call_ac_id, ads[0].droid.telecomCallGetCallState(
-                        call_ac_id)))
-            return False
+        1. PhoneB (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (WCDMA) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. On PhoneA disconnect call between A-B, verify call continues.
+        7. On PhoneA disconnect call between A-C, verify call continues.
 
-        # All calls still CONNECTED?
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "wcdma", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_merge_drop_wfc_wifi_only(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mo_add_1x_swap_once_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. No CEP.
 
-        Call from PhoneA (epdg) to PhoneB (epdg), accept on PhoneB.
-        Call from PhoneA (epdg) to PhoneC (epdg), accept on PhoneC.
-        On PhoneA, merge to conference call.
+        PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        Swap active call on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
         End call on PhoneC, verify call continues.
         End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_1x_swap_once_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. End call on PhoneC, verify call continues.
+        6. End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_merge_drop_wfc_wifi_preferred(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mo_add_1x_swap_once_merge_drop_second_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneA (epdg) to PhoneB (epdg), accept on PhoneB.
-        Call from PhoneA (epdg) to PhoneC (epdg), accept on PhoneC.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. On PhoneA disconnect call between A-C, verify call continues.
+        6. On PhoneA disconnect call between A-B, verify call continues.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_merge_drop_wfc_wifi_only(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mo_add_1x_swap_once_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneA (epdg) to PhoneB (epdg), accept on PhoneB.
-        Call from PhoneC (epdg) to PhoneA (epdg), accept on PhoneA.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. End call on PhoneB, verify call continues.
+        6. End call on PhoneC, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_1x_swap_once_merge_drop_first_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. On PhoneA disconnect call between A-B, verify call continues.
+        6. On PhoneA disconnect call between A-C, verify call continues.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_merge_drop_wfc_wifi_preferred(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mo_add_1x_swap_twice_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. No CEP.
 
-        Call from PhoneA (epdg) to PhoneB (epdg), accept on PhoneB.
-        Call from PhoneC (epdg) to PhoneA (epdg), accept on PhoneA.
-        On PhoneA, merge to conference call.
+        PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
         End call on PhoneC, verify call continues.
         End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mt_mt_add_epdg_merge_drop_wfc_wifi_only(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mo_add_1x_swap_twice_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneB (epdg) to PhoneA (epdg), accept on PhoneA.
-        Call from PhoneC (epdg) to PhoneA (epdg), accept on PhoneA.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. End call on PhoneC, verify call continues.
+        7. End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_1x_swap_twice_merge_drop_second_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        call_ab_id, call_ac_id = self._test_epdg_mt_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. On PhoneA disconnect call between A-C, verify call continues.
+        7. On PhoneA disconnect call between A-B, verify call continues.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mt_mt_add_epdg_merge_drop_wfc_wifi_preferred(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mo_add_1x_swap_twice_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneB (epdg) to PhoneA (epdg), accept on PhoneA.
-        Call from PhoneC (epdg) to PhoneA (epdg), accept on PhoneA.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. End call on PhoneB, verify call continues.
+        7. End call on PhoneC, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mo_add_1x_swap_twice_merge_drop_first_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        call_ab_id, call_ac_id = self._test_epdg_mt_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneA (VoLTE) call PhoneC (1x), accept on PhoneC.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. On PhoneA disconnect call between A-B, verify call continues.
+        7. On PhoneA disconnect call between A-C, verify call continues.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_volte_merge_drop_wfc_wifi_only(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mt_add_1x_swap_once_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. No CEP.
 
-        Call from PhoneA (epdg) to PhoneB (VoLTE), accept on PhoneB.
-        Call from PhoneA (epdg) to PhoneC (VoLTE), accept on PhoneC.
-        On PhoneA, merge to conference call.
+        PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        Swap active call on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
         End call on PhoneC, verify call continues.
         End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_1x_swap_once_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. End call on PhoneC, verify call continues.
+        6. End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_volte_merge_drop_wfc_wifi_preferred(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mt_add_1x_swap_once_merge_drop_second_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneA (epdg) to PhoneB (VoLTE), accept on PhoneB.
-        Call from PhoneA (epdg) to PhoneC (VoLTE), accept on PhoneC.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. On PhoneA disconnect call between A-C, verify call continues.
+        6. On PhoneA disconnect call between A-B, verify call continues.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_1x_swap_once_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. End call on PhoneB, verify call continues.
+        6. End call on PhoneC, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_volte_merge_drop_wfc_wifi_only(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mt_add_1x_swap_once_merge_drop_first_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneA (epdg) to PhoneB (VoLTE), accept on PhoneB.
-        Call from PhoneC (VoLTE) to PhoneA (epdg), accept on PhoneA.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. On PhoneA disconnect call between A-B, verify call continues.
+        6. On PhoneA disconnect call between A-C, verify call continues.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_1x_swap_twice_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. No CEP.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_volte_merge_drop_wfc_wifi_preferred(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mt_add_1x_swap_twice_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneA (epdg) to PhoneB (VoLTE), accept on PhoneB.
-        Call from PhoneC (VoLTE) to PhoneA (epdg), accept on PhoneA.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. End call on PhoneC, verify call continues.
+        7. End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_1x_swap_twice_merge_drop_second_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_volte_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. On PhoneA disconnect call between A-C, verify call continues.
+        7. On PhoneA disconnect call between A-B, verify call continues.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_wcdma_merge_drop_wfc_wifi_only(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mo_mt_add_1x_swap_twice_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneA (epdg) to PhoneB (WCDMA), accept on PhoneB.
-        Call from PhoneA (epdg) to PhoneC (WCDMA), accept on PhoneC.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. End call on PhoneB, verify call continues.
+        7. End call on PhoneC, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])),
-                 (phone_setup_voice_3g, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mo_mt_add_1x_swap_twice_merge_drop_first_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneA (VoLTE) call PhoneB (1x), accept on PhoneB.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. On PhoneA disconnect call between A-B, verify call continues.
+        7. On PhoneA disconnect call between A-C, verify call continues.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_wcdma_merge_drop_wfc_wifi_preferred(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mt_mt_add_1x_swap_once_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. No CEP.
 
-        Call from PhoneA (epdg) to PhoneB (WCDMA), accept on PhoneB.
-        Call from PhoneA (epdg) to PhoneC (WCDMA), accept on PhoneC.
-        On PhoneA, merge to conference call.
+        PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        Swap active call on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
         End call on PhoneC, verify call continues.
         End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])),
-                 (phone_setup_voice_3g, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_wcdma_merge_drop_wfc_wifi_only(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mt_mt_add_1x_swap_once_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneA (epdg) to PhoneB (WCDMA), accept on PhoneB.
-        Call from PhoneC (WCDMA) to PhoneA (epdg), accept on PhoneA.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. End call on PhoneC, verify call continues.
+        6. End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])),
-                 (phone_setup_voice_3g, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_1x_swap_once_merge_drop_second_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. On PhoneA disconnect call between A-C, verify call continues.
+        6. On PhoneA disconnect call between A-B, verify call continues.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_wcdma_merge_drop_wfc_wifi_preferred(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mt_mt_add_1x_swap_once_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneA (epdg) to PhoneB (WCDMA), accept on PhoneB.
-        Call from PhoneC (WCDMA) to PhoneA (epdg), accept on PhoneA.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. End call on PhoneB, verify call continues.
+        6. End call on PhoneC, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])),
-                 (phone_setup_voice_3g, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_1x_swap_once_merge_drop_first_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_wcdma_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        5. On PhoneA disconnect call between A-B, verify call continues.
+        6. On PhoneA disconnect call between A-C, verify call continues.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_1x_merge_drop_wfc_wifi_only(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mt_mt_add_1x_swap_twice_merge_drop_second_call_from_participant_no_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. No CEP.
 
-        Call from PhoneA (epdg) to PhoneB (1x), accept on PhoneB.
-        Call from PhoneA (epdg) to PhoneC (1x), accept on PhoneC.
-        On PhoneA, merge to conference call.
+        PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
+        PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        On PhoneA, merge to conference call (No CEP).
         End call on PhoneC, verify call continues.
         End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])),
-                 (phone_setup_voice_3g, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_1x_merge_drop_wfc_wifi_preferred(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mt_mt_add_1x_swap_twice_merge_drop_second_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneA (epdg) to PhoneB (1x), accept on PhoneB.
-        Call from PhoneA (epdg) to PhoneC (1x), accept on PhoneC.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. End call on PhoneC, verify call continues.
+        7. End call on PhoneB, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_volte_mt_mt_add_1x_swap_twice_merge_drop_second_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. On PhoneA disconnect call between A-C, verify call continues.
+        7. On PhoneA disconnect call between A-B, verify call continues.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_1x_merge_drop_wfc_wifi_only(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mt_mt_add_1x_swap_twice_merge_drop_first_call_from_participant_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneA (epdg) to PhoneB (1x), accept on PhoneB.
-        Call from PhoneC (1x) to PhoneA (epdg), accept on PhoneA.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. End call on PhoneB, verify call continues.
+        7. End call on PhoneC, verify call end on PhoneA.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_1x_merge_drop_wfc_wifi_preferred(self):
-        """ Test Conf Call among three phones.
+    def test_volte_mt_mt_add_1x_swap_twice_merge_drop_first_call_from_host_cep(
+            self):
+        """ Test swap and merge features in VoLTE call. CEP enabled.
 
-        Call from PhoneA (epdg) to PhoneB (1x), accept on PhoneB.
-        Call from PhoneC (1x) to PhoneA (epdg), accept on PhoneA.
-        On PhoneA, merge to conference call.
-        End call on PhoneC, verify call continues.
-        End call on PhoneB, verify call end on PhoneA.
+        1. PhoneB (1x) call PhoneA (VoLTE), accept on PhoneA.
+        2. PhoneC (1x) call PhoneA (VoLTE), accept on PhoneA.
+        3. Swap active call on PhoneA.
+        4. Swap active call on PhoneA.
+        5. On PhoneA, merge to conference call (VoLTE CEP conference call).
+        6. On PhoneA disconnect call between A-B, verify call continues.
+        7. On PhoneA disconnect call between A-C, verify call continues.
 
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_1x_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "volte", "1x", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_once_merge_drop_wfc_wifi_only(self):
-        """Test swap and merge feature in epdg call.
+    def test_csfb_wcdma_mo_mo_add_swap_once_merge_drop(self):
+        """Test swap and merge feature in CSFB WCDMA call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        PhoneA (CSFB_WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (CSFB_WCDMA) call PhoneC, accept on PhoneC.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_once_merge_drop_wfc_wifi_preferred(self):
-        """Test swap and merge feature in epdg call.
+    def test_csfb_wcdma_mo_mo_add_swap_twice_merge_drop(self):
+        """Test swap and merge feature in CSFB WCDMA call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (CSFB WCDMA) call PhoneC, accept on PhoneC.
+        Swap active call on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_twice_merge_drop_wfc_wifi_only(self):
-        """Test swap and merge feature in epdg call.
+    def test_csfb_wcdma_mo_mt_add_swap_once_merge_drop(self):
+        """Test swap and merge feature in CSFB WCDMA call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
-        Swap active call on PhoneA.
+        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_twice_merge_drop_wfc_wifi_preferred(
-            self):
-        """Test swap and merge feature in epdg call.
+    def test_csfb_wcdma_mo_mt_add_swap_twice_merge_drop(self):
+        """Test swap and merge feature in CSFB WCDMA call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        PhoneA (CSFB WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (CSFB WCDMA), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
@@ -8019,134 +4606,69 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "csfb", "general", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_once_merge_drop_wfc_wifi_only(self):
-        """Test swap and merge feature in epdg call.
+    def test_wcdma_mo_mo_add_swap_once_merge_drop(self):
+        """Test swap and merge feature in WCDMA call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "3g", "general", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_once_merge_drop_wfc_wifi_preferred(self):
-        """Test swap and merge feature in epdg call.
+    def test_wcdma_mo_mo_add_swap_twice_merge_drop(self):
+        """Test swap and merge feature in WCDMA call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneA (WCDMA) call PhoneC, accept on PhoneC.
+        Swap active call on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "3g", "general", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_twice_merge_drop_wfc_wifi_only(self):
-        """Test swap and merge feature in epdg call.
+    def test_wcdma_mo_mt_add_swap_once_merge_drop(self):
+        """Test swap and merge feature in WCDMA call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (WCDMA), accept on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "wcdma", "general", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_twice_merge_drop_wfc_wifi_preferred(
-            self):
-        """Test swap and merge feature in epdg call.
+    def test_wcdma_mo_mt_add_swap_twice_merge_drop(self):
+        """Test swap and merge feature in WCDMA call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (WCDMA) call PhoneB, accept on PhoneB.
+        PhoneC call PhoneA (WCDMA), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
@@ -8154,452 +4676,514 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "wcdma", "general", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_volte_swap_once_merge_drop_wfc_wifi_only(self):
-        """Test swap and merge feature in epdg call.
+    def test_wcdma_mt_mt_add_swap_once_merge_drop(self):
+        """Test swap and merge feature in WCDMA call.
 
-        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (VoLTE), accept on PhoneC.
+        PhoneB call PhoneA (WCDMA), accept on PhoneA.
+        PhoneC call PhoneA (WCDMA), accept on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "3g", "general", CONFERENCE_MT_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_volte_swap_once_merge_drop_wfc_wifi_preferred(
-            self):
-        """Test swap and merge feature in epdg call.
+    def test_wcdma_mt_mt_add_swap_twice_merge_drop(self):
+        """Test swap and merge feature in WCDMA call.
 
-        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (VoLTE), accept on PhoneC.
+        PhoneB call PhoneA (WCDMA), accept on PhoneA.
+        PhoneC call PhoneA (WCDMA), accept on PhoneA.
+        Swap active call on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
+        """
+        return self._test_conference(ConferenceScenario(
+            "3g", "general", CONFERENCE_MT_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
+
+    @TelephonyBaseTest.tel_test_wrap
+    def test_wcdma_mt_mt_add_merge_unmerge_swap_drop(self):
+        """Test Conference Call Unmerge operation.
+
+        Phones A, B, C are in WCDMA Conference call (MT-MT-Merge)
+        Unmerge call with B on PhoneA
+        Check the number of Call Ids to be 2 on PhoneA
+        Check if call AB is active since 'B' was unmerged
+        Swap call to C
+        Check if call AC is active
+        Tear down calls
+        All Phones should be in Idle
+
         """
         ads = self.android_devices
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
+        call_ab_id, call_ac_id = setup_and_swap_conference_calls(
+            self.log, ads, ConferenceScenario("3g", "general",
+                                              CONFERENCE_MT_MT))
+        if call_ab_id is None or call_ac_id is None:
+            self.log.error("Either of Call AB ID or Call AC ID is None.")
+            return False
+
+        self.log.info("Step4: Merge to Conf Call and verify Conf Call.")
+        ads[0].droid.telecomCallJoinCallsInConf(call_ab_id, call_ac_id)
+        time.sleep(WAIT_TIME_IN_CALL)
+        calls = ads[0].droid.telecomCallGetCallIds()
+        self.log.info("Calls in PhoneA{}".format(calls))
+        if num_active_calls(self.log, ads[0]) != 3:
+            self.log.error("Total number of call ids in {} is not 3.".format(
+                ads[0].serial))
+            return False
+        call_conf_id = None
+        for call_id in calls:
+            if call_id != call_ab_id and call_id != call_ac_id:
+                call_conf_id = call_id
+        if not call_conf_id:
+            self.log.error("Merge call fail, no new conference call id.")
+            return False
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
             return False
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
+        # Check if Conf Call currently active
+        if ads[0].droid.telecomCallGetCallState(
+                call_conf_id) != CALL_STATE_ACTIVE:
+            self.log.error(
+                "Call_id:{}, state:{}, expected: STATE_ACTIVE".format(
+                    call_conf_id, ads[0].droid.telecomCallGetCallState(
+                        call_conf_id)))
             return False
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        # Unmerge
+        self.log.info("Step5: UnMerge Conf Call into individual participants.")
+        ads[0].droid.telecomCallSplitFromConf(call_ab_id)
+        time.sleep(WAIT_TIME_IN_CALL)
+        calls = ads[0].droid.telecomCallGetCallIds()
+        self.log.info("Calls in PhoneA{}".format(calls))
 
-    @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_volte_swap_twice_merge_drop_wfc_wifi_only(self):
-        """Test swap and merge feature in epdg call.
+        # Are there 2 calls?
+        if num_active_calls(self.log, ads[0]) != 2:
+            self.log.error("Total number of call ids in {} is not 2".format(
+                ads[0].serial))
+            return False
 
-        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (VoLTE), accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        # Unmerged calls not dropped?
+        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
+            self.log.error("Either Call_AB or Call_AC was dropped")
+            return False
 
-        """
-        ads = self.android_devices
+        # Unmerged call in call state ACTIVE?
+        if ads[0].droid.telecomCallGetCallState(
+                call_ab_id) != CALL_STATE_ACTIVE:
+            self.log.error(
+                "Call_id:{}, state:{}, expected: STATE_ACTIVE".format(
+                    call_ab_id, ads[0].droid.telecomCallGetCallState(
+                        call_ab_id)))
+            return False
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
+        # Swap call
+        self.log.info("Step6: Swap call and see if Call_AC is ACTIVE.")
+        num_swaps = 1
+        if not swap_calls(self.log, ads, call_ac_id, call_ab_id, num_swaps):
+            self.log.error("Failed to swap calls.")
             return False
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
+        # Other call in call state ACTIVE?
+        if ads[0].droid.telecomCallGetCallState(
+                call_ac_id) != CALL_STATE_ACTIVE:
+            self.log.error(
+                "Call_id:{}, state:{}, expected: STATE_ACTIVE".format(
+                    call_ac_id, ads[0].droid.telecomCallGetCallState(
+                        call_ac_id)))
             return False
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        # All calls still CONNECTED?
+        return self._three_phone_hangup_call_verify_call_state(
+            ad_hangup=ads[2],
+            ad_verify=ads[0],
+            call_id=call_ab_id,
+            call_state=CALL_STATE_HOLDING,
+            ads_active=[ads[0], ads[1]])
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_volte_swap_twice_merge_drop_wfc_wifi_preferred(
-            self):
-        """Test swap and merge feature in epdg call.
+    def test_epdg_mo_mo_add_epdg_merge_drop_wfc_wifi_only(self):
+        """ Test Conf Call among three phones.
 
-        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (VoLTE), accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Call from PhoneA (epdg) to PhoneB (epdg), accept on PhoneB.
+        Call from PhoneA (epdg) to PhoneC (epdg), accept on PhoneC.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_epdg_merge_drop_wfc_wifi_preferred(self):
+        """ Test Conf Call among three phones.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        Call from PhoneA (epdg) to PhoneB (epdg), accept on PhoneB.
+        Call from PhoneA (epdg) to PhoneC (epdg), accept on PhoneC.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_volte_swap_once_merge_drop_wfc_wifi_only(self):
-        """Test swap and merge feature in epdg call.
+    def test_epdg_mo_mt_add_epdg_merge_drop_wfc_wifi_only(self):
+        """ Test Conf Call among three phones.
 
-        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Call from PhoneA (epdg) to PhoneB (epdg), accept on PhoneB.
+        Call from PhoneC (epdg) to PhoneA (epdg), accept on PhoneA.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_epdg_merge_drop_wfc_wifi_preferred(self):
+        """ Test Conf Call among three phones.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        Call from PhoneA (epdg) to PhoneB (epdg), accept on PhoneB.
+        Call from PhoneC (epdg) to PhoneA (epdg), accept on PhoneA.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_volte_swap_once_merge_drop_wfc_wifi_preferred(
-            self):
-        """Test swap and merge feature in epdg call.
+    def test_epdg_mt_mt_add_epdg_merge_drop_wfc_wifi_only(self):
+        """ Test Conf Call among three phones.
 
-        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Call from PhoneB (epdg) to PhoneA (epdg), accept on PhoneA.
+        Call from PhoneC (epdg) to PhoneA (epdg), accept on PhoneA.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mt_mt_add_epdg_merge_drop_wfc_wifi_preferred(self):
+        """ Test Conf Call among three phones.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_volte_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        Call from PhoneB (epdg) to PhoneA (epdg), accept on PhoneA.
+        Call from PhoneC (epdg) to PhoneA (epdg), accept on PhoneA.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_volte_swap_twice_merge_drop_wfc_wifi_only(self):
-        """Test swap and merge feature in epdg call.
+    def test_epdg_mo_mo_add_volte_merge_drop_wfc_wifi_only(self):
+        """ Test Conf Call among three phones.
 
-        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Call from PhoneA (epdg) to PhoneB (VoLTE), accept on PhoneB.
+        Call from PhoneA (epdg) to PhoneC (VoLTE), accept on PhoneC.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_volte_merge_drop_wfc_wifi_preferred(self):
+        """ Test Conf Call among three phones.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        Call from PhoneA (epdg) to PhoneB (VoLTE), accept on PhoneB.
+        Call from PhoneA (epdg) to PhoneC (VoLTE), accept on PhoneC.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_volte_swap_twice_merge_drop_wfc_wifi_preferred(
-            self):
-        """Test swap and merge feature in epdg call.
+    def test_epdg_mo_mt_add_volte_merge_drop_wfc_wifi_only(self):
+        """ Test Conf Call among three phones.
 
-        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
-        PhoneC (VoLTE) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Call from PhoneA (epdg) to PhoneB (VoLTE), accept on PhoneB.
+        Call from PhoneC (VoLTE) to PhoneA (epdg), accept on PhoneA.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_volte, (self.log, ads[1])), (phone_setup_volte,
-                                                           (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_volte_merge_drop_wfc_wifi_preferred(self):
+        """ Test Conf Call among three phones.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_volte_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        Call from PhoneA (epdg) to PhoneB (VoLTE), accept on PhoneB.
+        Call from PhoneC (VoLTE) to PhoneA (epdg), accept on PhoneA.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_wcdma_swap_once_merge_drop_wfc_wifi_only(self):
-        """Test swap and merge feature in epdg call.
+    def test_epdg_mo_mo_add_wcdma_merge_drop_wfc_wifi_only(self):
+        """ Test Conf Call among three phones.
 
-        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (WCDMA), accept on PhoneC.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Call from PhoneA (epdg) to PhoneB (WCDMA), accept on PhoneB.
+        Call from PhoneA (epdg) to PhoneC (WCDMA), accept on PhoneC.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_wcdma_merge_drop_wfc_wifi_preferred(self):
+        """ Test Conf Call among three phones.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        Call from PhoneA (epdg) to PhoneB (WCDMA), accept on PhoneB.
+        Call from PhoneA (epdg) to PhoneC (WCDMA), accept on PhoneC.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_wcdma_swap_once_merge_drop_wfc_wifi_preferred(
-            self):
-        """Test swap and merge feature in epdg call.
+    def test_epdg_mo_mt_add_wcdma_merge_drop_wfc_wifi_only(self):
+        """ Test Conf Call among three phones.
 
-        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (WCDMA), accept on PhoneC.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Call from PhoneA (epdg) to PhoneB (WCDMA), accept on PhoneB.
+        Call from PhoneC (WCDMA) to PhoneA (epdg), accept on PhoneA.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_wcdma_merge_drop_wfc_wifi_preferred(self):
+        """ Test Conf Call among three phones.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        Call from PhoneA (epdg) to PhoneB (WCDMA), accept on PhoneB.
+        Call from PhoneC (WCDMA) to PhoneA (epdg), accept on PhoneA.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_wcdma_swap_twice_merge_drop_wfc_wifi_only(self):
-        """Test swap and merge feature in epdg call.
+    def test_epdg_mo_mo_add_1x_merge_drop_wfc_wifi_only(self):
+        """ Test Conf Call among three phones.
 
-        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (WCDMA), accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Call from PhoneA (epdg) to PhoneB (1x), accept on PhoneB.
+        Call from PhoneA (epdg) to PhoneC (1x), accept on PhoneC.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_1x_merge_drop_wfc_wifi_preferred(self):
+        """ Test Conf Call among three phones.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        Call from PhoneA (epdg) to PhoneB (1x), accept on PhoneB.
+        Call from PhoneA (epdg) to PhoneC (1x), accept on PhoneC.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_wcdma_swap_twice_merge_drop_wfc_wifi_preferred(
-            self):
-        """Test swap and merge feature in epdg call.
+    def test_epdg_mo_mt_add_1x_merge_drop_wfc_wifi_only(self):
+        """ Test Conf Call among three phones.
 
-        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (WCDMA), accept on PhoneC.
-        Swap active call on PhoneA.
-        Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+        Call from PhoneA (epdg) to PhoneB (1x), accept on PhoneB.
+        Call from PhoneC (1x) to PhoneA (epdg), accept on PhoneA.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
+        Returns:
+            True if pass; False if fail.
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_1x_merge_drop_wfc_wifi_preferred(self):
+        """ Test Conf Call among three phones.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        Call from PhoneA (epdg) to PhoneB (1x), accept on PhoneB.
+        Call from PhoneC (1x) to PhoneA (epdg), accept on PhoneA.
+        On PhoneA, merge to conference call.
+        End call on PhoneC, verify call continues.
+        End call on PhoneB, verify call end on PhoneA.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        Returns:
+            True if pass; False if fail.
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_wcdma_swap_once_merge_drop_wfc_wifi_only(self):
+    def test_epdg_mo_mo_add_epdg_swap_once_merge_drop_wfc_wifi_only(self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneC (WCDMA) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_wcdma_swap_once_merge_drop_wfc_wifi_preferred(
-            self):
+    def test_epdg_mo_mo_add_epdg_swap_once_merge_drop_wfc_wifi_preferred(self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneC (WCDMA) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_wcdma_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_wcdma_swap_twice_merge_drop_wfc_wifi_only(self):
+    def test_epdg_mo_mo_add_epdg_swap_twice_merge_drop_wfc_wifi_only(self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneC (WCDMA) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
@@ -8607,30 +5191,19 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_wcdma_swap_twice_merge_drop_wfc_wifi_preferred(
+    def test_epdg_mo_mo_add_epdg_swap_twice_merge_drop_wfc_wifi_preferred(
             self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
-        PhoneC (WCDMA) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
@@ -8638,87 +5211,54 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_wcdma_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_1x_swap_once_merge_drop_wfc_wifi_only(self):
+    def test_epdg_mo_mt_add_epdg_swap_once_merge_drop_wfc_wifi_only(self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (1x), accept on PhoneC.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_1x_swap_once_merge_drop_wfc_wifi_preferred(self):
+    def test_epdg_mo_mt_add_epdg_swap_once_merge_drop_wfc_wifi_preferred(self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (1x), accept on PhoneC.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
-
-        """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_1x_swap_twice_merge_drop_wfc_wifi_only(self):
+    def test_epdg_mo_mt_add_epdg_swap_twice_merge_drop_wfc_wifi_only(self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (1x), accept on PhoneC.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
@@ -8726,29 +5266,19 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_1x_swap_twice_merge_drop_wfc_wifi_preferred(self):
+    def test_epdg_mo_mt_add_epdg_swap_twice_merge_drop_wfc_wifi_preferred(
+            self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (1x), accept on PhoneC.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
@@ -8756,87 +5286,55 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_1x_swap_once_merge_drop_wfc_wifi_only(self):
+    def test_epdg_mo_mo_add_volte_swap_once_merge_drop_wfc_wifi_only(self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
-        PhoneC (1x) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (VoLTE), accept on PhoneC.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_1x_swap_once_merge_drop_wfc_wifi_preferred(self):
+    def test_epdg_mo_mo_add_volte_swap_once_merge_drop_wfc_wifi_preferred(
+            self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
-        PhoneC (1x) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (VoLTE), accept on PhoneC.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
         Hangup on PhoneC, check call continues between AB.
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_1x_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_1x_swap_twice_merge_drop_wfc_wifi_only(self):
+    def test_epdg_mo_mo_add_volte_swap_twice_merge_drop_wfc_wifi_only(self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
-        PhoneC (1x) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (VoLTE), accept on PhoneC.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
@@ -8844,29 +5342,19 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_1x_swap_twice_merge_drop_wfc_wifi_preferred(self):
+    def test_epdg_mo_mo_add_volte_swap_twice_merge_drop_wfc_wifi_preferred(
+            self):
         """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
-        PhoneC (1x) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (VoLTE), accept on PhoneC.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
         Merge calls to conference on PhoneA.
@@ -8874,884 +5362,687 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_voice_3g, (self.log, ads[1])), (phone_setup_voice_3g,
-                                                        (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_1x_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_epdg_conference_merge_drop(call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_twice_drop_held_wfc_wifi_only(self):
-        """Test swap feature in epdg call.
+    def test_epdg_mo_mt_add_volte_swap_once_merge_drop_wfc_wifi_only(self):
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
-        Swap active call on PhoneA.
+        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneC (VoLTE) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[2]])
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_twice_drop_held_wfc_wifi_preferred(self):
-        """Test swap feature in epdg call.
+    def test_epdg_mo_mt_add_volte_swap_once_merge_drop_wfc_wifi_preferred(
+            self):
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
-        Swap active call on PhoneA.
+        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneC (VoLTE) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[2]])
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_twice_drop_active_wfc_wifi_only(self):
-        """Test swap feature in epdg call.
+    def test_epdg_mo_mt_add_volte_swap_twice_merge_drop_wfc_wifi_only(self):
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneC (VoLTE) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_twice_drop_active_wfc_wifi_preferred(
+    def test_epdg_mo_mt_add_volte_swap_twice_merge_drop_wfc_wifi_preferred(
             self):
-        """Test swap feature in epdg call.
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        PhoneA (epdg) call PhoneB (VoLTE), accept on PhoneB.
+        PhoneC (VoLTE) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "volte", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_wcdma_swap_once_merge_drop_wfc_wifi_only(self):
+        """Test swap and merge feature in epdg call.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (WCDMA), accept on PhoneC.
+        Swap active call on PhoneA.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_twice_drop_active_apm_wifi_preferred(
+    def test_epdg_mo_mo_add_wcdma_swap_once_merge_drop_wfc_wifi_preferred(
             self):
-        """Test swap feature in epdg call.
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
-        Swap active call on PhoneA.
+        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (WCDMA), accept on PhoneC.
         Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_twice_drop_held_wfc_wifi_only(self):
-        """Test swap feature in epdg call.
+    def test_epdg_mo_mo_add_wcdma_swap_twice_merge_drop_wfc_wifi_only(self):
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (WCDMA), accept on PhoneC.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_wcdma_swap_twice_merge_drop_wfc_wifi_preferred(
+            self):
+        """Test swap and merge feature in epdg call.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (WCDMA), accept on PhoneC.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[2]])
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_twice_drop_held_wfc_wifi_preferred(self):
-        """Test swap feature in epdg call.
+    def test_epdg_mo_mt_add_wcdma_swap_once_merge_drop_wfc_wifi_only(self):
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.
+        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneC (WCDMA) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_wcdma_swap_once_merge_drop_wfc_wifi_preferred(
+            self):
+        """Test swap and merge feature in epdg call.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneC (WCDMA) call PhoneA (epdg), accept on PhoneA.
+        Swap active call on PhoneA.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[2]])
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_twice_drop_active_wfc_wifi_only(self):
-        """Test swap feature in epdg call.
+    def test_epdg_mo_mt_add_wcdma_swap_twice_merge_drop_wfc_wifi_only(self):
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneC (WCDMA) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
         Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_wcdma_swap_twice_merge_drop_wfc_wifi_preferred(
+            self):
+        """Test swap and merge feature in epdg call.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        PhoneA (epdg) call PhoneB (WCDMA), accept on PhoneB.
+        PhoneC (WCDMA) call PhoneA (epdg), accept on PhoneA.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "wcdma", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_twice_drop_active_wfc_wifi_preferred(
-            self):
-        """Test swap feature in epdg call.
+    def test_epdg_mo_mo_add_1x_swap_once_merge_drop_wfc_wifi_only(self):
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
-        Swap active call on PhoneA.
+        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (1x), accept on PhoneC.
         Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_1x_swap_once_merge_drop_wfc_wifi_preferred(self):
+        """Test swap and merge feature in epdg call.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(2)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (1x), accept on PhoneC.
+        Swap active call on PhoneA.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[1]])
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MO, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_once_drop_held_wfc_wifi_only(self):
-        """Test swap feature in epdg call.
+    def test_epdg_mo_mo_add_1x_swap_twice_merge_drop_wfc_wifi_only(self):
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (1x), accept on PhoneC.
         Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
+        Swap active call on PhoneA.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_1x_swap_twice_merge_drop_wfc_wifi_preferred(self):
+        """Test swap and merge feature in epdg call.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (1x), accept on PhoneC.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MO, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_once_drop_held_wfc_wifi_preferred(self):
-        """Test swap feature in epdg call.
+    def test_epdg_mo_mt_add_1x_swap_once_merge_drop_wfc_wifi_only(self):
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
+        PhoneC (1x) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_1x_swap_once_merge_drop_wfc_wifi_preferred(self):
+        """Test swap and merge feature in epdg call.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
+        PhoneC (1x) call PhoneA (epdg), accept on PhoneA.
+        Swap active call on PhoneA.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_once_drop_active_wfc_wifi_only(self):
-        """Test swap feature in epdg call.
+    def test_epdg_mo_mt_add_1x_swap_twice_merge_drop_wfc_wifi_only(self):
+        """Test swap and merge feature in epdg call.
 
-        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
+        PhoneC (1x) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
+        Swap active call on PhoneA.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_1x_swap_twice_merge_drop_wfc_wifi_preferred(self):
+        """Test swap and merge feature in epdg call.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        PhoneA (epdg) call PhoneB (1x), accept on PhoneB.
+        PhoneC (1x) call PhoneA (epdg), accept on PhoneA.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Merge calls to conference on PhoneA.
+        Hangup on PhoneC, check call continues between AB.
+        Hangup on PhoneB, check A ends.
 
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[2]])
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, "1x", CONFERENCE_MO_MT, num_swaps=2,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_once_drop_active_wfc_wifi_preferred(
-            self):
+    def test_epdg_mo_mo_add_epdg_swap_twice_drop_held_wfc_wifi_only(self):
         """Test swap feature in epdg call.
 
         PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
         PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
         Swap active call on PhoneA.
+        Swap active call on PhoneA.
         Hangup call from PhoneB, check if call continues between AC.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[2]])
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=2,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mo_add_epdg_swap_once_drop_active_apm_wfc_wifi_preferred(
-            self):
+    def test_epdg_mo_mo_add_epdg_swap_twice_drop_held_wfc_wifi_preferred(self):
         """Test swap feature in epdg call.
 
         PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
         PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
         Swap active call on PhoneA.
+        Swap active call on PhoneA.
         Hangup call from PhoneB, check if call continues between AC.
 
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=2,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_epdg_swap_twice_drop_active_wfc_wifi_only(self):
+        """Test swap feature in epdg call.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[2]])
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=2,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_once_drop_held_wfc_wifi_only(self):
+    def test_epdg_mo_mo_add_epdg_swap_twice_drop_active_wfc_wifi_preferred(
+            self):
         """Test swap feature in epdg call.
 
         PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        Swap active call on PhoneA.
         Swap active call on PhoneA.
         Hangup call from PhoneC, check if call continues between AB.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=2,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_once_drop_held_wfc_wifi_preferred(self):
+    def test_epdg_mo_mo_add_epdg_swap_twice_drop_active_apm_wifi_preferred(
+            self):
         """Test swap feature in epdg call.
 
         PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
-        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        Swap active call on PhoneA.
         Swap active call on PhoneA.
         Hangup call from PhoneC, check if call continues between AB.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=2,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_once_drop_held_apm_wifi_preferred(self):
+    def test_epdg_mo_mt_add_epdg_swap_twice_drop_held_wfc_wifi_only(self):
         """Test swap feature in epdg call.
 
         PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
         PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
-        Hangup call from PhoneC, check if call continues between AB.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=2,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_once_drop_active_wfc_wifi_only(self):
+    def test_epdg_mo_mt_add_epdg_swap_twice_drop_held_wfc_wifi_preferred(self):
         """Test swap feature in epdg call.
 
         PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
         PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
+        Swap active call on PhoneA.
         Hangup call from PhoneB, check if call continues between AC.
 
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=2,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_ONLY,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_epdg_swap_twice_drop_active_wfc_wifi_only(self):
+        """Test swap feature in epdg call.
 
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        Swap active call on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[2]])
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=2,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
-    def test_epdg_mo_mt_add_epdg_swap_once_drop_active_wfc_wifi_preferred(
+    def test_epdg_mo_mt_add_epdg_swap_twice_drop_active_wfc_wifi_preferred(
             self):
         """Test swap feature in epdg call.
 
         PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
         PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
         Swap active call on PhoneA.
-        Hangup call from PhoneB, check if call continues between AC.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], False, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[1],
-            ad_verify=ads[0],
-            call_id=call_ac_id,
-            call_state=CALL_STATE_HOLDING,
-            ads_active=[ads[0], ads[2]])
-
-    def _test_gsm_mo_mo_add_swap_x(self, num_swaps):
-        """Test swap feature in GSM call.
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=2,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
-        PhoneA (GSM) call PhoneB, accept on PhoneB.
-        PhoneA (GSM) call PhoneC, accept on PhoneC.
-        Swap active call on PhoneA. (N times)
-
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_epdg_swap_once_drop_held_wfc_wifi_only(self):
+        """Test swap feature in epdg call.
 
-        Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
         """
-        ads = self.android_devices
-
-        # make sure PhoneA is GSM phone before proceed.
-        if (ads[0].droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-            self.log.error("{} not GSM phone, abort wcdma swap test.".format(
-                ads[0].serial))
-            return None, None
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
-        call_ab_id = self._three_phone_call_mo_add_mo(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_voice_2g, phone_setup_voice_general,
-             phone_setup_voice_general], [is_phone_in_call_2g, None, None])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_epdg_swap_once_drop_held_wfc_wifi_preferred(self):
+        """Test swap feature in epdg call.
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
-        return call_ab_id, call_ac_id
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_epdg_swap_once_drop_active_wfc_wifi_only(self):
+        """Test swap feature in epdg call.
 
-    def _test_gsm_mt_mt_add_swap_x(self, num_swaps):
-        """Test swap feature in GSM call.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        PhoneB call PhoneA (GSM), accept on PhoneA.
-        PhoneC call PhoneA (GSM), accept on PhoneA.
-        Swap active call on PhoneA. (N times)
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
-        Args:
-            num_swaps: do swap for 'num_swaps' times.
-                This value can be 0 (no swap operation).
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_epdg_swap_once_drop_active_wfc_wifi_preferred(
+            self):
+        """Test swap feature in epdg call.
 
-        Returns:
-            call_ab_id, call_ac_id if succeed;
-            None, None if failed.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
-        # make sure PhoneA is GSM phone before proceed.
-        if (ads[0].droid.telephonyGetPhoneType() != PHONE_TYPE_GSM):
-            self.log.error("{} not GSM phone, abort wcdma swap test.".format(
-                ads[0].serial))
-            return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mo_add_epdg_swap_once_drop_active_apm_wfc_wifi_preferred(
+            self):
+        """Test swap feature in epdg call.
 
-        call_ab_id = self._three_phone_call_mt_add_mt(
-            [ads[0], ads[1], ads[2]],
-            [phone_setup_voice_2g, phone_setup_voice_general,
-             phone_setup_voice_general], [is_phone_in_call_2g, None, None])
-        if call_ab_id is None:
-            self.log.error("Failed to get call_ab_id")
-            return None, None
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneA (epdg) call PhoneC (epdg), accept on PhoneC.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
 
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 2:
-            return None, None
-        if calls[0] == call_ab_id:
-            call_ac_id = calls[1]
-        else:
-            call_ac_id = calls[0]
+        """
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
-        if num_swaps > 0:
-            self.log.info("Step3: Begin Swap x{} test.".format(num_swaps))
-            if not swap_calls(self.log, ads, call_ab_id, call_ac_id,
-                              num_swaps):
-                self.log.error("Swap test failed.")
-                return None, None
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_epdg_swap_once_drop_held_wfc_wifi_only(self):
+        """Test swap feature in epdg call.
 
-        return call_ab_id, call_ac_id
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-    def _test_gsm_conference_merge_drop(self, call_ab_id, call_ac_id):
-        """Test conference merge and drop in GSM call.
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
-        PhoneA in GSM call with PhoneB.
-        PhoneA in GSM call with PhoneC.
-        Merge calls to conference on PhoneA.
-        Hangup on PhoneC, check call continues between AB.
-        Hangup on PhoneB, check A ends.
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_epdg_swap_once_drop_held_wfc_wifi_preferred(self):
+        """Test swap feature in epdg call.
 
-        Args:
-            call_ab_id: call id for call_AB on PhoneA.
-            call_ac_id: call id for call_AC on PhoneA.
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        Returns:
-            True if succeed;
-            False if failed.
         """
-        ads = self.android_devices
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
-        self.log.info("Step4: Merge to Conf Call and verify Conf Call.")
-        ads[0].droid.telecomCallJoinCallsInConf(call_ab_id, call_ac_id)
-        time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 3:
-            self.log.error("Total number of call ids in {} is not 3.".format(
-                ads[0].serial))
-            return False
-        call_conf_id = None
-        for call_id in calls:
-            if call_id != call_ab_id and call_id != call_ac_id:
-                call_conf_id = call_id
-        if not call_conf_id:
-            self.log.error("Merge call fail, no new conference call id.")
-            return False
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], True):
-            return False
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_epdg_swap_once_drop_held_apm_wifi_preferred(self):
+        """Test swap feature in epdg call.
 
-        # Check if Conf Call is currently active
-        if ads[0].droid.telecomCallGetCallState(
-                call_conf_id) != CALL_STATE_ACTIVE:
-            self.log.error(
-                "Call_id:{}, state:{}, expected: STATE_ACTIVE".format(
-                    call_conf_id, ads[0].droid.telecomCallGetCallState(
-                        call_conf_id)))
-            return False
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneC, check if call continues between AB.
 
-        self.log.info("Step5: End call on PhoneC and verify call continues.")
-        ads[2].droid.telecomEndCall()
-        time.sleep(WAIT_TIME_IN_CALL)
-        calls = ads[0].droid.telecomCallGetCallIds()
-        self.log.info("Calls in PhoneA{}".format(calls))
-        if num_active_calls(self.log, ads[0]) != 1:
-            return False
-        if not verify_incall_state(self.log, [ads[0], ads[1]], True):
-            return False
-        if not verify_incall_state(self.log, [ads[2]], False):
-            return False
+        """
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
-        self.log.info("Step6: End call on PhoneB and verify PhoneA end.")
-        ads[1].droid.telecomEndCall()
-        time.sleep(WAIT_TIME_IN_CALL)
-        if not verify_incall_state(self.log, [ads[0], ads[1], ads[2]], False):
-            return False
-        return True
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_epdg_swap_once_drop_active_wfc_wifi_only(self):
+        """Test swap feature in epdg call.
+
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
+
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_ONLY)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=1,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
+
+    @TelephonyBaseTest.tel_test_wrap
+    def test_epdg_mo_mt_add_epdg_swap_once_drop_active_wfc_wifi_preferred(
+            self):
+        """Test swap feature in epdg call.
+
+        PhoneA (epdg) call PhoneB (epdg), accept on PhoneB.
+        PhoneC (epdg) call PhoneA (epdg), accept on PhoneA.
+        Swap active call on PhoneA.
+        Hangup call from PhoneB, check if call continues between AC.
+
+        """
+        wfc_rat = self._get_wfc_rat(False, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=1,
+            drops=CONFERENCE_DROP_ACTIVE_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_gsm_mo_mo_add_merge_drop(self):
@@ -9766,11 +6057,9 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_gsm_mo_mo_add_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_gsm_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "gsm", "general", CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_gsm_mo_mo_add_swap_once_drop_held(self):
@@ -9785,17 +6074,9 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        ads = self.android_devices
-        call_ab_id, call_ac_id = self._test_gsm_mo_mo_add_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._three_phone_hangup_call_verify_call_state(
-            ad_hangup=ads[2],
-            ad_verify=ads[0],
-            call_id=call_ab_id,
-            call_state=CALL_STATE_ACTIVE,
-            ads_active=[ads[0], ads[1]])
+        return self._test_conference(ConferenceScenario(
+            "gsm", "general", CONFERENCE_MO_MO, num_swaps=1,
+            drops=CONFERENCE_DROP_HELD_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_gsm_mt_mt_add_merge_drop(self):
@@ -9810,11 +6091,9 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         Returns:
             True if pass; False if fail.
         """
-        call_ab_id, call_ac_id = self._test_gsm_mt_mt_add_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_gsm_conference_merge_drop(call_ab_id, call_ac_id)
+        return self._test_conference(ConferenceScenario(
+            "gsm", "general", CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mo_add_epdg_merge_drop_second_call_from_participant_wfc_apm_wifi_preferred_no_cep(
@@ -9839,27 +6118,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, No_CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mo_add_epdg_merge_drop_second_call_from_participant_wfc_apm_wifi_preferred_cep(
@@ -9884,27 +6146,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mo_add_epdg_merge_drop_second_call_from_host_wfc_apm_wifi_preferred_cep(
@@ -9929,27 +6174,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mo_add_epdg_merge_drop_first_call_from_participant_wfc_apm_wifi_preferred_cep(
@@ -9974,27 +6202,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mo_add_epdg_merge_drop_first_call_from_host_wfc_apm_wifi_preferred_cep(
@@ -10019,27 +6230,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mo_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MO, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mt_add_epdg_merge_drop_second_call_from_participant_wfc_apm_wifi_preferred_no_cep(
@@ -10064,27 +6258,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, No_CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mt_add_epdg_merge_drop_second_call_from_participant_wfc_apm_wifi_preferred_cep(
@@ -10109,27 +6286,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mt_add_epdg_merge_drop_second_call_from_host_wfc_apm_wifi_preferred_cep(
@@ -10154,27 +6314,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mt_add_epdg_merge_drop_first_call_from_participant_wfc_apm_wifi_preferred_cep(
@@ -10199,27 +6342,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mt_add_epdg_merge_drop_first_call_from_host_wfc_apm_wifi_preferred_cep(
@@ -10244,27 +6370,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mt_mt_add_epdg_merge_drop_second_call_from_participant_wfc_apm_wifi_preferred_no_cep(
@@ -10289,27 +6398,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, No_CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mt_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mt_mt_add_epdg_merge_drop_second_call_from_participant_wfc_apm_wifi_preferred_cep(
@@ -10334,27 +6426,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mt_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mt_mt_add_epdg_merge_drop_second_call_from_host_wfc_apm_wifi_preferred_cep(
@@ -10379,27 +6454,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mt_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mt_mt_add_epdg_merge_drop_first_call_from_participant_wfc_apm_wifi_preferred_cep(
@@ -10424,27 +6482,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mt_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mt_mt_add_epdg_merge_drop_first_call_from_host_wfc_apm_wifi_preferred_cep(
@@ -10469,27 +6510,10 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mt_mt_add_epdg_swap_x(0)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_first_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MT_MT, merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_FIRST_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mt_add_epdg_swap_once_merge_drop_second_call_from_participant_wfc_apm_wifi_preferred_no_cep(
@@ -10516,27 +6540,11 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, No_CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_no_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_IMS,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mt_add_epdg_swap_once_merge_drop_second_call_from_host_wfc_apm_wifi_preferred_cep(
@@ -10563,27 +6571,11 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_host_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_HOST))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_epdg_mo_mt_add_epdg_swap_once_merge_drop_second_call_from_participant_wfc_apm_wifi_preferred_cep(
@@ -10610,27 +6602,11 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         TAGS: Telephony, WFC, Conference, CEP
         Priority: 1
         """
-        ads = self.android_devices
-
-        tasks = [(phone_setup_iwlan,
-                  (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass)),
-                 (phone_setup_iwlan,
-                  (self.log, ads[2], True, WFC_MODE_WIFI_PREFERRED,
-                   self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
-            self.log.error("Phone Failed to Set Up Properly.")
-            return False
-
-        call_ab_id, call_ac_id = self._test_epdg_mo_mt_add_epdg_swap_x(1)
-        if call_ab_id is None or call_ac_id is None:
-            return False
-
-        return self._test_ims_conference_merge_drop_second_call_from_participant_cep(
-            call_ab_id, call_ac_id)
+        wfc_rat = self._get_wfc_rat(True, WFC_MODE_WIFI_PREFERRED)
+        return self._test_conference(ConferenceScenario(
+            wfc_rat, wfc_rat, CONFERENCE_MO_MT, num_swaps=1,
+            merge=CONFERENCE_MERGE_CEP,
+            drops=CONFERENCE_DROP_SECOND_CALL_FROM_PARTICIPANT))
 
     @TelephonyBaseTest.tel_test_wrap
     def test_wcdma_add_mt_decline(self):
@@ -10639,7 +6615,7 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         tasks = [(phone_setup_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1])),
                  (phone_setup_voice_general, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -10655,7 +6631,7 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         tasks = [(phone_setup_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1])),
                  (phone_setup_voice_general, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -10671,7 +6647,7 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         tasks = [(phone_setup_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1])),
                  (phone_setup_voice_general, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -10687,7 +6663,7 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         tasks = [(phone_setup_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1])),
                  (phone_setup_voice_general, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -10703,7 +6679,7 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         tasks = [(phone_setup_volte, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1])),
                  (phone_setup_voice_general, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -10719,7 +6695,7 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
         tasks = [(phone_setup_volte, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1])),
                  (phone_setup_voice_general, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -10737,7 +6713,7 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1])),
                  (phone_setup_voice_general, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -10755,7 +6731,7 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1])),
                  (phone_setup_voice_general, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -10773,7 +6749,7 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1])),
                  (phone_setup_voice_general, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -10791,7 +6767,7 @@ class TelLiveVoiceConfTest(TelephonyBaseTest):
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1])),
                  (phone_setup_voice_general, (self.log, ads[2]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
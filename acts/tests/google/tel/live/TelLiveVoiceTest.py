@@ -19,6 +19,7 @@
 
 import time
 from acts.utils import load_config
+from acts.test_utils.tel.tel_setup_planner import setup_phones
 from acts.test_utils.tel.tel_subscription_utils import \
     get_subid_from_slot_index
 from acts.test_utils.tel.tel_subscription_utils import set_subid_for_data
@@ -52,7 +53,6 @@ from acts.test_utils.tel.tel_test_utils import ensure_wifi_connected
 from acts.test_utils.tel.tel_test_utils import get_phone_number
 from acts.test_utils.tel.tel_test_utils import hangup_call
 from acts.test_utils.tel.tel_test_utils import is_droid_in_rat_family
-from acts.test_utils.tel.tel_test_utils import multithread_func
 from acts.test_utils.tel.tel_test_utils import num_active_calls
 from acts.test_utils.tel.tel_test_utils import phone_number_formatter
 from acts.test_utils.tel.tel_test_utils import set_call_state_listen_level
@@ -220,7 +220,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_general, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -243,7 +243,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_general, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -266,7 +266,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_volte,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -290,7 +290,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_volte,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -323,7 +323,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_volte,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -356,7 +356,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_volte,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -389,7 +389,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_volte,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -423,7 +423,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_csfb,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -447,7 +447,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_csfb,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -478,7 +478,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_csfb,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -509,7 +509,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_csfb,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -533,7 +533,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_voice_3g,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -563,7 +563,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_voice_3g,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -594,7 +594,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_voice_3g,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -618,7 +618,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_voice_2g,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -654,7 +654,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], apm_mode, wfc_mode, wifi_ssid, wifi_pwd)),
                  (phone_setup_iwlan,
                   (self.log, ads[1], apm_mode, wfc_mode, wifi_ssid, wifi_pwd))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -713,7 +713,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                  (phone_setup_iwlan_cellular_preferred,
                   (self.log, ads[1], self.wifi_network_ssid,
                    self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -787,7 +787,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_volte, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -814,7 +814,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_volte, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -841,7 +841,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_volte, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -868,7 +868,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_volte, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -895,7 +895,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_csfb, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -921,7 +921,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_csfb, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -947,7 +947,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_csfb, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -973,7 +973,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_csfb, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -999,7 +999,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_3g, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1025,7 +1025,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_3g, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1051,7 +1051,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_3g, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1077,7 +1077,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_3g, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1101,7 +1101,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_csfb, (self.log, ads[0])), (phone_setup_csfb,
                                                           (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1125,7 +1125,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_3g, (self.log, ads[0])), (phone_setup_voice_3g,
                                                         (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1151,7 +1151,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_volte,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1182,7 +1182,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                  (phone_setup_iwlan,
                   (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1213,7 +1213,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                  (phone_setup_iwlan,
                   (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1244,7 +1244,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                  (phone_setup_iwlan,
                   (self.log, ads[1], True, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1275,7 +1275,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                  (phone_setup_iwlan,
                   (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1302,7 +1302,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_csfb, (self.log, ads[0])), (phone_setup_csfb,
                                                           (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1328,7 +1328,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_3g, (self.log, ads[0])), (phone_setup_voice_3g,
                                                         (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1358,7 +1358,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])), (phone_setup_volte,
                                                            (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1416,7 +1416,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                  (phone_setup_iwlan,
                   (self.log, ads[1], False, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1474,7 +1474,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                  (phone_setup_iwlan,
                   (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1532,7 +1532,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                  (phone_setup_iwlan,
                   (self.log, ads[1], True, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1590,7 +1590,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                  (phone_setup_iwlan,
                   (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1644,7 +1644,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_csfb, (self.log, ads[0])), (phone_setup_csfb,
                                                           (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1696,7 +1696,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_3g, (self.log, ads[0])), (phone_setup_voice_3g,
                                                         (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1801,7 +1801,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1844,7 +1844,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1887,7 +1887,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1930,7 +1930,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -1973,7 +1973,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], False, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2016,7 +2016,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], False, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2059,7 +2059,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_ONLY,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2102,7 +2102,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2143,7 +2143,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2184,7 +2184,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2229,7 +2229,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2274,7 +2274,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2319,7 +2319,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_csfb, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2364,7 +2364,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_csfb, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2410,7 +2410,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_general, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2434,7 +2434,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_general, (self.log, ads[0])),
                  (phone_setup_volte, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         if not call_voicemail_erase_all_pending_voicemail(self.log, ads[1]):
@@ -2461,7 +2461,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_general, (self.log, ads[0])),
                  (phone_setup_csfb, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         if not call_voicemail_erase_all_pending_voicemail(self.log, ads[1]):
@@ -2488,7 +2488,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_general, (self.log, ads[0])),
                  (phone_setup_voice_3g, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         if not call_voicemail_erase_all_pending_voicemail(self.log, ads[1]):
@@ -2515,7 +2515,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_general, (self.log, ads[1])),
                  (phone_setup_voice_2g, (self.log, ads[0]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         if not call_voicemail_erase_all_pending_voicemail(self.log, ads[0]):
@@ -2544,7 +2544,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                  (phone_setup_iwlan,
                   (self.log, ads[1], False, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         if not call_voicemail_erase_all_pending_voicemail(self.log, ads[1]):
@@ -2573,7 +2573,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                  (phone_setup_iwlan,
                   (self.log, ads[1], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
         if not call_voicemail_erase_all_pending_voicemail(self.log, ads[1]):
@@ -2599,7 +2599,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_2g, (self.log, ads[0])),
                  (phone_setup_voice_2g, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2625,7 +2625,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_2g, (self.log, ads[0])),
                  (phone_setup_voice_2g, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2651,7 +2651,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_3g, (self.log, ads[0])),
                  (phone_setup_voice_2g, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2677,7 +2677,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_2g, (self.log, ads[0])),
                  (phone_setup_voice_3g, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2704,7 +2704,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_2g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2748,7 +2748,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_2g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2802,7 +2802,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_volte, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2831,7 +2831,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
                   (self.log, ads[0], True, WFC_MODE_WIFI_PREFERRED,
                    self.wifi_network_ssid, self.wifi_network_pass)),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 
@@ -2858,7 +2858,7 @@ class TelLiveVoiceTest(TelephonyBaseTest):
 
         tasks = [(phone_setup_voice_3g, (self.log, ads[0])),
                  (phone_setup_voice_general, (self.log, ads[1]))]
-        if not multithread_func(self.log, tasks):
+        if not setup_phones(self.log, tasks):
             self.log.error("Phone Failed to Set Up Properly.")
             return False
 